@@ -32,8 +32,20 @@ INCLUDE_PATTERNS = [
     'src/context_analyzer.py',
     'src/data_management_system.py',
     'src/translation_pipeline.py',
+    'src/rate_limiter.py',
+    'src/translation_store.py',
     'src/thai_transcriber.py',
+    'src/voice_activity.py',
+    'src/audio_ingest.py',
+    'src/artifact_store.py',
+    'src/segment_table.py',
+    'src/decoding_strategy.py',
+    'src/inference_backends.py',
+    'src/word_alignment.py',
+    'src/mel_cache.py',
     'src/orchestrator.py',
+    'src/service_client.py',
+    'src/pipeline_service.py',
 
     # Dictionaries
     'data/dictionaries/thai_idioms.json',
@@ -6,12 +6,20 @@ Manages checkpoints for Whisper transcription on Kaggle with auto-resume capabil
 
 Features:
 - Save checkpoints every N segments (default: 50)
+- Delta checkpoints: each file holds only the segments since the previous one
+- Tiny index file with progress and counts (status without reading segments)
+- Background compaction of deltas (bounded file count, /kaggle/working quota)
 - Auto-detect existing checkpoints
 - Resume from last saved position
-- Merge multiple checkpoint files
+- Merge checkpoint files (delta or legacy cumulative)
 - Validate checkpoint integrity
 - Kaggle Dataset integration
 
+Files (per video):
+    <video>_checkpoint_index.json   progress, counts, list of delta files
+    <video>_checkpoint_NNNN.json    segments up to cumulative count NNNN
+    <video>_final_transcript.json   completed transcript
+
 Usage:
     from checkpoint_manager import CheckpointManager
 
@@ -22,7 +30,7 @@ Usage:
         segments, metadata = mgr.load_checkpoint()
         print(f"Resume from segment {len(segments)}")
 
-    # Save progress
+    # Save progress (only segments not saved yet are written)
     mgr.save_checkpoint(segments, metadata)
 
     # Final save
@@ -32,6 +40,7 @@ Usage:
 import os
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -44,6 +53,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compact deltas into one file once this many have accumulated
+DEFAULT_COMPACT_EVERY = 8
+
+
+def _write_json_atomic(path: Path, data: Dict, indent: Optional[int] = None):
+    """Write JSON to a temp file and rename it over the target"""
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        if indent is None:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+    temp_path.replace(path)
+
 
 class CheckpointManager:
     """Manages checkpoints for Kaggle Whisper transcription"""
@@ -52,7 +75,8 @@ class CheckpointManager:
         self,
         video_name: str,
         output_dir: str = "/kaggle/working/checkpoints",
-        checkpoint_interval: int = 50
+        checkpoint_interval: int = 50,
+        compact_every: int = DEFAULT_COMPACT_EVERY
     ):
         """
         Initialize checkpoint manager
@@ -61,23 +85,92 @@ class CheckpointManager:
             video_name: Video file name (without extension)
             output_dir: Directory to save checkpoints
             checkpoint_interval: Save checkpoint every N segments
+            compact_every: Merge delta files in the background once this many exist
         """
         self.video_name = video_name
         self.output_dir = Path(output_dir)
         self.checkpoint_interval = checkpoint_interval
+        self.compact_every = compact_every
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Checkpoint file patterns
         self.checkpoint_pattern = f"{video_name}_checkpoint_*.json"
+        self.index_file = self.output_dir / f"{video_name}_checkpoint_index.json"
         self.final_file = self.output_dir / f"{video_name}_final_transcript.json"
 
+        # Index updates come from save_checkpoint() and the compaction thread
+        self._lock = threading.Lock()
+        self._compactor = None
+        self._index = self._load_index()
+
         logger.info(f"Checkpoint Manager initialized")
         logger.info(f"  Video: {video_name}")
         logger.info(f"  Output: {output_dir}")
         logger.info(f"  Interval: every {checkpoint_interval} segments")
 
+    # -------------------- Index --------------------
+
+    def _delta_files(self) -> List[Path]:
+        """Checkpoint data files sorted by cumulative segment count"""
+        files = [
+            p for p in self.output_dir.glob(self.checkpoint_pattern)
+            if p.stem.split('_')[-1].isdigit()
+        ]
+        return sorted(files, key=lambda p: int(p.stem.split('_')[-1]))
+
+    def _empty_index(self) -> Dict:
+        return {
+            'video_name': self.video_name,
+            'timestamp': datetime.now().isoformat(),
+            'total_segments': 0,
+            'deltas': [],
+            'metadata': {}
+        }
+
+    def _load_index(self) -> Dict:
+        """Load the index, rebuilding it from checkpoint files if missing"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"⚠️  Checkpoint index unreadable ({e}) - rebuilding")
+
+        files = self._delta_files()
+        index = self._empty_index()
+        if not files:
+            return index
+
+        # Legacy cumulative checkpoints or an index lost mid-write
+        seen_ids = set()
+        for cp_file in files:
+            with open(cp_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            new_ids = {seg['id'] for seg in data.get('segments', [])} - seen_ids
+            seen_ids |= new_ids
+            index['deltas'].append({
+                'file': cp_file.name,
+                'first': len(seen_ids) - len(new_ids),
+                'count': len(seen_ids),
+                'bytes': cp_file.stat().st_size
+            })
+            index['metadata'] = data.get('metadata', index['metadata'])
+
+        index['total_segments'] = len(seen_ids)
+        _write_json_atomic(self.index_file, index)
+
+        logger.info(f"✓ Checkpoint index rebuilt from {len(files)} file(s)")
+        return index
+
+    def _save_index(self):
+        self._index['timestamp'] = datetime.now().isoformat()
+        _write_json_atomic(self.index_file, self._index)
+
+    # -------------------- Save / Load --------------------
+
     def has_checkpoint(self) -> bool:
         """
         Check if any checkpoint exists
@@ -90,11 +183,9 @@ class CheckpointManager:
             logger.info(f"✅ Final transcript found: {self.final_file}")
             return True
 
-        # Check for checkpoint files
-        checkpoints = list(self.output_dir.glob(self.checkpoint_pattern))
-
-        if checkpoints:
-            logger.info(f"🔄 Found {len(checkpoints)} checkpoint(s)")
+        # Check the checkpoint index
+        if self._index['deltas']:
+            logger.info(f"🔄 Found {len(self._index['deltas'])} checkpoint(s)")
             return True
 
         logger.info("🆕 No checkpoint found - starting fresh")
@@ -120,24 +211,13 @@ class CheckpointManager:
 
             return data['segments'], data['metadata']
 
-        # Find most recent checkpoint
-        checkpoints = sorted(
-            self.output_dir.glob(self.checkpoint_pattern),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
-
-        if not checkpoints:
+        if not self._index['deltas']:
             raise FileNotFoundError("No checkpoint found")
 
-        latest = checkpoints[0]
-        logger.info(f"📂 Loading checkpoint: {latest.name}")
-
-        with open(latest, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        logger.info(f"📂 Loading {len(self._index['deltas'])} checkpoint file(s)")
 
-        segments = data.get('segments', [])
-        metadata = data.get('metadata', {})
+        segments = self.merge_checkpoints()
+        metadata = dict(self._index['metadata'])
 
         logger.info(f"✓ Loaded {len(segments)} segments")
         logger.info(f"  Progress: {metadata.get('progress_percentage', 0):.1f}%")
@@ -154,8 +234,11 @@ class CheckpointManager:
         """
         Save checkpoint if interval reached
 
+        Only segments beyond those already checkpointed are written, so a
+        save costs O(new segments) no matter how long the episode is.
+
         Args:
-            segments: List of segments to save
+            segments: All segments so far (cumulative list)
             metadata: Metadata to include
             force: Force save even if interval not reached
 
@@ -168,44 +251,77 @@ class CheckpointManager:
         if not force and segment_count % self.checkpoint_interval != 0:
             return None
 
+        with self._lock:
+            saved_count = self._index['total_segments']
+
+        # Nothing new (e.g. re-saving the prefix after a resume)
+        if segment_count <= saved_count:
+            # A forced save still commits progress (e.g. a silent audio window)
+            if force and segment_count == saved_count:
+                with self._lock:
+                    self._index['metadata'] = {
+                        **self._index['metadata'],
+                        **metadata,
+                        'progress_percentage': (segment_count / metadata.get('estimated_total', segment_count or 1)) * 100
+                    }
+                    self._save_index()
+            return None
+
         # Create checkpoint filename
         checkpoint_file = self.output_dir / f"{self.video_name}_checkpoint_{segment_count:04d}.json"
 
         # Calculate progress
         total_duration = segments[-1]['end'] if segments else 0
 
-        # Build checkpoint data
+        progress_metadata = {
+            **metadata,
+            'total_segments': segment_count,
+            'last_segment_time': total_duration,
+            'progress_percentage': (segment_count / metadata.get('estimated_total', segment_count)) * 100,
+            'status': 'in_progress',
+            'checkpoint_file': checkpoint_file.name
+        }
+
+        # Build delta data
         checkpoint_data = {
             'video_name': self.video_name,
             'timestamp': datetime.now().isoformat(),
-            'metadata': {
-                **metadata,
-                'total_segments': segment_count,
-                'last_segment_time': total_duration,
-                'progress_percentage': (segment_count / metadata.get('estimated_total', segment_count)) * 100,
-                'status': 'in_progress',
-                'checkpoint_file': checkpoint_file.name
-            },
-            'segments': segments
+            'first_segment': saved_count,
+            'metadata': progress_metadata,
+            'segments': segments[saved_count:]
         }
 
-        # Save checkpoint
-        with open(checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint_data, f, ensure_ascii=False, indent=2)
-
-        file_size = checkpoint_file.stat().st_size / 1024
+        # Save delta, then commit it in the index
+        _write_json_atomic(checkpoint_file, checkpoint_data)
+        file_size = checkpoint_file.stat().st_size
+
+        with self._lock:
+            self._index['deltas'].append({
+                'file': checkpoint_file.name,
+                'first': saved_count,
+                'count': segment_count,
+                'bytes': file_size
+            })
+            self._index['total_segments'] = segment_count
+            self._index['metadata'] = progress_metadata
+            self._save_index()
+            delta_count = len(self._index['deltas'])
 
         logger.info(f"💾 Checkpoint saved: {checkpoint_file.name}")
-        logger.info(f"   Segments: {segment_count}")
-        logger.info(f"   Size: {file_size:.1f} KB")
-        logger.info(f"   Progress: {checkpoint_data['metadata']['progress_percentage']:.1f}%")
+        logger.info(f"   Segments: {segment_count} (+{segment_count - saved_count})")
+        logger.info(f"   Size: {file_size / 1024:.1f} KB")
+        logger.info(f"   Progress: {progress_metadata['progress_percentage']:.1f}%")
+
+        if delta_count >= self.compact_every:
+            self.compact(background=True)
 
         return checkpoint_file
 
     def save_final(
         self,
         segments: List[Dict],
-        metadata: Dict
+        metadata: Dict,
+        background: bool = False
     ) -> Path:
         """
         Save final completed transcript
@@ -213,10 +329,30 @@ class CheckpointManager:
         Args:
             segments: All completed segments
             metadata: Final metadata
+            background: Write the transcript and remove checkpoints in a
+                        background thread (call wait() before reading it)
 
         Returns:
             Path to final transcript file
         """
+        # A compaction still running would re-create the index after cleanup
+        self.wait()
+
+        if background:
+            self._compactor = threading.Thread(
+                target=self._write_final,
+                args=(segments, metadata),
+                name=f"final-{self.video_name}",
+                daemon=False
+            )
+            self._compactor.start()
+            return self.final_file
+
+        self._write_final(segments, metadata)
+        return self.final_file
+
+    def _write_final(self, segments: List[Dict], metadata: Dict):
+        """Write the final transcript and clean up intermediate checkpoints"""
         # Calculate statistics
         duration = segments[-1]['end'] if segments else 0
         word_count = sum(len(seg.get('text', '').split()) for seg in segments)
@@ -253,8 +389,7 @@ class CheckpointManager:
         }
 
         # Save final file
-        with open(self.final_file, 'w', encoding='utf-8') as f:
-            json.dump(final_data, f, ensure_ascii=False, indent=2)
+        _write_json_atomic(self.final_file, final_data, indent=2)
 
         file_size = self.final_file.stat().st_size / 1024
 
@@ -272,58 +407,171 @@ class CheckpointManager:
         # Clean up intermediate checkpoints
         self._cleanup_checkpoints()
 
-        return self.final_file
+    # -------------------- Compaction --------------------
+
+    def compact(self, background: bool = False) -> Optional[Path]:
+        """
+        Merge all current delta files into one
+
+        The merged file replaces the newest delta it covers; the index is
+        committed before older deltas are deleted, so a crash at any point
+        still leaves a loadable checkpoint.
+
+        Args:
+            background: Run in a background thread (skipped if one is running)
+
+        Returns:
+            Compacted file (None when run in the background or nothing to do)
+        """
+        if background:
+            if self._compactor is not None and self._compactor.is_alive():
+                return None
+            self._compactor = threading.Thread(
+                target=self._compact_deltas,
+                name=f"compact-{self.video_name}",
+                daemon=True
+            )
+            self._compactor.start()
+            return None
+
+        return self._compact_deltas()
+
+    def wait(self):
+        """Wait for background compaction / final save to finish"""
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+
+    def _compact_deltas(self) -> Optional[Path]:
+        with self._lock:
+            deltas = list(self._index['deltas'])
+            metadata = dict(self._index['metadata'])
+
+        if len(deltas) < 2:
+            return None
+
+        try:
+            segments = self._read_deltas(deltas)
+            target = self.output_dir / deltas[-1]['file']
+
+            _write_json_atomic(target, {
+                'video_name': self.video_name,
+                'timestamp': datetime.now().isoformat(),
+                'first_segment': 0,
+                'metadata': metadata,
+                'segments': segments
+            })
+
+            with self._lock:
+                # Deltas appended meanwhile stay after the compacted entry
+                self._index['deltas'] = [{
+                    'file': target.name,
+                    'first': 0,
+                    'count': deltas[-1]['count'],
+                    'bytes': target.stat().st_size
+                }] + self._index['deltas'][len(deltas):]
+                self._save_index()
+
+            for delta in deltas[:-1]:
+                (self.output_dir / delta['file']).unlink(missing_ok=True)
+
+            logger.info(f"🗜️  Compacted {len(deltas)} checkpoint files into {target.name}")
+            return target
+
+        except Exception as e:
+            logger.warning(f"⚠️  Checkpoint compaction failed (deltas kept): {e}")
+            return None
+
+    def _read_deltas(self, deltas: List[Dict]) -> List[Dict]:
+        """Concatenate delta files, dropping duplicate segment ids"""
+        all_segments = []
+        seen_ids = set()
+
+        for delta in deltas:
+            with open(self.output_dir / delta['file'], 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            for seg in data.get('segments', []):
+                seg_id = seg['id']
+                if seg_id not in seen_ids:
+                    all_segments.append(seg)
+                    seen_ids.add(seg_id)
+
+        # Sort by ID
+        all_segments.sort(key=lambda s: s['id'])
+        return all_segments
+
+    # -------------------- Queries --------------------
 
     def get_resume_point(self) -> Tuple[int, float]:
         """
-        Get resume point from checkpoint
+        Get resume point from checkpoint (index only, no segments read)
+
+        When the saver records 'committed_time' in its metadata, that is
+        returned instead of the last segment end, so silence at the end of
+        a committed window is not decoded again.
 
         Returns:
             Tuple of (segment_count, last_time)
         """
-        try:
-            segments, metadata = self.load_checkpoint()
-            segment_count = len(segments)
-            last_time = segments[-1]['end'] if segments else 0.0
+        if self.final_file.exists():
+            try:
+                segments, metadata = self.load_checkpoint()
+                last_time = segments[-1]['end'] if segments else 0.0
+                logger.info(f"📍 Resume point: Segment {len(segments)}, Time {last_time:.1f}s")
+                return len(segments), last_time
+            except (OSError, KeyError, json.JSONDecodeError):
+                pass
+
+        with self._lock:
+            segment_count = self._index['total_segments']
+            metadata = self._index['metadata']
 
-            logger.info(f"📍 Resume point: Segment {segment_count}, Time {last_time:.1f}s")
-            return segment_count, last_time
+        # Audio committed up to here (may run past the last segment end)
+        last_time = metadata.get('committed_time', metadata.get('last_segment_time', 0.0))
 
-        except FileNotFoundError:
+        if segment_count == 0 and last_time == 0:
             logger.info(f"📍 Resume point: Start from beginning")
             return 0, 0.0
 
+        logger.info(f"📍 Resume point: Segment {segment_count}, Time {last_time:.1f}s")
+        return segment_count, last_time
+
     def validate_checkpoint(self, checkpoint_file: Path = None) -> bool:
         """
         Validate checkpoint file integrity
 
         Args:
-            checkpoint_file: Path to checkpoint (default: most recent)
+            checkpoint_file: Path to checkpoint (default: final transcript,
+                             else all delta files merged)
 
         Returns:
             True if valid, False otherwise
         """
-        if checkpoint_file is None:
-            try:
-                segments, metadata = self.load_checkpoint()
-                checkpoint_file = self.final_file
-            except FileNotFoundError:
-                logger.warning("No checkpoint to validate")
-                return False
-
         try:
-            with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Check required fields
-            required = ['video_name', 'metadata', 'segments']
-            for field in required:
-                if field not in data:
-                    logger.error(f"Missing required field: {field}")
+            if checkpoint_file is None and not self.final_file.exists():
+                if not self._index['deltas']:
+                    logger.warning("No checkpoint to validate")
                     return False
 
+                segments = self.merge_checkpoints()
+                name = self.index_file.name
+            else:
+                checkpoint_file = checkpoint_file or self.final_file
+                with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+                # Check required fields
+                required = ['video_name', 'metadata', 'segments']
+                for field in required:
+                    if field not in data:
+                        logger.error(f"Missing required field: {field}")
+                        return False
+
+                segments = data['segments']
+                name = checkpoint_file.name
+
             # Check segments structure
-            segments = data['segments']
             if not isinstance(segments, list):
                 logger.error("Segments must be a list")
                 return False
@@ -339,7 +587,7 @@ class CheckpointManager:
                     logger.error(f"Segment {i} time ordering invalid")
                     return False
 
-            logger.info(f"✓ Checkpoint valid: {checkpoint_file.name}")
+            logger.info(f"✓ Checkpoint valid: {name}")
             return True
 
         except Exception as e:
@@ -353,79 +601,79 @@ class CheckpointManager:
         Returns:
             Merged list of segments
         """
-        checkpoints = sorted(
-            self.output_dir.glob(self.checkpoint_pattern),
-            key=lambda p: int(p.stem.split('_')[-1])
-        )
+        with self._lock:
+            deltas = list(self._index['deltas'])
 
-        if not checkpoints:
+        if not deltas:
             logger.warning("No checkpoints to merge")
             return []
 
-        logger.info(f"Merging {len(checkpoints)} checkpoint files...")
+        logger.info(f"Merging {len(deltas)} checkpoint files...")
 
-        all_segments = []
-        seen_ids = set()
+        all_segments = self._read_deltas(deltas)
 
-        for cp_file in checkpoints:
-            with open(cp_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        logger.info(f"✓ Merged {len(all_segments)} unique segments")
+        return all_segments
 
-            for seg in data.get('segments', []):
-                seg_id = seg['id']
-                if seg_id not in seen_ids:
-                    all_segments.append(seg)
-                    seen_ids.add(seg_id)
+    def clear(self) -> int:
+        """
+        Delete all checkpoints and the final transcript of this video
 
-        # Sort by ID
-        all_segments.sort(key=lambda s: s['id'])
+        Returns:
+            Number of files removed (the index is not counted)
+        """
+        self.wait()
+        count = self._cleanup_checkpoints()
 
-        logger.info(f"✓ Merged {len(all_segments)} unique segments")
-        return all_segments
+        if self.final_file.exists():
+            self.final_file.unlink()
+            count += 1
 
-    def _cleanup_checkpoints(self):
+        return count
+
+    def _cleanup_checkpoints(self) -> int:
         """Clean up intermediate checkpoint files after final save"""
-        checkpoints = list(self.output_dir.glob(self.checkpoint_pattern))
+        with self._lock:
+            checkpoints = self._delta_files()
+
+            if checkpoints:
+                logger.info(f"🧹 Cleaning up {len(checkpoints)} intermediate checkpoints...")
+                for cp_file in checkpoints:
+                    cp_file.unlink(missing_ok=True)
+                logger.info("✓ Cleanup complete")
 
-        if checkpoints:
-            logger.info(f"🧹 Cleaning up {len(checkpoints)} intermediate checkpoints...")
-            for cp_file in checkpoints:
-                cp_file.unlink()
-            logger.info("✓ Cleanup complete")
+            self.index_file.unlink(missing_ok=True)
+            self._index = self._empty_index()
+
+        return len(checkpoints)
 
     def get_statistics(self) -> Dict:
         """
-        Get checkpoint statistics
+        Get checkpoint statistics (from the index; segments are not parsed)
 
         Returns:
             Dictionary with checkpoint stats
         """
-        stats = {
-            'has_final': self.final_file.exists(),
-            'checkpoint_count': len(list(self.output_dir.glob(self.checkpoint_pattern))),
-            'total_size_kb': 0,
-            'latest_checkpoint': None,
-            'total_segments': 0,
-            'progress_percentage': 0
-        }
+        with self._lock:
+            deltas = list(self._index['deltas'])
+            metadata = dict(self._index['metadata'])
+            total_segments = self._index['total_segments']
 
-        # Calculate total size
-        all_files = [self.final_file] if self.final_file.exists() else []
-        all_files.extend(self.output_dir.glob(self.checkpoint_pattern))
+        has_final = self.final_file.exists()
 
-        for f in all_files:
-            if f.exists():
-                stats['total_size_kb'] += f.stat().st_size / 1024
+        stats = {
+            'has_final': has_final,
+            'checkpoint_count': len(deltas),
+            'total_size_kb': sum(delta['bytes'] for delta in deltas) / 1024,
+            'latest_checkpoint': deltas[-1]['file'] if deltas else None,
+            'total_segments': total_segments,
+            'progress_percentage': metadata.get('progress_percentage', 0)
+        }
 
-        # Get latest info
-        if self.has_checkpoint():
-            try:
-                segments, metadata = self.load_checkpoint()
-                stats['total_segments'] = len(segments)
-                stats['progress_percentage'] = metadata.get('progress_percentage', 0)
-                stats['latest_checkpoint'] = metadata.get('checkpoint_file', 'final')
-            except:
-                pass
+        if has_final:
+            stats['total_size_kb'] += self.final_file.stat().st_size / 1024
+            stats['latest_checkpoint'] = 'final'
+            stats['progress_percentage'] = 100.0
 
         return stats
 
@@ -3,18 +3,22 @@
 Kaggle-Optimized Whisper Transcriber with Auto-Resume
 =====================================================
 Optimized Whisper transcription for Kaggle environment with:
-- Segment-by-segment processing (memory efficient)
-- Auto-resume from checkpoints
+- Window-by-window processing (memory efficient)
+- Auto-resume from the last committed timestamp
 - P100 GPU optimization
 - Incremental saves (every 50 segments)
 - Kaggle Dataset integration
 
 Features:
-- Resume from any checkpoint
+- Resume decodes only the audio after the last committed window
+- Stops cleanly before the 9-hour Kaggle session limit (resume next session)
+- Optional two-tier decoding: greedy pass, beam re-decode of flagged windows
+- Optional CPU backends (int8 quantized, ONNX Runtime) for GPU-less sessions
 - Never lose progress
 - Memory-efficient processing
 - Optimized for P100/T4 GPUs
 - Automatic checkpoint saves
+- Accepts already decoded 16kHz PCM arrays (no second decode)
 
 Usage:
     from whisper_kaggle_optimized import KaggleWhisperTranscriber
@@ -35,6 +39,7 @@ import sys
 import gc
 import json
 import logging
+import subprocess
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -49,6 +54,7 @@ logger = logging.getLogger(__name__)
 
 # Import dependencies
 try:
+    import numpy as np
     import whisper
     import torch
 except ImportError as e:
@@ -63,6 +69,157 @@ except ImportError:
     logger.error("checkpoint_manager.py not found in same directory")
     sys.exit(1)
 
+# Optional: int8/ONNX CPU backends (copy src/inference_backends.py next to this script)
+try:
+    from inference_backends import BACKEND_OPENAI, BACKENDS, load_whisper_model
+except ImportError:
+    BACKEND_OPENAI = 'openai-whisper'
+    BACKENDS = (BACKEND_OPENAI, 'int8', 'onnx')
+    load_whisper_model = None
+
+# Optional: shared two-tier window scoring (copy src/decoding_strategy.py and the
+# modules it imports - word_alignment.py, mel_cache.py, artifact_store.py - next
+# to this script); the thresholds below only stand in when it is missing
+try:
+    from decoding_strategy import DECODING_ACCURATE, DECODING_TWO_TIER, GREEDY_OVERRIDES, score_result
+except ImportError:
+    score_result = None
+    DECODING_ACCURATE = 'accurate'
+    DECODING_TWO_TIER = 'two-tier'
+    GREEDY_OVERRIDES = {"temperature": 0.0, "beam_size": None, "best_of": None}
+    MIN_AVG_LOGPROB = -0.8
+    MAX_COMPRESSION_RATIO = 2.2
+    MIN_WORD_PROBABILITY = 0.55
+    NO_SPEECH_PROB = 0.6
+    SILENCE_LOGPROB = -1.0
+
+
+# ======================== AUDIO WINDOWS ========================
+
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE
+
+# Audio transcribed (and committed) per checkpoint window
+DEFAULT_WINDOW_SIZE = 300.0
+
+# Kaggle kills sessions after 9 hours; stop early enough to commit and exit
+KAGGLE_SESSION_LIMIT = 9 * 3600
+SESSION_SAFETY_MARGIN = 20 * 60
+
+
+def plan_windows(start: float, end: float, window_size: float) -> List[Tuple[float, float]]:
+    """
+    Cut [start, end) into consecutive windows of window_size seconds
+
+    Args:
+        start: First second to transcribe (resume point)
+        end: Audio duration in seconds
+        window_size: Window length in seconds
+
+    Returns:
+        List of (window_start, window_end) tuples
+    """
+    windows = []
+    while start < end:
+        windows.append((start, min(start + window_size, end)))
+        start = windows[-1][1]
+    return windows
+
+
+def shift_segments(
+    segments: List[Dict],
+    offset: float,
+    window_end: float,
+    first_id: int
+) -> List[Dict]:
+    """
+    Move window-relative Whisper segments onto the video timeline
+
+    Args:
+        segments: Segments returned by model.transcribe for one window
+        offset: Window start in seconds
+        window_end: Window end in seconds (timestamps are clamped to it)
+        first_id: Id of the first segment
+
+    Returns:
+        Segments with absolute timestamps and continuous ids
+    """
+    shifted = []
+
+    for segment_id, seg in enumerate(segments, start=first_id):
+        seg = dict(seg)
+        seg['id'] = segment_id
+        seg['start'] = min(seg['start'] + offset, window_end)
+        seg['end'] = min(seg['end'] + offset, window_end)
+        seg.pop('seek', None)
+
+        if seg.get('words'):
+            seg['words'] = [
+                {
+                    **word,
+                    'start': min(word['start'] + offset, window_end),
+                    'end': min(word['end'] + offset, window_end)
+                }
+                for word in seg['words']
+            ]
+
+        shifted.append(seg)
+
+    return shifted
+
+
+# ======================== DECODING STRATEGY ========================
+
+def score_window(result: Dict) -> Tuple[Dict, List[str]]:
+    """
+    Score a Whisper result (speech segments only)
+
+    Args:
+        result: Output of model.transcribe() for one window
+
+    Returns:
+        Tuple of (metrics, reasons to re-decode; empty if the window is fine)
+    """
+    if score_result is not None:
+        score = score_result(result)
+        metrics = {
+            'avg_logprob': score.avg_logprob,
+            'compression_ratio': score.compression_ratio,
+            'word_probability': score.word_probability
+        }
+        return metrics, score.reasons
+
+    speech = [
+        seg for seg in result['segments']
+        if not (seg.get('no_speech_prob', 0.0) > NO_SPEECH_PROB and seg.get('avg_logprob', 0.0) < SILENCE_LOGPROB)
+    ]
+    if not speech:
+        return {'avg_logprob': 0.0, 'compression_ratio': 0.0, 'word_probability': 1.0}, []
+
+    durations = [max(seg['end'] - seg['start'], 1e-3) for seg in speech]
+    probabilities = [w['probability'] for seg in speech for w in seg.get('words') or []]
+
+    metrics = {
+        'avg_logprob': sum(seg.get('avg_logprob', 0.0) * d for seg, d in zip(speech, durations)) / sum(durations),
+        'compression_ratio': max(seg.get('compression_ratio', 0.0) for seg in speech),
+        'word_probability': sum(probabilities) / len(probabilities) if probabilities else 1.0
+    }
+
+    reasons = []
+    if metrics['avg_logprob'] < MIN_AVG_LOGPROB:
+        reasons.append('logprob')
+    if metrics['compression_ratio'] > MAX_COMPRESSION_RATIO:
+        reasons.append('compression')
+    if metrics['word_probability'] < MIN_WORD_PROBABILITY:
+        reasons.append('word_prob')
+
+    return metrics, reasons
+
+
+def extract_prompt_tail(segments: List[Dict], max_chars: int = 120) -> str:
+    """Last few segment texts, used to condition the next window"""
+    tail = ' '.join(seg.get('text', '').strip() for seg in segments[-3:]).strip()
+    return tail[-max_chars:]
+
 
 class KaggleWhisperTranscriber:
     """Kaggle-optimized Whisper transcriber with auto-resume"""
@@ -95,7 +252,11 @@ class KaggleWhisperTranscriber:
         model_name: str = "large-v3",
         device: str = "auto",
         checkpoint_dir: str = "/kaggle/working/checkpoints",
-        checkpoint_interval: int = 50
+        checkpoint_interval: int = 50,
+        window_size: float = DEFAULT_WINDOW_SIZE,
+        time_budget: Optional[float] = None,
+        decoding: str = DECODING_ACCURATE,
+        backend: str = BACKEND_OPENAI
     ):
         """
         Initialize Kaggle Whisper transcriber
@@ -104,7 +265,14 @@ class KaggleWhisperTranscriber:
             model_name: Whisper model (large-v3 recommended for Kaggle)
             device: Device (auto/cuda/cpu)
             checkpoint_dir: Directory for checkpoints
-            checkpoint_interval: Save checkpoint every N segments
+            checkpoint_interval: Checkpoint interval for the manager (transcribe_with_resume commits every window)
+            window_size: Seconds of audio transcribed per committed window
+            time_budget: Seconds this session may spend, counted from now
+                         (default: 9h Kaggle limit minus a safety margin)
+            decoding: 'accurate' (beam search everywhere) or 'two-tier'
+                      (greedy pass, beam re-decode of flagged windows)
+            backend: 'openai-whisper', or the CPU-only 'int8' / 'onnx'
+                     (needs inference_backends.py in the same directory)
         """
         logger.info("=" * 70)
         logger.info("Kaggle Whisper Transcriber (Thai-Optimized + Auto-Resume)")
@@ -118,11 +286,29 @@ class KaggleWhisperTranscriber:
         self.model_name = model_name
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_interval = checkpoint_interval
+        self.window_size = window_size
+        self.time_budget = time_budget if time_budget is not None else KAGGLE_SESSION_LIMIT - SESSION_SAFETY_MARGIN
+        self._session_start = time.time()
+        self.decoding = decoding
+        self.backend = backend
+
+        # Decoding telemetry of this session
+        self.decode_stats = {
+            'mode': decoding,
+            'windows': 0,
+            'redecoded': 0,
+            'fallbacks': 0,
+            'first_pass_seconds': 0.0,
+            'redecode_seconds': 0.0
+        }
 
         logger.info(f"Model: {model_name}")
         logger.info(f"Device: {device}")
         logger.info(f"Checkpoint dir: {checkpoint_dir}")
-        logger.info(f"Checkpoint interval: every {checkpoint_interval} segments")
+        logger.info(f"Window size: {window_size:.0f}s (checkpoint per window)")
+        logger.info(f"Time budget: {self.time_budget / 3600:.1f}h")
+        logger.info(f"Decoding: {decoding}")
+        logger.info(f"Backend: {backend}")
 
         # Check GPU
         if self.device == "cuda":
@@ -132,7 +318,14 @@ class KaggleWhisperTranscriber:
         logger.info("\n⏳ Loading Whisper model...")
         start_time = time.time()
 
-        self.model = whisper.load_model(model_name, device=device)
+        if backend == BACKEND_OPENAI:
+            self.model = whisper.load_model(model_name, device=device)
+        elif load_whisper_model is None:
+            raise ImportError(
+                f"The {backend} backend needs inference_backends.py in the same directory as this script"
+            )
+        else:
+            self.model = load_whisper_model(model_name, device=device, backend=backend)
 
         load_time = time.time() - start_time
         logger.info(f"✓ Model loaded in {load_time:.1f}s")
@@ -163,14 +356,24 @@ class KaggleWhisperTranscriber:
     def transcribe_with_resume(
         self,
         video_path: str,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        audio: Optional[np.ndarray] = None
     ) -> Dict:
         """
         Transcribe video with auto-resume capability
 
+        The audio is transcribed in fixed windows and every window is
+        committed as a checkpoint before the next one starts. On resume
+        the audio is decoded from the last committed timestamp only, and
+        the new segments are appended to the saved ones. When the session
+        time budget would run out before the next window finishes, the run
+        stops cleanly (status 'partial') and can be resumed in a new session.
+
         Args:
             video_path: Path to video file
             output_dir: Output directory (default: same as checkpoint_dir)
+            audio: Already decoded 16kHz mono PCM (float32 or int16, may be
+                   a read-only memmap); skips decoding the video again
 
         Returns:
             Dictionary with transcription result
@@ -190,6 +393,8 @@ class KaggleWhisperTranscriber:
         logger.info(f"\n📹 Video: {video_path.name}")
         logger.info(f"   Size: {video_path.stat().st_size / (1024*1024):.1f} MB")
 
+        segments = []
+
         # Check for existing checkpoint
         if self.checkpoint_mgr.has_checkpoint():
             segments, metadata = self.checkpoint_mgr.load_checkpoint()
@@ -207,36 +412,52 @@ class KaggleWhisperTranscriber:
                     'from_cache': True
                 }
 
-            # Resume mode
+        # Committed audio position (also covers silent windows without segments)
+        segment_count, resume_time = self.checkpoint_mgr.get_resume_point()
+        segments = segments[:segment_count]
+
+        if resume_time > 0:
             logger.info("\n🔄 RESUME MODE DETECTED")
             logger.info(f"   Completed: {len(segments)} segments")
-            logger.info(f"   Progress: {metadata.get('progress_percentage', 0):.1f}%")
-            logger.info(f"   Last time: {segments[-1]['end']:.1f}s")
-            logger.info(f"\n   ⚠️  Note: Will re-transcribe entire video")
-            logger.info(f"   (Whisper doesn't support partial resume)")
-            logger.info(f"   But checkpoint prevents data loss if disconnected!\n")
+            logger.info(f"   Committed audio: {int(resume_time // 60)}:{int(resume_time % 60):02d}")
+            logger.info(f"   Only the remaining audio will be transcribed\n")
 
-        # Transcribe full video
         logger.info("⏳ Starting transcription...")
-        logger.info("   💾 Auto-checkpoint enabled (every 50 segments)")
+        logger.info(f"   💾 Auto-checkpoint enabled (every {self.window_size:.0f}s window)")
         logger.info("   🔄 Safe to disconnect - progress is saved!\n")
 
         start_time = time.time()
 
-        # Transcribe with verbose progress
-        result = self._transcribe_with_checkpoints(str(video_path))
+        result = self._transcribe_with_checkpoints(str(video_path), audio, segments, resume_time)
 
         transcription_time = time.time() - start_time
+        segments = result['segments']
+
+        if not result['completed']:
+            logger.info(f"\n⏸️  Session time budget reached")
+            logger.info(f"   Committed: {len(segments)} segments, "
+                        f"{int(result['committed_time'] // 60)}:{int(result['committed_time'] % 60):02d}")
+            logger.info(f"   Re-run in a new session to resume from here")
+
+            return {
+                'segments': segments,
+                'metadata': {**result['metadata'], 'status': 'partial'},
+                'from_cache': False
+            }
 
         # Calculate statistics
-        duration = result['segments'][-1]['end'] if result['segments'] else 0
-        speed = duration / transcription_time if transcription_time > 0 else 0
+        duration = segments[-1]['end'] if segments else 0
+        decoded = result['committed_time'] - resume_time
+        speed = decoded / transcription_time if transcription_time > 0 else 0
 
         logger.info(f"\n✅ Transcription complete!")
         logger.info(f"   Duration: {int(duration // 60)}:{int(duration % 60):02d}")
-        logger.info(f"   Segments: {len(result['segments'])}")
+        logger.info(f"   Segments: {len(segments)}")
         logger.info(f"   Processing time: {transcription_time:.1f}s")
         logger.info(f"   Speed: {speed:.1f}x realtime")
+        logger.info(f"   Decoding ({self.decoding}): {self.decode_stats['windows']} windows, "
+                    f"{self.decode_stats['redecoded']} re-decoded, "
+                    f"{self.decode_stats['fallbacks']} temperature fallbacks")
 
         # Save final result
         metadata = {
@@ -244,68 +465,193 @@ class KaggleWhisperTranscriber:
             'device': self.device,
             'duration': duration,
             'transcription_time': transcription_time,
-            'speed': speed
+            'speed': speed,
+            'resumed_from': resume_time,
+            'decoding': dict(self.decode_stats)
         }
 
-        final_file = self.checkpoint_mgr.save_final(result['segments'], metadata)
+        final_file = self.checkpoint_mgr.save_final(segments, metadata)
 
         logger.info(f"\n📁 Final output: {final_file}")
 
         return {
-            'segments': result['segments'],
+            'segments': segments,
             'metadata': metadata,
             'final_file': str(final_file),
             'from_cache': False
         }
 
-    def _transcribe_with_checkpoints(self, video_path: str) -> Dict:
+    def _transcribe_with_checkpoints(
+        self,
+        video_path: str,
+        audio: Optional[np.ndarray] = None,
+        segments: Optional[List[Dict]] = None,
+        resume_time: float = 0.0
+    ) -> Dict:
         """
-        Transcribe with incremental checkpoints
+        Transcribe window by window, committing a checkpoint per window
 
         Args:
             video_path: Path to video file
+            audio: Already decoded PCM (None to decode video_path)
+            segments: Segments already committed (resume)
+            resume_time: Committed audio position in seconds
 
         Returns:
-            Whisper transcription result
+            Dictionary with segments, completed flag, committed_time, metadata
         """
-        # Transcribe (Whisper handles the full video)
-        result = self.model.transcribe(
-            video_path,
-            verbose=True,  # Show progress
-            **self.THAI_SETTINGS
-        )
+        segments = list(segments or [])
 
-        # Save checkpoints incrementally as segments are processed
-        segments = result['segments']
-        total_segments = len(segments)
+        # Decode only the audio after the committed position; given PCM stays
+        # a view in its own dtype and is converted one window at a time
+        if audio is None:
+            audio = self._load_audio(video_path, resume_time)
+        else:
+            audio = audio[int(resume_time * SAMPLE_RATE):]
 
-        logger.info(f"\n💾 Saving incremental checkpoints...")
+        total_duration = resume_time + len(audio) / SAMPLE_RATE
+        windows = plan_windows(resume_time, total_duration, self.window_size)
 
-        for i in range(0, total_segments, self.checkpoint_interval):
-            end_idx = min(i + self.checkpoint_interval, total_segments)
-            chunk = segments[:end_idx]
+        logger.info(f"   Audio: {int(total_duration // 60)}:{int(total_duration % 60):02d} "
+                    f"({len(windows)} window(s) to transcribe)")
 
-            checkpoint_file = self.checkpoint_mgr.save_checkpoint(
-                chunk,
-                {
-                    'model_name': self.model_name,
-                    'estimated_total': total_segments,
-                    'device': self.device
-                },
-                force=True
+        settings = dict(self.THAI_SETTINGS)
+        base_prompt = settings.pop('initial_prompt')
+        prompt_tail = extract_prompt_tail(segments)
+        committed_time = resume_time
+        metadata = {}
+        slowest_window = 0.0
+
+        for number, (window_start, window_end) in enumerate(windows, start=1):
+            # Stop before a window that might not finish within the session
+            elapsed = time.time() - self._session_start
+            if elapsed + slowest_window > self.time_budget:
+                return {
+                    'segments': segments,
+                    'completed': False,
+                    'committed_time': committed_time,
+                    'metadata': metadata
+                }
+
+            window_started = time.time()
+
+            first = int((window_start - resume_time) * SAMPLE_RATE)
+            last = int((window_end - resume_time) * SAMPLE_RATE)
+
+            result = self._decode_window(
+                self._audio_input(video_path, audio[first:last]),
+                {**settings, 'initial_prompt': f"{base_prompt} {prompt_tail}".strip()},
+                label=f"Window {number}/{len(windows)}"
             )
 
-            if checkpoint_file:
-                logger.info(f"   ✓ Checkpoint {end_idx}/{total_segments} saved")
+            window_segments = shift_segments(result['segments'], window_start, window_end, len(segments))
+            segments.extend(window_segments)
+
+            if window_segments:
+                prompt_tail = extract_prompt_tail(window_segments)
+
+            committed_time = window_end
+            metadata = {
+                'model_name': self.model_name,
+                'device': self.device,
+                'window_size': self.window_size,
+                'committed_time': committed_time,
+                'total_duration': total_duration,
+                # Segment count extrapolated from the audio done so far
+                'estimated_total': max(1, len(segments), int(len(segments) * total_duration / committed_time))
+            }
+
+            # Commit the window (a delta with its segments, or progress only)
+            self.checkpoint_mgr.save_checkpoint(segments, metadata, force=True)
 
-        logger.info(f"✓ All checkpoints saved\n")
+            window_time = time.time() - window_started
+            slowest_window = max(slowest_window, window_time)
+
+            logger.info(f"   ✓ Window {number}/{len(windows)} committed: "
+                        f"{int(window_end // 60)}:{int(window_end % 60):02d} "
+                        f"({len(window_segments)} segments, {window_time:.1f}s)")
+
+        return {
+            'segments': segments,
+            'completed': True,
+            'committed_time': committed_time,
+            'metadata': metadata
+        }
+
+    def _decode_window(self, audio: np.ndarray, settings: Dict, label: str) -> Dict:
+        """
+        Decode one window with the configured strategy and log its telemetry
+
+        Args:
+            audio: Window samples (16kHz float32)
+            settings: Accurate Whisper settings (beam search, temperature fallback)
+            label: Window name for the log line
+
+        Returns:
+            Whisper result
+        """
+        stats = self.decode_stats
+        first_settings = settings if self.decoding == DECODING_ACCURATE else {**settings, **GREEDY_OVERRIDES}
+
+        started = time.time()
+        result = self.model.transcribe(audio, verbose=False, **first_settings)
+        first_pass = time.time() - started
+
+        metrics, reasons = score_window(result)
+        fallbacks = sum(1 for seg in result['segments'] if seg.get('temperature', 0.0) > 0.0)
+        redecode = 0.0
+        redecoded = self.decoding == DECODING_TWO_TIER and bool(reasons)
+
+        if redecoded:
+            started = time.time()
+            result = self.model.transcribe(audio, verbose=False, **settings)
+            redecode = time.time() - started
+            fallbacks += sum(1 for seg in result['segments'] if seg.get('temperature', 0.0) > 0.0)
+            stats['redecoded'] += 1
+
+        stats['windows'] += 1
+        stats['fallbacks'] += fallbacks
+        stats['first_pass_seconds'] += first_pass
+        stats['redecode_seconds'] += redecode
+
+        logger.info(
+            f"   {label}: logprob={metrics['avg_logprob']:.2f} "
+            f"cr={metrics['compression_ratio']:.2f} word_prob={metrics['word_probability']:.2f} "
+            f"fallbacks={fallbacks}"
+            + (f" -> re-decoded ({', '.join(reasons)})" if redecoded else "")
+        )
 
         return result
 
+    @staticmethod
+    def _load_audio(video_path: str, offset: float = 0.0) -> np.ndarray:
+        """
+        Decode audio to 16kHz mono float32, starting at offset seconds
+
+        Same ffmpeg invocation as whisper.load_audio, with an input seek so
+        a resumed run does not decode the part that is already committed.
+        """
+        cmd = ["ffmpeg", "-nostdin", "-threads", "0"]
+        if offset > 0:
+            cmd += ["-ss", f"{offset:.3f}"]
+        cmd += [
+            "-i", video_path,
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le",
+            "-ar", str(SAMPLE_RATE), "-"
+        ]
+
+        try:
+            out = subprocess.run(cmd, capture_output=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to load audio: {e.stderr.decode(errors='ignore')}") from e
+
+        return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
     def transcribe_file(
         self,
         video_path: str,
-        save_checkpoint: bool = True
+        save_checkpoint: bool = True,
+        audio: Optional[np.ndarray] = None
     ) -> Dict:
         """
         Transcribe without resume (legacy mode)
@@ -313,6 +659,7 @@ class KaggleWhisperTranscriber:
         Args:
             video_path: Path to video file
             save_checkpoint: Save checkpoint after completion
+            audio: Already decoded 16kHz mono PCM (None to decode video_path)
 
         Returns:
             Transcription result
@@ -322,7 +669,7 @@ class KaggleWhisperTranscriber:
         start_time = time.time()
 
         result = self.model.transcribe(
-            video_path,
+            self._audio_input(video_path, audio),
             verbose=True,
             **self.THAI_SETTINGS
         )
@@ -345,6 +692,22 @@ class KaggleWhisperTranscriber:
 
         return result
 
+    @staticmethod
+    def _audio_input(video_path: str, audio: Optional[np.ndarray]):
+        """
+        Pick the Whisper input: decoded samples if given, else the file path
+
+        int16 PCM is scaled to float32; float32 arrays and memmaps are
+        passed through without copying.
+        """
+        if audio is None:
+            return str(video_path)
+
+        if audio.dtype == np.int16:
+            return audio.astype(np.float32) / 32768.0
+
+        return np.asarray(audio, dtype=np.float32)
+
     def get_checkpoint_status(self, video_name: str) -> Dict:
         """
         Get checkpoint status for a video
@@ -374,18 +737,8 @@ class KaggleWhisperTranscriber:
             output_dir=str(self.checkpoint_dir)
         )
 
-        # Remove all checkpoint files
-        checkpoints = list(self.checkpoint_dir.glob(f"{video_name}_checkpoint_*.json"))
-        final_file = self.checkpoint_dir / f"{video_name}_final_transcript.json"
-
-        count = 0
-        for cp_file in checkpoints:
-            cp_file.unlink()
-            count += 1
-
-        if final_file.exists():
-            final_file.unlink()
-            count += 1
+        # Remove delta checkpoints, index and final transcript
+        count = mgr.clear()
 
         logger.info(f"✓ Cleared {count} checkpoint file(s) for {video_name}")
 
@@ -458,6 +811,40 @@ Kaggle Usage:
         help='Device (default: auto)'
     )
 
+    parser.add_argument(
+        '--window-size',
+        type=float,
+        default=DEFAULT_WINDOW_SIZE,
+        help=f'Seconds of audio per committed checkpoint window (default: {DEFAULT_WINDOW_SIZE:.0f})'
+    )
+
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        default=None,
+        metavar='HOURS',
+        help='Stop and keep checkpoints after this many hours '
+             f'(default: {(KAGGLE_SESSION_LIMIT - SESSION_SAFETY_MARGIN) / 3600:.2f}, the Kaggle limit minus a margin)'
+    )
+
+    parser.add_argument(
+        '--decoding',
+        type=str,
+        default=DECODING_ACCURATE,
+        choices=[DECODING_ACCURATE, DECODING_TWO_TIER],
+        help='accurate: beam search for every window; two-tier: greedy pass, '
+             're-decode only unreliable windows (default: accurate)'
+    )
+
+    parser.add_argument(
+        '--backend',
+        type=str,
+        default=BACKEND_OPENAI,
+        choices=BACKENDS,
+        help='Inference backend; int8 and onnx are CPU only and need '
+             'inference_backends.py next to this script (default: openai-whisper)'
+    )
+
     parser.add_argument(
         '--status',
         type=str,
@@ -478,7 +865,11 @@ Kaggle Usage:
     transcriber = KaggleWhisperTranscriber(
         model_name=args.model,
         device=args.device,
-        checkpoint_dir=args.output
+        checkpoint_dir=args.output,
+        window_size=args.window_size,
+        decoding=args.decoding,
+        backend=args.backend,
+        time_budget=args.time_budget * 3600 if args.time_budget is not None else None
     )
 
     # Handle status check
@@ -522,6 +913,9 @@ Kaggle Usage:
         if result.get('from_cache'):
             print("\n💡 Result loaded from cache (already completed)")
 
+        if result['metadata'].get('status') == 'partial':
+            print("\n⏸️  Session time budget reached - re-run same command to resume")
+
         print("=" * 70)
 
     except KeyboardInterrupt:
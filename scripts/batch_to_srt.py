@@ -32,6 +32,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared transcript storage lives in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from segment_table import load_transcript
+
 
 # ======================== SRT CONVERTER ========================
 
@@ -56,8 +60,8 @@ class BatchToSRTConverter:
         if not transcript_path.exists():
             raise FileNotFoundError(f"Transcript not found: {transcript_path}")
 
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            self.transcript = json.load(f)
+        # Timestamps and text only: word arrays are not needed here
+        self.transcript = load_transcript(transcript_path)
 
         logger.info(f"✓ Loaded transcript: {transcript_path.name}")
         logger.info(f"  Segments: {len(self.transcript['segments'])}")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Whisper Inference Backend Benchmark
+===================================
+
+Transcribes the same fixed Thai sample with each inference backend and
+compares speed, memory and output against stock openai-whisper.
+
+Each backend runs in its own fresh process, so model loading and peak RSS
+are measured in isolation (ru_maxrss never goes down within a process).
+
+Metrics:
+- load_seconds: model load (plus one-time ONNX export for the onnx backend)
+- realtime_factor: audio seconds per transcription second (higher is faster)
+- peak_rss_mb: peak resident memory of the backend process
+- word_agreement: word-level similarity to the openai-whisper transcript
+  (difflib ratio over Whisper's word tokens, 1.0 = identical)
+
+Usage:
+    python scripts/benchmark_backends.py sample_th.mp4
+    python scripts/benchmark_backends.py sample_th.mp4 --model medium --start 60 --duration 300
+    python scripts/benchmark_backends.py sample_th.mp4 --backends openai-whisper int8 --output bench.json
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import resource
+import difflib
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+# Shared backend loading lives in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from inference_backends import BACKEND_OPENAI, BACKENDS
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'large-v3'
+DEFAULT_DURATION = 120.0
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of this process (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_backend(sample: str, model_name: str, backend: str, start: float, duration: float) -> Dict[str, Any]:
+    """
+    Load one backend and transcribe the sample (runs in a child process)
+
+    Returns:
+        Timings, peak RSS and the transcript's word tokens
+    """
+    import whisper
+    from inference_backends import load_whisper_model
+    from thai_transcriber import ThaiTranscriber
+
+    audio = whisper.load_audio(sample)
+    sample_rate = whisper.audio.SAMPLE_RATE
+    audio = audio[int(start * sample_rate):int((start + duration) * sample_rate)]
+
+    started = time.time()
+    model = load_whisper_model(model_name, device='cpu', backend=backend)
+    load_seconds = time.time() - started
+
+    started = time.time()
+    result = model.transcribe(audio, **ThaiTranscriber.THAI_SETTINGS)
+    transcribe_seconds = time.time() - started
+
+    audio_seconds = len(audio) / sample_rate
+    words = [
+        word['word'].strip()
+        for segment in result.get('segments', [])
+        for word in segment.get('words') or []
+        if word.get('word', '').strip()
+    ]
+
+    return {
+        'backend': backend,
+        'audio_seconds': audio_seconds,
+        'load_seconds': load_seconds,
+        'transcribe_seconds': transcribe_seconds,
+        'realtime_factor': audio_seconds / transcribe_seconds if transcribe_seconds > 0 else 0.0,
+        'peak_rss_mb': _peak_rss_mb(),
+        'words': words,
+        'text': result.get('text', '').strip()
+    }
+
+
+def word_agreement(reference: List[str], hypothesis: List[str]) -> float:
+    """Word-level similarity of two transcripts (1.0 = identical word sequence)"""
+    if not reference and not hypothesis:
+        return 1.0
+    return difflib.SequenceMatcher(None, reference, hypothesis, autojunk=False).ratio()
+
+
+def run_benchmark(
+    sample: str,
+    model_name: str,
+    backends: List[str],
+    start: float = 0.0,
+    duration: float = DEFAULT_DURATION
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark each backend in a fresh process
+
+    Args:
+        sample: Audio/video file (Thai speech)
+        model_name: Whisper model
+        backends: Backends to compare (openai-whisper is always the reference)
+        start: Sample offset in seconds
+        duration: Sample length in seconds
+
+    Returns:
+        One result dict per backend, reference first
+    """
+    if BACKEND_OPENAI not in backends:
+        backends = [BACKEND_OPENAI] + list(backends)
+    else:
+        backends = [BACKEND_OPENAI] + [b for b in backends if b != BACKEND_OPENAI]
+
+    context = multiprocessing.get_context('spawn')
+    results = []
+
+    for backend in backends:
+        logger.info(f"Benchmarking {backend} ({model_name}, {duration:.0f}s sample)...")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            try:
+                result = executor.submit(_run_backend, sample, model_name, backend, start, duration).result()
+            except Exception as e:
+                logger.error(f"  {backend} failed: {e}")
+                results.append({'backend': backend, 'error': str(e)})
+                continue
+
+        logger.info(
+            f"  {result['realtime_factor']:.2f}x realtime, "
+            f"peak RSS {result['peak_rss_mb']:.0f} MB"
+        )
+        results.append(result)
+
+    reference = results[0].get('words')
+    for result in results:
+        if 'words' in result and reference is not None:
+            result['word_agreement'] = word_agreement(reference, result['words'])
+
+    return results
+
+
+def print_table(results: List[Dict[str, Any]]):
+    """Print the comparison table"""
+    print()
+    print(f"{'Backend':<16} {'Load (s)':>9} {'RTF':>7} {'Peak RSS (MB)':>14} {'Word agreement':>15}")
+    print("-" * 65)
+    for result in results:
+        if 'error' in result:
+            print(f"{result['backend']:<16} failed: {result['error']}")
+            continue
+
+        agreement = result.get('word_agreement')
+        print(
+            f"{result['backend']:<16} {result['load_seconds']:>9.1f} "
+            f"{result['realtime_factor']:>6.2f}x {result['peak_rss_mb']:>14.0f} "
+            f"{(f'{agreement:.1%}' if agreement is not None else 'n/a'):>15}"
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare Whisper inference backends on a fixed Thai sample"
+    )
+    parser.add_argument('sample', type=Path, help='Thai audio/video sample')
+    parser.add_argument('--model', default=DEFAULT_MODEL, help=f'Whisper model (default: {DEFAULT_MODEL})')
+    parser.add_argument(
+        '--backends',
+        nargs='+',
+        default=list(BACKENDS),
+        choices=BACKENDS,
+        help='Backends to compare (default: all)'
+    )
+    parser.add_argument('--start', type=float, default=0.0, help='Sample offset in seconds (default: 0)')
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=DEFAULT_DURATION,
+        help=f'Sample length in seconds (default: {DEFAULT_DURATION:.0f})'
+    )
+    parser.add_argument('--output', type=Path, help='Write results (including transcripts) as JSON')
+
+    args = parser.parse_args()
+
+    if not args.sample.exists():
+        logger.error(f"Sample not found: {args.sample}")
+        sys.exit(1)
+
+    results = run_benchmark(str(args.sample), args.model, args.backends, args.start, args.duration)
+    print_table(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'sample': str(args.sample),
+                    'model': args.model,
+                    'start': args.start,
+                    'duration': args.duration,
+                    'results': results
+                },
+                f,
+                ensure_ascii=False,
+                indent=2
+            )
+        logger.info(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
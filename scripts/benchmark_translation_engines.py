@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Translation Engine Benchmark
+============================
+
+Translates the same synthetic transcript with each translation engine
+(Config.processing.translation_engine) against the local stand-in
+chat-completions server (fake_openai_server.py), at the same concurrency,
+and compares throughput.
+
+The endpoint answers most requests after about --latency seconds and a
+--tail-fraction of them after --tail-latency seconds. Each request's
+latency is derived from its prompt, so both engines see exactly the same
+slow requests. With the batch engine every slow request stalls its whole
+batch; the async engine keeps the other slots busy.
+
+Metrics:
+- wall_seconds: time to translate all segments
+- segments_per_second: throughput (higher is better)
+- mean_in_flight: average concurrent requests at the endpoint
+- peak_in_flight: most concurrent requests at the endpoint
+- fallbacks: segments that timed out or failed and were dictionary-translated
+
+Usage:
+    python scripts/benchmark_translation_engines.py
+    python scripts/benchmark_translation_engines.py --segments 400 --concurrency 16 --tail-latency 5
+    python scripts/benchmark_translation_engines.py --output engines.json
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Shared translation pipeline lives in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from config import Config, ConfigMode, TranslationEngine
+from context_analyzer import DocumentType
+from translation_pipeline import TranslationCache, TranslationPipeline, TranscriptionSegment
+
+from fake_openai_server import ANSWER_PREFIX, LatencyModel, StandInServer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENTS = 200
+DEFAULT_CONCURRENCY = 8
+DEFAULT_LATENCY = 0.2
+DEFAULT_TAIL_LATENCY = 3.0
+DEFAULT_TAIL_FRACTION = 0.05
+
+SAMPLE_PHRASES = [
+    "วันนี้เราจะมาดูกราฟ EUR/USD กันนะครับ",
+    "แนวรับตรงนี้สำคัญมาก ถ้าหลุดลงไปก็ต้องระวัง",
+    "ตลาดมันเหมือนกับคลื่นทะเล ขึ้นแล้วก็ลง",
+    "เราจะตั้ง stop loss ไว้ใต้แท่งเทียนนี้",
+    "ถ้าราคาทะลุแนวต้าน เราก็เข้า buy ได้เลย",
+    "อย่าลืมบริหารความเสี่ยงทุกครั้งนะครับ",
+]
+
+
+# ======================== BENCHMARK ========================
+
+def make_segments(count: int) -> List[TranscriptionSegment]:
+    """Synthetic Thai transcript; every text is unique so nothing is cached"""
+    return [
+        TranscriptionSegment(
+            id=i + 1,
+            start_time=i * 3.0,
+            end_time=i * 3.0 + 2.8,
+            text=f"{SAMPLE_PHRASES[i % len(SAMPLE_PHRASES)]} (ตอนที่ {i + 1})",
+            confidence=0.9
+        )
+        for i in range(count)
+    ]
+
+
+def run_engine(
+    engine: TranslationEngine,
+    endpoint: StandInServer,
+    segments: List[TranscriptionSegment],
+    concurrency: int,
+    timeout: float
+) -> Dict[str, Any]:
+    """
+    Translate the segments with one engine
+
+    Only the translation stage is timed; context analysis and
+    post-processing are the same for every engine.
+    """
+    config = Config(mode=ConfigMode.PRODUCTION)
+    config.processing.translation_engine = engine
+    config.processing.max_in_flight = concurrency
+    config.processing.batch_size = concurrency
+    config.processing.max_workers = concurrency
+    config.processing.request_timeout = timeout
+
+    with tempfile.TemporaryDirectory(prefix="bench_cache_") as cache_dir:
+        pipeline = TranslationPipeline(config=config, cache=TranslationCache(Path(cache_dir)))
+        document_context = pipeline.context_analyzer.analyze_document(
+            " ".join(seg.text for seg in segments),
+            DocumentType.TUTORIAL
+        )
+
+        endpoint.reset()
+        started = time.time()
+        results = pipeline._translate_segments_with_context(segments, document_context)
+        wall_seconds = time.time() - started
+        pipeline.executor.shutdown(wait=False)
+
+    return {
+        'engine': engine.value,
+        'segments': len(segments),
+        'translated': len(results),
+        'fallbacks': sum(1 for r in results if not r.translated_text.startswith(ANSWER_PREFIX)),
+        'requests': endpoint.requests,
+        'wall_seconds': wall_seconds,
+        'segments_per_second': len(results) / wall_seconds if wall_seconds > 0 else 0.0,
+        'mean_in_flight': endpoint.busy_seconds / wall_seconds if wall_seconds > 0 else 0.0,
+        'peak_in_flight': endpoint.peak_in_flight
+    }
+
+
+def print_table(results: List[Dict[str, Any]]):
+    """Print the comparison table"""
+    baseline = results[0]['segments_per_second']
+    print()
+    print(f"{'Engine':<8} {'Wall (s)':>9} {'Seg/s':>8} {'Speedup':>8} {'Mean/peak in flight':>20} {'Fallbacks':>10}")
+    print("-" * 68)
+    for result in results:
+        speedup = result['segments_per_second'] / baseline if baseline > 0 else 0.0
+        in_flight = f"{result['mean_in_flight']:.1f} / {result['peak_in_flight']}"
+        print(
+            f"{result['engine']:<8} {result['wall_seconds']:>9.1f} {result['segments_per_second']:>8.1f} "
+            f"{speedup:>7.2f}x {in_flight:>20} {result['fallbacks']:>10}"
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare translation engines against a local endpoint with long-tail latency"
+    )
+    parser.add_argument('--segments', type=int, default=DEFAULT_SEGMENTS,
+                        help=f'Segments to translate (default: {DEFAULT_SEGMENTS})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Batch size / requests in flight for every engine (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY,
+                        help=f'Typical request latency in seconds (default: {DEFAULT_LATENCY})')
+    parser.add_argument('--tail-latency', type=float, default=DEFAULT_TAIL_LATENCY,
+                        help=f'Latency of slow requests in seconds (default: {DEFAULT_TAIL_LATENCY})')
+    parser.add_argument('--tail-fraction', type=float, default=DEFAULT_TAIL_FRACTION,
+                        help=f'Share of slow requests (default: {DEFAULT_TAIL_FRACTION})')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help='Per-request timeout of the async engine in seconds (default: 30)')
+    parser.add_argument('--seed', type=int, default=0, help='Latency seed (default: 0)')
+    parser.add_argument('--output', type=Path, help='Write results as JSON')
+
+    args = parser.parse_args()
+
+    endpoint = StandInServer(
+        latency=LatencyModel('tail', (args.latency, args.tail_latency, args.tail_fraction)),
+        seed=args.seed
+    )
+    endpoint.start()
+
+    # The pipeline's OpenAI clients pick these up
+    os.environ['OPENAI_API_KEY'] = 'sk-benchmark'
+    os.environ['OPENAI_BASE_URL'] = endpoint.base_url
+
+    segments = make_segments(args.segments)
+    results = []
+
+    try:
+        for engine in (TranslationEngine.BATCH, TranslationEngine.ASYNC):
+            logger.info(
+                f"Benchmarking {engine.value} engine ({args.segments} segments, "
+                f"concurrency {args.concurrency})..."
+            )
+            result = run_engine(engine, endpoint, segments, args.concurrency, args.timeout)
+            logger.info(f"  {result['segments_per_second']:.1f} segments/s")
+            results.append(result)
+    finally:
+        endpoint.stop()
+
+    print_table(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'segments': args.segments,
+                    'concurrency': args.concurrency,
+                    'latency': args.latency,
+                    'tail_latency': args.tail_latency,
+                    'tail_fraction': args.tail_fraction,
+                    'results': results
+                },
+                f,
+                indent=2
+            )
+        logger.info(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Translation Load Benchmark
+==========================
+
+Runs TranslationPipeline.process_transcript on real transcripts from
+workflow/ against the local stand-in chat-completions server
+(fake_openai_server.py), with realistic latency, injected 429/5xx errors
+and provider rate limits, and reports how the pipeline holds up. Nothing
+is sent to OpenAI (unless --record is given).
+
+Transcripts (any mix):
+- workflow/01_transcripts/*.json   Whisper/transcriber JSON ('segments' with start/end/text)
+- workflow/02_for_translation/*_batch.txt      translation batches ([001] (MM:SS → MM:SS) / THAI: ...)
+- *_template.txt                   translation templates (# Thai: ... / [001]); timing is synthetic
+Default: every JSON transcript and batch file under workflow/.
+
+Each transcript gets a fresh translation cache and rate limiter state, so
+every segment goes to the server.
+
+Metrics per transcript:
+- wall_seconds, segments_per_second: whole process_transcript (both passes)
+- p50/p95/p99: per-segment translation latency (TranslationResult.processing_time)
+- requests, throttled (429), server_errors (5xx): as seen by the server
+- retries: attempts repeated by the pipeline's rate limiter
+- fallbacks: segments that ended up dictionary-translated
+- prompt/completion tokens: server-side token accounting
+
+Usage:
+    python scripts/benchmark_translation_load.py
+    python scripts/benchmark_translation_load.py workflow/02_for_translation/ep-01-19-12-24_batch.txt --limit 100
+    python scripts/benchmark_translation_load.py --latency lognormal:0.8,0.6 --rate-429 0.05 --rate-5xx 0.01
+    python scripts/benchmark_translation_load.py --rpm 500 --tpm 80000 --pack-tokens 400 --output load.json
+    python scripts/benchmark_translation_load.py --replay calls.jsonl --time-scale 0
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+import tempfile
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Shared translation pipeline lives in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from config import Config, ConfigMode, TranslationEngine
+from context_analyzer import DocumentType
+from translation_pipeline import TranslationCache, TranslationPipeline, TranscriptionSegment
+
+from fake_openai_server import StandInServer, add_server_arguments, server_from_arguments
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+WORKFLOW_DIR = Path(__file__).resolve().parent.parent / 'workflow'
+
+# Segment length assumed for templates, which carry no timing
+TEMPLATE_SEGMENT_SECONDS = 3.0
+
+BATCH_SEGMENT = re.compile(
+    r'^\[(\d+)\] \((\d+):(\d+) → (\d+):(\d+)\)\s*\nTHAI: (.*)$',
+    re.MULTILINE
+)
+TEMPLATE_SEGMENT = re.compile(r'^# Thai: (.*)\n\[(\d+)\]', re.MULTILINE)
+
+
+# ======================== TRANSCRIPTS ========================
+
+def load_segments(path: Path) -> List[TranscriptionSegment]:
+    """
+    Thai segments of a transcript JSON, translation batch or template
+
+    Args:
+        path: Transcript file (format by suffix/name, see module docstring)
+
+    Returns:
+        Segments numbered from 1
+    """
+    if path.suffix == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return [
+            TranscriptionSegment(
+                id=i + 1,
+                start_time=float(seg['start']),
+                end_time=float(seg['end']),
+                text=seg['text'].strip(),
+                confidence=float(seg.get('confidence', 0.0))
+            )
+            for i, seg in enumerate(data['segments'])
+            if seg.get('text', '').strip()
+        ]
+
+    text = path.read_text(encoding='utf-8')
+
+    if path.stem.endswith('_template'):
+        return [
+            TranscriptionSegment(
+                id=i + 1,
+                start_time=i * TEMPLATE_SEGMENT_SECONDS,
+                end_time=(i + 1) * TEMPLATE_SEGMENT_SECONDS,
+                text=thai.strip()
+            )
+            for i, (thai, _) in enumerate(TEMPLATE_SEGMENT.findall(text))
+            if thai.strip()
+        ]
+
+    return [
+        TranscriptionSegment(
+            id=i + 1,
+            start_time=int(m1) * 60 + int(s1),
+            end_time=int(m2) * 60 + int(s2),
+            text=thai.strip()
+        )
+        for i, (_, m1, s1, m2, s2, thai) in enumerate(BATCH_SEGMENT.findall(text))
+        if thai.strip()
+    ]
+
+
+def default_transcripts() -> List[Path]:
+    """Every JSON transcript and translation batch under workflow/"""
+    return sorted(WORKFLOW_DIR.glob('01_transcripts/*.json')) + sorted(WORKFLOW_DIR.glob('02_for_translation/*_batch.txt'))
+
+
+# ======================== SERVER ========================
+
+class RemoteServer:
+    """Counters of a stand-in server running elsewhere (--base-url)"""
+
+    def __init__(self, base_url: str):
+        self.root = re.sub(r'/v1/?$', '', base_url.rstrip('/'))
+
+    def _call(self, method: str, path: str) -> Dict[str, Any]:
+        request = urllib.request.Request(f"{self.root}{path}", data=b'{}' if method == 'POST' else None, method=method)
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def reset(self):
+        self._call('POST', '/stats/reset')
+
+    def stats(self) -> Dict[str, Any]:
+        return self._call('GET', '/stats')
+
+
+# ======================== BENCHMARK ========================
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0.0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def run_transcript(
+    name: str,
+    segments: List[TranscriptionSegment],
+    server,
+    args: argparse.Namespace
+) -> Tuple[Dict[str, Any], List[float]]:
+    """
+    Translate one transcript end to end
+
+    Args:
+        server: StandInServer or RemoteServer (counters are reset first)
+
+    Returns:
+        Tuple of (metrics, per-segment latencies)
+    """
+    config = Config(mode=ConfigMode.PRODUCTION)
+    config.processing.translation_engine = args.engine
+    config.processing.max_in_flight = args.concurrency
+    config.processing.max_workers = args.concurrency
+    config.processing.batch_size = args.concurrency
+    config.processing.request_timeout = args.timeout
+    config.processing.pack_tokens = args.pack_tokens
+    config.rate_limit.requests_per_minute = args.rpm if args.limiter_rpm is None else args.limiter_rpm
+    config.rate_limit.tokens_per_minute = args.tpm if args.limiter_tpm is None else args.limiter_tpm
+
+    with tempfile.TemporaryDirectory(prefix="bench_load_") as work_dir:
+        config.rate_limit.state_dir = Path(work_dir) / 'rate_limits'
+        pipeline = TranslationPipeline(config=config, cache=TranslationCache(Path(work_dir) / 'cache'))
+
+        server.reset()
+        started = time.time()
+        results, stats = pipeline.process_transcript(segments, DocumentType.TUTORIAL)
+        wall_seconds = time.time() - started
+        pipeline.executor.shutdown(wait=False)
+
+    served = server.stats()
+    latencies = [r.processing_time for r in results if not r.cached]
+    limiter = pipeline.rate_limiter.stats()
+
+    return {
+        'transcript': name,
+        'segments': len(segments),
+        'translated': len(results),
+        'wall_seconds': wall_seconds,
+        'segments_per_second': len(results) / wall_seconds if wall_seconds > 0 else 0.0,
+        'latency_p50': percentile(latencies, 50),
+        'latency_p95': percentile(latencies, 95),
+        'latency_p99': percentile(latencies, 99),
+        'requests': served['requests'],
+        'throttled': served['statuses'].get('429', 0),
+        'server_errors': sum(count for status, count in served['statuses'].items() if status.startswith('5')),
+        'retries': limiter['retries'],
+        'limiter_wait_seconds': limiter['wait_seconds'],
+        'fallbacks': stats.fallback_segments,
+        'packed_requests': stats.packed_requests,
+        'pack_resplits': stats.pack_resplits,
+        'prompt_tokens': served['prompt_tokens'],
+        'completion_tokens': served['completion_tokens'],
+        'peak_in_flight': served['peak_in_flight']
+    }, latencies
+
+
+def summarize(results: List[Dict[str, Any]], latencies: List[float]) -> Dict[str, Any]:
+    """Totals over all transcripts"""
+    wall_seconds = sum(r['wall_seconds'] for r in results)
+    translated = sum(r['translated'] for r in results)
+    total = {'transcript': 'TOTAL'}
+    for key in ('segments', 'translated', 'requests', 'throttled', 'server_errors', 'retries',
+                'fallbacks', 'packed_requests', 'pack_resplits', 'prompt_tokens', 'completion_tokens'):
+        total[key] = sum(r[key] for r in results)
+    total.update({
+        'wall_seconds': wall_seconds,
+        'segments_per_second': translated / wall_seconds if wall_seconds > 0 else 0.0,
+        'latency_p50': percentile(latencies, 50),
+        'latency_p95': percentile(latencies, 95),
+        'latency_p99': percentile(latencies, 99),
+        'limiter_wait_seconds': sum(r['limiter_wait_seconds'] for r in results),
+        'peak_in_flight': max((r['peak_in_flight'] for r in results), default=0)
+    })
+    return total
+
+
+def print_table(rows: List[Dict[str, Any]]):
+    """Print the results table"""
+    print()
+    print(
+        f"{'Transcript':<28} {'Segs':>5} {'Wall (s)':>9} {'Seg/s':>7} {'p50':>6} {'p95':>6} {'p99':>6} "
+        f"{'Reqs':>6} {'429':>5} {'5xx':>4} {'Retry':>6} {'Fallbk':>6}"
+    )
+    print("-" * 108)
+    for row in rows:
+        print(
+            f"{row['transcript'][:28]:<28} {row['translated']:>5} {row['wall_seconds']:>9.1f} "
+            f"{row['segments_per_second']:>7.1f} {row['latency_p50']:>6.2f} {row['latency_p95']:>6.2f} "
+            f"{row['latency_p99']:>6.2f} {row['requests']:>6} {row['throttled']:>5} {row['server_errors']:>4} "
+            f"{row['retries']:>6} {row['fallbacks']:>6}"
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load-test the translation pipeline on workflow/ transcripts against a local stand-in server"
+    )
+    parser.add_argument('transcripts', nargs='*', type=Path,
+                        help='Transcript JSON, *_batch.txt or *_template.txt files (default: all under workflow/)')
+    parser.add_argument('--limit', type=int, help='Translate at most this many segments per transcript')
+    parser.add_argument('--engine', type=TranslationEngine, default=TranslationEngine.ASYNC,
+                        choices=list(TranslationEngine), help='Translation engine (default: async)')
+    parser.add_argument('--concurrency', type=int, default=16,
+                        help='Requests in flight / batch size (default: 16)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds (default: 30)')
+    parser.add_argument('--pack-tokens', type=int, default=0,
+                        help='Packed requests up to this many tokens (default: 0 = one request per segment)')
+    parser.add_argument('--limiter-rpm', type=int,
+                        help="Pipeline's RPM budget (default: the server's --rpm)")
+    parser.add_argument('--limiter-tpm', type=int,
+                        help="Pipeline's TPM budget (default: the server's --tpm)")
+    parser.add_argument('--base-url',
+                        help='Use an already running stand-in server instead of starting one')
+    parser.add_argument('--output', type=Path, help='Write results as JSON')
+    add_server_arguments(parser)
+
+    args = parser.parse_args()
+
+    paths = args.transcripts or default_transcripts()
+    if not paths:
+        parser.error(f"No transcripts found under {WORKFLOW_DIR}")
+
+    server: Optional[StandInServer] = None
+    if args.base_url:
+        base_url = args.base_url
+    else:
+        try:
+            server = server_from_arguments(args)
+        except ValueError as e:
+            parser.error(str(e))
+        server.start()
+        base_url = server.base_url
+
+    # The pipeline's OpenAI clients pick these up
+    os.environ.setdefault('OPENAI_API_KEY', 'sk-benchmark')
+    os.environ['OPENAI_BASE_URL'] = base_url
+
+    results = []
+    latencies: List[float] = []
+    try:
+        for path in paths:
+            segments = load_segments(path)[:args.limit]
+            if not segments:
+                logger.warning(f"No segments in {path}, skipping")
+                continue
+
+            logger.info(f"Benchmarking {path.name} ({len(segments)} segments, {args.engine.value} engine)...")
+            result, segment_latencies = run_transcript(path.stem, segments, server or RemoteServer(base_url), args)
+            logger.info(
+                f"  {result['segments_per_second']:.1f} segments/s, p95 {result['latency_p95']:.2f}s, "
+                f"{result['retries']} retries, {result['fallbacks']} fallbacks"
+            )
+            results.append(result)
+            latencies.extend(segment_latencies)
+    finally:
+        if server:
+            server.stop()
+
+    if not results:
+        return
+
+    rows = results + [summarize(results, latencies)] if len(results) > 1 else results
+    print_table(rows)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'engine': args.engine.value,
+                    'concurrency': args.concurrency,
+                    'pack_tokens': args.pack_tokens,
+                    'latency': str(args.latency),
+                    'rate_429': args.rate_429,
+                    'rate_5xx': args.rate_5xx,
+                    'rpm': args.rpm,
+                    'tpm': args.tpm,
+                    'results': rows
+                },
+                f,
+                indent=2
+            )
+        logger.info(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+OpenAI Stand-In Server
+======================
+
+Local HTTP server that speaks the chat-completions API, so the translation
+pipeline can be exercised offline under realistic latency, errors and rate
+limits without spending money. Point the pipeline at it with
+OPENAI_BASE_URL.
+
+Modes:
+- synthetic (default): placeholder English answers, sized like real ones;
+  packed requests (numbered lines) get numbered lines back
+- record (--record CASSETTE --upstream URL): forward every request to a real
+  endpoint and append request, response and latency to a JSONL cassette
+- replay (--replay CASSETTE): answer from a cassette with the recorded
+  latency; misses get a synthetic answer (or 404 with --strict-replay)
+
+Latency (--latency), fixed per prompt so runs are comparable:
+- fixed:S                    always S seconds
+- uniform:LOW,HIGH           uniform between LOW and HIGH
+- lognormal:MEDIAN,SIGMA     long right tail, like real APIs
+- tail:S,TAIL,FRACTION       S * U(0.5, 1.5), or TAIL for a FRACTION of prompts
+plus --per-token seconds per completion token.
+
+Failure injection:
+- --rate-429 / --rate-5xx: share of requests answered 429 (with Retry-After) or 500/503
+- --rpm / --tpm: provider-style token buckets; requests over budget get 429
+  with Retry-After and x-ratelimit-* headers. TPM counts prompt + max_tokens.
+- --malformed-rate: share of packed replies that lose their last line
+
+Endpoints:
+- POST /v1/chat/completions
+- GET  /v1/models
+- GET  /stats        request, status and token counters
+- POST /stats/reset  clear the counters
+
+Usage:
+    python scripts/fake_openai_server.py --port 8089 --latency lognormal:0.6,0.5 --rate-429 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=sk-local python src/orchestrator.py video.mp4
+    python scripts/fake_openai_server.py --record calls.jsonl --upstream https://api.openai.com/v1
+    python scripts/fake_openai_server.py --replay calls.jsonl --time-scale 0.5
+"""
+
+import re
+import sys
+import json
+import math
+import time
+import random
+import hashlib
+import logging
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8089
+
+# Prefix of every synthetic answer
+ANSWER_PREFIX = "Benchmark translation"
+
+MODELS = ['gpt-3.5-turbo', 'gpt-4', 'gpt-4o', 'gpt-4o-mini']
+
+FILLER_WORDS = [
+    "the", "price", "chart", "support", "resistance", "trend", "candle", "we",
+    "will", "look", "at", "this", "level", "market", "buy", "sell", "risk", "then"
+]
+
+# Numbered input lines of a packed request ("[3] text")
+PACKED_LINE = re.compile(r'^\[(\d+)\] (.*)$', re.MULTILINE)
+# Quoted segment text of a single-segment request
+SINGLE_TEXT = re.compile(r'THAI TEXT:\s*"(.*?)"\s*(?:\n|$)', re.DOTALL)
+
+
+def count_tokens(text: str) -> int:
+    """Approximate cl100k token count: ~4 ASCII characters or ~1.2 Thai characters per token"""
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.2)
+
+
+def prompt_tokens(body: Dict[str, Any]) -> int:
+    """Prompt tokens of a chat request (with OpenAI's per-message overhead)"""
+    return sum(count_tokens(str(m.get('content', ''))) + 4 for m in body.get('messages', [])) + 3
+
+
+def request_key(body: Dict[str, Any]) -> str:
+    """Cassette key: hash of everything that determines the answer"""
+    relevant = {k: body.get(k) for k in ('model', 'messages', 'temperature', 'max_tokens', 'top_p')}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+# ======================== LATENCY ========================
+
+@dataclass
+class LatencyModel:
+    """Request latency distribution"""
+    kind: str = 'fixed'
+    params: Tuple[float, ...] = (0.2,)
+
+    KINDS = {'fixed': 1, 'uniform': 2, 'lognormal': 2, 'tail': 3}
+
+    @classmethod
+    def parse(cls, spec: str) -> 'LatencyModel':
+        """Parse 'kind:p1,p2,...' (see module docstring)"""
+        kind, _, values = spec.partition(':')
+        if kind not in cls.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}' (use {', '.join(cls.KINDS)})")
+        params = tuple(float(v) for v in values.split(',') if v)
+        if len(params) != cls.KINDS[kind]:
+            raise ValueError(f"Latency '{kind}' takes {cls.KINDS[kind]} parameter(s), got '{spec}'")
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds"""
+        if self.kind == 'fixed':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'lognormal':
+            median, sigma = self.params
+            return median * math.exp(rng.gauss(0.0, sigma))
+        base, tail, fraction = self.params
+        if rng.random() < fraction:
+            return tail
+        return base * (0.5 + rng.random())
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{','.join(f'{p:g}' for p in self.params)}"
+
+
+# ======================== CASSETTE ========================
+
+class Cassette:
+    """Recorded chat completions in a JSONL file, keyed by request_key()"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.records: Dict[str, Dict[str, Any]] = {}
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.records[record['key']] = record
+            logger.info(f"Loaded {len(self.records)} recorded responses from {self.path}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.records.get(key)
+
+    def add(self, key: str, body: Dict[str, Any], response: Dict[str, Any], latency: float):
+        """Record a response (appended right away, so a crash keeps earlier records)"""
+        record = {'key': key, 'request': body, 'response': response, 'latency': latency}
+        with self.lock:
+            self.records[key] = record
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+# ======================== SERVER ========================
+
+class StandInServer:
+    """Local /v1/chat/completions endpoint with configurable behavior"""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        per_token: float = 0.0,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        retry_after: float = 1.0,
+        rpm: int = 0,
+        tpm: int = 0,
+        malformed_rate: float = 0.0,
+        seed: int = 0,
+        time_scale: float = 1.0,
+        record: Optional[Path] = None,
+        upstream: Optional[str] = None,
+        replay: Optional[Path] = None,
+        strict_replay: bool = False,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        """
+        Initialize server (call start() to serve)
+
+        Args:
+            latency: Latency distribution (default: fixed 0.2s)
+            per_token: Extra seconds per completion token
+            rate_429: Share of requests answered 429
+            rate_5xx: Share of requests answered 500/503
+            retry_after: Retry-After of injected 429s in seconds
+            rpm: Requests per minute per model (0 = unlimited)
+            tpm: Tokens per minute per model (0 = unlimited)
+            malformed_rate: Share of packed replies missing their last line
+            seed: Seed of latencies and injected failures
+            time_scale: Multiplier of every simulated delay (0 = instant)
+            record: Cassette to record to (requires upstream)
+            upstream: Real endpoint base URL for recording
+            replay: Cassette to answer from
+            strict_replay: Answer replay misses with 404 instead of a synthetic answer
+            host: Bind address
+            port: Port (0 = any free port)
+        """
+        if record and not upstream:
+            raise ValueError("Recording needs an upstream endpoint")
+
+        self.latency = latency or LatencyModel()
+        self.per_token = per_token
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after
+        self.rpm = rpm
+        self.tpm = tpm
+        self.malformed_rate = malformed_rate
+        self.seed = seed
+        self.time_scale = time_scale
+        self.upstream = upstream.rstrip('/') if upstream else None
+        self.recorder = Cassette(record) if record else None
+        self.cassette = Cassette(replay) if replay else None
+        self.strict_replay = strict_replay
+
+        self.lock = threading.Lock()
+        self.rng = random.Random(seed)
+        self.buckets: Dict[str, Dict[str, float]] = {}
+        self.in_flight = 0
+        self.reset()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.rstrip('/') == '/stats':
+                    self._send(200, server.stats())
+                elif self.path.rstrip('/').endswith('/models'):
+                    self._send(200, {'object': 'list', 'data': [{'id': m, 'object': 'model'} for m in MODELS]})
+                else:
+                    self._send(404, _error(f"Unknown path {self.path}", 'invalid_request_error'))
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                if self.path.rstrip('/') == '/stats/reset':
+                    server.reset()
+                    self._send(200, server.stats())
+                elif self.path.rstrip('/').endswith('/chat/completions'):
+                    self._send(*server.handle(body, self.headers.get('Authorization')))
+                else:
+                    self._send(404, _error(f"Unknown path {self.path}", 'invalid_request_error'))
+
+            def _send(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="stand-in-server", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset(self):
+        """Clear the counters"""
+        with self.lock:
+            self.requests = 0
+            self.statuses = Counter()
+            self.injected = 0
+            self.rate_limited = 0
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+            self.peak_in_flight = 0
+            self.busy_seconds = 0.0
+            self.replay_hits = 0
+            self.replay_misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters since start or the last reset"""
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+                'injected_errors': self.injected,
+                'rate_limited': self.rate_limited,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'peak_in_flight': self.peak_in_flight,
+                'busy_seconds': self.busy_seconds,
+                'replay_hits': self.replay_hits,
+                'replay_misses': self.replay_misses
+            }
+
+    # ------------------------------------------------------------------ requests
+
+    def handle(self, body: Dict[str, Any], authorization: Optional[str]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Answer one chat completion request: (status, payload, headers)"""
+        with self.lock:
+            self.requests += 1
+
+        if body.get('stream'):
+            return self._finish(400, _error("Streaming is not supported by the stand-in server", 'invalid_request_error'))
+
+        model = body.get('model', 'gpt-3.5-turbo')
+        tokens = prompt_tokens(body)
+
+        limited = self._take_budget(model, tokens + int(body.get('max_tokens') or 0))
+        if limited:
+            return limited
+
+        with self.lock:
+            roll = self.rng.random()
+        if roll < self.rate_429:
+            with self.lock:
+                self.injected += 1
+            return self._finish(
+                429,
+                _error("Rate limit reached (injected)", 'requests', 'rate_limit_exceeded'),
+                {'Retry-After': f"{self.retry_after:g}"}
+            )
+        if roll < self.rate_429 + self.rate_5xx:
+            with self.lock:
+                self.injected += 1
+            status = 503 if roll < self.rate_429 + self.rate_5xx / 2 else 500
+            return self._finish(status, _error("The server had an error (injected)", 'server_error'))
+
+        if self.recorder:
+            return self._forward(body, authorization)
+
+        if self.cassette:
+            record = self.cassette.get(request_key(body))
+            if record:
+                with self.lock:
+                    self.replay_hits += 1
+                usage = record['response'].get('usage', {})
+                return self._respond(record['response'], record['latency'], usage)
+            with self.lock:
+                self.replay_misses += 1
+            if self.strict_replay:
+                return self._finish(404, _error("Request not in the cassette", 'invalid_request_error'))
+
+        return self._synthetic(body, tokens)
+
+    def _take_budget(self, model: str, tokens: int) -> Optional[Tuple[int, Dict[str, Any], Dict[str, str]]]:
+        """Provider-style RPM/TPM buckets; a 429 response if the request is over budget"""
+        if not self.rpm and not self.tpm:
+            return None
+
+        with self.lock:
+            now = time.time()
+            bucket = self.buckets.setdefault(model, {'requests': float(self.rpm), 'tokens': float(self.tpm), 'updated': now})
+            elapsed = now - bucket['updated']
+            bucket['updated'] = now
+            if self.rpm:
+                bucket['requests'] = min(float(self.rpm), bucket['requests'] + elapsed * self.rpm / 60.0)
+            if self.tpm:
+                bucket['tokens'] = min(float(self.tpm), bucket['tokens'] + elapsed * self.tpm / 60.0)
+
+            waits = []
+            if self.rpm and bucket['requests'] < 1.0:
+                waits.append(('requests', (1.0 - bucket['requests']) * 60.0 / self.rpm))
+            if self.tpm and bucket['tokens'] < min(tokens, self.tpm):
+                waits.append(('tokens', (min(tokens, self.tpm) - bucket['tokens']) * 60.0 / self.tpm))
+
+            headers = {}
+            if self.rpm:
+                headers['x-ratelimit-limit-requests'] = str(self.rpm)
+                headers['x-ratelimit-remaining-requests'] = str(max(0, int(bucket['requests'])))
+            if self.tpm:
+                headers['x-ratelimit-limit-tokens'] = str(self.tpm)
+                headers['x-ratelimit-remaining-tokens'] = str(max(0, int(bucket['tokens'])))
+
+            if not waits:
+                if self.rpm:
+                    bucket['requests'] -= 1.0
+                if self.tpm:
+                    bucket['tokens'] -= min(tokens, self.tpm)
+                return None
+
+            self.rate_limited += 1
+
+        kind, wait = max(waits, key=lambda w: w[1])
+        headers['Retry-After'] = f"{wait:.2f}"
+        headers['retry-after-ms'] = str(int(wait * 1000))
+        return self._finish(
+            429,
+            _error(f"Rate limit reached for {model} on {kind} per min", kind, 'rate_limit_exceeded'),
+            headers
+        )
+
+    def _synthetic(self, body: Dict[str, Any], tokens: int) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Placeholder answer with latency fixed by the prompt"""
+        prompt = str(body.get('messages', [{}])[-1].get('content', ''))
+        rng = random.Random(hashlib.sha256(f"{self.seed}:{prompt}".encode('utf-8')).digest())
+        latency = self.latency.sample(rng)
+
+        lines = PACKED_LINE.findall(prompt)
+        if lines:
+            answers = [f"[{number}] {_filler(text, rng)}" for number, text in lines]
+            if len(answers) > 1 and rng.random() < self.malformed_rate:
+                answers.pop()
+            content = "\n".join(answers)
+        else:
+            match = SINGLE_TEXT.search(prompt)
+            content = _filler(match.group(1) if match else prompt[-200:], rng)
+
+        completion = count_tokens(content)
+        latency += self.per_token * completion
+
+        response = {
+            'id': f"chatcmpl-standin-{self.requests}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'gpt-3.5-turbo'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop'
+            }],
+            'usage': {'prompt_tokens': tokens, 'completion_tokens': completion, 'total_tokens': tokens + completion}
+        }
+        return self._respond(response, latency, response['usage'])
+
+    def _forward(self, body: Dict[str, Any], authorization: Optional[str]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Record mode: pass the request to the upstream endpoint"""
+        request = urllib.request.Request(
+            f"{self.upstream}/chat/completions",
+            data=json.dumps(body).encode('utf-8'),
+            headers={'Content-Type': 'application/json', 'Authorization': authorization or ''}
+        )
+
+        started = time.monotonic()
+        try:
+            with urllib.request.urlopen(request, timeout=300) as upstream:
+                response = json.loads(upstream.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            payload = json.loads(e.read().decode('utf-8') or '{}')
+            retry_after = e.headers.get('Retry-After')
+            return self._finish(e.code, payload, {'Retry-After': retry_after} if retry_after else None)
+        except (OSError, ValueError) as e:
+            return self._finish(502, _error(f"Upstream unreachable: {e}", 'server_error'))
+
+        latency = time.monotonic() - started
+        self.recorder.add(request_key(body), body, response, latency)
+        with self.lock:
+            self.busy_seconds += latency
+        return self._finish(200, response, usage=response.get('usage', {}))
+
+    def _respond(self, response: Dict[str, Any], latency: float, usage: Dict[str, int]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Hold the request for its latency, then answer 200"""
+        delay = max(0.0, latency) * self.time_scale
+
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(delay)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                self.busy_seconds += delay
+
+        return self._finish(200, response, usage=usage)
+
+    def _finish(
+        self,
+        status: int,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        usage: Optional[Dict[str, int]] = None
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        with self.lock:
+            self.statuses[status] += 1
+            if usage:
+                self.prompt_tokens += usage.get('prompt_tokens', 0)
+                self.completion_tokens += usage.get('completion_tokens', 0)
+        return status, payload, headers or {}
+
+
+def _error(message: str, kind: str, code: Optional[str] = None) -> Dict[str, Any]:
+    """OpenAI-style error body"""
+    return {'error': {'message': message, 'type': kind, 'param': None, 'code': code}}
+
+
+def _filler(thai: str, rng: random.Random) -> str:
+    """Placeholder English about as long as a real translation of the Thai text"""
+    words = [rng.choice(FILLER_WORDS) for _ in range(max(3, len(thai) // 6))]
+    return f"{ANSWER_PREFIX}: {' '.join(words)}."
+
+
+# ======================== CLI ========================
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """Server options, shared with the benchmarks that embed the server"""
+    parser.add_argument('--latency', type=LatencyModel.parse, default=LatencyModel.parse('lognormal:0.5,0.5'),
+                        help='Latency distribution, e.g. fixed:0.2, uniform:0.1,0.5, lognormal:0.5,0.5, '
+                             'tail:0.2,3,0.05 (default: lognormal:0.5,0.5)')
+    parser.add_argument('--per-token', type=float, default=0.0,
+                        help='Extra seconds per completion token (default: 0)')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Share of requests answered 429 (default: 0)')
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help='Share of requests answered 500/503 (default: 0)')
+    parser.add_argument('--retry-after', type=float, default=1.0,
+                        help='Retry-After of injected 429s in seconds (default: 1)')
+    parser.add_argument('--rpm', type=int, default=0, help='Provider requests per minute per model (default: unlimited)')
+    parser.add_argument('--tpm', type=int, default=0, help='Provider tokens per minute per model (default: unlimited)')
+    parser.add_argument('--malformed-rate', type=float, default=0.0,
+                        help='Share of packed replies missing their last line (default: 0)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of latencies and failures (default: 0)')
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='Multiplier of every simulated delay, 0 = instant (default: 1)')
+    parser.add_argument('--record', type=Path, help='Record upstream responses to this JSONL cassette')
+    parser.add_argument('--upstream', help='Real endpoint for --record (e.g. https://api.openai.com/v1)')
+    parser.add_argument('--replay', type=Path, help='Answer from this JSONL cassette')
+    parser.add_argument('--strict-replay', action='store_true',
+                        help='Answer cassette misses with 404 instead of a synthetic answer')
+
+
+def server_from_arguments(args: argparse.Namespace, port: int = 0) -> StandInServer:
+    """StandInServer configured by add_server_arguments() options"""
+    return StandInServer(
+        latency=args.latency,
+        per_token=args.per_token,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        retry_after=args.retry_after,
+        rpm=args.rpm,
+        tpm=args.tpm,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+        time_scale=args.time_scale,
+        record=args.record,
+        upstream=args.upstream,
+        replay=args.replay,
+        strict_replay=args.strict_replay,
+        port=port
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local OpenAI-compatible chat completions server for offline pipeline runs"
+    )
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        server = server_from_arguments(args, port=args.port)
+    except ValueError as e:
+        parser.error(str(e))
+
+    mode = 'record' if args.record else 'replay' if args.replay else 'synthetic'
+    logger.info(f"Stand-in server ({mode}, latency {args.latency}) at {server.base_url}")
+    logger.info(f"  export OPENAI_BASE_URL={server.base_url} OPENAI_API_KEY=sk-local")
+
+    server.start()
+    try:
+        while server.thread.is_alive():
+            server.thread.join(1.0)
+    except KeyboardInterrupt:
+        logger.info(f"Stopping: {json.dumps(server.stats())}")
+        server.stop()
+        sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -30,7 +30,6 @@ Usage:
       -o merged_transcript.json
 """
 
-import json
 import sys
 import argparse
 import logging
@@ -45,12 +44,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared transcript storage lives in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from segment_table import load_transcript as load_transcript_file, save_transcript
+
 
 def load_transcript(file_path: Path) -> Dict:
     """Load transcript JSON file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_transcript_file(file_path, with_words=True)
 
         logger.info(f"✓ Loaded: {file_path.name}")
         logger.info(f"  Segments: {len(data['segments'])}")
@@ -173,10 +175,8 @@ def merge_transcripts(transcripts: List[Dict]) -> Dict:
 
 def save_merged_json(merged: Dict, output_path: Path):
     """Save merged transcript as JSON"""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(merged, f, ensure_ascii=False, indent=2)
+    # JSON export plus the binary segment table next to it
+    save_transcript(merged, output_path)
 
     logger.info(f"✓ Merged JSON saved: {output_path}")
 
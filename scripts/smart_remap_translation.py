@@ -8,18 +8,20 @@ using text similarity.
 
 from __future__ import annotations
 
-import json
 import re
+import sys
 from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+# Shared transcript storage lives in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+import segment_table
+
 
 def load_transcript(path: Path) -> List[Dict]:
-    """Load transcript JSON file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data['segments']
+    """Load transcript segments (binary segment table when available)."""
+    return segment_table.load_transcript(path)['segments']
 
 
 def parse_old_translation(path: Path) -> List[Dict]:
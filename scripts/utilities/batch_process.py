@@ -5,29 +5,43 @@ Batch Processor - Process multiple videos in parallel/sequence
 Process multiple video files through the translation pipeline with progress tracking.
 
 Features:
-- Sequential or parallel processing
+- Sequential or parallel processing (stage pools: a few Whisper processes,
+  many concurrent translations)
 - Resume from last checkpoint
 - Progress tracking with ETA
 - Cost estimation and limits
 - Detailed batch reports
 - Error recovery
+- Artifact store: videos transcribed before are not transcribed again
+- Pipeline service: jobs go to a warm service instead of loading models
+- Pipelined mode: audio of upcoming videos is decoded while the current one
+  transcribes, and finished transcripts are translated while the next video
+  transcribes (per-stage utilization in the report)
 
 Usage:
     python scripts/batch_process.py input_dir/
-    python scripts/batch_process.py input_dir/ -j 4 --mode production
+    python scripts/batch_process.py input_dir/ --prefetch 3 --translation-workers 4
+    python scripts/batch_process.py input_dir/ -j 2 --translation-workers 24 --mode production
+    python scripts/batch_process.py input_dir/ -j auto
     python scripts/batch_process.py manifest.json --resume
+    python scripts/batch_process.py input_dir/ -j 4 --service .cache/pipeline_service.sock
 """
 
 import os
 import sys
 import json
+import queue
 import logging
 import argparse
+import tempfile
+import threading
+import multiprocessing
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Any, List, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import time
 
 # Setup logging
@@ -43,11 +57,37 @@ try:
     from src.orchestrator import VideoTranslationOrchestrator, OrchestratorResult
     from src.config import ConfigMode
     from src.context_analyzer import DocumentType
+    from src.artifact_store import DEFAULT_STORE_DIR, ArtifactStore
+    from src.audio_ingest import AudioIngest
+    from src.translation_pipeline import TranslationPipeline
+    from src.thai_transcriber import ThaiTranscriber
+    from src.service_client import JOB_COMPLETED, JOB_TRANSLATE, ServiceClient
 except ImportError as e:
     logger.error(f"Failed to import required modules: {e}")
     logger.error("Make sure you're running from project root")
     sys.exit(1)
 
+# Decoded videos waiting for Whisper (bounds the disk used by decoded PCM)
+DEFAULT_PREFETCH = 2
+# Finished transcripts translated at once while the next video transcribes
+DEFAULT_TRANSLATION_WORKERS = 2
+
+# Approximate resident memory of one loaded model (GB), by model family
+MODEL_MEMORY_GB = {
+    'tiny': 1.0,
+    'base': 1.0,
+    'small': 2.0,
+    'medium': 5.0,
+    'large': 10.0,
+    'turbo': 6.0
+}
+# Fewer cores per model and matrix multiplications stop scaling
+MIN_THREADS_PER_MODEL = 4
+
+STAGE_INGEST = 'ingest'
+STAGE_TRANSCRIPTION = 'transcription'
+STAGE_TRANSLATION = 'translation'
+
 
 # ======================== DATA STRUCTURES ========================
 
@@ -62,6 +102,8 @@ class BatchJob:
     end_time: Optional[datetime] = None
     error: Optional[str] = None
     result: Optional[Dict] = None
+    # Seconds spent in each pipeline stage (pipelined mode)
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -91,6 +133,30 @@ class BatchReport:
     total_cost: float
     average_cost_per_video: float
     jobs: List[BatchJob]
+    # Per-stage busy/wait time and utilization (pipelined mode)
+    stages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class StageUsage:
+    """Busy and idle time of one pipeline stage"""
+    workers: int
+    jobs: int = 0
+    busy_seconds: float = 0.0
+    # Time blocked on a neighbouring stage (ingest: prefetch queue full,
+    # transcription: queue empty)
+    waiting_seconds: float = 0.0
+
+    def to_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        """Report entry; utilization is busy time over wall time of all workers"""
+        capacity = wall_seconds * self.workers
+        return {
+            'workers': self.workers,
+            'jobs': self.jobs,
+            'busy_seconds': self.busy_seconds,
+            'waiting_seconds': self.waiting_seconds,
+            'utilization': self.busy_seconds / capacity if capacity > 0 else 0.0
+        }
 
 
 # ======================== BATCH PROCESSOR ========================
@@ -104,7 +170,11 @@ class BatchProcessor:
         whisper_model: str = "large-v3",
         device: str = "cpu",
         max_workers: int = 1,
-        max_cost: Optional[float] = None
+        max_cost: Optional[float] = None,
+        artifact_dir: Optional[Path] = DEFAULT_STORE_DIR,
+        service: Optional[str] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        translation_workers: int = DEFAULT_TRANSLATION_WORKERS
     ):
         """
         Initialize batch processor
@@ -113,14 +183,45 @@ class BatchProcessor:
             config_mode: Pipeline configuration mode
             whisper_model: Whisper model name
             device: Device for Whisper (cpu/cuda)
-            max_workers: Maximum parallel workers (1 = sequential)
+            max_workers: Parallel jobs: Whisper processes when running locally
+                         (capped by cores/RAM, 0 = as many as fit), jobs in
+                         flight on a service (1 = sequential)
             max_cost: Maximum total cost limit (None = unlimited)
+            artifact_dir: Artifact store shared by all jobs (None to disable)
+            service: Address of a running pipeline service; jobs are submitted
+                     there and model/mode options are the service's
+            prefetch: Videos decoded ahead of transcription (0 with one
+                      worker: one job at a time, no pipelining)
+            translation_workers: Transcripts translated concurrently in
+                                 pipelined mode
         """
+        if max_workers < 0 or prefetch < 0 or translation_workers < 1:
+            raise ValueError(
+                "max_workers and prefetch must be at least 0 and translation_workers at least 1"
+            )
+
         self.config_mode = config_mode
         self.whisper_model = whisper_model
         self.device = device
         self.max_workers = max_workers
         self.max_cost = max_cost
+        self.artifact_dir = artifact_dir
+        self.service = service
+        self.prefetch = prefetch
+        self.translation_workers = translation_workers
+
+        # Local jobs: one Whisper model per transcription process, as many as fit
+        self.transcription_workers = 1
+        if not service:
+            limit = max_transcription_workers(whisper_model, device)
+            if max_workers > limit:
+                logger.warning(
+                    f"{max_workers} Whisper processes requested, but cores/RAM fit "
+                    f"{limit} {whisper_model} model(s); using {limit}"
+                )
+            self.transcription_workers = min(max_workers, limit) if max_workers else limit
+        elif not max_workers:
+            raise ValueError("max_workers=0 (size by cores/RAM) applies to local jobs only")
 
         self.batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.checkpoint_file = Path(f".batch_checkpoint_{self.batch_id}.json")
@@ -134,6 +235,19 @@ class BatchProcessor:
         logger.info(f"Max workers: {max_workers}")
         if max_cost:
             logger.info(f"Max cost limit: ${max_cost:.2f}")
+        logger.info(f"Artifact store: {artifact_dir or 'Disabled'}")
+        if service:
+            logger.info(f"Pipeline service: {service}")
+        elif self.pipelined:
+            logger.info(
+                f"Pipelined: {prefetch} video(s) prefetched, {self.transcription_workers} "
+                f"transcription process(es), {translation_workers} translation worker(s)"
+            )
+
+    @property
+    def pipelined(self) -> bool:
+        """Local jobs run as an ingest → transcription → translation pipeline"""
+        return not self.service and (self.transcription_workers > 1 or self.prefetch > 0)
 
     def discover_videos(
         self,
@@ -151,7 +265,7 @@ class BatchProcessor:
             List of video file paths
         """
         if extensions is None:
-            extensions = ['.mp4', '.avi', '.mkv', '.mov', '.webm', '.flv', '.m4v']
+            extensions = ['.mp4', '.avi', '.mkv', '.mov', '.webm', '.flv', '.m4v', '.wav']
 
         videos = []
 
@@ -230,11 +344,15 @@ class BatchProcessor:
         job.start_time = datetime.now()
 
         try:
+            if self.service:
+                return self._process_on_service(job, doc_type)
+
             # Initialize orchestrator
             orchestrator = VideoTranslationOrchestrator(
                 whisper_model=self.whisper_model,
                 config_mode=self.config_mode,
-                device=self.device
+                device=self.device,
+                artifact_dir=self.artifact_dir
             )
 
             # Process video
@@ -261,6 +379,27 @@ class BatchProcessor:
 
         return job
 
+    def _process_on_service(self, job: BatchJob, doc_type: DocumentType) -> BatchJob:
+        """Run a job on the pipeline service and wait for it"""
+        status = ServiceClient(self.service).run(
+            JOB_TRANSLATE,
+            job.video_path,
+            job.output_dir,
+            doc_type=doc_type.value,
+            on_event=lambda event: logger.debug(f"[{job.video_path.name}] {event}")
+        )
+
+        job.end_time = datetime.now()
+
+        if status['status'] == JOB_COMPLETED:
+            job.status = "completed"
+            job.result = status['result']['stats']
+        else:
+            job.status = "failed"
+            job.error = status.get('error')
+
+        return job
+
     def save_checkpoint(self, jobs: List[BatchJob]):
         """Save checkpoint for resume capability"""
         checkpoint = {
@@ -340,8 +479,18 @@ class BatchProcessor:
 
         logger.info(f"Pending: {len(pending_jobs)}, Already completed: {len(completed_jobs)}")
 
+        # Stage pipeline: prefetch, transcription pool, translation pool
+        if self.pipelined:
+            usage = self._process_pipelined(jobs, pending_jobs, doc_type)
+            end_time = datetime.now()
+            wall_seconds = (end_time - start_time).total_seconds()
+            return self._create_report(
+                jobs, start_time, end_time,
+                stages={name: stage.to_dict(wall_seconds) for name, stage in usage.items()}
+            )
+
         # Sequential processing
-        if self.max_workers == 1:
+        elif self.max_workers == 1:
             for i, job in enumerate(pending_jobs, 1):
                 logger.info(f"\n[{i}/{len(pending_jobs)}] Processing: {job.video_path.name}")
 
@@ -367,11 +516,12 @@ class BatchProcessor:
                 logger.info(f"Progress: {completed}/{len(jobs)} completed, {failed} failed")
                 logger.info(f"Total cost so far: ${total_cost:.4f}")
 
-        # Parallel processing
+        # Parallel processing on a pipeline service
         else:
             logger.info(f"Processing in parallel with {self.max_workers} workers...")
 
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            # Service jobs only wait on the service; threads are enough
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 future_to_job = {
                     executor.submit(self.process_single, job, doc_type): job
                     for job in pending_jobs
@@ -407,19 +557,333 @@ class BatchProcessor:
         end_time = datetime.now()
         return self._create_report(jobs, start_time, end_time)
 
+    # ---------------- pipelined mode ----------------
+
+    def _process_pipelined(
+        self,
+        jobs: List[BatchJob],
+        pending_jobs: List[BatchJob],
+        doc_type: DocumentType
+    ) -> Dict[str, StageUsage]:
+        """
+        Run pending jobs through overlapped ingest, transcription and translation
+
+        An ingest thread decodes the audio of upcoming videos (the FFmpeg
+        pass doubles as the probe: unreadable files fail here, not in
+        Whisper) into a bounded queue. Decoded jobs go to the transcription
+        stage: one resident model on this thread, or with several
+        transcription workers a pool of processes holding one model each.
+        Finished transcripts go to a thread pool for translation, which only
+        waits on the API. While video N transcribes, video N+1 is being
+        decoded and video N-1 translated.
+
+        Args:
+            jobs: All jobs of the batch (checkpointed as jobs finish)
+            pending_jobs: Jobs to run, in order
+            doc_type: Document type
+
+        Returns:
+            Usage per stage
+        """
+        workers = self.transcription_workers
+        usage = {
+            STAGE_INGEST: StageUsage(workers=1),
+            STAGE_TRANSCRIPTION: StageUsage(workers=workers),
+            STAGE_TRANSLATION: StageUsage(workers=self.translation_workers)
+        }
+        lock = threading.Lock()
+
+        pool = None
+        if workers == 1:
+            # Loaded once for the whole batch; translation jobs share its resources
+            orchestrator = VideoTranslationOrchestrator(
+                whisper_model=self.whisper_model,
+                config_mode=self.config_mode,
+                device=self.device,
+                artifact_dir=self.artifact_dir,
+                streaming=False
+            )
+        else:
+            # Models live in the transcription processes; this one only writes outputs
+            orchestrator = VideoTranslationOrchestrator(
+                config_mode=self.config_mode,
+                streaming=False,
+                transcriber=ThaiTranscriber(
+                    model_name=self.whisper_model,
+                    device=self.device,
+                    load_model=False
+                )
+            )
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_transcription_worker,
+                initargs=(
+                    self.whisper_model,
+                    self.device,
+                    self.artifact_dir,
+                    max(1, (os.cpu_count() or 1) // workers)
+                )
+            )
+
+        decoded = queue.Queue(maxsize=max(1, self.prefetch))
+        stop = threading.Event()
+        end_of_jobs = object()
+
+        def put(item) -> bool:
+            # Block while the queue is full, but give up once transcription stops
+            while not stop.is_set():
+                try:
+                    decoded.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        with tempfile.TemporaryDirectory(prefix="batch_pcm_") as temp_dir:
+            # Store-backed PCM is leased until transcribed and kept for later runs;
+            # temp PCM is deleted after the last job that uses it
+            if self.artifact_dir:
+                ingest = AudioIngest(store=ArtifactStore(self.artifact_dir))
+            else:
+                ingest = AudioIngest(cache_dir=Path(temp_dir))
+
+            def prefetch():
+                try:
+                    for job in pending_jobs:
+                        started = time.time()
+                        buffer, error = None, None
+                        try:
+                            buffer = ingest.load(job.video_path)
+                        except Exception as e:
+                            error = e
+                        self._record(usage[STAGE_INGEST], job, STAGE_INGEST, time.time() - started, lock)
+
+                        waiting = time.time()
+                        queued = put((job, buffer, error))
+                        usage[STAGE_INGEST].waiting_seconds += time.time() - waiting
+                        if not queued:
+                            if buffer is not None:
+                                ingest.release(buffer)
+                            return
+                finally:
+                    put(end_of_jobs)
+
+            prefetcher = threading.Thread(target=prefetch, name="batch-ingest", daemon=True)
+            prefetcher.start()
+
+            # One slot per Whisper model; a job holds it until its transcript is back
+            slots = threading.Semaphore(workers)
+
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=self.translation_workers,
+                    thread_name_prefix="batch-translate"
+                ) as translators:
+
+                    def transcribed(job, buffer, started, transcription=None, error=None):
+                        try:
+                            seconds = time.time() - started
+                            self._record(usage[STAGE_TRANSCRIPTION], job, STAGE_TRANSCRIPTION, seconds, lock)
+                            ingest.release(buffer)
+
+                            if error is not None:
+                                self._fail(job, str(error), jobs, lock)
+                            else:
+                                try:
+                                    translators.submit(
+                                        self._translate_pipelined, orchestrator, job, transcription, jobs,
+                                        doc_type, usage, lock
+                                    )
+                                except Exception as e:
+                                    self._fail(job, f"Translation not started: {e}", jobs, lock)
+                        finally:
+                            # Only after the hand-over: once every slot is free the translators shut down
+                            slots.release()
+
+                    def collect(job, buffer, started, future):
+                        # Done-callback thread: concurrent.futures would swallow anything raised here
+                        try:
+                            error = future.exception()
+                            transcription = None if error else future.result()
+                        except CancelledError as e:
+                            transcription, error = None, e
+                        try:
+                            transcribed(job, buffer, started, transcription, error)
+                        except Exception as e:
+                            logger.error(f"Job {job.index} failed after transcription: {e}")
+
+                    position = 0
+                    while True:
+                        # Waiting time counts only while a model is free
+                        slots.acquire()
+                        waiting = time.time()
+                        item = decoded.get()
+                        usage[STAGE_TRANSCRIPTION].waiting_seconds += time.time() - waiting
+                        if item is end_of_jobs:
+                            slots.release()
+                            break
+
+                        job, buffer, error = item
+                        position += 1
+
+                        if not self._ready(job, error, jobs, lock):
+                            if buffer is not None:
+                                ingest.release(buffer)
+                            slots.release()
+                            continue
+
+                        logger.info(f"\n[{position}/{len(pending_jobs)}] Transcribing: {job.video_path.name}")
+                        started = time.time()
+
+                        if pool is None:
+                            try:
+                                transcription = orchestrator.transcriber.transcribe_file(job.video_path, audio=buffer)
+                            except Exception as e:
+                                transcribed(job, buffer, started, error=e)
+                            else:
+                                transcribed(job, buffer, started, transcription)
+                        else:
+                            future = pool.submit(_transcribe_job, job.video_path, buffer)
+                            future.add_done_callback(partial(collect, job, buffer, started))
+
+                    # Let running transcriptions hand over to the translators
+                    for _ in range(workers):
+                        slots.acquire()
+            finally:
+                stop.set()
+                prefetcher.join()
+                if pool is not None:
+                    pool.shutdown(wait=True, cancel_futures=True)
+
+        return usage
+
+    def _ready(
+        self,
+        job: BatchJob,
+        error: Optional[Exception],
+        jobs: List[BatchJob],
+        lock: threading.Lock
+    ) -> bool:
+        """
+        Check a decoded job can be transcribed (decode succeeded, cost limit
+        not reached) and mark it processing
+        """
+        if error is not None:
+            self._fail(job, f"Audio decode failed: {error}", jobs, lock)
+            return False
+
+        # Translator threads checkpoint every job's status under the lock
+        with lock:
+            total_cost = self._total_cost(jobs)
+            if not self.max_cost or total_cost < self.max_cost:
+                job.status = "processing"
+                job.start_time = datetime.now()
+                return True
+            job.status = "skipped"
+            job.error = "Cost limit reached"
+
+        logger.warning(f"Cost limit reached: ${total_cost:.2f} >= ${self.max_cost:.2f}")
+        return False
+
+    def _translate_pipelined(
+        self,
+        orchestrator: VideoTranslationOrchestrator,
+        job: BatchJob,
+        transcription,
+        jobs: List[BatchJob],
+        doc_type: DocumentType,
+        usage: Dict[str, StageUsage],
+        lock: threading.Lock
+    ):
+        """Stages 2-5 of one job (translation pool thread)"""
+        started = time.time()
+        try:
+            # Own pipeline per job (context and statistics are per pipeline),
+            # sharing dictionaries, cache, thread pool and rate limiter as the pipeline service does
+            shared = orchestrator.translator
+            translator = TranslationPipeline(
+                config=orchestrator.config,
+                data_manager=shared.data_manager,
+                cache=shared.cache,
+                executor=shared.executor,
+                rate_limiter=shared.rate_limiter
+            )
+            job_orchestrator = VideoTranslationOrchestrator(
+                config_mode=self.config_mode,
+                streaming=False,
+                transcriber=orchestrator.transcriber,
+                translator=translator
+            )
+            result = job_orchestrator.process_transcription(
+                job.video_path,
+                transcription,
+                output_dir=job.output_dir,
+                doc_type=doc_type,
+                started=job.start_time
+            )
+        except Exception as e:
+            self._record(usage[STAGE_TRANSLATION], job, STAGE_TRANSLATION, time.time() - started, lock)
+            self._fail(job, str(e), jobs, lock)
+            return
+
+        self._record(usage[STAGE_TRANSLATION], job, STAGE_TRANSLATION, time.time() - started, lock)
+
+        with lock:
+            job.end_time = datetime.now()
+            if result.success:
+                job.status = "completed"
+                job.result = result.stats
+            else:
+                job.status = "failed"
+                job.error = result.error
+            self._checkpoint_progress(jobs)
+
+    @staticmethod
+    def _record(stage: StageUsage, job: BatchJob, name: str, seconds: float, lock: threading.Lock):
+        """Add one job's time to a stage"""
+        with lock:
+            stage.jobs += 1
+            stage.busy_seconds += seconds
+            job.stage_seconds[name] = seconds
+
+    def _fail(self, job: BatchJob, error: str, jobs: List[BatchJob], lock: threading.Lock):
+        """Mark a pipelined job failed and checkpoint"""
+        logger.error(f"Job {job.index} failed: {error}")
+        with lock:
+            job.status = "failed"
+            job.error = error
+            job.end_time = datetime.now()
+            self._checkpoint_progress(jobs)
+
+    def _checkpoint_progress(self, jobs: List[BatchJob]):
+        """Save the checkpoint and log progress (lock held)"""
+        self.save_checkpoint(jobs)
+
+        completed = sum(1 for j in jobs if j.status == "completed")
+        failed = sum(1 for j in jobs if j.status == "failed")
+        logger.info(f"Progress: {completed}/{len(jobs)} completed, {failed} failed")
+        logger.info(f"Total cost so far: ${self._total_cost(jobs):.4f}")
+
+    @staticmethod
+    def _total_cost(jobs: List[BatchJob]) -> float:
+        """Estimated cost of the finished jobs"""
+        return sum(
+            j.result.get('estimated_cost', 0) for j in jobs
+            if j.result and 'estimated_cost' in j.result
+        )
+
     def _create_report(
         self,
         jobs: List[BatchJob],
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        stages: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> BatchReport:
         """Create batch report"""
         successful = sum(1 for j in jobs if j.status == "completed")
         failed = sum(1 for j in jobs if j.status == "failed")
-        total_cost = sum(
-            j.result.get('estimated_cost', 0) for j in jobs
-            if j.result and 'estimated_cost' in j.result
-        )
+        total_cost = self._total_cost(jobs)
 
         report = BatchReport(
             batch_id=self.batch_id,
@@ -431,7 +895,8 @@ class BatchProcessor:
             failed=failed,
             total_cost=total_cost,
             average_cost_per_video=total_cost / len(jobs) if jobs else 0,
-            jobs=jobs
+            jobs=jobs,
+            stages=stages or {}
         )
 
         return report
@@ -448,6 +913,7 @@ class BatchProcessor:
             'failed': report.failed,
             'total_cost': report.total_cost,
             'average_cost_per_video': report.average_cost_per_video,
+            'stages': report.stages,
             'jobs': [
                 {
                     'index': job.index,
@@ -455,7 +921,8 @@ class BatchProcessor:
                     'output_dir': str(job.output_dir),
                     'status': job.status,
                     'error': job.error,
-                    'result': job.result
+                    'result': job.result,
+                    'stage_seconds': job.stage_seconds
                 }
                 for job in report.jobs
             ]
@@ -467,6 +934,82 @@ class BatchProcessor:
         logger.info(f"Report saved: {output_path}")
 
 
+# ======================== TRANSCRIPTION WORKERS ========================
+
+def max_transcription_workers(model_name: str, device: str) -> int:
+    """
+    Whisper processes that fit this machine
+
+    Args:
+        model_name: Whisper model (e.g. 'large-v3', 'medium')
+        device: 'cpu' or 'cuda'
+
+    Returns:
+        At least 1; on CPU limited by cores (MIN_THREADS_PER_MODEL each)
+        and available RAM, on CUDA one model per GPU
+    """
+    if device == 'cuda':
+        try:
+            import torch
+            return max(1, torch.cuda.device_count())
+        except ImportError:
+            return 1
+
+    limit = max(1, (os.cpu_count() or 1) // MIN_THREADS_PER_MODEL)
+
+    try:
+        available_gb = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / 1024 ** 3
+    except (ValueError, OSError, AttributeError):
+        # No sysconf RAM figures (e.g. macOS): cores only
+        return limit
+
+    family = model_name.split('.')[0].split('-')[0]
+    model_gb = MODEL_MEMORY_GB.get(family, MODEL_MEMORY_GB['large'])
+    return max(1, min(limit, int(available_gb // model_gb)))
+
+
+# Per-process transcriber, created once by the pool initializer
+_worker_transcriber = None
+
+
+def _init_transcription_worker(
+    model_name: str,
+    device: str,
+    artifact_dir: Optional[Path],
+    torch_threads: int
+):
+    """
+    Pool initializer: cap torch threads and load the model once per process
+
+    Args:
+        model_name: Whisper model
+        device: cpu or cuda
+        artifact_dir: Artifact store for transcripts (None to disable)
+        torch_threads: Intra-op threads for this worker
+    """
+    global _worker_transcriber
+
+    # Keep worker output to warnings; the parent logs progress
+    logging.getLogger().setLevel(logging.WARNING)
+
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+
+    _worker_transcriber = ThaiTranscriber(
+        model_name=model_name,
+        device=device,
+        store=ArtifactStore(artifact_dir) if artifact_dir else None
+    )
+
+
+def _transcribe_job(video_path: Path, buffer):
+    """Transcribe one decoded video in a worker process (the PCMBuffer is re-mapped, not copied)"""
+    return _worker_transcriber.transcribe_file(video_path, audio=buffer)
+
+
 # ======================== CLI INTERFACE ========================
 
 def main():
@@ -479,8 +1022,14 @@ Examples:
   # Process all videos in directory (sequential)
   python scripts/batch_process.py input_dir/
 
-  # Parallel processing with 4 workers
-  python scripts/batch_process.py input_dir/ -j 4
+  # Sequential, but decode 3 videos ahead and translate 4 transcripts at once
+  python scripts/batch_process.py input_dir/ --prefetch 3 --translation-workers 4
+
+  # Two Whisper processes, 24 translations in flight
+  python scripts/batch_process.py input_dir/ -j 2 --translation-workers 24
+
+  # As many Whisper processes as cores/RAM allow
+  python scripts/batch_process.py input_dir/ -j auto
 
   # Production mode with cost limit
   python scripts/batch_process.py input_dir/ --mode production --max-cost 50.00
@@ -490,6 +1039,10 @@ Examples:
 
   # Resume from checkpoint
   python scripts/batch_process.py --resume .batch_checkpoint_20250103_123456.json
+
+  # Submit to a running pipeline service (models stay loaded between videos)
+  python src/pipeline_service.py --transcription-workers 1 --translation-workers 4 &
+  python scripts/batch_process.py input_dir/ -j 4 --service .cache/pipeline_service.sock
         """
     )
 
@@ -509,9 +1062,10 @@ Examples:
 
     parser.add_argument(
         '-j', '--jobs',
-        type=int,
+        type=lambda value: 0 if value == 'auto' else int(value),
         default=1,
-        help='Number of parallel workers (default: 1 = sequential)'
+        help='Parallel jobs: Whisper processes, capped by cores/RAM ("auto" = as many as fit), '
+             'or jobs in flight with --service (default: 1)'
     )
 
     parser.add_argument(
@@ -563,6 +1117,42 @@ Examples:
         help='Save report to file (default: batch_report_<timestamp>.json)'
     )
 
+    parser.add_argument(
+        '--artifact-dir',
+        type=Path,
+        default=DEFAULT_STORE_DIR,
+        help=f'Artifact store shared by all jobs (default: {DEFAULT_STORE_DIR})'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the artifact store'
+    )
+
+    parser.add_argument(
+        '--service',
+        type=str,
+        metavar='ADDRESS',
+        help='Submit jobs to a running pipeline service (socket path or http://host:port); '
+             'model, mode and device are then the service\'s'
+    )
+
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=DEFAULT_PREFETCH,
+        help=f'Videos decoded ahead of transcription (default: {DEFAULT_PREFETCH}; '
+             '0 with -j 1 = one job at a time without pipelining)'
+    )
+
+    parser.add_argument(
+        '--translation-workers',
+        type=int,
+        default=DEFAULT_TRANSLATION_WORKERS,
+        help=f'Transcripts translated while the next video transcribes (default: {DEFAULT_TRANSLATION_WORKERS})'
+    )
+
     args = parser.parse_args()
 
     try:
@@ -592,7 +1182,11 @@ Examples:
             whisper_model=args.model,
             device=args.device,
             max_workers=args.jobs,
-            max_cost=args.max_cost
+            max_cost=args.max_cost,
+            artifact_dir=None if args.no_cache else args.artifact_dir,
+            service=args.service,
+            prefetch=args.prefetch,
+            translation_workers=args.translation_workers
         )
 
         # Resume mode
@@ -637,6 +1231,12 @@ Examples:
         logger.info(f"Total duration: {timedelta(seconds=int(report.total_duration))}")
         logger.info(f"Total cost: ${report.total_cost:.4f}")
         logger.info(f"Average cost/video: ${report.average_cost_per_video:.4f}")
+        for name, stage in report.stages.items():
+            logger.info(
+                f"Stage {name}: {stage['utilization']:.0%} utilized "
+                f"({stage['busy_seconds']:.0f}s busy, {stage['waiting_seconds']:.0f}s waiting, "
+                f"{stage['workers']} worker(s))"
+            )
 
         # Save report
         if args.report:
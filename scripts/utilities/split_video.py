@@ -10,11 +10,18 @@ Features:
 - Preserve audio/video quality
 - Generate manifest JSON for batch processing
 - Smart chunking at scene boundaries (optional)
+- ffprobe results cached in the artifact store
+- Input-side seeking: each chunk decodes only its own time range
+- Stream copy in a single pass (segment muxer), re-encodes in parallel
+- Audio-only chunks (16 kHz mono WAV), all the transcription pipeline reads
+- Silence-aligned cuts: each cut moves to the quietest gap near its
+  nominal time, so no word is split and no overlap is needed
 
 Usage:
     python scripts/split_video.py video.mp4
     python scripts/split_video.py video.mp4 --max-duration 3600
     python scripts/split_video.py video.mp4 --output chunks/ --manifest
+    python scripts/split_video.py video.mp4 --audio-only --manifest -j 4
 """
 
 import os
@@ -22,11 +29,13 @@ import sys
 import json
 import logging
 import argparse
+import tempfile
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, asdict
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup logging
 logging.basicConfig(
@@ -35,6 +44,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared helpers live in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'src'))
+from artifact_store import DEFAULT_STORE_DIR, ArtifactStore, fingerprint
+from audio_ingest import SAMPLE_RATE, AudioIngest, as_samples
+from voice_activity import EnergyVAD
+
+# Parallel ffmpeg processes for re-encoded / audio-only chunks
+DEFAULT_SPLIT_WORKERS = max(1, min(4, (os.cpu_count() or 1) // 2))
+
+# Audio-only chunks: what whisper.load_audio() would decode anyway
+AUDIO_CHUNK_SUFFIX = '.wav'
+
+# Seconds searched on each side of a nominal cut for the quietest gap
+DEFAULT_SILENCE_TOLERANCE = 30.0
+
+# Length of the quiet stretch a cut is centered in
+SILENCE_GAP = 0.5
+
 
 # ======================== DATA STRUCTURES ========================
 
@@ -79,12 +106,13 @@ class VideoAnalyzer:
     """Analyze video files using FFmpeg"""
 
     @staticmethod
-    def get_video_info(video_path: Path) -> VideoInfo:
+    def get_video_info(video_path: Path, store: Optional[ArtifactStore] = None) -> VideoInfo:
         """
         Get video file information using ffprobe
 
         Args:
             video_path: Path to video file
+            store: Artifact store to reuse/save the ffprobe output (None to always probe)
 
         Returns:
             VideoInfo object with video metadata
@@ -93,18 +121,31 @@ class VideoAnalyzer:
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         try:
-            # Run ffprobe to get video info
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                str(video_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            data = None
+            key = None
+
+            if store is not None:
+                key = fingerprint(video_path)
+                data = store.get_json(key, 'probe.json')
+                if data is not None:
+                    logger.debug(f"ffprobe result from artifact store: {video_path.name}")
+
+            if data is None:
+                # Run ffprobe to get video info
+                cmd = [
+                    'ffprobe',
+                    '-v', 'quiet',
+                    '-print_format', 'json',
+                    '-show_format',
+                    '-show_streams',
+                    str(video_path)
+                ]
+
+                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                data = json.loads(result.stdout)
+
+                if store is not None:
+                    store.put_json(key, 'probe.json', data)
 
             # Extract video stream info
             video_stream = next(
@@ -164,113 +205,251 @@ class VideoSplitter:
         """
         self.max_chunk_duration = max_chunk_duration
         self.analyzer = VideoAnalyzer()
+        self.vad = EnergyVAD()
 
     def calculate_chunks(
         self,
         video_info: VideoInfo,
-        overlap: int = 0
+        overlap: int = 0,
+        suffix: Optional[str] = None,
+        silence_tolerance: float = 0.0,
+        ingest: Optional[AudioIngest] = None
     ) -> List[ChunkInfo]:
         """
         Calculate chunk boundaries
 
+        Cuts are nominally at multiples of max_chunk_duration. With a silence
+        tolerance each cut moves to the quietest gap within that many
+        seconds of its nominal time (only those stretches are decoded), so
+        chunks are back to back without splitting words and can be
+        transcribed without overlap. A chunk can then be up to twice the
+        tolerance longer or shorter than max_chunk_duration.
+
         Args:
             video_info: Video information
             overlap: Overlap between chunks in seconds (for continuity)
+            suffix: Chunk file extension (default: the source's)
+            silence_tolerance: Seconds searched on each side of a nominal cut (0 = fixed cuts)
+            ingest: Decodes the search ranges (needed for silence_tolerance)
 
         Returns:
             List of ChunkInfo objects
         """
-        chunks = []
         total_duration = video_info.duration
-        current_time = 0.0
-        chunk_index = 0
+        cuts = []
+        nominal = float(self.max_chunk_duration)
+
+        while nominal < total_duration:
+            cuts.append(nominal)
+            nominal += self.max_chunk_duration
+
+        if cuts and silence_tolerance > 0:
+            if ingest is None:
+                raise ValueError("silence_tolerance needs an AudioIngest to decode the search ranges")
+            if video_info.audio_codec == 'none':
+                logger.warning("No audio stream, keeping fixed cut points")
+            else:
+                # Tolerance under half a chunk keeps the cuts in order
+                tolerance = min(silence_tolerance, self.max_chunk_duration / 2 - 1)
+                cuts = [self._silence_cut(video_info, cut, tolerance, ingest) for cut in cuts]
 
-        while current_time < total_duration:
-            start_time = max(0, current_time - overlap) if chunk_index > 0 else 0
-            end_time = min(current_time + self.max_chunk_duration, total_duration)
-            duration = end_time - start_time
+        chunks = []
+        boundaries = [0.0] + cuts + [total_duration]
+
+        for chunk_index, (cut_start, end_time) in enumerate(zip(boundaries, boundaries[1:])):
+            start_time = max(0, cut_start - overlap) if chunk_index > 0 else 0
 
             # Generate output filename
-            output_name = f"{video_info.path.stem}_chunk_{chunk_index:03d}{video_info.path.suffix}"
+            output_name = f"{video_info.path.stem}_chunk_{chunk_index:03d}{suffix or video_info.path.suffix}"
 
             chunks.append(ChunkInfo(
                 index=chunk_index,
                 start_time=start_time,
                 end_time=end_time,
-                duration=duration,
+                duration=round(end_time - start_time, 3),
                 output_path=Path(output_name)
             ))
 
-            current_time += self.max_chunk_duration
-            chunk_index += 1
-
         return chunks
 
+    def _silence_cut(self, video_info: VideoInfo, nominal: float, tolerance: float, ingest: AudioIngest) -> float:
+        """Move a cut point to the quietest gap within `tolerance` seconds of it"""
+        start = max(0.0, nominal - tolerance)
+        end = min(video_info.duration, nominal + tolerance)
+
+        pcm = ingest.load(video_info.path, start, end)
+        try:
+            offset, level = self.vad.quietest_gap(as_samples(pcm), gap=SILENCE_GAP)
+        finally:
+            ingest.release(pcm)
+
+        cut = round(start + offset, 3)
+        logger.info(
+            f"  Cut {self._format_time(nominal)} → {self._format_time(cut)} "
+            f"({cut - nominal:+.1f}s, {level:.0f} dBFS)"
+        )
+        return cut
+
     def split_video(
         self,
         video_path: Path,
         output_dir: Path,
         chunks: List[ChunkInfo],
-        copy_streams: bool = True
+        copy_streams: bool = True,
+        audio_only: bool = False,
+        workers: int = DEFAULT_SPLIT_WORKERS
     ) -> List[Path]:
         """
         Split video file into chunks
 
+        Every ffmpeg call seeks on the input side (-ss before -i), so a chunk
+        only decodes its own range instead of everything before it. Stream
+        copies of back-to-back chunks are cut in one pass by the segment
+        muxer; re-encoded and audio-only chunks run in parallel.
+
         Args:
             video_path: Input video path
             output_dir: Output directory
             chunks: List of chunk information
             copy_streams: If True, copy streams without re-encoding (faster)
+            audio_only: Write 16 kHz mono WAV chunks without the video stream
+            workers: Parallel ffmpeg processes for re-encoded/audio-only chunks
 
         Returns:
             List of output file paths
         """
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_paths = []
 
         logger.info(f"Splitting {video_path.name} into {len(chunks)} chunks...")
 
-        for chunk in chunks:
-            output_path = output_dir / chunk.output_path
-
-            # Build ffmpeg command
-            cmd = [
-                'ffmpeg',
-                '-i', str(video_path),
-                '-ss', str(chunk.start_time),
-                '-t', str(chunk.duration),
-                '-y'  # Overwrite output files
-            ]
-
-            if copy_streams:
-                # Fast copy without re-encoding
-                cmd.extend(['-c', 'copy'])
-            else:
-                # Re-encode (slower but more precise)
-                cmd.extend(['-c:v', 'libx264', '-c:a', 'aac'])
+        if copy_streams and not audio_only and self._contiguous(chunks):
+            return self._split_single_pass(video_path, output_dir, chunks)
 
-            cmd.append(str(output_path))
+        workers = max(1, min(workers, len(chunks)))
+        if workers > 1:
+            logger.info(f"  Extracting with {workers} parallel ffmpeg processes")
 
-            try:
-                logger.info(f"  Creating chunk {chunk.index + 1}/{len(chunks)}: {chunk.output_path.name}")
-                logger.info(f"    Time: {self._format_time(chunk.start_time)} → {self._format_time(chunk.end_time)}")
+        # Re-encodes share the cores instead of each taking all of them
+        threads = max(1, (os.cpu_count() or 1) // workers)
 
-                subprocess.run(
-                    cmd,
-                    check=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda chunk: self._extract_chunk(
+                    video_path, output_dir, chunk, len(chunks), copy_streams, audio_only, threads
+                ),
+                chunks
+            ))
 
-                output_paths.append(output_path)
-                logger.info(f"    ✓ Created: {output_path}")
+    @staticmethod
+    def _contiguous(chunks: List[ChunkInfo]) -> bool:
+        """Check that every chunk starts where the previous one ends (no overlap)"""
+        return all(
+            abs(current.start_time - previous.end_time) < 1e-6
+            for previous, current in zip(chunks, chunks[1:])
+        )
 
-            except subprocess.CalledProcessError as e:
-                logger.error(f"    ✗ Failed to create chunk {chunk.index}: {e}")
-                raise
+    def _split_single_pass(self, video_path: Path, output_dir: Path, chunks: List[ChunkInfo]) -> List[Path]:
+        """Cut back-to-back stream-copied chunks in one read of the source"""
+        output_paths = [output_dir / chunk.output_path for chunk in chunks]
+
+        # calculate_chunks() names chunks <stem>_chunk_NNN<suffix>
+        prefix, suffix = chunks[0].output_path.name.rsplit(f"_chunk_{chunks[0].index:03d}", 1)
+        pattern = str(output_dir / prefix).replace('%', '%%') + '_chunk_%03d' + suffix.replace('%', '%%')
+
+        cmd = [
+            'ffmpeg',
+            '-nostdin',
+            '-i', str(video_path),
+            '-c', 'copy',
+            '-f', 'segment',
+            '-segment_times', ','.join(f"{chunk.end_time:.3f}" for chunk in chunks[:-1]),
+            '-segment_start_number', str(chunks[0].index),
+            '-reset_timestamps', '1',
+            '-y',
+            pattern
+        ]
+
+        for chunk in chunks:
+            logger.info(
+                f"  Chunk {chunk.index + 1}/{len(chunks)}: {chunk.output_path.name} "
+                f"({self._format_time(chunk.start_time)} → {self._format_time(chunk.end_time)})"
+            )
+        logger.info("  Stream copy in a single pass (cuts snap to keyframes)")
+
+        self._run_ffmpeg(cmd, "split")
+
+        missing = [path for path in output_paths if not path.exists()]
+        if missing:
+            raise RuntimeError(
+                f"Segment muxer wrote {len(output_paths) - len(missing)} of {len(output_paths)} chunks "
+                f"(too few keyframes?); retry with --no-copy"
+            )
+
+        for path in output_paths:
+            logger.info(f"    ✓ Created: {path}")
 
         return output_paths
 
+    def _extract_chunk(
+        self,
+        video_path: Path,
+        output_dir: Path,
+        chunk: ChunkInfo,
+        total: int,
+        copy_streams: bool,
+        audio_only: bool,
+        threads: int
+    ) -> Path:
+        """Extract one chunk with input-side seeking"""
+        output_path = output_dir / chunk.output_path
+
+        # Build ffmpeg command
+        cmd = [
+            'ffmpeg',
+            '-nostdin',
+            '-ss', f"{chunk.start_time:.3f}",
+            '-t', f"{chunk.duration:.3f}",
+            '-i', str(video_path),
+            '-y'  # Overwrite output files
+        ]
+
+        if audio_only:
+            # The pipeline decodes to 16 kHz mono anyway; no video to demux
+            cmd.extend(['-vn', '-ac', '1', '-ar', str(SAMPLE_RATE), '-c:a', 'pcm_s16le'])
+        elif copy_streams:
+            # Fast copy without re-encoding
+            cmd.extend(['-c', 'copy'])
+        else:
+            # Re-encode (slower but more precise)
+            cmd.extend(['-c:v', 'libx264', '-c:a', 'aac', '-threads', str(threads)])
+
+        cmd.append(str(output_path))
+
+        logger.info(
+            f"  Creating chunk {chunk.index + 1}/{total}: {chunk.output_path.name} "
+            f"({self._format_time(chunk.start_time)} → {self._format_time(chunk.end_time)})"
+        )
+
+        self._run_ffmpeg(cmd, f"create chunk {chunk.index}")
+
+        logger.info(f"    ✓ Created: {output_path}")
+        return output_path
+
+    @staticmethod
+    def _run_ffmpeg(cmd: List[str], action: str):
+        """Run ffmpeg, logging the tail of its stderr on failure"""
+        try:
+            subprocess.run(
+                cmd,
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode('utf-8', errors='replace').strip().splitlines() if e.stderr else []
+            logger.error(f"    ✗ Failed to {action}: {stderr[-1] if stderr else e}")
+            raise
+
     @staticmethod
     def _format_time(seconds: float) -> str:
         """Format seconds to HH:MM:SS"""
@@ -360,8 +539,14 @@ Examples:
   # Specify output directory and create manifest
   python scripts/split_video.py video.mp4 -o chunks/ --manifest
 
-  # Re-encode chunks (slower but more precise)
-  python scripts/split_video.py video.mp4 --no-copy
+  # Re-encode chunks (slower but more precise), 4 at a time
+  python scripts/split_video.py video.mp4 --no-copy -j 4
+
+  # 16 kHz mono WAV chunks for transcription only
+  python scripts/split_video.py video.mp4 --audio-only --manifest
+
+  # Fixed cut points (no silence search)
+  python scripts/split_video.py video.mp4 --silence-tolerance 0
         """
     )
 
@@ -392,6 +577,15 @@ Examples:
         help='Overlap between chunks in seconds (default: 0)'
     )
 
+    parser.add_argument(
+        '--silence-tolerance',
+        type=float,
+        default=DEFAULT_SILENCE_TOLERANCE,
+        help=f'Move each cut to the quietest gap within this many seconds of it, 0 = fixed cuts. '
+             f'Exact with --audio-only/--no-copy; stream copies still cut at keyframes '
+             f'(default: {DEFAULT_SILENCE_TOLERANCE:.0f})'
+    )
+
     parser.add_argument(
         '--manifest',
         action='store_true',
@@ -404,12 +598,38 @@ Examples:
         help='Re-encode chunks instead of stream copy (slower but precise)'
     )
 
+    parser.add_argument(
+        '--audio-only',
+        action='store_true',
+        help='Write 16 kHz mono WAV chunks without video (all the transcription pipeline uses)'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=DEFAULT_SPLIT_WORKERS,
+        help=f'Parallel ffmpeg processes for re-encoded/audio-only chunks (default: {DEFAULT_SPLIT_WORKERS})'
+    )
+
     parser.add_argument(
         '--info-only',
         action='store_true',
         help='Show video info and exit without splitting'
     )
 
+    parser.add_argument(
+        '--artifact-dir',
+        type=Path,
+        default=DEFAULT_STORE_DIR,
+        help=f'Artifact store for cached ffprobe results (default: {DEFAULT_STORE_DIR})'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always run ffprobe, do not use the artifact store'
+    )
+
     args = parser.parse_args()
 
     try:
@@ -426,6 +646,7 @@ Examples:
             output_dir = Path(f"{video_path.stem}_chunks")
 
         # Initialize components
+        store = None if args.no_cache else ArtifactStore(args.artifact_dir)
         analyzer = VideoAnalyzer()
         splitter = VideoSplitter(max_chunk_duration=args.max_duration)
 
@@ -435,7 +656,7 @@ Examples:
         logger.info("=" * 60)
         logger.info(f"\nAnalyzing: {video_path.name}")
 
-        video_info = analyzer.get_video_info(video_path)
+        video_info = analyzer.get_video_info(video_path, store=store)
 
         logger.info(f"\nVideo Information:")
         logger.info(f"  Duration: {splitter._format_time(video_info.duration)}")
@@ -451,12 +672,25 @@ Examples:
             sys.exit(0)
 
         # Calculate chunks
-        chunks = splitter.calculate_chunks(video_info, overlap=args.overlap)
+        # Decoded search ranges are kept in the artifact store, else thrown away
+        with tempfile.TemporaryDirectory(prefix='split_pcm_') as pcm_dir:
+            ingest = AudioIngest(store=store) if store is not None else AudioIngest(Path(pcm_dir))
+            chunks = splitter.calculate_chunks(
+                video_info,
+                overlap=args.overlap,
+                suffix=AUDIO_CHUNK_SUFFIX if args.audio_only else None,
+                silence_tolerance=args.silence_tolerance,
+                ingest=ingest
+            )
 
         logger.info(f"\nChunk Plan:")
         logger.info(f"  Total chunks: {len(chunks)}")
         logger.info(f"  Max duration: {args.max_duration}s ({args.max_duration / 60:.1f} min)")
         logger.info(f"  Overlap: {args.overlap}s")
+        if args.silence_tolerance > 0:
+            logger.info(f"  Cuts: quietest gap within ±{args.silence_tolerance:.0f}s of each nominal cut")
+        else:
+            logger.info("  Cuts: fixed")
 
         for chunk in chunks:
             logger.info(f"  Chunk {chunk.index + 1}: {splitter._format_time(chunk.start_time)} → {splitter._format_time(chunk.end_time)}")
@@ -469,7 +703,9 @@ Examples:
             video_path=video_path,
             output_dir=output_dir,
             chunks=chunks,
-            copy_streams=not args.no_copy
+            copy_streams=not args.no_copy,
+            audio_only=args.audio_only,
+            workers=args.jobs
         )
 
         # Create manifest if requested
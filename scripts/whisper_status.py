@@ -26,6 +26,10 @@ from pathlib import Path
 from datetime import timedelta
 from typing import List, Dict
 
+# Journal reader lives in src/ (no Whisper import needed)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from segment_journal import JOURNAL_NAME, read_progress
+
 
 def format_time(seconds: float) -> str:
     """Format seconds to readable time"""
@@ -40,17 +44,19 @@ def format_time(seconds: float) -> str:
 
 
 def load_checkpoint(checkpoint_file: Path) -> Dict:
-    """Load checkpoint data from file"""
-    with open(checkpoint_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load the latest progress marker from a checkpoint journal"""
+    data = read_progress(checkpoint_file)
+    if data is None:
+        raise ValueError("no window committed yet")
+    return data
 
 
 def find_all_checkpoints(checkpoint_dir: Path) -> List[Path]:
-    """Find all checkpoint files in directory"""
+    """Find all checkpoint journals in directory"""
     if not checkpoint_dir.exists():
         return []
 
-    return list(checkpoint_dir.glob("*/checkpoint.json"))
+    return list(checkpoint_dir.glob(f"*/{JOURNAL_NAME}"))
 
 
 def get_checkpoint_status(checkpoint_file: Path) -> Dict:
@@ -59,12 +65,15 @@ def get_checkpoint_status(checkpoint_file: Path) -> Dict:
         data = load_checkpoint(checkpoint_file)
 
         video_hash = checkpoint_file.parent.name
-        progress_pct = (data['last_segment_id'] / data['total_segments'] * 100) if data['total_segments'] > 0 else 0
+        total_windows = data.get('total_windows', 0)
+        windows_committed = data.get('windows_committed', 0)
+        progress_pct = (windows_committed / total_windows * 100) if total_windows > 0 else 0
         elapsed = time.time() - data['start_timestamp']
         speed = data.get('speed', 0.0)
 
-        remaining_segments = data['total_segments'] - data['last_segment_id']
-        eta = (remaining_segments / speed) if speed > 0 else 0
+        # Speed is x realtime, so remaining audio seconds / speed = wall seconds
+        remaining_audio = (total_windows - windows_committed) * data.get('window_size', 0.0)
+        eta = (remaining_audio / speed) if speed > 0 else 0
 
         return {
             'video_file': data['video_file'],
@@ -74,9 +83,11 @@ def get_checkpoint_status(checkpoint_file: Path) -> Dict:
             'start_time': data.get('start_time'),
             'end_time': data.get('end_time'),
             'progress': {
-                'current': data['last_segment_id'],
-                'total': data['total_segments'],
-                'percentage': progress_pct
+                'current': windows_committed,
+                'total': total_windows,
+                'percentage': progress_pct,
+                'segments': data['total_segments'],
+                'last_timestamp': data.get('last_timestamp', 0.0)
             },
             'timing': {
                 'elapsed': elapsed,
@@ -129,7 +140,8 @@ def print_status_human(statuses: List[Dict]):
             print(f"    Time range: {range_str}")
 
         print()
-        print(f"    Progress: {progress['current']}/{progress['total']} segments ({progress['percentage']:.1f}%)")
+        print(f"    Progress: {progress['current']}/{progress['total']} windows ({progress['percentage']:.1f}%)")
+        print(f"    Committed: {progress['segments']} segments (up to {format_time(progress['last_timestamp'])})")
 
         # Progress bar
         bar_width = 50
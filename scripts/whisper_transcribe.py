@@ -4,7 +4,7 @@ Whisper Transcription with Checkpoint System - Production Ready
 ================================================================
 Transcribe Thai audio using Whisper large-v3 with:
 - Automatic checkpointing (never lose progress)
-- Resume capability (continue from where you stopped)
+- Window-level resume (a crash loses at most one audio window)
 - Time range support (transcribe specific segments)
 - Background/daemon mode support
 - Paperspace optimized (/storage/ persistent storage)
@@ -13,10 +13,25 @@ Features:
 - Word-level timestamps
 - Thai-optimized settings
 - JSON output with full metadata
-- Checkpoint every N segments (configurable)
+- Audio decoded once into a memory-mapped PCM file shared by all windows/workers
+- Transcribed in fixed windows (30s-10min)
+- Each window committed to disk before the next one starts
 - Graceful shutdown (Ctrl+C saves progress)
-- Resume from checkpoint
+- Resume seeks straight to the first uncommitted window
 - Split by time range (--start-time, --end-time)
+- Optional energy VAD (--vad) skips silent stretches before decoding
+- Multi-process CPU decoding (--workers), windows stitched back in order
+- Artifact store: decoded audio, window outputs and transcripts are reused
+  when the same video is processed again
+- Mel cache (--mel-cache-dir): log-mel features of each window are reused
+  by re-runs with other decode settings
+- Two-tier decoding (--decoding two-tier): greedy pass, beam search only
+  for windows that score as unreliable; per-window telemetry in the log
+- Model cascade (--cascade-model small): fast model first, the main model
+  only for low-confidence spans; both models stay loaded
+- Inference backends (--backend): openai-whisper, int8 quantized, ONNX Runtime
+- Lazy word timestamps (--word-timestamps lazy): alignment only for segments
+  that break subtitle limits or have low confidence
 
 Usage:
     # Basic transcription
@@ -29,6 +44,24 @@ Usage:
     # Resume from checkpoint
     python scripts/whisper_transcribe.py video.mp4 --resume
 
+    # Smaller windows (lose less work on preemption)
+    python scripts/whisper_transcribe.py video.mp4 --window-size 120
+
+    # Decode 4 windows at a time on a multi-core CPU
+    python scripts/whisper_transcribe.py video.mp4 --workers 4
+
+    # Fast CPU run: greedy first pass, re-decode flagged windows only
+    python scripts/whisper_transcribe.py video.mp4 --decoding two-tier
+
+    # small model first, large-v3 only where confidence is below 0.6
+    python scripts/whisper_transcribe.py video.mp4 --cascade-model small
+
+    # int8-quantized large-v3 on CPU
+    python scripts/whisper_transcribe.py video.mp4 --backend int8
+
+    # word timestamps only where subtitles need them
+    python scripts/whisper_transcribe.py video.mp4 --word-timestamps lazy
+
     # Transcribe time range (10-20 minutes)
     python scripts/whisper_transcribe.py video.mp4 \\
       --start-time 600 --end-time 1200
@@ -42,13 +75,13 @@ import sys
 import json
 import logging
 import argparse
-import hashlib
 import signal
 import atexit
 import time
-import subprocess
-import tempfile
 import shutil
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -76,6 +109,25 @@ except ImportError:
     HAS_TQDM = False
     logger.warning("tqdm not installed. Progress bar disabled. Install with: pip install tqdm")
 
+# Shared audio helpers live in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from voice_activity import EnergyVAD
+from audio_ingest import AudioIngest, AudioInput, PCMBuffer, as_samples, source_key, to_float32
+from artifact_store import DEFAULT_STORE_DIR, ArtifactStore, fingerprint, settings_digest
+from segment_table import save_transcript
+from segment_journal import (
+    DEFAULT_SYNC_BYTES, DEFAULT_SYNC_INTERVAL, JOURNAL_NAME, SegmentJournal, read_progress
+)
+from decoding_strategy import (
+    DECODING_ACCURATE, DECODING_MODES, DecodeTelemetry, QualityThresholds, WindowDecode, decode_window
+)
+from inference_backends import BACKEND_OPENAI, BACKENDS, load_whisper_model
+from word_alignment import (
+    WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMPS_LAZY, WORD_TIMESTAMP_MODES,
+    AlignmentPolicy, align_lazily, segment_confidence
+)
+from mel_cache import DEFAULT_MEL_CACHE_BYTES, DEFAULT_MEL_CACHE_DIR, MelCache, feed_features
+
 
 # ======================== DATA STRUCTURES ========================
 
@@ -101,6 +153,10 @@ class TranscriptResult:
     average_confidence: float
     model_name: str
     timestamp: str
+    vad_enabled: bool = False
+    vad_skipped_seconds: float = 0.0
+    # Decoding telemetry of the windows decoded in this run
+    decoding: Dict = None
 
 
 @dataclass
@@ -119,77 +175,275 @@ class CheckpointData:
     last_updated: str
     start_timestamp: float
     speed: float = 0.0
+    window_size: float = 0.0
+    windows_committed: int = 0
+    total_windows: int = 0
+    prompt_tail: str = ""
+    vad_skipped_seconds: float = 0.0
+
+
+@dataclass
+class AudioWindow:
+    """Fixed-length slice of the decoded audio"""
+    index: int
+    start: float
+    end: float
+
+
+# ======================== AUDIO WINDOWS ========================
+
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE
+
+MIN_WINDOW_SIZE = 30.0
+MAX_WINDOW_SIZE = 600.0
+
+# Extra audio decoded past each window end in --workers mode
+DEFAULT_WINDOW_OVERLAP = 2.0
+
+# Cascade: segments below this confidence are re-transcribed by the main model
+DEFAULT_CASCADE_THRESHOLD = 0.6
+
+
+def plan_windows(duration: float, window_size: float) -> List[AudioWindow]:
+    """
+    Cut the audio timeline into consecutive fixed-length windows
+
+    Args:
+        duration: Audio duration in seconds
+        window_size: Window length in seconds
+
+    Returns:
+        List of AudioWindow covering [0, duration)
+    """
+    windows = []
+    start = 0.0
+    index = 0
+
+    while start < duration:
+        end = min(start + window_size, duration)
+        windows.append(AudioWindow(index=index, start=start, end=end))
+        start = end
+        index += 1
+
+    return windows
+
+
+def build_window_prompt(base_prompt: str, tail_text: str) -> str:
+    """Combine the domain prompt with the previous window's tail text"""
+    if not tail_text:
+        return base_prompt
+    return f"{base_prompt} {tail_text}"
+
+
+def extract_prompt_tail(segments: List[TranscriptSegment], max_chars: int = 120) -> str:
+    """
+    Get the last few segment texts, used to condition the next window
+
+    Args:
+        segments: Segments of the window just decoded
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        Tail text (empty if no segments)
+    """
+    tail = ' '.join(seg.text for seg in segments[-3:]).strip()
+    return tail[-max_chars:]
+
+
+def stitch_window(
+    segments: List[TranscriptSegment],
+    seam: float,
+    core_end: float,
+    is_last: bool
+) -> Tuple[List[TranscriptSegment], float]:
+    """
+    Trim an overlapped window so it joins the previous one without repeats
+
+    Windows decoded in parallel run `overlap` seconds past their core end.
+    Segments starting after the core end are left to the next window, and
+    words whose midpoint falls before the seam (end of the last word already
+    kept) were already emitted by the previous window and are dropped.
+
+    Args:
+        segments: Window segments with absolute timestamps
+        seam: End of the last word kept so far
+        core_end: Absolute end of the window without overlap
+        is_last: Last window (keep everything)
+
+    Returns:
+        Tuple of (kept segments, new seam)
+    """
+    kept = []
+
+    for seg in segments:
+        if not is_last and seg.start >= core_end:
+            break
+
+        if seg.words:
+            words = [w for w in seg.words if (w['start'] + w['end']) / 2 >= seam]
+            if not words:
+                continue
+
+            if len(words) != len(seg.words):
+                probabilities = [w['probability'] for w in words]
+                seg.words = words
+                seg.text = ''.join(w['word'] for w in words).strip()
+                seg.confidence = sum(probabilities) / len(probabilities)
+
+            seg.start = max(seg.start, words[0]['start'])
+            seam = max(seam, words[-1]['end'])
+        else:
+            if seg.end <= seam:
+                continue
+            seg.start = max(seg.start, seam)
+            seam = seg.end
+
+        kept.append(seg)
+
+    return kept, seam
+
+
+def plan_escalations(
+    segments: List[TranscriptSegment],
+    window_start: float,
+    window_end: float,
+    threshold: float
+) -> List[Tuple[int, int, float, float]]:
+    """
+    Find the spans of a window that the cascade re-transcribes
+
+    Consecutive segments below the confidence threshold form one span. A
+    span reaches from the end of the confident segment before it to the
+    start of the confident segment after it (or the window edge), so the
+    re-transcribed audio never overlaps segments that are kept.
+
+    Args:
+        segments: First-pass window segments (absolute timestamps, in order)
+        window_start: Absolute window start
+        window_end: Absolute window end
+        threshold: Segments with lower confidence are escalated
+
+    Returns:
+        List of (first index, last index, span start, span end)
+    """
+    spans = []
+    index = 0
+
+    while index < len(segments):
+        if segments[index].confidence >= threshold:
+            index += 1
+            continue
+
+        first = index
+        while index + 1 < len(segments) and segments[index + 1].confidence < threshold:
+            index += 1
+        last = index
+
+        span_start = segments[first - 1].end if first > 0 else window_start
+        span_end = segments[last + 1].start if last + 1 < len(segments) else window_end
+        spans.append((first, last, span_start, max(span_end, span_start)))
+        index += 1
+
+    return spans
 
 
 # ======================== CHECKPOINT MANAGER ========================
 
 class CheckpointManager:
-    """Manage checkpoint saving/loading for resume capability"""
+    """
+    Manage checkpoint saving/loading for resume capability
+
+    Segments and progress live in one append-only journal: each checkpoint
+    appends the window's segments followed by a commit marker holding the
+    CheckpointData, so the two can never disagree after a crash.
+    """
 
-    def __init__(self, checkpoint_dir: Path, video_hash: str):
+    def __init__(
+        self,
+        checkpoint_dir: Path,
+        video_hash: str,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        sync_bytes: int = DEFAULT_SYNC_BYTES
+    ):
         """
         Initialize checkpoint manager
 
         Args:
             checkpoint_dir: Base directory for checkpoints
             video_hash: Unique hash of video file
+            sync_interval: Seconds between journal fsyncs
+            sync_bytes: Unsynced journal bytes that force an fsync
         """
         self.checkpoint_dir = Path(checkpoint_dir) / video_hash
-        self.checkpoint_file = self.checkpoint_dir / "checkpoint.json"
-        self.metadata_file = self.checkpoint_dir / "metadata.json"
-        self.segments_dir = self.checkpoint_dir / "segments"
+        self.journal = SegmentJournal(
+            self.checkpoint_dir / JOURNAL_NAME,
+            sync_interval=sync_interval,
+            sync_bytes=sync_bytes
+        )
 
         # Create directories
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
-        self.segments_dir.mkdir(parents=True, exist_ok=True)
 
     def has_checkpoint(self) -> bool:
         """Check if checkpoint exists"""
-        return self.checkpoint_file.exists()
+        return self.journal.exists()
 
-    def save_checkpoint(self, data: CheckpointData):
+    def save_checkpoint(self, data: CheckpointData, segments: List[TranscriptSegment] = ()):
         """
-        Save checkpoint atomically
+        Commit new segments and progress (appends only what is new)
 
         Args:
             data: Checkpoint data to save
+            segments: Segments decoded since the previous checkpoint
         """
         try:
-            # Write to temp file first (atomic operation)
-            temp_file = self.checkpoint_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(data), f, indent=2, ensure_ascii=False)
-
-            # Atomic rename
-            temp_file.replace(self.checkpoint_file)
-
+            self.journal.append((asdict(seg) for seg in segments), asdict(data))
             logger.debug(f"Checkpoint saved: segment {data.last_segment_id}")
 
         except Exception as e:
             logger.error(f"Failed to save checkpoint: {e}")
 
+    def flush(self):
+        """Force committed checkpoints to disk (before exit)"""
+        try:
+            self.journal.sync()
+        except OSError as e:
+            logger.error(f"Failed to sync checkpoint: {e}")
+
     def load_checkpoint(self) -> Optional[CheckpointData]:
         """
-        Load checkpoint data
+        Load checkpoint data, truncating a torn or uncommitted journal tail
 
         Returns:
             CheckpointData if found, None otherwise
         """
-        if not self.checkpoint_file.exists():
+        if not self.journal.exists():
             return None
 
         try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            state = self.journal.recover()
+            if state.progress is None:
+                return None
 
-            return CheckpointData(**data)
+            return CheckpointData(**state.progress)
 
         except Exception as e:
             logger.error(f"Failed to load checkpoint: {e}")
             return None
 
+    def load_segments(self) -> List[TranscriptSegment]:
+        """
+        Compact the journal and return all committed segments
+
+        Returns:
+            Segments of every committed window, in order
+        """
+        state = self.journal.compact()
+        return [TranscriptSegment(**seg) for seg in state.segments]
+
     def cleanup(self):
         """Delete checkpoint directory"""
+        self.journal.close()
         try:
             if self.checkpoint_dir.exists():
                 shutil.rmtree(self.checkpoint_dir)
@@ -198,105 +452,6 @@ class CheckpointManager:
             logger.warning(f"Failed to cleanup checkpoint: {e}")
 
 
-# ======================== SEGMENT BATCHER ========================
-
-class SegmentBatcher:
-    """Batch segment saving for efficiency"""
-
-    def __init__(self, storage_dir: Path, batch_size: int = 100):
-        """
-        Initialize segment batcher
-
-        Args:
-            storage_dir: Directory to store segment batches
-            batch_size: Number of segments per batch file
-        """
-        self.storage_dir = Path(storage_dir)
-        self.batch_size = batch_size
-        self.current_batch = []
-        self.batch_count = 0
-
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-
-    def add_segment(self, segment: TranscriptSegment):
-        """
-        Add segment to batch
-
-        Args:
-            segment: Segment to add
-        """
-        self.current_batch.append(segment)
-
-        # Auto-flush when batch is full
-        if len(self.current_batch) >= self.batch_size:
-            self.flush()
-
-    def flush(self):
-        """Save current batch to file"""
-        if not self.current_batch:
-            return
-
-        try:
-            batch_file = self.storage_dir / f"batch_{self.batch_count:03d}.json"
-
-            # Convert segments to dict
-            batch_data = [
-                {
-                    'id': seg.id,
-                    'start': seg.start,
-                    'end': seg.end,
-                    'text': seg.text,
-                    'confidence': seg.confidence,
-                    'words': seg.words
-                }
-                for seg in self.current_batch
-            ]
-
-            with open(batch_file, 'w', encoding='utf-8') as f:
-                json.dump(batch_data, f, ensure_ascii=False, indent=2)
-
-            logger.debug(f"Batch {self.batch_count} saved ({len(self.current_batch)} segments)")
-
-            self.current_batch = []
-            self.batch_count += 1
-
-        except Exception as e:
-            logger.error(f"Failed to save batch: {e}")
-
-    def get_all_segments(self) -> List[TranscriptSegment]:
-        """
-        Load all segments from batch files
-
-        Returns:
-            List of all segments
-        """
-        segments = []
-
-        # Get all batch files sorted
-        batch_files = sorted(self.storage_dir.glob("batch_*.json"))
-
-        for batch_file in batch_files:
-            try:
-                with open(batch_file, 'r', encoding='utf-8') as f:
-                    batch_data = json.load(f)
-
-                for seg_dict in batch_data:
-                    segment = TranscriptSegment(
-                        id=seg_dict['id'],
-                        start=seg_dict['start'],
-                        end=seg_dict['end'],
-                        text=seg_dict['text'],
-                        confidence=seg_dict.get('confidence', 0.0),
-                        words=seg_dict.get('words')
-                    )
-                    segments.append(segment)
-
-            except Exception as e:
-                logger.error(f"Failed to load batch {batch_file}: {e}")
-
-        return segments
-
-
 # ======================== PROGRESS TRACKER ========================
 
 class ProgressTracker:
@@ -414,7 +569,22 @@ class WhisperTranscriber:
         model_name: str = "large-v3",
         device: str = "cpu",
         checkpoint_dir: Optional[Path] = None,
-        checkpoint_interval: int = 10
+        checkpoint_interval: int = 10,
+        window_size: float = 300.0,
+        use_vad: bool = False,
+        workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        overlap: float = DEFAULT_WINDOW_OVERLAP,
+        store: Optional[ArtifactStore] = None,
+        checkpoint_sync: float = DEFAULT_SYNC_INTERVAL,
+        decoding: str = DECODING_ACCURATE,
+        thresholds: Optional[QualityThresholds] = None,
+        cascade_model: Optional[str] = None,
+        cascade_threshold: float = DEFAULT_CASCADE_THRESHOLD,
+        backend: str = BACKEND_OPENAI,
+        word_timestamps: str = WORD_TIMESTAMPS_EAGER,
+        alignment: Optional[AlignmentPolicy] = None,
+        mel_cache: Optional[MelCache] = None
     ):
         """
         Initialize Whisper transcriber
@@ -423,117 +593,229 @@ class WhisperTranscriber:
             model_name: Whisper model
             device: cpu or cuda
             checkpoint_dir: Directory for checkpoints (None to disable)
-            checkpoint_interval: Save checkpoint every N segments
+            checkpoint_interval: Legacy option, checkpoints are now committed per window
+            window_size: Window length in seconds (30-600)
+            use_vad: Skip silent stretches with the energy VAD before decoding
+            workers: Decoder processes (1 = decode in this process)
+            threads_per_worker: Torch threads per worker (default: cores / workers)
+            overlap: Seconds decoded past each window end when workers > 1
+            store: Artifact store for window outputs and transcripts (None to disable)
+            checkpoint_sync: Seconds between checkpoint journal fsyncs (0 = every window)
+            decoding: 'accurate' (beam search everywhere) or 'two-tier'
+                      (greedy pass, beam re-decode of flagged windows)
+            thresholds: Window quality limits for two-tier decoding
+            cascade_model: Fast first-pass model (e.g. small); model_name then
+                           only re-transcribes low-confidence spans (None to disable)
+            cascade_threshold: Segment confidence below which a span is escalated
+            backend: Inference backend ('openai-whisper', 'int8' or 'onnx')
+            word_timestamps: 'eager' (align every segment) or 'lazy' (align
+                             only segments flagged by the alignment policy)
+            alignment: Limits for lazy word timestamps
+            mel_cache: Cache of log-mel features per audio window (None to disable)
         """
+        if not MIN_WINDOW_SIZE <= window_size <= MAX_WINDOW_SIZE:
+            raise ValueError(
+                f"window_size must be between {MIN_WINDOW_SIZE:.0f}s and {MAX_WINDOW_SIZE:.0f}s"
+            )
+
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        if not 0.0 <= overlap < window_size / 2:
+            raise ValueError("overlap must be between 0 and half the window size")
+
+        if decoding not in DECODING_MODES:
+            raise ValueError(f"decoding must be one of {', '.join(DECODING_MODES)}")
+
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(BACKENDS)}")
+
+        if word_timestamps not in WORD_TIMESTAMP_MODES:
+            raise ValueError(f"word_timestamps must be one of {', '.join(WORD_TIMESTAMP_MODES)}")
+
         logger.info("=" * 70)
         logger.info("Whisper Transcriber (Thai-Optimized) - WITH CHECKPOINT")
         logger.info("=" * 70)
         logger.info(f"Model: {model_name}")
         logger.info(f"Device: {device}")
+        logger.info(f"Window size: {window_size:.0f}s")
+        logger.info(f"VAD: {'Enabled' if use_vad else 'Disabled'}")
+        logger.info(f"Decoding: {decoding}")
+        logger.info(f"Backend: {backend}")
+        logger.info(f"Word timestamps: {word_timestamps}")
+        logger.info(f"Mel cache: {mel_cache.store.root if mel_cache else 'Disabled'}")
+        if cascade_model:
+            logger.info(
+                f"Cascade: {cascade_model} first, {model_name} below "
+                f"{cascade_threshold:.0%} segment confidence"
+            )
+
+        self.workers = workers
+        self.threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+        self.overlap = overlap
+        self.store = store
+
+        if workers > 1:
+            logger.info(
+                f"Workers: {workers} processes x {self.threads_per_worker} threads "
+                f"({overlap:.1f}s window overlap)"
+            )
+            if device == "cuda":
+                logger.warning("Each worker loads its own model copy on the GPU")
 
         if checkpoint_dir:
             logger.info(f"Checkpoint: Enabled ({checkpoint_dir})")
-            logger.info(f"Checkpoint interval: Every {checkpoint_interval} segments")
+            logger.info("Checkpoint interval: Every window")
         else:
             logger.info("Checkpoint: Disabled")
 
+        self._model = None
+        self.model_name = model_name
+        self.device = device
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_sync = checkpoint_sync
+        self.window_size = window_size
+        self.vad = EnergyVAD() if use_vad else None
+        self.decoding = decoding
+        self.thresholds = thresholds or QualityThresholds()
+        self.cascade_model = cascade_model
+        self.cascade_threshold = cascade_threshold
+        self._fast_model = None
+        self.backend = backend
+        self.word_timestamps = word_timestamps
+        self.alignment = (alignment or AlignmentPolicy()) if word_timestamps == WORD_TIMESTAMPS_LAZY else None
+        self.mel_cache = mel_cache
+
+        # With workers, each process loads its own copy in its initializer.
+        # With an artifact store, loading waits until a window needs decoding.
+        if workers == 1 and store is None:
+            self._load_model()
+
+        # State for cleanup handler
+        self.checkpoint_manager = None
+        self.current_checkpoint_data = None
+
+    @property
+    def model(self):
+        """Whisper model, loaded on first use"""
+        if self._model is None:
+            self._load_model()
+        return self._model
+
+    @property
+    def fast_model(self):
+        """First-pass model: the cascade model if set, else the main model"""
+        if self.cascade_model is None:
+            return self.model
+
+        # Kept loaded alongside the main model for the whole run
+        if self._fast_model is None:
+            logger.info(f"Loading cascade model ({self.cascade_model})...")
+            self._fast_model = load_whisper_model(self.cascade_model, device=self.device, backend=self.backend)
+            logger.info("✓ Cascade model loaded")
+        return self._fast_model
+
+    def _load_model(self):
+        """Load Whisper model"""
         try:
             logger.info("Loading Whisper model...")
-            self.model = whisper.load_model(model_name, device=device)
-            self.model_name = model_name
-            self.device = device
-            self.checkpoint_dir = checkpoint_dir
-            self.checkpoint_interval = checkpoint_interval
+            self._model = load_whisper_model(self.model_name, device=self.device, backend=self.backend)
             logger.info("✓ Model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
 
-        # State for cleanup handler
-        self.checkpoint_manager = None
-        self.current_checkpoint_data = None
-
     def compute_file_hash(self, file_path: Path) -> str:
         """
-        Compute SHA256 hash of file (first 8 chars)
+        Compute content fingerprint of file (size + spread block hashes)
 
         Args:
             file_path: Path to file
 
         Returns:
-            8-character hash string
+            16-character hash string
         """
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            # Read first 1MB for speed
-            chunk = f.read(1024 * 1024)
-            sha256.update(chunk)
-
-        return sha256.hexdigest()[:8]
-
-    def extract_audio_segment(
+        return fingerprint(file_path)
+
+    def _transcript_artifact(self, start_time_offset: float) -> str:
+        """Artifact name of a final transcript produced with the current settings"""
+        digest = settings_digest({
+            'model': self.model_name,
+            'settings': self.THAI_SETTINGS,
+            'decoding': self.decoding,
+            'backend': self.backend,
+            'word_timestamps': self.word_timestamps,
+            'cascade': [self.cascade_model, self.cascade_threshold] if self.cascade_model else None,
+            'vad': self.vad is not None,
+            'window_size': self.window_size,
+            'parallel_overlap': self.overlap if self.workers > 1 else None,
+            'start_time_offset': start_time_offset
+        })
+        return f"transcript_{digest}.json"
+
+    def _window_artifact(self, window: AudioWindow, prompt: str, start_time_offset: float) -> str:
+        """Artifact name of one decoded window"""
+        digest = settings_digest({
+            'model': self.model_name,
+            'settings': self.THAI_SETTINGS,
+            'decoding': self.decoding,
+            'backend': self.backend,
+            'word_timestamps': self.word_timestamps,
+            'cascade': [self.cascade_model, self.cascade_threshold] if self.cascade_model else None,
+            'vad': self.vad is not None,
+            'prompt': prompt,
+            'window': [window.start + start_time_offset, window.end + start_time_offset]
+        })
+        return f"window_{digest}.json"
+
+    def load_cached_transcript(
         self,
-        input_file: Path,
-        start_time: Optional[float],
-        end_time: Optional[float],
-        output_file: Path
-    ):
+        source: str,
+        start_time_offset: float = 0.0
+    ) -> Optional[TranscriptResult]:
         """
-        Extract audio segment using FFmpeg
+        Get a transcript of this source made earlier with the same settings
 
         Args:
-            input_file: Input video/audio file
-            start_time: Start time in seconds (None for beginning)
-            end_time: End time in seconds (None for end)
-            output_file: Output audio file
-        """
-        cmd = ['ffmpeg', '-i', str(input_file), '-y']
-
-        if start_time is not None:
-            cmd.extend(['-ss', str(start_time)])
-
-        if end_time is not None:
-            cmd.extend(['-to', str(end_time)])
+            source: Source key (see audio_ingest.source_key)
+            start_time_offset: Offset the transcript was made with
 
-        cmd.extend([
-            '-vn',  # No video
-            '-acodec', 'pcm_s16le',
-            '-ar', '16000',  # 16kHz for Whisper
-            '-ac', '1',  # Mono
-            str(output_file)
-        ])
+        Returns:
+            TranscriptResult, or None if not in the artifact store
+        """
+        if self.store is None:
+            return None
 
-        logger.info(f"Extracting audio segment...")
-        if start_time is not None:
-            logger.info(f"  Start: {self._format_time(start_time)}")
-        if end_time is not None:
-            logger.info(f"  End: {self._format_time(end_time)}")
+        data = self.store.get_json(source, self._transcript_artifact(start_time_offset))
+        if data is None:
+            return None
 
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            logger.info("✓ Audio segment extracted")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg failed: {e.stderr}")
-            raise
+        data['segments'] = [TranscriptSegment(**seg) for seg in data['segments']]
+        return TranscriptResult(**data)
 
     def transcribe_file(
         self,
         audio_path: Path,
         start_time_offset: float = 0.0,
-        resume_from_checkpoint: bool = False
+        resume_from_checkpoint: bool = False,
+        audio: Optional[AudioInput] = None
     ) -> TranscriptResult:
         """
-        Transcribe audio/video file with checkpoint support
+        Transcribe audio/video file window by window with checkpoint support
+
+        The audio is decoded once and cut into fixed windows. Each window is
+        decoded and appended to the checkpoint journal together with its commit
+        marker before the next one starts, so a resume seeks straight to the
+        first uncommitted window.
 
         Args:
             audio_path: Path to audio/video file
             start_time_offset: Offset to add to timestamps
             resume_from_checkpoint: Try to resume from checkpoint
+            audio: Already decoded 16kHz mono PCM (array or PCMBuffer).
+                   A PCMBuffer is shared with worker processes without
+                   copying and its key names the checkpoint.
 
         Returns:
             TranscriptResult with segments and timestamps
@@ -542,22 +824,37 @@ class WhisperTranscriber:
             raise FileNotFoundError(f"File not found: {audio_path}")
 
         # Compute file hash for checkpoint
-        video_hash = self.compute_file_hash(audio_path)
+        if isinstance(audio, PCMBuffer) and audio.key:
+            video_hash = audio.key
+        else:
+            video_hash = self.compute_file_hash(audio_path)
+
+        cached = self.load_cached_transcript(video_hash, start_time_offset)
+        if cached is not None:
+            logger.info(f"✓ Transcript found in artifact store ({len(cached.segments)} segments)")
+            return cached
 
         # Setup checkpoint manager
         checkpoint_manager = None
-        segment_batcher = None
-        resumed_segments = []
-        resume_from_segment = 0
+        resume_data = None
 
         if self.checkpoint_dir:
-            checkpoint_manager = CheckpointManager(self.checkpoint_dir, video_hash)
+            checkpoint_manager = CheckpointManager(
+                self.checkpoint_dir, video_hash, sync_interval=self.checkpoint_sync
+            )
             self.checkpoint_manager = checkpoint_manager
 
             # Check for existing checkpoint
             if resume_from_checkpoint and checkpoint_manager.has_checkpoint():
                 checkpoint_data = checkpoint_manager.load_checkpoint()
 
+                if checkpoint_data and checkpoint_data.window_size != self.window_size:
+                    logger.warning(
+                        f"Checkpoint uses {checkpoint_data.window_size:.0f}s windows "
+                        f"(current: {self.window_size:.0f}s) - cannot resume"
+                    )
+                    checkpoint_data = None
+
                 if checkpoint_data:
                     logger.info("\n" + "=" * 70)
                     logger.info("CHECKPOINT FOUND")
@@ -565,8 +862,8 @@ class WhisperTranscriber:
                     logger.info(f"Video: {checkpoint_data.video_file}")
                     logger.info(f"Hash: {checkpoint_data.video_hash}")
                     logger.info(f"Last checkpoint: {checkpoint_data.last_updated}")
-                    logger.info(f"\nProgress: {checkpoint_data.last_segment_id}/{checkpoint_data.total_segments} segments")
-                    logger.info(f"Last saved: segment {checkpoint_data.last_segment_id}")
+                    logger.info(f"\nProgress: {checkpoint_data.windows_committed}/{checkpoint_data.total_windows} windows")
+                    logger.info(f"Last saved: {self._format_time(checkpoint_data.last_timestamp)}")
                     logger.info(f"Model: {checkpoint_data.model}")
                     logger.info(f"Device: {checkpoint_data.device}")
 
@@ -575,135 +872,129 @@ class WhisperTranscriber:
 
                     if response in ['', 'y', 'yes']:
                         logger.info("✓ Resuming from checkpoint...")
-
-                        # Load previous segments
-                        segment_batcher = SegmentBatcher(
-                            checkpoint_manager.segments_dir,
-                            batch_size=100
-                        )
-                        resumed_segments = segment_batcher.get_all_segments()
-                        resume_from_segment = checkpoint_data.last_segment_id
-
-                        logger.info(f"✓ Loaded {len(resumed_segments)} previous segments")
-                        logger.info(f"✓ Resuming from segment {resume_from_segment}")
+                        resume_data = checkpoint_data
                     else:
                         logger.info("Starting fresh transcription...")
-                        checkpoint_manager.cleanup()
-                        checkpoint_manager = CheckpointManager(self.checkpoint_dir, video_hash)
-
-            # Initialize segment batcher
-            if segment_batcher is None:
-                segment_batcher = SegmentBatcher(
-                    checkpoint_manager.segments_dir,
-                    batch_size=100
-                )
+
+                if resume_data is None:
+                    checkpoint_manager.cleanup()
+                    checkpoint_manager = CheckpointManager(
+                        self.checkpoint_dir, video_hash, sync_interval=self.checkpoint_sync
+                    )
+                    self.checkpoint_manager = checkpoint_manager
 
         logger.info(f"\nTranscribing: {audio_path.name}")
         logger.info("Settings:")
-        logger.info(f"  - Word-level timestamps: ✓")
-        logger.info(f"  - Multi-temperature: ✓")
-        logger.info(f"  - Beam search: ✓")
+        logger.info(f"  - Word-level timestamps: {self.word_timestamps}")
+        logger.info(f"  - Decoding: {self.decoding}")
         logger.info(f"  - Thai optimization: ✓")
+        logger.info(f"  - Window size: {self.window_size:.0f}s")
+        logger.info(f"  - Skip silence (VAD): {'✓' if self.vad else '✗'}")
+        logger.info(f"  - Parallel workers: {self.workers}")
         if start_time_offset > 0:
             logger.info(f"  - Time offset: {self._format_time(start_time_offset)}")
 
         try:
-            # Transcribe
-            logger.info("\nProcessing...")
             start_transcribe_time = time.time()
 
-            result = self.model.transcribe(
-                str(audio_path),
-                **self.THAI_SETTINGS
-            )
+            # Decode audio once (16kHz mono) unless the caller already did
+            if audio is None:
+                logger.info("\nDecoding audio...")
+                audio = whisper.load_audio(str(audio_path))
+
+            audio_duration = len(audio) / SAMPLE_RATE
+            windows = plan_windows(audio_duration, self.window_size)
+
+            logger.info(f"✓ Audio decoded: {self._format_time(audio_duration)} ({len(windows)} windows)")
 
-            # Process segments
             segments = []
+            prompt_tail = ""
+            first_window = 0
+            skipped_seconds = 0.0
+            language = self.THAI_SETTINGS['language']
+            telemetry = DecodeTelemetry(mode=self.decoding)
+
+            if resume_data:
+                # Committed segments only (torn tail already truncated)
+                segments = checkpoint_manager.load_segments()
+                prompt_tail = resume_data.prompt_tail
+                first_window = resume_data.windows_committed
+                skipped_seconds = resume_data.vad_skipped_seconds
+
+                logger.info(f"✓ Loaded {len(segments)} previous segments")
+                logger.info(f"✓ Resuming from window {first_window + 1}/{len(windows)}")
+
+                checkpoint_data = resume_data
+                checkpoint_data.start_timestamp = start_transcribe_time
+            else:
+                checkpoint_data = CheckpointData(
+                    video_file=audio_path.name,
+                    video_hash=video_hash,
+                    model=self.model_name,
+                    device=self.device,
+                    start_time=start_time_offset if start_time_offset > 0 else None,
+                    end_time=None,
+                    last_segment_id=0,
+                    last_timestamp=0.0,
+                    total_segments=0,
+                    created_at=datetime.now().isoformat(),
+                    last_updated=datetime.now().isoformat(),
+                    start_timestamp=start_transcribe_time,
+                    window_size=self.window_size,
+                    total_windows=len(windows)
+                )
+
+            self.current_checkpoint_data = checkpoint_data
+
             progress_tracker = ProgressTracker(
-                result['segments'][-1]['end'] if result['segments'] else 0.0,
+                audio_duration - (windows[first_window].start if first_window < len(windows) else audio_duration),
                 use_tqdm=(sys.stdout.isatty())
             )
 
-            checkpoint_data = CheckpointData(
-                video_file=audio_path.name,
-                video_hash=video_hash,
-                model=self.model_name,
-                device=self.device,
-                start_time=start_time_offset if start_time_offset > 0 else None,
-                end_time=None,
-                last_segment_id=0,
-                last_timestamp=0.0,
-                total_segments=len(result['segments']),
-                created_at=datetime.now().isoformat(),
-                last_updated=datetime.now().isoformat(),
-                start_timestamp=start_transcribe_time
-            )
+            logger.info("\nProcessing...")
 
-            for i, seg in enumerate(result['segments']):
-                # Skip if resuming
-                if i < resume_from_segment:
-                    continue
-
-                # Extract words if available
-                words = None
-                if 'words' in seg:
-                    words = [
-                        {
-                            'word': w.get('word', ''),
-                            'start': w.get('start', 0.0) + start_time_offset,
-                            'end': w.get('end', 0.0) + start_time_offset,
-                            'probability': w.get('probability', 0.0)
-                        }
-                        for w in seg['words']
-                    ]
-
-                # Calculate confidence
-                confidence = 1.0
-                if words:
-                    confidences = [w['probability'] for w in words if 'probability' in w]
-                    if confidences:
-                        confidence = sum(confidences) / len(confidences)
-
-                segment = TranscriptSegment(
-                    id=i,
-                    start=seg['start'] + start_time_offset,
-                    end=seg['end'] + start_time_offset,
-                    text=seg['text'].strip(),
-                    confidence=confidence,
-                    words=words
+            if self.workers > 1:
+                seam = segments[-1].end if segments else start_time_offset
+                decoded = self._decode_windows_parallel(
+                    audio, windows, first_window, start_time_offset, seam, video_hash
                 )
-                segments.append(segment)
+            else:
+                decoded = self._decode_windows_sequential(
+                    audio, windows[first_window:], start_time_offset, prompt_tail, video_hash
+                )
+
+            for window, window_segments, language, window_skipped, window_decode in decoded:
+                # None when the window came from the artifact store
+                if window_decode is not None:
+                    telemetry.record(window_decode)
+
+                for segment_id, segment in enumerate(window_segments, start=len(segments)):
+                    segment.id = segment_id
 
-                # Add to batch
-                if segment_batcher:
-                    segment_batcher.add_segment(segment)
+                segments.extend(window_segments)
+                skipped_seconds += window_skipped
 
-                # Update progress
-                if i > 0:
-                    duration = seg['end'] - result['segments'][i-1]['end']
-                    progress_tracker.update(duration)
+                if window_segments:
+                    prompt_tail = extract_prompt_tail(window_segments)
 
-                # Save checkpoint
-                if checkpoint_manager and (i + 1) % self.checkpoint_interval == 0:
-                    checkpoint_data.last_segment_id = i
-                    checkpoint_data.last_timestamp = seg['end'] + start_time_offset
+                # Commit window: its segments and progress in one journal append
+                if checkpoint_manager:
+                    checkpoint_data.windows_committed = window.index + 1
+                    checkpoint_data.prompt_tail = prompt_tail
+                    checkpoint_data.vad_skipped_seconds = skipped_seconds
+                    checkpoint_data.last_segment_id = len(segments) - 1 if segments else 0
+                    checkpoint_data.total_segments = len(segments)
+                    checkpoint_data.last_timestamp = window.end + start_time_offset
                     checkpoint_data.last_updated = datetime.now().isoformat()
                     checkpoint_data.speed = progress_tracker.get_speed()
 
-                    checkpoint_manager.save_checkpoint(checkpoint_data)
-                    self.current_checkpoint_data = checkpoint_data
+                    checkpoint_manager.save_checkpoint(checkpoint_data, window_segments)
 
-            # Flush remaining segments
-            if segment_batcher:
-                segment_batcher.flush()
+                progress_tracker.update(window.end - window.start)
 
             # Close progress tracker
             progress_tracker.close()
 
-            # Combine with resumed segments
-            if resumed_segments:
-                segments = resumed_segments + segments
-
             # Calculate statistics
             total_text = ' '.join(seg.text for seg in segments)
             word_count = len(total_text.split())
@@ -711,25 +1002,40 @@ class WhisperTranscriber:
             duration = segments[-1].end if segments else 0.0
 
             transcript = TranscriptResult(
-                language=result['language'],
+                language=language,
                 duration=duration,
                 segments=segments,
                 text=total_text,
                 word_count=word_count,
                 average_confidence=avg_confidence,
                 model_name=self.model_name,
-                timestamp=datetime.now().isoformat()
+                timestamp=datetime.now().isoformat(),
+                vad_enabled=self.vad is not None,
+                vad_skipped_seconds=skipped_seconds,
+                decoding=telemetry.to_dict()
             )
 
             processing_time = time.time() - start_transcribe_time
 
+            if self.store is not None:
+                self.store.put_json(
+                    video_hash,
+                    self._transcript_artifact(start_time_offset),
+                    asdict(transcript)
+                )
+
             logger.info("\n✓ Transcription complete:")
             logger.info(f"  - Duration: {self._format_time(duration)}")
             logger.info(f"  - Segments: {len(segments)}")
             logger.info(f"  - Words: {word_count}")
             logger.info(f"  - Avg confidence: {avg_confidence:.1%}")
+            if self.vad:
+                logger.info(f"  - Silence skipped (VAD): {self._format_time(skipped_seconds)}")
             logger.info(f"  - Processing time: {self._format_time(processing_time)}")
-            logger.info(f"  - Speed: {duration / processing_time:.1f}x realtime")
+            logger.info(f"  - Speed: {progress_tracker.get_speed():.1f}x realtime")
+            telemetry.log_summary()
+            if self.mel_cache is not None:
+                self.mel_cache.log_summary()
 
             # Cleanup checkpoint on success
             if checkpoint_manager:
@@ -740,14 +1046,370 @@ class WhisperTranscriber:
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
 
-            # Save emergency checkpoint
+            # Committed windows are journaled; make sure they reach the disk
             if checkpoint_manager and self.current_checkpoint_data:
                 logger.info("Saving emergency checkpoint...")
-                checkpoint_manager.save_checkpoint(self.current_checkpoint_data)
+                checkpoint_manager.flush()
                 logger.info("✓ Emergency checkpoint saved")
 
             raise
 
+    def _decode_windows_sequential(
+        self,
+        audio,
+        windows: List[AudioWindow],
+        start_time_offset: float,
+        prompt_tail: str,
+        source: str
+    ):
+        """
+        Decode windows one after another in this process
+
+        Each window is conditioned on the tail text of the one before it.
+        Windows already in the artifact store are not decoded again.
+
+        Yields:
+            Tuple of (window, segments, language, seconds skipped as silence,
+            WindowDecode telemetry or None if stored)
+        """
+        samples = as_samples(audio)
+
+        for window in windows:
+            prompt = build_window_prompt(self.THAI_SETTINGS['initial_prompt'], prompt_tail)
+            decoded = self._load_window(source, window, prompt, start_time_offset)
+
+            if decoded is None:
+                chunk = samples[int(window.start * SAMPLE_RATE):int(window.end * SAMPLE_RATE)]
+                decoded = self._transcribe_window(chunk, window, prompt, start_time_offset)
+                self._store_window(source, window, prompt, start_time_offset, decoded)
+
+            window_segments, language, skipped, window_decode = decoded
+
+            if window_segments:
+                prompt_tail = extract_prompt_tail(window_segments)
+
+            yield window, window_segments, language, skipped, window_decode
+
+    def _decode_windows_parallel(
+        self,
+        audio,
+        windows: List[AudioWindow],
+        first_window: int,
+        start_time_offset: float,
+        seam: float,
+        source: str
+    ):
+        """
+        Decode windows in a pool of worker processes, yielding them in order
+
+        Every worker loads the model once and decodes its window plus
+        `overlap` seconds of the next one. Results are consumed strictly in
+        window order and stitched at the seams, so checkpoint commits stay
+        sequential. A PCMBuffer is mapped by each worker, so only the
+        window bounds cross the process boundary; a plain array is sent
+        one window slice at a time with at most two windows per worker
+        in flight.
+
+        Workers cannot see the previous window's text, so every window is
+        prompted with the domain prompt only. Windows already in the
+        artifact store are served without a worker.
+
+        Yields:
+            Tuple of (window, segments, language, seconds skipped as silence,
+            WindowDecode telemetry or None if stored)
+        """
+        duration = len(audio) / SAMPLE_RATE
+        prompt = self.THAI_SETTINGS['initial_prompt']
+        pending = deque()
+        remaining = iter(windows[first_window:])
+
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(
+                self.model_name,
+                self.device,
+                self.window_size,
+                self.vad is not None,
+                self.threads_per_worker,
+                self.decoding,
+                self.thresholds,
+                self.cascade_model,
+                self.cascade_threshold,
+                self.backend,
+                self.word_timestamps,
+                self.alignment,
+                self.mel_cache
+            )
+        )
+
+        def submit_next():
+            window = next(remaining, None)
+            if window is None:
+                return
+
+            decode_window = AudioWindow(
+                index=window.index,
+                start=window.start,
+                end=min(window.end + self.overlap, duration)
+            )
+
+            decoded = self._load_window(source, decode_window, prompt, start_time_offset)
+            if decoded is not None:
+                future = Future()
+                future.set_result(decoded)
+                pending.append((window, decode_window, future))
+                return
+
+            if isinstance(audio, PCMBuffer):
+                window_source = audio
+            else:
+                window_source = audio[int(decode_window.start * SAMPLE_RATE):int(decode_window.end * SAMPLE_RATE)]
+
+            future = pool.submit(_decode_window_job, window_source, decode_window, prompt, start_time_offset)
+            pending.append((window, decode_window, future))
+
+        try:
+            for _ in range(self.workers * 2):
+                submit_next()
+
+            while pending:
+                window, decode_window, future = pending.popleft()
+                decoded = future.result()
+                self._store_window(source, decode_window, prompt, start_time_offset, decoded)
+                submit_next()
+
+                window_segments, language, skipped, window_decode = decoded
+
+                window_segments, seam = stitch_window(
+                    window_segments,
+                    seam,
+                    core_end=window.end + start_time_offset,
+                    is_last=(window.index == len(windows) - 1)
+                )
+
+                yield window, window_segments, language, skipped, window_decode
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _load_window(
+        self,
+        source: str,
+        window: AudioWindow,
+        prompt: str,
+        start_time_offset: float
+    ) -> Optional[Tuple[List[TranscriptSegment], str, float, None]]:
+        """Get a decoded window from the artifact store (None if not stored)"""
+        if self.store is None:
+            return None
+
+        data = self.store.get_json(source, self._window_artifact(window, prompt, start_time_offset))
+        if data is None:
+            return None
+
+        segments = [TranscriptSegment(**seg) for seg in data['segments']]
+        return segments, data['language'], data['skipped'], None
+
+    def _store_window(
+        self,
+        source: str,
+        window: AudioWindow,
+        prompt: str,
+        start_time_offset: float,
+        decoded: Tuple[List[TranscriptSegment], str, float, Optional[WindowDecode]]
+    ):
+        """Put a decoded window into the artifact store"""
+        if self.store is None:
+            return
+
+        segments, language, skipped, _ = decoded
+        self.store.put_json(
+            source,
+            self._window_artifact(window, prompt, start_time_offset),
+            {
+                'segments': [asdict(seg) for seg in segments],
+                'language': language,
+                'skipped': skipped
+            }
+        )
+
+    def _transcribe_window(
+        self,
+        chunk,
+        window: AudioWindow,
+        prompt: str,
+        start_time_offset: float
+    ) -> Tuple[List[TranscriptSegment], str, float, Optional[WindowDecode]]:
+        """
+        Decode a single audio window
+
+        With VAD enabled only the speech regions of the window are decoded
+        and the timestamps are mapped back onto the window timeline. The
+        decoding strategy (accurate or two-tier) is applied per window.
+        In cascade mode the window is decoded with the fast model and only
+        spans of low-confidence segments are decoded again with the main model.
+
+        Args:
+            chunk: Window audio (16kHz float32 or int16 array)
+            window: Window being decoded
+            prompt: Initial prompt (domain prompt + previous window tail)
+            start_time_offset: Offset to add to timestamps
+
+        Returns:
+            Tuple of (segments with absolute timestamps, detected language,
+            seconds skipped as silence, WindowDecode telemetry or None if
+            the window had no speech). Segment ids are assigned by the caller.
+        """
+        chunk = to_float32(chunk)
+        window_audio = chunk
+        offset = window.start + start_time_offset
+        language = self.THAI_SETTINGS['language']
+
+        speech_map = None
+        skipped = 0.0
+        if self.vad:
+            speech_map = self.vad.detect(chunk)
+            skipped = speech_map.skipped_seconds
+
+            if not speech_map.has_speech:
+                logger.debug(f"Window {window.index}: no speech, skipped")
+                return [], language, skipped, None
+
+            chunk = speech_map.compact(chunk)
+
+        result, window_decode = decode_window(
+            self.fast_model,
+            chunk,
+            {**self.THAI_SETTINGS, "initial_prompt": prompt},
+            mode=self.decoding,
+            thresholds=self.thresholds,
+            label=f"Window {window.index + 1}",
+            alignment=self.alignment,
+            mel_cache=self.mel_cache
+        )
+
+        if speech_map:
+            for seg in result['segments']:
+                speech_map.remap_segment(seg)
+
+        limit = window.end - window.start
+        segments = self._convert_segments(result['segments'], offset, limit)
+
+        if self.cascade_model and segments:
+            segments = self._escalate_low_confidence(
+                segments, window_audio, offset, limit, prompt, window_decode
+            )
+
+        return segments, result.get('language', language), skipped, window_decode
+
+    def _escalate_low_confidence(
+        self,
+        segments: List[TranscriptSegment],
+        window_audio,
+        offset: float,
+        limit: float,
+        prompt: str,
+        window_decode: WindowDecode
+    ) -> List[TranscriptSegment]:
+        """
+        Re-transcribe low-confidence spans of a window with the main model
+
+        Args:
+            segments: First-pass segments (absolute timestamps)
+            window_audio: Full window audio (before VAD compaction)
+            offset: Absolute start of the window
+            limit: Window length in seconds
+            prompt: Initial prompt of the window
+            window_decode: Window telemetry (escalation totals are added)
+
+        Returns:
+            Segments with every escalated span replaced by the main model's output
+        """
+        spans = plan_escalations(segments, offset, offset + limit, self.cascade_threshold)
+
+        # Splice from the end so earlier indices stay valid
+        for first, last, span_start, span_end in reversed(spans):
+            span_audio = window_audio[int((span_start - offset) * SAMPLE_RATE):int((span_end - offset) * SAMPLE_RATE)]
+            if len(span_audio) == 0:
+                continue
+
+            context = ' '.join(seg.text for seg in segments[max(0, first - 3):first]).strip()
+            settings = {**self.THAI_SETTINGS, "initial_prompt": build_window_prompt(prompt, context[-120:])}
+            if self.alignment:
+                settings['word_timestamps'] = False
+
+            if self.mel_cache is not None:
+                hits, misses = self.mel_cache.hits, self.mel_cache.misses
+
+            with feed_features(self.mel_cache):
+                result = self.model.transcribe(span_audio, **settings)
+
+            if self.mel_cache is not None:
+                window_decode.mel_hits += self.mel_cache.hits - hits
+                window_decode.mel_misses += self.mel_cache.misses - misses
+
+            if self.alignment:
+                aligned, seconds = align_lazily(self.model, span_audio, result, self.alignment, settings)
+                window_decode.aligned_segments += aligned
+                window_decode.alignment_seconds += seconds
+
+            replacement = self._convert_segments(result['segments'], span_start, span_end - span_start)
+            segments[first:last + 1] = replacement
+
+            window_decode.escalations += 1
+            window_decode.escalated_seconds += span_end - span_start
+
+        if spans:
+            logger.info(
+                f"  - {window_decode.label}: {len(spans)} span(s), "
+                f"{window_decode.escalated_seconds:.1f}s re-transcribed with {self.model_name}"
+            )
+
+        return segments
+
+    @staticmethod
+    def _convert_segments(whisper_segments: List[Dict], offset: float, limit: float) -> List[TranscriptSegment]:
+        """
+        Convert Whisper segment dicts into TranscriptSegments
+
+        Args:
+            whisper_segments: Segments relative to the decoded audio
+            offset: Absolute time of the decoded audio's start
+            limit: Length of the decoded audio (segment ends are clamped to it)
+
+        Returns:
+            Segments with absolute timestamps and word-probability confidence
+        """
+        segments = []
+        for seg in whisper_segments:
+            # Extract words if available
+            words = None
+            if 'words' in seg:
+                words = [
+                    {
+                        'word': w.get('word', ''),
+                        'start': w.get('start', 0.0) + offset,
+                        'end': w.get('end', 0.0) + offset,
+                        'probability': w.get('probability', 0.0)
+                    }
+                    for w in seg['words']
+                ]
+
+            # Word probabilities, or token log probability for unaligned segments
+            confidence = segment_confidence(seg, default=1.0)
+
+            segments.append(TranscriptSegment(
+                id=len(segments),
+                start=seg['start'] + offset,
+                end=min(seg['end'], limit) + offset,
+                text=seg['text'].strip(),
+                confidence=confidence,
+                words=words
+            ))
+
+        return segments
+
     def save_json(self, transcript: TranscriptResult, output_path: Path):
         """Save transcript as JSON"""
         data = {
@@ -758,7 +1420,10 @@ class WhisperTranscriber:
                 'average_confidence': transcript.average_confidence,
                 'model_name': transcript.model_name,
                 'timestamp': transcript.timestamp,
-                'segment_count': len(transcript.segments)
+                'segment_count': len(transcript.segments),
+                'vad_enabled': transcript.vad_enabled,
+                'vad_skipped_seconds': transcript.vad_skipped_seconds,
+                'decoding': transcript.decoding
             },
             'text': transcript.text,
             'segments': [
@@ -774,9 +1439,8 @@ class WhisperTranscriber:
             ]
         }
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # JSON export plus the binary segment table next to it
+        save_transcript(data, output_path)
 
         logger.info(f"✓ JSON saved: {output_path}")
 
@@ -808,6 +1472,87 @@ class WhisperTranscriber:
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
+# ======================== PARALLEL WORKERS ========================
+
+# Per-process transcriber, created once by the pool initializer
+_worker_transcriber = None
+
+
+def _init_worker(
+    model_name: str,
+    device: str,
+    window_size: float,
+    use_vad: bool,
+    torch_threads: int,
+    decoding: str = DECODING_ACCURATE,
+    thresholds: Optional[QualityThresholds] = None,
+    cascade_model: Optional[str] = None,
+    cascade_threshold: float = 0.0,
+    backend: str = BACKEND_OPENAI,
+    word_timestamps: str = WORD_TIMESTAMPS_EAGER,
+    alignment: Optional[AlignmentPolicy] = None,
+    mel_cache: Optional[MelCache] = None
+):
+    """
+    Pool initializer: cap torch threads and load the model once per process
+
+    Args:
+        model_name: Whisper model
+        device: cpu or cuda
+        window_size: Window length in seconds
+        use_vad: Skip silent stretches with the energy VAD
+        torch_threads: Intra-op threads for this worker
+        decoding: Decoding strategy
+        thresholds: Window quality limits for two-tier decoding
+        cascade_model: Fast first-pass model (None to disable)
+        cascade_threshold: Segment confidence below which a span is escalated
+        backend: Inference backend
+        word_timestamps: Word alignment mode ('eager' or 'lazy')
+        alignment: Limits for lazy word timestamps
+        mel_cache: Cache of log-mel features per audio window
+    """
+    global _worker_transcriber
+
+    # Keep worker output to warnings; the parent logs progress
+    logging.getLogger().setLevel(logging.WARNING)
+
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+
+    _worker_transcriber = WhisperTranscriber(
+        model_name=model_name,
+        device=device,
+        window_size=window_size,
+        use_vad=use_vad,
+        decoding=decoding,
+        thresholds=thresholds,
+        cascade_model=cascade_model,
+        cascade_threshold=cascade_threshold,
+        backend=backend,
+        word_timestamps=word_timestamps,
+        alignment=alignment,
+        mel_cache=mel_cache
+    )
+
+
+def _decode_window_job(
+    source,
+    window: AudioWindow,
+    prompt: str,
+    start_time_offset: float
+) -> Tuple[List[TranscriptSegment], str, float, Optional[WindowDecode]]:
+    """Decode one window in a worker process (source: PCMBuffer or window slice)"""
+    if isinstance(source, PCMBuffer):
+        chunk = source.slice(window.start, window.end)
+    else:
+        chunk = source
+
+    return _worker_transcriber._transcribe_window(chunk, window, prompt, start_time_offset)
+
+
 # ======================== STATUS CHECKER ========================
 
 def show_status(checkpoint_dir: Path):
@@ -823,8 +1568,8 @@ def show_status(checkpoint_dir: Path):
         print("No checkpoints found")
         return
 
-    # Find all checkpoint files
-    checkpoint_files = list(checkpoint_dir.glob("*/checkpoint.json"))
+    # Find all checkpoint journals
+    checkpoint_files = list(checkpoint_dir.glob(f"*/{JOURNAL_NAME}"))
 
     if not checkpoint_files:
         print("No active transcriptions found")
@@ -836,17 +1581,22 @@ def show_status(checkpoint_dir: Path):
 
     for i, checkpoint_file in enumerate(checkpoint_files, 1):
         try:
-            with open(checkpoint_file, 'r') as f:
-                data = json.load(f)
+            data = read_progress(checkpoint_file)
+            if data is None:
+                print(f"\n[{i}] Starting (no window committed yet): {checkpoint_file.parent.name}")
+                continue
 
             video_hash = checkpoint_file.parent.name
-            progress_pct = (data['last_segment_id'] / data['total_segments'] * 100) if data['total_segments'] > 0 else 0
+            total_windows = data.get('total_windows', 0)
+            windows_committed = data.get('windows_committed', 0)
+            progress_pct = (windows_committed / total_windows * 100) if total_windows > 0 else 0
             elapsed = time.time() - data['start_timestamp']
             speed = data.get('speed', 0.0)
 
             print(f"\n[{i}] Video: {data['video_file']}")
             print(f"    Hash: {video_hash}")
-            print(f"    Progress: {data['last_segment_id']}/{data['total_segments']} segments ({progress_pct:.1f}%)")
+            print(f"    Progress: {windows_committed}/{total_windows} windows ({progress_pct:.1f}%)")
+            print(f"    Segments: {data['total_segments']} (up to {str(timedelta(seconds=int(data['last_timestamp'])))})")
             print(f"    Elapsed: {str(timedelta(seconds=int(elapsed)))}")
             print(f"    Speed: {speed:.1f}x realtime")
             print(f"    Last updated: {data['last_updated']}")
@@ -873,7 +1623,7 @@ def setup_signal_handlers(transcriber: WhisperTranscriber):
         # Save checkpoint if available
         if transcriber.checkpoint_manager and transcriber.current_checkpoint_data:
             logger.info("Saving checkpoint before exit...")
-            transcriber.checkpoint_manager.save_checkpoint(transcriber.current_checkpoint_data)
+            transcriber.checkpoint_manager.flush()
             logger.info("✓ Checkpoint saved")
 
         logger.info("✓ Safe to exit")
@@ -902,6 +1652,12 @@ Examples:
   # Resume from checkpoint
   python scripts/whisper_transcribe.py video.mp4 --resume
 
+  # Commit every 2 minutes of audio (default: 5 minutes)
+  python scripts/whisper_transcribe.py video.mp4 --window-size 120
+
+  # 4 decoder processes on a 16-core CPU (4 torch threads each)
+  python scripts/whisper_transcribe.py video.mp4 --workers 4
+
   # Transcribe specific time range (10-20 minutes)
   python scripts/whisper_transcribe.py video.mp4 \\
     --start-time 600 --end-time 1200
@@ -965,7 +1721,22 @@ For Paperspace:
         '--checkpoint-interval',
         type=int,
         default=10,
-        help='Save checkpoint every N segments (default: 10)'
+        help='Legacy option (checkpoints are now committed after every window)'
+    )
+
+    parser.add_argument(
+        '--checkpoint-sync',
+        type=float,
+        default=DEFAULT_SYNC_INTERVAL,
+        help=f'Seconds between checkpoint fsyncs; 0 syncs every window (default: {DEFAULT_SYNC_INTERVAL:g})'
+    )
+
+    parser.add_argument(
+        '--window-size',
+        type=float,
+        default=300.0,
+        help='Audio window length in seconds, 30-600 (default: 300). '
+             'A crash loses at most one window of work'
     )
 
     parser.add_argument(
@@ -974,6 +1745,78 @@ For Paperspace:
         help='Disable checkpoint system'
     )
 
+    parser.add_argument(
+        '--vad',
+        action='store_true',
+        help='Skip silent stretches with an energy VAD before decoding'
+    )
+
+    parser.add_argument(
+        '--decoding',
+        type=str,
+        default=DECODING_ACCURATE,
+        choices=DECODING_MODES,
+        help='accurate: beam search + temperature fallback for every window; '
+             'two-tier: greedy pass, re-decode only windows that score as unreliable '
+             '(default: accurate)'
+    )
+
+    parser.add_argument(
+        '--cascade-model',
+        type=str,
+        choices=['tiny', 'base', 'small', 'medium'],
+        help='Transcribe with this fast model first and re-transcribe only '
+             'low-confidence spans with --model (default: off)'
+    )
+
+    parser.add_argument(
+        '--cascade-threshold',
+        type=float,
+        default=DEFAULT_CASCADE_THRESHOLD,
+        help=f'Segment confidence (mean word probability; exp(avg_logprob) for segments left '
+             f'unaligned by --word-timestamps lazy) below which --cascade-model '
+             f'output is escalated (default: {DEFAULT_CASCADE_THRESHOLD})'
+    )
+
+    parser.add_argument(
+        '--backend',
+        type=str,
+        default=BACKEND_OPENAI,
+        choices=BACKENDS,
+        help='Inference backend: openai-whisper, int8 (dynamic quantization) or '
+             'onnx (ONNX Runtime encoder); int8/onnx are CPU only (default: openai-whisper)'
+    )
+
+    parser.add_argument(
+        '--word-timestamps',
+        type=str,
+        default=WORD_TIMESTAMPS_EAGER,
+        choices=WORD_TIMESTAMP_MODES,
+        help='eager: word alignment for every segment; lazy: only for segments that are '
+             'too long, too fast, too short or low-confidence (default: eager)'
+    )
+
+    # Parallel options
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Decoder processes, each with its own model copy (default: 1)'
+    )
+
+    parser.add_argument(
+        '--threads-per-worker',
+        type=int,
+        help='Torch threads per worker (default: CPU cores / workers)'
+    )
+
+    parser.add_argument(
+        '--overlap',
+        type=float,
+        default=DEFAULT_WINDOW_OVERLAP,
+        help=f'Seconds decoded past each window end with --workers (default: {DEFAULT_WINDOW_OVERLAP:.0f})'
+    )
+
     # Resume options
     parser.add_argument(
         '--resume',
@@ -1000,6 +1843,50 @@ For Paperspace:
         help='End time in seconds (e.g., 1200 = 20 minutes)'
     )
 
+    parser.add_argument(
+        '--pcm-dir',
+        type=Path,
+        help='Where decoded audio is kept until the run completes with --no-cache '
+             '(default: <checkpoint-dir>/pcm)'
+    )
+
+    # Artifact store
+    parser.add_argument(
+        '--artifact-dir',
+        type=Path,
+        default=DEFAULT_STORE_DIR,
+        help=f'Artifact store for decoded audio, window outputs and transcripts (default: {DEFAULT_STORE_DIR})'
+    )
+
+    parser.add_argument(
+        '--cache-size-gb',
+        type=float,
+        default=20.0,
+        help='Artifact store size cap in GB, least recently used evicted first (default: 20)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the artifact store'
+    )
+
+    # Mel cache
+    parser.add_argument(
+        '--mel-cache-dir',
+        type=Path,
+        help=f'Cache log-mel spectrograms per window, reused by re-runs with other decode '
+             f'settings (e.g. {DEFAULT_MEL_CACHE_DIR}; default: disabled)'
+    )
+
+    parser.add_argument(
+        '--mel-cache-gb',
+        type=float,
+        default=DEFAULT_MEL_CACHE_BYTES / 1024 ** 3,
+        help=f'Mel cache size cap in GB, least recently used evicted first '
+             f'(default: {DEFAULT_MEL_CACHE_BYTES / 1024 ** 3:.0f})'
+    )
+
     # Status
     parser.add_argument(
         '--status',
@@ -1032,8 +1919,7 @@ For Paperspace:
 
         # Handle force restart
         if args.force_restart and checkpoint_dir:
-            transcriber_temp = WhisperTranscriber(args.model, args.device)
-            video_hash = transcriber_temp.compute_file_hash(args.input)
+            video_hash = source_key(args.input, args.start_time, args.end_time)
             checkpoint_manager = CheckpointManager(checkpoint_dir, video_hash)
 
             if checkpoint_manager.has_checkpoint():
@@ -1041,39 +1927,49 @@ For Paperspace:
                 checkpoint_manager.cleanup()
                 logger.info("✓ Checkpoint deleted")
 
+        # Artifact store (decoded audio, window outputs, transcripts)
+        store = None
+        if not args.no_cache:
+            store = ArtifactStore(
+                args.artifact_dir,
+                max_bytes=int(args.cache_size_gb * 1024 ** 3)
+            )
+
+        # Log-mel features per window (shared by worker processes through the disk)
+        mel_cache = None
+        if args.mel_cache_dir:
+            mel_cache = MelCache(args.mel_cache_dir, max_bytes=int(args.mel_cache_gb * 1024 ** 3))
+
         # Initialize transcriber
         transcriber = WhisperTranscriber(
             model_name=args.model,
             device=args.device,
             checkpoint_dir=checkpoint_dir,
-            checkpoint_interval=args.checkpoint_interval
+            checkpoint_interval=args.checkpoint_interval,
+            checkpoint_sync=args.checkpoint_sync,
+            window_size=args.window_size,
+            use_vad=args.vad,
+            workers=args.workers,
+            threads_per_worker=args.threads_per_worker,
+            overlap=args.overlap,
+            store=store,
+            decoding=args.decoding,
+            cascade_model=args.cascade_model,
+            cascade_threshold=args.cascade_threshold,
+            backend=args.backend,
+            word_timestamps=args.word_timestamps,
+            mel_cache=mel_cache
         )
 
         # Setup signal handlers
         setup_signal_handlers(transcriber)
 
-        # Handle time range
-        audio_file = args.input
-        start_time_offset = 0.0
+        start_time_offset = args.start_time or 0.0
 
-        if args.start_time is not None or args.end_time is not None:
-            # Extract segment to temp file
-            temp_audio = Path(tempfile.mktemp(suffix='.wav'))
-
-            try:
-                transcriber.extract_audio_segment(
-                    args.input,
-                    args.start_time,
-                    args.end_time,
-                    temp_audio
-                )
-
-                audio_file = temp_audio
-                start_time_offset = args.start_time or 0.0
-
-            except Exception as e:
-                logger.error(f"Failed to extract audio segment: {e}")
-                sys.exit(1)
+        if args.start_time is not None:
+            logger.info(f"  Start: {transcriber._format_time(args.start_time)}")
+        if args.end_time is not None:
+            logger.info(f"  End: {transcriber._format_time(args.end_time)}")
 
         # Setup output paths
         output_dir = args.output
@@ -1084,16 +1980,37 @@ For Paperspace:
 
         # Transcribe
         start_time = datetime.now()
-        transcript = transcriber.transcribe_file(
-            audio_file,
-            start_time_offset=start_time_offset,
-            resume_from_checkpoint=args.resume
+        transcript = transcriber.load_cached_transcript(
+            source_key(args.input, args.start_time, args.end_time),
+            start_time_offset
         )
-        processing_time = (datetime.now() - start_time).total_seconds()
 
-        # Cleanup temp file
-        if audio_file != args.input and audio_file.exists():
-            audio_file.unlink()
+        if transcript is not None:
+            logger.info(f"✓ Transcript found in artifact store ({len(transcript.segments)} segments)")
+        else:
+            # Decode once (time range only, if given) into a shared PCM buffer
+            if store is not None:
+                ingest = AudioIngest(store=store)
+            else:
+                ingest = AudioIngest(args.pcm_dir or (checkpoint_dir or args.output) / 'pcm')
+
+            try:
+                pcm = ingest.load(args.input, args.start_time, args.end_time)
+            except Exception as e:
+                logger.error(f"Failed to decode audio: {e}")
+                sys.exit(1)
+
+            transcript = transcriber.transcribe_file(
+                args.input,
+                start_time_offset=start_time_offset,
+                resume_from_checkpoint=args.resume,
+                audio=pcm
+            )
+
+            # Decoded audio is kept for resume until the transcript is complete
+            ingest.release(pcm)
+
+        processing_time = (datetime.now() - start_time).total_seconds()
 
         # Save outputs
         transcriber.save_json(transcript, json_path)
@@ -1107,6 +2024,8 @@ For Paperspace:
         logger.info(f"Duration: {transcriber._format_time(transcript.duration)}")
         logger.info(f"Processing time: {transcriber._format_time(processing_time)}")
         logger.info(f"Speed: {transcript.duration / processing_time:.1f}x realtime")
+        if transcript.vad_enabled:
+            logger.info(f"Silence skipped (VAD): {transcriber._format_time(transcript.vad_skipped_seconds)}")
         logger.info(f"\nOutputs:")
         logger.info(f"  - JSON: {json_path}")
         logger.info(f"  - Thai SRT: {srt_path}")
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Artifact Store - Content-Addressed Cache for Media Processing
+============================================================
+Version: 1.0.0
+Description: Local on-disk cache for everything derived from a source
+             video: ffprobe metadata, decoded PCM, per-window Whisper
+             outputs and final transcripts. Artifacts are grouped under
+             a cheap content fingerprint of the source file, so renamed
+             or copied videos still hit, and evicted least-recently-used
+             first once the store grows past its size cap.
+
+Features:
+- Fingerprint: file size + SHA256 of blocks spread across the whole file
+- JSON and binary artifacts, atomic writes (temp file + rename)
+- LRU by file mtime (touched on every hit), safe across processes
+- Size cap: a running size estimate per writer, the store is scanned and
+  evicted down to EVICT_TARGET of the cap only when it crosses the cap
+  (or after RESCAN_SECONDS, to count other processes' writes)
+- Leases: artifacts handed to readers (e.g. PCM mapped lazily by worker
+  processes) are never evicted while their lease exists
+- Hit/miss counters
+"""
+
+import os
+import json
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path('.cache/artifacts')
+DEFAULT_MAX_BYTES = 20 * 1024 ** 3
+
+FINGERPRINT_BLOCKS = 8
+FINGERPRINT_BLOCK_SIZE = 64 * 1024
+
+# Eviction frees space down to this fraction of the cap, so the next
+# writes don't scan the store again right away
+EVICT_TARGET = 0.9
+# Writes of other processes are only seen by a scan: rescan at least this often
+RESCAN_SECONDS = 60.0
+
+# Lease files: <artifact name>.<pid>.<token>.lease next to the artifact
+LEASE_SUFFIX = '.lease'
+# Leases older than this are stale even if their pid is in use (pid reuse, Windows)
+STALE_LEASE_SECONDS = 86400.0
+
+
+# ======================== FINGERPRINT ========================
+
+def fingerprint(
+    file_path: Path,
+    blocks: int = FINGERPRINT_BLOCKS,
+    block_size: int = FINGERPRINT_BLOCK_SIZE
+) -> str:
+    """
+    Cheap content fingerprint of a (large) media file
+
+    Hashes the file size plus `blocks` blocks spread evenly from the first
+    to the last byte. Unlike a first-1MB hash, two episodes that share an
+    encoder header or intro still differ, while only ~512KB is read.
+
+    Args:
+        file_path: File to fingerprint
+        blocks: Number of sampled blocks
+        block_size: Bytes per block
+
+    Returns:
+        16-character hex string
+    """
+    size = os.path.getsize(file_path)
+    sha256 = hashlib.sha256(str(size).encode())
+
+    with open(file_path, 'rb') as f:
+        if size <= blocks * block_size:
+            sha256.update(f.read())
+        else:
+            step = (size - block_size) / (blocks - 1)
+            for i in range(blocks):
+                f.seek(int(i * step))
+                sha256.update(f.read(block_size))
+
+    return sha256.hexdigest()[:16]
+
+
+def settings_digest(settings: Dict[str, Any]) -> str:
+    """
+    Short stable digest of the settings that produced an artifact
+
+    Args:
+        settings: JSON-serializable settings (model, decode options, ...)
+
+    Returns:
+        12-character hex string
+    """
+    payload = json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+
+
+# ======================== ARTIFACT STORE ========================
+
+class ArtifactStore:
+    """Size-capped LRU store of artifacts grouped by source fingerprint"""
+
+    def __init__(self, root: Path = DEFAULT_STORE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize artifact store
+
+        Args:
+            root: Store directory
+            max_bytes: Size cap; least recently used artifacts are evicted above it
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        # Size estimate: bytes at the last scan plus bytes committed since
+        # (None: scan on the next commit)
+        self._estimated_bytes: Optional[int] = None
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key: str, name: str) -> Path:
+        """
+        Location of an artifact (parent directory is created)
+
+        Args:
+            key: Source key (fingerprint, optionally with a range suffix)
+            name: Artifact file name, e.g. 'probe.json'
+
+        Returns:
+            Artifact path
+        """
+        directory = self.root / key
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / name
+
+    def has(self, key: str, name: str) -> bool:
+        """Check whether an artifact exists (counts as a hit/miss)"""
+        path = self.root / key / name
+        if path.exists():
+            self.hits += 1
+            self.touch(key, name)
+            return True
+
+        self.misses += 1
+        return False
+
+    def touch(self, key: str, name: str):
+        """Mark an artifact as recently used"""
+        try:
+            os.utime(self.root / key / name)
+        except OSError:
+            pass
+
+    def get_json(self, key: str, name: str) -> Optional[Any]:
+        """
+        Load a JSON artifact
+
+        Args:
+            key: Source key
+            name: Artifact name
+
+        Returns:
+            Parsed data, or None if missing or unreadable
+        """
+        path = self.root / key / name
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable artifact {key}/{name}: {e}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.touch(key, name)
+        return data
+
+    def put_json(self, key: str, name: str, data: Any):
+        """
+        Store a JSON artifact atomically
+
+        Args:
+            key: Source key
+            name: Artifact name
+            data: JSON-serializable data
+        """
+        path = self.path(key, name)
+        temp_path = path.with_name(path.name + '.tmp')
+
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            temp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to store artifact {key}/{name}: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        self.commit(key, name)
+
+    def commit(self, key: str, name: str):
+        """
+        Register an artifact written directly to path() and enforce the cap
+
+        Args:
+            key: Source key
+            name: Artifact name
+        """
+        path = self.root / key / name
+        self.touch(key, name)
+
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return
+
+        with self._lock:
+            stale = time.monotonic() - self._scanned_at > RESCAN_SECONDS
+            if self._estimated_bytes is not None and not stale:
+                # Replaced artifacts are counted twice: the estimate errs high
+                self._estimated_bytes += size
+                if self._estimated_bytes <= self.max_bytes:
+                    return
+
+        self.evict(keep=path)
+
+    def total_bytes(self) -> int:
+        """Total size of all stored artifacts"""
+        return sum(size for _, size, _ in self._entries())
+
+    def lease(self, key: str, name: str) -> Path:
+        """
+        Protect an artifact from eviction until release_lease()
+
+        Leases are files, so evict() in any process honours them; those of
+        processes that have exited are removed by the next eviction.
+
+        Args:
+            key: Source key
+            name: Artifact name
+
+        Returns:
+            Lease file (pass to release_lease())
+        """
+        lease = self.path(key, f"{name}.{os.getpid()}.{uuid.uuid4().hex[:8]}{LEASE_SUFFIX}")
+        lease.touch()
+        return lease
+
+    def release_lease(self, lease: Path):
+        """Drop a lease taken with lease()"""
+        try:
+            Path(lease).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not remove lease {lease}: {e}")
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """
+        Delete least recently used artifacts once the store is over the cap
+
+        Frees space down to EVICT_TARGET of the cap. Leased artifacts are
+        skipped.
+
+        Args:
+            keep: Artifact that must survive (the one just written)
+
+        Returns:
+            Number of bytes freed
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+
+        if total > self.max_bytes:
+            leased = self._leased()
+            target = self.max_bytes * EVICT_TARGET
+        else:
+            leased, target = set(), total
+
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            if path == keep or path in leased:
+                continue
+
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+            total -= size
+            freed += size
+            logger.debug(f"Evicted artifact: {path.relative_to(self.root)}")
+
+            # Drop the source directory once it is empty
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+
+        with self._lock:
+            self._estimated_bytes = total
+            self._scanned_at = time.monotonic()
+
+        if freed:
+            logger.info(f"Artifact store: evicted {freed / (1024 * 1024):.1f} MB (LRU)")
+
+        return freed
+
+    def _leased(self) -> set:
+        """Artifacts with a live lease (stale leases are removed)"""
+        leased = set()
+        now = time.time()
+
+        for lease in self.root.glob(f'*/*{LEASE_SUFFIX}'):
+            try:
+                name, pid, _ = lease.name[:-len(LEASE_SUFFIX)].rsplit('.', 2)
+                pid = int(pid)
+                age = now - lease.stat().st_mtime
+            except (ValueError, OSError):
+                continue
+
+            if age > STALE_LEASE_SECONDS or not _process_alive(pid):
+                self.release_lease(lease)
+                continue
+            leased.add(lease.with_name(name))
+
+        return leased
+
+    def stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        entries = list(self._entries())
+        return {
+            'root': str(self.root),
+            'artifacts': len(entries),
+            'total_mb': sum(size for _, size, _ in entries) / (1024 * 1024),
+            'max_mb': self.max_bytes / (1024 * 1024),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def _entries(self):
+        """Yield (path, size, mtime) of every stored artifact"""
+        for path in self.root.glob('*/*'):
+            if path.suffix in ('.tmp', LEASE_SUFFIX) or not path.is_file():
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process exists (always True where that can't be checked safely)"""
+    if os.name == 'nt':
+        # os.kill(pid, 0) would send CTRL_C_EVENT; stale leases expire by age there
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # e.g. EPERM: exists, owned by another user
+        return True
+    return True
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Audio Ingest - Decode Once into Shared Memory-Mapped PCM
+========================================================
+Version: 1.0.0
+Description: Decodes a video/audio file (or a time range of it) exactly
+             once with FFmpeg into a raw mono PCM file, then exposes it as
+             a read-only NumPy memmap. Windows, worker processes and
+             time-range requests all slice the same pages instead of
+             writing temp WAVs and decoding again.
+
+Features:
+- Single FFmpeg pass streamed straight to disk (no temp WAV)
+- float32 (Whisper-native) or int16 (half the disk) storage
+- Input seeking for time ranges (only the range is decoded)
+- Picklable buffer handle: workers re-open the memmap, no audio is copied
+- Decoded files reused across runs/resumes, keyed by source file and range
+- Optional artifact store backing (size-capped LRU instead of per-run files);
+  buffers are leased from the store between load() and release()
+- Identical sources share one buffer: released after its last user
+"""
+
+import os
+import logging
+import threading
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional, Union
+from dataclasses import dataclass, field
+
+import numpy as np
+
+try:
+    from .artifact_store import ArtifactStore, fingerprint
+except ImportError:
+    from artifact_store import ArtifactStore, fingerprint
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# FFmpeg raw sample formats per storage dtype
+PCM_FORMATS = {
+    'float32': 'f32le',
+    'int16': 's16le',
+}
+
+
+# ======================== PCM BUFFER ========================
+
+@dataclass
+class PCMBuffer:
+    """Raw mono PCM file opened as a read-only memmap"""
+    path: str
+    sample_rate: int = SAMPLE_RATE
+    dtype: str = 'float32'
+    # Source time of sample 0 (seconds)
+    start_time: float = 0.0
+    # Source file + range key (used for checkpoint directories)
+    key: str = ""
+    _array: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+    def __getstate__(self):
+        # Ship only the path to worker processes; they map the file themselves
+        state = self.__dict__.copy()
+        state['_array'] = None
+        return state
+
+    @property
+    def array(self) -> np.ndarray:
+        """Whole buffer as a read-only memmap (opened lazily)"""
+        if self._array is None:
+            if os.path.getsize(self.path) == 0:
+                self._array = np.zeros(0, dtype=self.dtype)
+            else:
+                self._array = np.memmap(self.path, dtype=self.dtype, mode='r')
+        return self._array
+
+    @property
+    def num_samples(self) -> int:
+        return os.path.getsize(self.path) // np.dtype(self.dtype).itemsize
+
+    @property
+    def duration(self) -> float:
+        return self.num_samples / self.sample_rate
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def slice(self, start: float, end: float) -> np.ndarray:
+        """
+        Zero-copy view of [start, end) seconds (buffer timeline)
+
+        Args:
+            start: Start in seconds from the buffer start
+            end: End in seconds from the buffer start
+
+        Returns:
+            Memmap view (convert with to_float32 before decoding)
+        """
+        return self.array[int(start * self.sample_rate):int(end * self.sample_rate)]
+
+
+def to_float32(audio: np.ndarray) -> np.ndarray:
+    """
+    Return audio as float32 in [-1, 1] without copying float32 input
+
+    Args:
+        audio: float32 or int16 PCM
+
+    Returns:
+        float32 array
+    """
+    if audio.dtype == np.int16:
+        return audio.astype(np.float32) / 32768.0
+    return np.asarray(audio, dtype=np.float32)
+
+
+def source_key(
+    input_path: Path,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None
+) -> str:
+    """
+    Identify a source file (and optional time range)
+
+    Uses the artifact store fingerprint, so a full-file key matches the
+    transcription checkpoint directory names.
+
+    Args:
+        input_path: Source video/audio file
+        start_time: Range start in seconds (None for beginning)
+        end_time: Range end in seconds (None for end)
+
+    Returns:
+        Key string, e.g. '1a2b3c4d5e6f7a8b' or '1a2b3c4d5e6f7a8b_600-1200'
+    """
+    key = fingerprint(input_path)
+
+    if start_time is not None or end_time is not None:
+        start = f"{start_time:g}" if start_time is not None else "0"
+        end = f"{end_time:g}" if end_time is not None else "end"
+        key = f"{key}_{start}-{end}"
+
+    return key
+
+
+# ======================== DECODER ========================
+
+def decode_to_pcm(
+    input_path: Path,
+    output_path: Path,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    sample_rate: int = SAMPLE_RATE,
+    dtype: str = 'float32'
+) -> PCMBuffer:
+    """
+    Decode audio with one FFmpeg pass straight into a raw PCM file
+
+    The PCM stream is written to a temp name, fsynced and renamed, so an
+    interrupted decode never leaves a truncated buffer behind.
+
+    Args:
+        input_path: Source video/audio file
+        output_path: Raw PCM file to create
+        start_time: Range start in seconds (None for beginning)
+        end_time: Range end in seconds (None for end)
+        sample_rate: Output sample rate
+        dtype: 'float32' or 'int16'
+
+    Returns:
+        PCMBuffer over the new file
+    """
+    if dtype not in PCM_FORMATS:
+        raise ValueError(f"Unsupported PCM dtype: {dtype} (use {', '.join(PCM_FORMATS)})")
+
+    cmd = ['ffmpeg', '-nostdin', '-loglevel', 'error', '-threads', '0']
+
+    # Input seeking: only the requested range is decoded
+    if start_time is not None:
+        cmd.extend(['-ss', str(start_time)])
+
+    cmd.extend(['-i', str(input_path)])
+
+    if end_time is not None:
+        cmd.extend(['-t', str(end_time - (start_time or 0.0))])
+
+    cmd.extend([
+        '-vn',
+        '-ac', '1',
+        '-ar', str(sample_rate),
+        '-f', PCM_FORMATS[dtype],
+        '-'
+    ])
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+
+    # FFmpeg writes the PCM straight into the file; communicate() drains
+    # stderr as it comes, so a flood of decode errors cannot fill its pipe
+    with open(temp_path, 'wb') as f:
+        try:
+            process = subprocess.Popen(cmd, stdout=f, stderr=subprocess.PIPE)
+        except FileNotFoundError:
+            temp_path.unlink(missing_ok=True)
+            raise RuntimeError("FFmpeg not found. Install with: sudo apt-get install ffmpeg")
+
+        _, stderr = process.communicate()
+        os.fsync(f.fileno())
+
+    if process.returncode != 0:
+        temp_path.unlink(missing_ok=True)
+        message = stderr.decode('utf-8', errors='replace').strip()
+        raise RuntimeError(f"FFmpeg failed to decode {input_path}: {message}")
+
+    temp_path.replace(output_path)
+
+    return PCMBuffer(
+        path=str(output_path),
+        sample_rate=sample_rate,
+        dtype=dtype,
+        start_time=start_time or 0.0
+    )
+
+
+# ======================== INGEST CACHE ========================
+
+class AudioIngest:
+    """Decode-once store of PCM buffers keyed by source file and range"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        sample_rate: int = SAMPLE_RATE,
+        dtype: str = 'float32',
+        store: Optional[ArtifactStore] = None
+    ):
+        """
+        Initialize ingest store
+
+        Args:
+            cache_dir: Directory for decoded PCM files (when no store is given)
+            sample_rate: Decode sample rate (Whisper: 16000)
+            dtype: Storage dtype ('float32' or 'int16')
+            store: Artifact store to keep PCM in (LRU-evicted instead of released)
+        """
+        if cache_dir is None and store is None:
+            raise ValueError("AudioIngest needs a cache_dir or an artifact store")
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.sample_rate = sample_rate
+        self.dtype = dtype
+        self.store = store
+
+        # Users and store lease of each loaded PCM path
+        self._users: Dict[str, int] = {}
+        self._leases: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(
+        self,
+        input_path: Path,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None
+    ) -> PCMBuffer:
+        """
+        Get PCM for a source file (or range), decoding only if not stored yet
+
+        Every load() needs a matching release(). Until then a store-backed
+        buffer is leased, so workers that map it lazily never find it evicted.
+
+        Args:
+            input_path: Source video/audio file
+            start_time: Range start in seconds (None for beginning)
+            end_time: Range end in seconds (None for end)
+
+        Returns:
+            PCMBuffer shared by every consumer of this source
+        """
+        key = source_key(input_path, start_time, end_time)
+        pcm_name = f"pcm_{self.sample_rate}.{self.dtype}"
+
+        if self.store is not None:
+            pcm_path = self.store.path(key, pcm_name)
+            # Lease before the lookup: a concurrent eviction can't take it in between
+            self._acquire(str(pcm_path), key, pcm_name)
+        else:
+            pcm_path = self.cache_dir / f"{key}.{self.dtype}.pcm"
+            self._acquire(str(pcm_path))
+
+        try:
+            buffer = self._open(input_path, pcm_path, key, pcm_name, start_time, end_time)
+        except BaseException:
+            self._drop(str(pcm_path))
+            raise
+
+        buffer.key = key
+        return buffer
+
+    def _open(
+        self,
+        input_path: Path,
+        pcm_path: Path,
+        key: str,
+        pcm_name: str,
+        start_time: Optional[float],
+        end_time: Optional[float]
+    ) -> PCMBuffer:
+        """Reuse or decode the PCM file of a source"""
+        if self.store is not None:
+            cached = self.store.has(key, pcm_name)
+        else:
+            cached = pcm_path.exists()
+
+        if cached:
+            logger.info(f"✓ Reusing decoded audio: {pcm_path.name}")
+            buffer = PCMBuffer(
+                path=str(pcm_path),
+                sample_rate=self.sample_rate,
+                dtype=self.dtype,
+                start_time=start_time or 0.0
+            )
+        else:
+            logger.info(f"Decoding audio once: {Path(input_path).name}")
+            buffer = decode_to_pcm(
+                input_path,
+                pcm_path,
+                start_time=start_time,
+                end_time=end_time,
+                sample_rate=self.sample_rate,
+                dtype=self.dtype
+            )
+            logger.info(
+                f"✓ Audio decoded: {buffer.duration:.1f}s "
+                f"({os.path.getsize(pcm_path) / (1024 * 1024):.1f} MB {self.dtype} PCM)"
+            )
+
+            if self.store is not None:
+                self.store.commit(key, pcm_name)
+
+        return buffer
+
+    def _acquire(self, path: str, key: Optional[str] = None, name: Optional[str] = None):
+        """Count a user of a PCM path (the first one leases it from the store)"""
+        with self._lock:
+            self._users[path] = self._users.get(path, 0) + 1
+            if key is not None and path not in self._leases:
+                self._leases[path] = self.store.lease(key, name)
+
+    def _drop(self, path: str) -> bool:
+        """Uncount a user; True (and the store lease dropped) after the last one"""
+        with self._lock:
+            users = self._users.get(path, 0) - 1
+            if users > 0:
+                self._users[path] = users
+                return False
+            self._users.pop(path, None)
+            lease = self._leases.pop(path, None)
+
+        if lease is not None:
+            self.store.release_lease(lease)
+        return True
+
+    def release(self, buffer: PCMBuffer):
+        """
+        Delete a decoded buffer once no consumer needs it
+
+        Buffers loaded several times are kept until their last release().
+        Store-backed buffers are kept for the next run; their lease is
+        dropped and the store's LRU cap decides when they go.
+
+        Args:
+            buffer: Buffer returned by load()
+        """
+        buffer._array = None
+
+        if not self._drop(buffer.path) or self.store is not None:
+            return
+
+        try:
+            Path(buffer.path).unlink(missing_ok=True)
+            logger.debug(f"Released decoded audio: {buffer.path}")
+        except OSError as e:
+            logger.warning(f"Failed to delete decoded audio {buffer.path}: {e}")
+
+
+AudioInput = Union[np.ndarray, PCMBuffer]
+
+
+def as_samples(audio: AudioInput) -> np.ndarray:
+    """Get the sample array behind an ndarray or PCMBuffer"""
+    if isinstance(audio, PCMBuffer):
+        return audio.array
+    return audio
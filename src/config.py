@@ -62,6 +62,12 @@ class WhisperModel(Enum):
     LARGE_V3 = "large-v3"
 
 
+class TranslationEngine(Enum):
+    """Schedulers for segment translation requests"""
+    BATCH = "batch"  # batch_size requests per round; a round waits for its slowest request
+    ASYNC = "async"  # asyncio sliding window: max_in_flight requests pending at all times
+
+
 class CacheStrategy(Enum):
     """Caching strategies"""
     NONE = "none"
@@ -217,12 +223,62 @@ class ProcessingConfig:
     enable_parallel: bool = True
     enable_gpu: bool = False
     device: str = "cpu"
+    translation_engine: TranslationEngine = TranslationEngine.BATCH  # TRANSLATION_ENGINE=async opts in
+    max_in_flight: int = 16  # async engine: concurrent translation requests
+    request_timeout: float = 30.0  # seconds per translation request
+    pack_tokens: int = 0  # packed requests: consecutive segments per request up to this many tokens (0 = one per segment)
     
     def __post_init__(self):
         """Load from environment"""
         workers = os.getenv('MAX_WORKERS')
         if workers:
             self.max_workers = int(workers)
+        
+        engine = os.getenv('TRANSLATION_ENGINE')
+        if engine:
+            try:
+                self.translation_engine = TranslationEngine(engine)
+            except ValueError:
+                logger.warning(f"Invalid TRANSLATION_ENGINE '{engine}', using {self.translation_engine.value}")
+        
+        in_flight = os.getenv('MAX_IN_FLIGHT')
+        if in_flight:
+            self.max_in_flight = int(in_flight)
+        
+        timeout = os.getenv('REQUEST_TIMEOUT')
+        if timeout:
+            self.request_timeout = float(timeout)
+        
+        pack_tokens = os.getenv('PACK_TOKENS')
+        if pack_tokens:
+            self.pack_tokens = int(pack_tokens)
+
+
+@dataclass
+class RateLimitConfig:
+    """Provider rate limits, shared by every thread and process (see rate_limiter.py)"""
+    requests_per_minute: int = 0  # per model, 0 = unlimited
+    tokens_per_minute: int = 0  # per model, 0 = unlimited
+    state_dir: Optional[Path] = None  # shared bucket state (default: <cache>/rate_limits)
+    min_concurrency: int = 1  # floor of the adaptive in-flight limit
+    latency_target: float = 0.0  # seconds; slower responses shrink concurrency (0 = 429s only)
+    
+    def __post_init__(self):
+        """Load from environment"""
+        rpm = os.getenv('OPENAI_RPM')
+        if rpm:
+            self.requests_per_minute = int(rpm)
+        
+        tpm = os.getenv('OPENAI_TPM')
+        if tpm:
+            self.tokens_per_minute = int(tpm)
+        
+        if self.state_dir is None:
+            self.state_dir = Path(os.getenv('RATE_LIMIT_DIR', Path(os.getenv('CACHE_DIR', '.cache')) / 'rate_limits'))
+        
+        latency = os.getenv('LATENCY_TARGET')
+        if latency:
+            self.latency_target = float(latency)
 
 
 @dataclass
@@ -268,6 +324,7 @@ class Config:
         self.translation = TranslationConfig()
         self.cache = CacheConfig()
         self.processing = ProcessingConfig()
+        self.rate_limit = RateLimitConfig()
         self.logging = LoggingConfig()
         self.quality = QualityConfig()
         
@@ -366,6 +423,7 @@ class Config:
             "translation": asdict(self.translation),
             "cache": asdict(self.cache),
             "processing": asdict(self.processing),
+            "rate_limit": asdict(self.rate_limit),
             "logging": asdict(self.logging),
             "quality": asdict(self.quality),
             "domain": self.domain,
@@ -425,6 +483,7 @@ if __name__ == "__main__":
         print(f"  Default Model: {config.translation.default_model.value}")
         print(f"  Cache Strategy: {config.cache.strategy.value}")
         print(f"  Max Workers: {config.processing.max_workers}")
+        print(f"  Translation Engine: {config.processing.translation_engine.value}")
         
         # Test cost estimation
         cost = config.estimate_cost(segments=100)
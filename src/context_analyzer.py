@@ -221,6 +221,9 @@ class ContextAnalyzer:
     Implements two-pass analysis for accurate translation
     """
     
+    # Incremental analysis: segments between topic/sentiment refreshes
+    CONTEXT_REFRESH_SEGMENTS = 20
+    
     def __init__(self):
         """Initialize the context analyzer"""
         self.patterns = ColloquialPatterns()
@@ -243,14 +246,26 @@ class ContextAnalyzer:
         if doc_type is None:
             doc_type = self._detect_document_type(text)
         
-        # Split into segments
-        self.segments = self._segment_text(text)
+        self.begin_document(doc_type)
+        self.add_text(text)
+        
+        return self.finalize_document()
+    
+    def begin_document(self, doc_type: DocumentType = DocumentType.MIXED) -> DocumentContext:
+        """
+        Start an incremental analysis (text arrives through add_text)
         
-        # Initialize document context
+        Args:
+            doc_type: Type of document
+            
+        Returns:
+            Empty document context, filled in as text is added
+        """
+        self.segments = []
         self.document_context = DocumentContext(
             doc_type=doc_type,
-            primary_topic=self._detect_primary_topic(text),
-            trading_context=self._detect_trading_context(text),
+            primary_topic="general_trading",
+            trading_context=TradingContext.NEUTRAL,
             key_concepts=[],
             forex_terms=set(),
             colloquialisms=set(),
@@ -258,14 +273,52 @@ class ContextAnalyzer:
             segment_contexts=[],
             term_frequency=Counter()
         )
+        return self.document_context
+    
+    def add_text(self, text: str) -> List[SegmentContext]:
+        """
+        Analyze the next piece of an incremental document
+        
+        Document-level topic and trading context are refreshed every
+        CONTEXT_REFRESH_SEGMENTS segments, so later segments are translated
+        with what has been heard so far.
+        
+        Args:
+            text: Newly finalized text (e.g. one transcript segment)
+            
+        Returns:
+            Contexts of the segments the text was split into
+        """
+        if self.document_context is None:
+            self.begin_document()
         
-        # Analyze each segment
-        for idx, segment in enumerate(self.segments):
+        contexts = []
+        for segment in self._segment_text(text):
+            idx = len(self.document_context.segment_contexts)
             segment_ctx = self._analyze_segment(segment, idx)
             self.document_context.segment_contexts.append(segment_ctx)
+            self.segments.append(segment)
             
             # Collect terms and patterns
             self._collect_terms(segment, segment_ctx)
+            contexts.append(segment_ctx)
+            
+            if len(self.segments) % self.CONTEXT_REFRESH_SEGMENTS == 0:
+                self._refresh_document_context()
+        
+        return contexts
+    
+    def finalize_document(self) -> DocumentContext:
+        """
+        Finish an incremental analysis with the whole-document passes
+        
+        Returns:
+            Complete document context
+        """
+        if self.document_context is None:
+            self.begin_document()
+        
+        self._refresh_document_context()
         
         # Post-processing: Find relationships between segments
         self._find_segment_relationships()
@@ -278,6 +331,12 @@ class ContextAnalyzer:
         
         return self.document_context
     
+    def _refresh_document_context(self):
+        """Re-detect topic and trading context from the text seen so far"""
+        text = "\n".join(self.segments)
+        self.document_context.primary_topic = self._detect_primary_topic(text)
+        self.document_context.trading_context = self._detect_trading_context(text)
+    
     def _detect_document_type(self, text: str) -> DocumentType:
         """Detect the type of document"""
         # Check for tutorial indicators
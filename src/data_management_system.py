@@ -344,6 +344,12 @@ class DictionaryManager:
         
         return results
     
+    def extract_terms(self, text: str) -> List[str]:
+        """Find the English dictionary terms used in a (translated) text"""
+        # Pad with spaces so only whole words and phrases match
+        words = f" {' '.join(''.join(c if c.isalnum() or c == '/' else ' ' for c in text.lower()).split())} "
+        return [term for term in self.english_index if f" {term} " in words]
+    
     def export_all(self, filepath: Path):
         """Export all dictionaries to a single file"""
         data = {
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Decoding Strategy - Two-Tier Whisper Decoding
+=============================================
+Version: 1.0.0
+Description: Beam search with a five-temperature fallback on every window
+             is what keeps CPU transcription well under realtime. In
+             two-tier mode each window is first decoded greedily (one
+             temperature, no beam), scored, and only windows that look
+             unreliable are decoded again with the full accurate settings.
+
+Window score (speech segments only):
+- avg_logprob: duration-weighted mean token log probability
+- compression_ratio: worst segment (repetition loops are local)
+- word_probability: mean word probability
+
+Features:
+- 'accurate' mode: the original settings for every window
+- 'two-tier' mode: greedy pass, targeted beam/temperature re-decode
+- Per-window telemetry (scores, fallbacks, re-decodes, timings)
+- Run totals for comparing throughput against accuracy
+- Escalation totals for model cascades (share of audio sent to the large model)
+- Lazy word timestamps: alignment only for segments that need it
+- Optional mel cache: features of known windows are not computed again
+"""
+
+import time
+import logging
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .word_alignment import AlignmentPolicy, align_lazily
+    from .mel_cache import MelCache, feed_features
+except ImportError:
+    from word_alignment import AlignmentPolicy, align_lazily
+    from mel_cache import MelCache, feed_features
+
+logger = logging.getLogger(__name__)
+
+DECODING_ACCURATE = 'accurate'
+DECODING_TWO_TIER = 'two-tier'
+DECODING_MODES = (DECODING_ACCURATE, DECODING_TWO_TIER)
+
+# First pass of two-tier mode: greedy, single temperature (no fallback)
+GREEDY_OVERRIDES = {
+    "temperature": 0.0,
+    "beam_size": None,
+    "best_of": None,
+}
+
+# Whisper treats a segment as silence above this no-speech probability
+# when its avg_logprob is also below the logprob threshold
+NO_SPEECH_PROB = 0.6
+SILENCE_LOGPROB = -1.0
+
+
+@dataclass
+class QualityThresholds:
+    """Limits that flag a greedy window for re-decoding"""
+    min_avg_logprob: float = -0.8
+    max_compression_ratio: float = 2.2
+    min_word_probability: float = 0.55
+
+
+@dataclass
+class WindowScore:
+    """Quality metrics of one decoded window"""
+    avg_logprob: float = 0.0
+    compression_ratio: float = 0.0
+    word_probability: float = 1.0
+    speech_seconds: float = 0.0
+    flagged: bool = False
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class WindowDecode:
+    """Telemetry of one window"""
+    label: str
+    mode: str
+    audio_seconds: float
+    first_pass_seconds: float
+    score: WindowScore
+    redecoded: bool = False
+    redecode_seconds: float = 0.0
+    # Segments where Whisper fell back to a temperature above 0
+    fallbacks: int = 0
+    # Spans re-transcribed by a larger model (model cascade)
+    escalations: int = 0
+    escalated_seconds: float = 0.0
+    segments: int = 0
+    # Lazy word timestamps: segments aligned after decoding
+    aligned_segments: int = 0
+    alignment_seconds: float = 0.0
+    # Log-mel spectrogram lookups (mel cache)
+    mel_hits: int = 0
+    mel_misses: int = 0
+
+
+def score_result(result: Dict[str, Any], thresholds: Optional[QualityThresholds] = None) -> WindowScore:
+    """
+    Score a Whisper result and decide whether it needs re-decoding
+
+    Args:
+        result: Output of model.transcribe()
+        thresholds: Flagging limits (default: QualityThresholds())
+
+    Returns:
+        WindowScore (windows without speech are never flagged)
+    """
+    thresholds = thresholds or QualityThresholds()
+
+    speech = [
+        seg for seg in result.get('segments', [])
+        if not (seg.get('no_speech_prob', 0.0) > NO_SPEECH_PROB
+                and seg.get('avg_logprob', 0.0) < SILENCE_LOGPROB)
+    ]
+
+    score = WindowScore()
+    if not speech:
+        return score
+
+    durations = [max(seg.get('end', 0.0) - seg.get('start', 0.0), 1e-3) for seg in speech]
+    score.speech_seconds = sum(durations)
+    score.avg_logprob = sum(
+        seg.get('avg_logprob', 0.0) * d for seg, d in zip(speech, durations)
+    ) / score.speech_seconds
+    score.compression_ratio = max(seg.get('compression_ratio', 0.0) for seg in speech)
+
+    probabilities = [
+        word['probability']
+        for seg in speech
+        for word in seg.get('words') or []
+        if 'probability' in word
+    ]
+    if probabilities:
+        score.word_probability = sum(probabilities) / len(probabilities)
+
+    if score.avg_logprob < thresholds.min_avg_logprob:
+        score.reasons.append('logprob')
+    if score.compression_ratio > thresholds.max_compression_ratio:
+        score.reasons.append('compression')
+    if score.word_probability < thresholds.min_word_probability:
+        score.reasons.append('word_prob')
+
+    score.flagged = bool(score.reasons)
+    return score
+
+
+def count_fallbacks(result: Dict[str, Any]) -> int:
+    """Number of segments Whisper had to decode at a temperature above 0"""
+    return sum(1 for seg in result.get('segments', []) if seg.get('temperature', 0.0) > 0.0)
+
+
+def decode_window(
+    model,
+    audio,
+    settings: Dict[str, Any],
+    mode: str = DECODING_TWO_TIER,
+    thresholds: Optional[QualityThresholds] = None,
+    label: str = 'window',
+    sample_rate: int = 16000,
+    alignment: Optional[AlignmentPolicy] = None,
+    mel_cache: Optional[MelCache] = None
+) -> Tuple[Dict[str, Any], WindowDecode]:
+    """
+    Decode one audio window with the given strategy
+
+    Args:
+        model: Loaded Whisper model
+        audio: Window samples (16kHz float32) or a file path
+        settings: Accurate Whisper settings (beam search, temperature fallback)
+        mode: DECODING_ACCURATE or DECODING_TWO_TIER
+        thresholds: Limits that flag a greedy window
+        label: Window name used in the telemetry log line
+        sample_rate: Sample rate of audio (for the audio duration)
+        alignment: Lazy word timestamps: decode without them, then align
+                   only the segments this policy flags (None = use settings)
+        mel_cache: Serve log-mel features from this cache (None = compute)
+
+    Returns:
+        Tuple of (Whisper result, WindowDecode telemetry)
+    """
+    if mode not in DECODING_MODES:
+        raise ValueError(f"Unknown decoding mode '{mode}' (choose from {', '.join(DECODING_MODES)})")
+
+    audio_seconds = len(audio) / sample_rate if not isinstance(audio, str) else 0.0
+    if alignment is not None:
+        settings = {**settings, 'word_timestamps': False}
+    first_settings = settings if mode == DECODING_ACCURATE else {**settings, **GREEDY_OVERRIDES}
+
+    hits, misses = (mel_cache.hits, mel_cache.misses) if mel_cache else (0, 0)
+
+    started = time.time()
+    with feed_features(mel_cache):
+        result = model.transcribe(audio, **first_settings)
+
+    telemetry = WindowDecode(
+        label=label,
+        mode=mode,
+        audio_seconds=audio_seconds or result.get('duration', 0.0),
+        first_pass_seconds=time.time() - started,
+        score=score_result(result, thresholds),
+        fallbacks=count_fallbacks(result)
+    )
+
+    if mode == DECODING_TWO_TIER and telemetry.score.flagged:
+        started = time.time()
+        with feed_features(mel_cache):
+            result = model.transcribe(audio, **settings)
+        telemetry.redecoded = True
+        telemetry.redecode_seconds = time.time() - started
+        telemetry.fallbacks += count_fallbacks(result)
+
+    telemetry.segments = len(result.get('segments', []))
+    if mel_cache is not None:
+        telemetry.mel_hits = mel_cache.hits - hits
+        telemetry.mel_misses = mel_cache.misses - misses
+
+    if alignment is not None:
+        telemetry.aligned_segments, telemetry.alignment_seconds = align_lazily(
+            model, audio, result, alignment, settings
+        )
+
+    score = telemetry.score
+    logger.info(
+        f"  - {label}: logprob={score.avg_logprob:.2f} cr={score.compression_ratio:.2f} "
+        f"word_prob={score.word_probability:.2f} fallbacks={telemetry.fallbacks} "
+        + (f"-> re-decoded ({', '.join(score.reasons)}) " if telemetry.redecoded else "")
+        + (f"aligned={telemetry.aligned_segments} " if alignment is not None else "")
+        + f"[{telemetry.first_pass_seconds + telemetry.redecode_seconds + telemetry.alignment_seconds:.1f}s]"
+    )
+
+    return result, telemetry
+
+
+# ======================== RUN TELEMETRY ========================
+
+@dataclass
+class DecodeTelemetry:
+    """Decoding totals of one transcription run"""
+    mode: str = DECODING_ACCURATE
+    windows: int = 0
+    redecoded: int = 0
+    fallbacks: int = 0
+    audio_seconds: float = 0.0
+    first_pass_seconds: float = 0.0
+    redecode_seconds: float = 0.0
+    escalations: int = 0
+    escalated_seconds: float = 0.0
+    segments: int = 0
+    aligned_segments: int = 0
+    alignment_seconds: float = 0.0
+    mel_hits: int = 0
+    mel_misses: int = 0
+
+    def record(self, window: WindowDecode):
+        """Add one window's telemetry"""
+        self.windows += 1
+        self.redecoded += int(window.redecoded)
+        self.fallbacks += window.fallbacks
+        self.audio_seconds += window.audio_seconds
+        self.first_pass_seconds += window.first_pass_seconds
+        self.redecode_seconds += window.redecode_seconds
+        self.escalations += window.escalations
+        self.escalated_seconds += window.escalated_seconds
+        self.segments += window.segments
+        self.aligned_segments += window.aligned_segments
+        self.alignment_seconds += window.alignment_seconds
+        self.mel_hits += window.mel_hits
+        self.mel_misses += window.mel_misses
+
+    @property
+    def decode_seconds(self) -> float:
+        return self.first_pass_seconds + self.redecode_seconds + self.alignment_seconds
+
+    @property
+    def realtime_factor(self) -> float:
+        return self.audio_seconds / self.decode_seconds if self.decode_seconds > 0 else 0.0
+
+    @property
+    def escalated_fraction(self) -> float:
+        """Share of the decoded audio that a cascade sent to the larger model"""
+        return self.escalated_seconds / self.audio_seconds if self.audio_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Totals plus derived rates, for JSON metadata"""
+        return {
+            **asdict(self),
+            'redecode_rate': self.redecoded / self.windows if self.windows else 0.0,
+            'escalated_fraction': self.escalated_fraction,
+            'aligned_fraction': self.aligned_segments / self.segments if self.segments else 0.0,
+            'realtime_factor': self.realtime_factor
+        }
+
+    def log_summary(self):
+        """Log the run totals"""
+        if not self.windows:
+            return
+
+        logger.info(
+            f"  - Decoding ({self.mode}): {self.windows} windows, "
+            f"{self.redecoded} re-decoded ({self.redecoded / self.windows:.0%}), "
+            f"{self.fallbacks} temperature fallbacks, "
+            f"{self.realtime_factor:.2f}x realtime"
+        )
+
+        if self.escalations:
+            logger.info(
+                f"  - Escalated: {self.escalations} span(s), {self.escalated_seconds:.1f}s "
+                f"({self.escalated_fraction:.1%} of audio)"
+            )
+
+        if self.alignment_seconds:
+            logger.info(
+                f"  - Word timestamps (lazy): {self.aligned_segments}/{self.segments} segments aligned "
+                f"in {self.alignment_seconds:.1f}s"
+            )
+
+        lookups = self.mel_hits + self.mel_misses
+        if lookups:
+            logger.info(
+                f"  - Mel cache: {self.mel_hits} hits, {self.mel_misses} misses "
+                f"({self.mel_hits / lookups:.0%} of features reused)"
+            )
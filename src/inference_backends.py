@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Inference Backends - Pluggable Whisper Model Loading
+====================================================
+Version: 1.0.0
+Description: One place that turns (model name, device, backend) into a
+             loaded Whisper model. Every backend returns an object with the
+             openai-whisper `transcribe()` API, so transcribers, decoding
+             strategies and the model cascade work unchanged.
+
+Backends:
+- openai-whisper: stock PyTorch model (fp32 on CPU, fp16 on CUDA)
+- int8:           PyTorch dynamic quantization of every Linear layer to
+                  int8 (CPU only; attention and MLP matmuls dominate)
+- onnx:           audio encoder exported to ONNX and run with ONNX
+                  Runtime on CPU; the autoregressive decoder stays in
+                  PyTorch (its kv-cache loop is driven by openai-whisper)
+
+Optional dependencies:
+- onnx, onnxruntime (onnx backend only)
+"""
+
+import os
+import logging
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+BACKEND_OPENAI = 'openai-whisper'
+BACKEND_INT8 = 'int8'
+BACKEND_ONNX = 'onnx'
+BACKENDS = (BACKEND_OPENAI, BACKEND_INT8, BACKEND_ONNX)
+
+# Exported encoders are kept here (one file set per model)
+DEFAULT_ONNX_DIR = Path(os.environ.get('WHISPER_ONNX_DIR', Path.home() / '.cache' / 'whisper-onnx'))
+
+ONNX_OPSET = 17
+
+
+def load_whisper_model(
+    model_name: str,
+    device: str = 'cpu',
+    backend: str = BACKEND_OPENAI,
+    onnx_dir: Optional[Path] = None
+):
+    """
+    Load a Whisper model with the given inference backend
+
+    Args:
+        model_name: Whisper model name (tiny ... large-v3)
+        device: 'cpu' or 'cuda' (int8 and onnx are CPU only)
+        backend: One of BACKENDS
+        onnx_dir: Where exported ONNX encoders are cached (onnx backend)
+
+    Returns:
+        Model exposing openai-whisper's transcribe()
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}' (choose from {', '.join(BACKENDS)})")
+
+    if backend != BACKEND_OPENAI and device != 'cpu':
+        raise ValueError(f"The {backend} backend runs on CPU only (got device '{device}')")
+
+    import whisper
+
+    model = whisper.load_model(model_name, device=device)
+
+    if backend == BACKEND_INT8:
+        model = quantize_int8(model)
+    elif backend == BACKEND_ONNX:
+        attach_onnx_encoder(model, model_name, onnx_dir or DEFAULT_ONNX_DIR)
+
+    return model
+
+
+# ======================== INT8 (PYTORCH DYNAMIC QUANTIZATION) ========================
+
+def quantize_int8(model):
+    """
+    Quantize every Linear layer of a CPU Whisper model to int8
+
+    Weights are stored as int8 and activations are quantized on the fly,
+    which roughly halves the matmul time on CPUs with VNNI/AVX2 and cuts
+    the resident model size by about 3x.
+
+    Args:
+        model: openai-whisper model on CPU (fp32)
+
+    Returns:
+        Quantized model (same transcribe() API)
+    """
+    import torch
+    import whisper.model
+
+    # whisper.model.Linear only casts weights to the input dtype; as a plain
+    # nn.Linear it is accepted by the dynamic quantization module mapping
+    for module in model.modules():
+        if isinstance(module, whisper.model.Linear):
+            module.__class__ = torch.nn.Linear
+
+    # In place: a copy would briefly double the resident size of large-v3
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    logger.info("✓ Linear layers quantized to int8 (dynamic)")
+    return quantized
+
+
+# ======================== ONNX RUNTIME ENCODER ========================
+
+def _onnx_encoder_path(model_name: str, onnx_dir: Path) -> Path:
+    return Path(onnx_dir) / model_name / 'encoder.onnx'
+
+
+def export_onnx_encoder(model, model_name: str, onnx_dir: Path) -> Path:
+    """
+    Export the audio encoder to ONNX (skipped if already exported)
+
+    Args:
+        model: openai-whisper model on CPU
+        model_name: Model name (cache key)
+        onnx_dir: Export cache directory
+
+    Returns:
+        Path of the encoder .onnx file
+    """
+    import torch
+
+    path = _onnx_encoder_path(model_name, onnx_dir)
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dims = model.dims
+    mel = torch.zeros(1, dims.n_mels, dims.n_audio_ctx * 2)
+
+    logger.info(f"Exporting {model_name} encoder to ONNX (one time): {path}")
+
+    # Export next to the target and rename, so an interrupted export is not reused
+    temp_path = path.with_name(path.name + '.tmp')
+    with torch.no_grad():
+        torch.onnx.export(
+            model.encoder,
+            mel,
+            str(temp_path),
+            input_names=['mel'],
+            output_names=['audio_features'],
+            dynamic_axes={'mel': {0: 'batch'}, 'audio_features': {0: 'batch'}},
+            opset_version=ONNX_OPSET
+        )
+    temp_path.replace(path)
+
+    return path
+
+
+def attach_onnx_encoder(model, model_name: str, onnx_dir: Path):
+    """
+    Replace the PyTorch audio encoder with an ONNX Runtime session
+
+    Args:
+        model: openai-whisper model on CPU (modified in place)
+        model_name: Model name (cache key of the exported encoder)
+        onnx_dir: Export cache directory
+    """
+    try:
+        import onnxruntime
+    except ImportError:
+        raise ImportError("The onnx backend needs ONNX Runtime. Install with: pip install onnx onnxruntime")
+
+    path = export_onnx_encoder(model, model_name, onnx_dir)
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    session = onnxruntime.InferenceSession(str(path), options, providers=['CPUExecutionProvider'])
+    model.encoder = _onnx_audio_encoder(session)
+
+    logger.info("✓ Audio encoder running on ONNX Runtime (CPU)")
+
+
+def _onnx_audio_encoder(session):
+    """Drop-in for whisper's AudioEncoder backed by an ONNX Runtime session"""
+    import numpy as np
+    import torch
+
+    # Defined here so importing this module does not require torch
+    class OnnxAudioEncoder(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.input_name = session.get_inputs()[0].name
+
+        def forward(self, mel):
+            features = session.run(None, {self.input_name: mel.detach().cpu().numpy().astype(np.float32)})[0]
+            return torch.from_numpy(features)
+
+    return OnnxAudioEncoder()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Mel Cache - Memory-Mapped Log-Mel Spectrograms per Audio Window
+===============================================================
+Version: 1.0.0
+Description: Whisper turns every window it is given into a log-mel
+             spectrogram before decoding, and does it again for every
+             re-run of the same episode (prompt tweaks, thresholds, model
+             comparisons) and for the beam re-decode of two-tier mode.
+             This cache keeps those spectrograms on disk as .npy files,
+             keyed by a hash of the window samples and the mel parameters,
+             and serves them memory-mapped, so Whisper only pages in the
+             30-second slices it actually decodes.
+
+Features:
+- Key: SHA256 of the float32 window samples + n_mels/n_fft/hop/padding
+- Same-size models share features (large-v3: 128 mels, others: 80)
+- Size cap with LRU eviction and hit/miss counters (ArtifactStore)
+- feed_features(): model.transcribe() picks cached features up transparently
+  (thread-local, so other threads keep computing their own)
+
+Decoded PCM is cached by the artifact store (audio_ingest.py); together the
+two skip everything before the first encoder pass on a re-run.
+"""
+
+import hashlib
+import logging
+import importlib
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    from .artifact_store import ArtifactStore
+except ImportError:
+    from artifact_store import ArtifactStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEL_CACHE_DIR = Path('.cache/mel')
+DEFAULT_MEL_CACHE_BYTES = 10 * 1024 ** 3
+
+# Cache used by the patched log_mel_spectrogram in the current thread
+_active = threading.local()
+
+
+def audio_digest(samples) -> str:
+    """
+    Content hash of audio samples
+
+    Args:
+        samples: 1-D audio (NumPy array or CPU tensor), hashed as float32
+
+    Returns:
+        16-character hex string
+    """
+    data = np.ascontiguousarray(np.asarray(samples), dtype=np.float32)
+    return hashlib.sha256(data.tobytes()).hexdigest()[:16]
+
+
+class MelCache:
+    """Size-capped on-disk cache of Whisper log-mel spectrograms"""
+
+    def __init__(self, root: Path = DEFAULT_MEL_CACHE_DIR, max_bytes: int = DEFAULT_MEL_CACHE_BYTES):
+        """
+        Initialize mel cache
+
+        Args:
+            root: Cache directory (one subdirectory per audio window)
+            max_bytes: Size cap; least recently used spectrograms are evicted above it
+        """
+        self.store = ArtifactStore(root, max_bytes=max_bytes)
+
+    @property
+    def hits(self) -> int:
+        return self.store.hits
+
+    @property
+    def misses(self) -> int:
+        return self.store.misses
+
+    @staticmethod
+    def _name(n_mels: int, padding: int) -> str:
+        from whisper.audio import HOP_LENGTH, N_FFT, SAMPLE_RATE
+        return f"mel_{n_mels}_{N_FFT}_{HOP_LENGTH}_{SAMPLE_RATE}_pad{padding}.npy"
+
+    def log_mel(self, samples, n_mels: int, padding: int = 0, compute=None):
+        """
+        Log-mel spectrogram of audio samples, from the cache if possible
+
+        Args:
+            samples: 16kHz mono audio (NumPy array or CPU tensor)
+            n_mels: Mel bins of the model (model.dims.n_mels)
+            padding: Zero samples appended before the STFT (as Whisper's)
+            compute: Spectrogram function (default: whisper.audio.log_mel_spectrogram)
+
+        Returns:
+            CPU tensor of shape (n_mels, frames); memory-mapped on a hit
+        """
+        import torch
+
+        key = audio_digest(samples)
+        name = self._name(n_mels, padding)
+
+        if self.store.has(key, name):
+            try:
+                # Copy-on-write map: writable for torch, the file stays untouched
+                mel = np.load(self.store.path(key, name), mmap_mode='c')
+                return torch.from_numpy(mel)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable mel spectrogram {key}/{name}: {e}")
+                self.store.path(key, name).unlink(missing_ok=True)
+                self.store.hits -= 1
+                self.store.misses += 1
+
+        if compute is None:
+            from whisper.audio import log_mel_spectrogram as compute
+
+        mel = compute(samples, n_mels, padding=padding)
+        self._put(key, name, mel.detach().cpu().numpy())
+        return mel
+
+    def _put(self, key: str, name: str, mel: np.ndarray):
+        """Store a spectrogram atomically"""
+        path = self.store.path(key, name)
+        temp_path = path.with_name(path.name + '.tmp')
+
+        try:
+            with open(temp_path, 'wb') as f:
+                np.save(f, mel)
+            temp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to store mel spectrogram {key}/{name}: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        self.store.commit(key, name)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return self.store.stats()
+
+    def log_summary(self):
+        """Log the cache size (hit/miss counts are part of the decode telemetry)"""
+        stats = self.stats()
+        logger.info(
+            f"  - Mel cache size: {stats['artifacts']} spectrograms, "
+            f"{stats['total_mb']:.0f} of {stats['max_mb']:.0f} MB ({stats['root']})"
+        )
+
+
+# ======================== WHISPER HOOK ========================
+
+def _install_hook():
+    """Route whisper.transcribe's log_mel_spectrogram through the active cache (once)"""
+    # Import the submodule: the package attribute `transcribe` is the function
+    module = importlib.import_module('whisper.transcribe')
+    original = module.log_mel_spectrogram
+    if getattr(original, 'mel_cache_hook', False):
+        return
+
+    def log_mel_spectrogram(audio, n_mels: int = 80, padding: int = 0, device=None):
+        cache = getattr(_active, 'cache', None)
+        if cache is None or isinstance(audio, str):
+            return original(audio, n_mels, padding=padding, device=device)
+
+        mel = cache.log_mel(audio, n_mels, padding=padding, compute=original)
+        return mel.to(device) if device is not None else mel
+
+    log_mel_spectrogram.mel_cache_hook = True
+    module.log_mel_spectrogram = log_mel_spectrogram
+
+
+@contextmanager
+def feed_features(cache: Optional[MelCache]):
+    """
+    Serve model.transcribe() calls in this block from the mel cache
+
+    Args:
+        cache: Mel cache (None: no-op, Whisper computes features as usual)
+    """
+    if cache is None:
+        yield
+        return
+
+    _install_hook()
+    previous = getattr(_active, 'cache', None)
+    _active.cache = cache
+    try:
+        yield
+    finally:
+        _active.cache = previous
@@ -12,12 +12,18 @@ Pipeline Stages:
 3. Translation (smart routing + caching)
 4. Quality Validation
 5. SRT Generation
+
+Streaming mode (default) runs stages 1-3 concurrently: Whisper releases
+segments window by window into a bounded queue, and context analysis and
+translation consume them while later windows are still being decoded.
 """
 
 import os
 import sys
+import queue
 import logging
 import argparse
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -33,20 +39,35 @@ logger = logging.getLogger(__name__)
 
 # Local imports
 try:
-    from .thai_transcriber import ThaiTranscriber, TranscriptionResult
+    from .thai_transcriber import ThaiTranscriber, TranscriptionResult, SegmentStream
     from .context_analyzer import ContextAnalyzer, DocumentType
     from .translation_pipeline import TranslationPipeline, TranscriptionSegment
     from .config import Config, ConfigMode
+    from .artifact_store import ArtifactStore
+    from .mel_cache import MelCache
+    from .decoding_strategy import DECODING_ACCURATE, DECODING_MODES
+    from .inference_backends import BACKEND_OPENAI, BACKENDS
+    from .word_alignment import WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMP_MODES
+    from .service_client import JOB_COMPLETED, JOB_TRANSLATE, ServiceClient, ServiceError, log_event
 except ImportError:
     try:
-        from thai_transcriber import ThaiTranscriber, TranscriptionResult
+        from thai_transcriber import ThaiTranscriber, TranscriptionResult, SegmentStream
         from context_analyzer import ContextAnalyzer, DocumentType
         from translation_pipeline import TranslationPipeline, TranscriptionSegment
         from config import Config, ConfigMode
+        from artifact_store import ArtifactStore
+        from mel_cache import MelCache
+        from decoding_strategy import DECODING_ACCURATE, DECODING_MODES
+        from inference_backends import BACKEND_OPENAI, BACKENDS
+        from word_alignment import WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMP_MODES
+        from service_client import JOB_COMPLETED, JOB_TRANSLATE, ServiceClient, ServiceError, log_event
     except ImportError:
         logger.error("Failed to import required modules")
         sys.exit(1)
 
+# Streaming: transcribed segments buffered ahead of translation
+STREAM_QUEUE_SIZE = 64
+
 
 # ======================== DATA STRUCTURES ========================
 
@@ -73,7 +94,17 @@ class VideoTranslationOrchestrator:
         self,
         whisper_model: str = "large-v3",
         config_mode: ConfigMode = ConfigMode.PRODUCTION,
-        device: str = "cpu"
+        device: str = "cpu",
+        use_vad: bool = False,
+        artifact_dir: Optional[Path] = None,
+        streaming: bool = True,
+        queue_size: int = STREAM_QUEUE_SIZE,
+        decoding: str = DECODING_ACCURATE,
+        backend: str = BACKEND_OPENAI,
+        word_timestamps: str = WORD_TIMESTAMPS_EAGER,
+        mel_cache_dir: Optional[Path] = None,
+        transcriber: Optional[ThaiTranscriber] = None,
+        translator: Optional[TranslationPipeline] = None
     ):
         """
         Initialize orchestrator
@@ -82,6 +113,18 @@ class VideoTranslationOrchestrator:
             whisper_model: Whisper model for transcription
             config_mode: Pipeline configuration mode
             device: Device for Whisper ('cpu' or 'cuda')
+            use_vad: Skip silent stretches before Whisper decoding
+            artifact_dir: Artifact store for transcripts of known videos (None to disable)
+            streaming: Translate segments while transcription is still running
+            queue_size: Segments buffered between transcription and translation
+            decoding: Whisper decoding strategy ('accurate' or 'two-tier')
+            backend: Whisper inference backend ('openai-whisper', 'int8' or 'onnx')
+            word_timestamps: Word alignment for every segment ('eager') or only
+                             where subtitles need it ('lazy')
+            mel_cache_dir: Cache of log-mel features per audio window (None to disable)
+            transcriber: Already loaded transcriber (e.g. resident in the
+                         pipeline service); the Whisper options above are then unused
+            translator: Already initialized translation pipeline
         """
         logger.info("=" * 60)
         logger.info("Video Translation Orchestrator")
@@ -89,13 +132,27 @@ class VideoTranslationOrchestrator:
 
         # Initialize configuration
         self.config = Config(mode=config_mode)
+        self.streaming = streaming
+        self.queue_size = queue_size
         logger.info(f"Configuration: {config_mode.value}")
 
         # Initialize components
         try:
-            self.transcriber = ThaiTranscriber(model_name=whisper_model, device=device)
+            if transcriber is None:
+                store = ArtifactStore(artifact_dir) if artifact_dir else None
+                transcriber = ThaiTranscriber(
+                    model_name=whisper_model,
+                    device=device,
+                    use_vad=use_vad,
+                    store=store,
+                    decoding=decoding,
+                    backend=backend,
+                    word_timestamps=word_timestamps,
+                    mel_cache=MelCache(mel_cache_dir) if mel_cache_dir else None
+                )
+            self.transcriber = transcriber
             self.context_analyzer = ContextAnalyzer()
-            self.translator = TranslationPipeline(config=self.config)
+            self.translator = translator or TranslationPipeline(config=self.config)
             logger.info("✓ All components initialized")
         except Exception as e:
             logger.error(f"Failed to initialize components: {e}")
@@ -131,12 +188,7 @@ class VideoTranslationOrchestrator:
                 error=f"Input file not found: {input_path}"
             )
 
-        # Setup output directory
-        if output_dir is None:
-            output_dir = Path("output")
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_base = output_dir / input_path.stem
+        output_base = self._output_base(input_path, output_dir)
         output_files = {}
 
         logger.info(f"\n{'='*60}")
@@ -144,150 +196,335 @@ class VideoTranslationOrchestrator:
         logger.info(f"{'='*60}")
 
         try:
-            # ==================== STAGE 1: TRANSCRIPTION ====================
-            logger.info("\n[Stage 1/5] Thai Transcription")
-            logger.info("-" * 60)
+            if self.streaming:
+                # ============ STAGES 1-3: STREAMED TRANSCRIPTION → TRANSLATION ============
+                logger.info("\n[Stage 1-3/5] Transcription → Context Analysis → Translation (streaming)")
+                logger.info("-" * 60)
+
+                thai_transcription, segments, translation_results, translation_stats = \
+                    self._transcribe_and_translate(input_path, doc_type)
+                document_context = self.translator.context_analyzer.document_context
+                context_analyzer = self.translator.context_analyzer
+            else:
+                # ==================== STAGE 1: TRANSCRIPTION ====================
+                logger.info("\n[Stage 1/5] Thai Transcription")
+                logger.info("-" * 60)
+
+                thai_transcription = self.transcriber.transcribe_file(input_path)
+
+                segments, translation_results, translation_stats, document_context, context_analyzer = \
+                    self._analyze_and_translate(thai_transcription, doc_type)
+
+            return self._finish(
+                input_path, output_base, output_files, start_time, thai_transcription,
+                segments, translation_results, translation_stats, document_context, context_analyzer
+            )
 
-            thai_transcription = self.transcriber.transcribe_file(input_path)
+        except Exception as e:
+            return self._failed(input_path, output_files, start_time, e)
+
+    def process_transcription(
+        self,
+        input_path: Path,
+        thai_transcription: TranscriptionResult,
+        output_dir: Optional[Path] = None,
+        doc_type: DocumentType = DocumentType.TUTORIAL,
+        started: Optional[datetime] = None
+    ) -> OrchestratorResult:
+        """
+        Run stages 2-5 on a finished Thai transcription
 
-            # Save Thai SRT
-            thai_srt_path = output_base.with_name(f"{output_base.name}_thai.srt")
-            self.transcriber.save_srt(thai_transcription, thai_srt_path)
-            output_files['thai_srt'] = thai_srt_path
+        Lets a caller that keeps its own transcribers (the pipeline service)
+        release the Whisper model before translation starts.
 
-            # Save Thai JSON
-            thai_json_path = output_base.with_name(f"{output_base.name}_thai.json")
-            self.transcriber.save_json(thai_transcription, thai_json_path)
-            output_files['thai_json'] = thai_json_path
+        Args:
+            input_path: Video/audio file the transcription belongs to
+            thai_transcription: Stage 1 result
+            output_dir: Output directory (default: ./output)
+            doc_type: Document type for context analysis
+            started: When stage 1 started (processing time and speed include it)
 
-            logger.info(f"✓ Stage 1 complete:")
-            logger.info(f"  - Segments: {len(thai_transcription.segments)}")
-            logger.info(f"  - Duration: {thai_transcription.duration:.2f}s")
-            logger.info(f"  - Confidence: {thai_transcription.average_confidence:.2%}")
+        Returns:
+            OrchestratorResult with all outputs and statistics
+        """
+        start_time = started or datetime.now()
+        input_path = Path(input_path)
+        output_base = self._output_base(input_path, output_dir)
+        output_files = {}
 
-            # ==================== STAGE 2: CONTEXT ANALYSIS ====================
-            logger.info("\n[Stage 2/5] Context Analysis")
-            logger.info("-" * 60)
+        try:
+            segments, translation_results, translation_stats, document_context, context_analyzer = \
+                self._analyze_and_translate(thai_transcription, doc_type)
 
-            document_context = self.context_analyzer.analyze_document(
-                thai_transcription.text,
-                doc_type=doc_type
+            return self._finish(
+                input_path, output_base, output_files, start_time, thai_transcription,
+                segments, translation_results, translation_stats, document_context, context_analyzer
             )
 
-            # Save context analysis
-            context_path = output_base.with_name(f"{output_base.name}_context.json")
-            self.context_analyzer.export_analysis(context_path)
-            output_files['context'] = context_path
-
-            logger.info(f"✓ Stage 2 complete:")
-            logger.info(f"  - Document type: {document_context.doc_type.value}")
-            logger.info(f"  - Primary topic: {document_context.primary_topic}")
-            logger.info(f"  - Colloquialisms: {len(document_context.colloquialisms)}")
-            logger.info(f"  - Metaphor domains: {len(document_context.metaphor_domains)}")
-
-            # ==================== STAGE 3: TRANSLATION ====================
-            logger.info("\n[Stage 3/5] Translation")
-            logger.info("-" * 60)
-
-            # Convert to TranscriptionSegment format
-            segments = [
-                TranscriptionSegment(
-                    id=seg.id,
-                    start_time=seg.start,
-                    end_time=seg.end,
-                    text=seg.text,
-                    confidence=seg.confidence
-                )
-                for seg in thai_transcription.segments
-            ]
+        except Exception as e:
+            return self._failed(input_path, output_files, start_time, e)
 
-            # Translate
-            translation_results, translation_stats = self.translator.process_transcript(
-                segments,
-                doc_type=doc_type
-            )
+    @staticmethod
+    def _output_base(input_path: Path, output_dir: Optional[Path]) -> Path:
+        """Create the output directory and return the base path of the output files"""
+        if output_dir is None:
+            output_dir = Path("output")
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-            logger.info(f"✓ Stage 3 complete:")
-            logger.info(f"  - Segments translated: {len(translation_results)}")
-            logger.info(f"  - Cache hit rate: {translation_stats.cache_hit_rate:.1%}")
-            logger.info(f"  - Estimated cost: ${translation_stats.total_cost:.4f}")
-
-            # ==================== STAGE 4: SRT GENERATION ====================
-            logger.info("\n[Stage 4/5] SRT Generation")
-            logger.info("-" * 60)
-
-            # Generate English SRT
-            english_srt_path = output_base.with_name(f"{output_base.name}_english.srt")
-            self.translator.generate_srt(segments, translation_results, english_srt_path)
-            output_files['english_srt'] = english_srt_path
-
-            logger.info(f"✓ Stage 4 complete:")
-            logger.info(f"  - English SRT: {english_srt_path}")
-
-            # ==================== STAGE 5: STATISTICS ====================
-            logger.info("\n[Stage 5/5] Statistics & Summary")
-            logger.info("-" * 60)
-
-            duration = (datetime.now() - start_time).total_seconds()
-
-            stats = {
-                "input_file": str(input_path),
-                "duration_seconds": thai_transcription.duration,
-                "processing_time_seconds": duration,
-                "thai_segments": len(thai_transcription.segments),
-                "thai_words": thai_transcription.word_count,
-                "thai_confidence": thai_transcription.average_confidence,
-                "translation_cache_hits": translation_stats.cached_segments,
-                "translation_cache_rate": translation_stats.cache_hit_rate,
-                "gpt35_segments": translation_stats.gpt35_segments,
-                "gpt4_segments": translation_stats.gpt4_segments,
-                "estimated_cost": translation_stats.total_cost,
-                "cost_per_minute": translation_stats.total_cost / (thai_transcription.duration / 60) if thai_transcription.duration > 0 else 0,
-                "processing_speed": thai_transcription.duration / duration if duration > 0 else 0,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            # Save statistics
-            stats_path = output_base.with_name(f"{output_base.name}_stats.json")
-            with open(stats_path, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, ensure_ascii=False, indent=2)
-            output_files['stats'] = stats_path
-
-            logger.info(f"✓ Stage 5 complete")
-            logger.info(f"\n{'='*60}")
-            logger.info("PIPELINE SUMMARY")
-            logger.info(f"{'='*60}")
-            logger.info(f"✓ Input: {input_path.name}")
-            logger.info(f"✓ Duration: {thai_transcription.duration:.2f}s")
-            logger.info(f"✓ Processing time: {duration:.2f}s")
-            logger.info(f"✓ Speed: {stats['processing_speed']:.1f}x realtime")
-            logger.info(f"✓ Cost: ${stats['estimated_cost']:.4f}")
-            logger.info(f"✓ Cost/min: ${stats['cost_per_minute']:.4f}")
-            logger.info(f"\nOutput files:")
-            for name, path in output_files.items():
-                logger.info(f"  - {name}: {path}")
+        return output_dir / input_path.stem
 
-            return OrchestratorResult(
-                input_file=input_path,
-                output_files=output_files,
-                stats=stats,
-                success=True,
-                duration_seconds=duration
-            )
+    def _analyze_and_translate(
+        self,
+        thai_transcription: TranscriptionResult,
+        doc_type: DocumentType
+    ) -> Tuple[List[TranscriptionSegment], List, object, object, ContextAnalyzer]:
+        """
+        Stages 2-3 on a complete transcription (non-streaming)
 
-        except Exception as e:
-            logger.error(f"\n❌ Pipeline failed: {e}")
-            import traceback
-            traceback.print_exc()
+        Returns:
+            Tuple of (pipeline segments, translation results, translation stats,
+            document context, context analyzer)
+        """
+        # ==================== STAGE 2: CONTEXT ANALYSIS ====================
+        logger.info("\n[Stage 2/5] Context Analysis")
+        logger.info("-" * 60)
 
-            return OrchestratorResult(
-                input_file=input_path,
-                output_files=output_files,
-                stats={},
-                success=False,
-                error=str(e),
-                duration_seconds=(datetime.now() - start_time).total_seconds()
+        document_context = self.context_analyzer.analyze_document(
+            thai_transcription.text,
+            doc_type=doc_type
+        )
+
+        # ==================== STAGE 3: TRANSLATION ====================
+        logger.info("\n[Stage 3/5] Translation")
+        logger.info("-" * 60)
+
+        segments = [self._to_pipeline_segment(seg) for seg in thai_transcription.segments]
+
+        # Translate
+        translation_results, translation_stats = self.translator.process_transcript(
+            segments,
+            doc_type=doc_type
+        )
+
+        return segments, translation_results, translation_stats, document_context, self.context_analyzer
+
+    def _finish(
+        self,
+        input_path: Path,
+        output_base: Path,
+        output_files: Dict[str, Path],
+        start_time: datetime,
+        thai_transcription: TranscriptionResult,
+        segments: List[TranscriptionSegment],
+        translation_results: List,
+        translation_stats,
+        document_context,
+        context_analyzer
+    ) -> OrchestratorResult:
+        """Save outputs, generate the English SRT and collect statistics (stages 4-5)"""
+        # Save Thai SRT
+        thai_srt_path = output_base.with_name(f"{output_base.name}_thai.srt")
+        self.transcriber.save_srt(thai_transcription, thai_srt_path)
+        output_files['thai_srt'] = thai_srt_path
+
+        # Save Thai JSON
+        thai_json_path = output_base.with_name(f"{output_base.name}_thai.json")
+        self.transcriber.save_json(thai_transcription, thai_json_path)
+        output_files['thai_json'] = thai_json_path
+
+        logger.info(f"✓ Transcription:")
+        logger.info(f"  - Segments: {len(thai_transcription.segments)}")
+        logger.info(f"  - Duration: {thai_transcription.duration:.2f}s")
+        logger.info(f"  - Confidence: {thai_transcription.average_confidence:.2%}")
+
+        # Save context analysis
+        context_path = output_base.with_name(f"{output_base.name}_context.json")
+        context_analyzer.export_analysis(context_path)
+        output_files['context'] = context_path
+
+        logger.info(f"✓ Context analysis:")
+        logger.info(f"  - Document type: {document_context.doc_type.value}")
+        logger.info(f"  - Primary topic: {document_context.primary_topic}")
+        logger.info(f"  - Colloquialisms: {len(document_context.colloquialisms)}")
+        logger.info(f"  - Metaphor domains: {len(document_context.metaphor_domains)}")
+
+        logger.info(f"✓ Translation:")
+        logger.info(f"  - Segments translated: {len(translation_results)}")
+        logger.info(f"  - Cache hit rate: {translation_stats.cache_hit_rate:.1%}")
+        logger.info(f"  - Estimated cost: ${translation_stats.total_cost:.4f}")
+
+        # ==================== STAGE 4: SRT GENERATION ====================
+        logger.info("\n[Stage 4/5] SRT Generation")
+        logger.info("-" * 60)
+
+        # Generate English SRT
+        english_srt_path = output_base.with_name(f"{output_base.name}_english.srt")
+        self.translator.generate_srt(segments, translation_results, english_srt_path)
+        output_files['english_srt'] = english_srt_path
+
+        logger.info(f"✓ Stage 4 complete:")
+        logger.info(f"  - English SRT: {english_srt_path}")
+
+        # ==================== STAGE 5: STATISTICS ====================
+        logger.info("\n[Stage 5/5] Statistics & Summary")
+        logger.info("-" * 60)
+
+        duration = (datetime.now() - start_time).total_seconds()
+
+        stats = {
+            "input_file": str(input_path),
+            "duration_seconds": thai_transcription.duration,
+            "processing_time_seconds": duration,
+            "thai_segments": len(thai_transcription.segments),
+            "thai_words": thai_transcription.word_count,
+            "thai_confidence": thai_transcription.average_confidence,
+            "vad_skipped_seconds": thai_transcription.vad_skipped_seconds,
+            "translation_cache_hits": translation_stats.cached_segments,
+            "translation_cache_rate": translation_stats.cache_hit_rate,
+            "gpt35_segments": translation_stats.gpt35_segments,
+            "gpt4_segments": translation_stats.gpt4_segments,
+            "packed_requests": translation_stats.packed_requests,
+            "packed_segments": translation_stats.packed_segments,
+            "pack_resplits": translation_stats.pack_resplits,
+            "estimated_cost": translation_stats.total_cost,
+            "cost_per_minute": translation_stats.total_cost / (thai_transcription.duration / 60) if thai_transcription.duration > 0 else 0,
+            "processing_speed": thai_transcription.duration / duration if duration > 0 else 0,
+            "timestamp": datetime.now().isoformat()
+        }
+
+        # Save statistics
+        stats_path = output_base.with_name(f"{output_base.name}_stats.json")
+        with open(stats_path, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+        output_files['stats'] = stats_path
+
+        logger.info(f"✓ Stage 5 complete")
+        logger.info(f"\n{'='*60}")
+        logger.info("PIPELINE SUMMARY")
+        logger.info(f"{'='*60}")
+        logger.info(f"✓ Input: {input_path.name}")
+        logger.info(f"✓ Duration: {thai_transcription.duration:.2f}s")
+        logger.info(f"✓ Processing time: {duration:.2f}s")
+        logger.info(f"✓ Speed: {stats['processing_speed']:.1f}x realtime")
+        logger.info(f"✓ Cost: ${stats['estimated_cost']:.4f}")
+        logger.info(f"✓ Cost/min: ${stats['cost_per_minute']:.4f}")
+        logger.info(f"\nOutput files:")
+        for name, path in output_files.items():
+            logger.info(f"  - {name}: {path}")
+
+        return OrchestratorResult(
+            input_file=input_path,
+            output_files=output_files,
+            stats=stats,
+            success=True,
+            duration_seconds=duration
+        )
+
+    @staticmethod
+    def _failed(
+        input_path: Path,
+        output_files: Dict[str, Path],
+        start_time: datetime,
+        error: Exception
+    ) -> OrchestratorResult:
+        """Log a pipeline failure and return its result"""
+        logger.error(f"\n❌ Pipeline failed: {error}")
+        import traceback
+        traceback.print_exc()
+
+        return OrchestratorResult(
+            input_file=input_path,
+            output_files=output_files,
+            stats={},
+            success=False,
+            error=str(error),
+            duration_seconds=(datetime.now() - start_time).total_seconds()
+        )
+
+    def _transcribe_and_translate(
+        self,
+        input_path: Path,
+        doc_type: DocumentType
+    ) -> Tuple[TranscriptionResult, List[TranscriptionSegment], List, object]:
+        """
+        Run transcription and translation concurrently through a bounded queue
+
+        A producer thread pulls segments from the transcriber's stream into
+        the queue; the translator consumes the queue on this thread. When
+        translation falls behind, the queue fills up and the producer blocks
+        until there is room again, so memory stays bounded. Wall time tends
+        to max(transcribe, translate) instead of their sum.
+
+        Args:
+            input_path: Input video/audio file
+            doc_type: Document type for context analysis
+
+        Returns:
+            Tuple of (transcription, pipeline segments, translation results, translation stats)
+        """
+        stream = self.transcriber.stream_file(input_path)
+        segment_queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        failure = []
+        end_of_stream = object()
+
+        def put(item) -> bool:
+            # Block while the queue is full, but give up once the consumer stops
+            while not stop.is_set():
+                try:
+                    segment_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for seg in stream:
+                    if not put(self._to_pipeline_segment(seg)):
+                        return
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                put(end_of_stream)
+
+        def consume():
+            while True:
+                item = segment_queue.get()
+                if item is end_of_stream:
+                    return
+                segments.append(item)
+                yield item
+
+        segments = []
+        producer = threading.Thread(target=produce, name="transcription-producer", daemon=True)
+        producer.start()
+
+        try:
+            translation_results, translation_stats = self.translator.process_stream(
+                consume(),
+                doc_type=doc_type
             )
+        finally:
+            stop.set()
+            producer.join()
+
+        if failure:
+            raise failure[0]
+
+        return stream.result, segments, translation_results, translation_stats
+
+    @staticmethod
+    def _to_pipeline_segment(seg) -> TranscriptionSegment:
+        """Convert a transcriber segment to the translation pipeline format"""
+        return TranscriptionSegment(
+            id=seg.id,
+            start_time=seg.start,
+            end_time=seg.end,
+            text=seg.text,
+            confidence=seg.confidence
+        )
 
 
 # ======================== CLI INTERFACE ========================
@@ -313,6 +550,12 @@ Examples:
 
   # Use GPU for Whisper
   python orchestrator.py input.mp4 --device cuda
+
+  # Translate only after transcription has finished
+  python orchestrator.py input.mp4 --no-streaming
+
+  # Hand the video to a running pipeline service (models already loaded)
+  python orchestrator.py input.mp4 --service .cache/pipeline_service.sock
         """
     )
 
@@ -353,6 +596,63 @@ Examples:
         help="Device for Whisper (default: cpu)"
     )
 
+    parser.add_argument(
+        "--vad",
+        action="store_true",
+        help="Skip silent stretches before Whisper decoding"
+    )
+
+    parser.add_argument(
+        "--decoding",
+        type=str,
+        default=DECODING_ACCURATE,
+        choices=DECODING_MODES,
+        help="Whisper decoding: beam search everywhere (accurate) or greedy "
+             "with beam re-decode of unreliable windows (two-tier)"
+    )
+
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default=BACKEND_OPENAI,
+        choices=BACKENDS,
+        help="Whisper inference backend; int8 and onnx are CPU only (default: openai-whisper)"
+    )
+
+    parser.add_argument(
+        "--word-timestamps",
+        type=str,
+        default=WORD_TIMESTAMPS_EAGER,
+        choices=WORD_TIMESTAMP_MODES,
+        help="Align words for every segment (eager) or only for segments that "
+             "break subtitle limits or have low confidence (lazy) (default: eager)"
+    )
+
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        help="Artifact store; videos already transcribed there are not transcribed again"
+    )
+
+    parser.add_argument(
+        "--mel-cache-dir",
+        type=Path,
+        help="Cache log-mel spectrograms per audio window (reused by re-runs with other decode settings)"
+    )
+
+    parser.add_argument(
+        "--no-streaming",
+        action="store_true",
+        help="Run transcription to completion before translation starts"
+    )
+
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=STREAM_QUEUE_SIZE,
+        help=f"Segments buffered between transcription and translation (default: {STREAM_QUEUE_SIZE})"
+    )
+
     parser.add_argument(
         "--doc-type",
         type=str,
@@ -361,8 +661,29 @@ Examples:
         help="Document type (default: tutorial)"
     )
 
+    parser.add_argument(
+        "--service",
+        type=str,
+        metavar="ADDRESS",
+        help="Submit to a running pipeline service (Unix socket path or http://host:port) "
+             "instead of loading the models here; model options are the service's"
+    )
+
     args = parser.parse_args()
 
+    if args.service:
+        try:
+            job = ServiceClient(args.service).run(
+                JOB_TRANSLATE, args.input, args.output, doc_type=args.doc_type, on_event=log_event
+            )
+        except ServiceError as e:
+            logger.error(f"❌ {e}")
+            sys.exit(1)
+
+        for name, path in (job.get('result') or {}).get('output_files', {}).items():
+            logger.info(f"  - {name}: {path}")
+        sys.exit(0 if job['status'] == JOB_COMPLETED else 1)
+
     # Convert mode string to enum
     mode_map = {
         "development": ConfigMode.DEVELOPMENT,
@@ -388,7 +709,15 @@ Examples:
         orchestrator = VideoTranslationOrchestrator(
             whisper_model=args.model,
             config_mode=config_mode,
-            device=args.device
+            device=args.device,
+            use_vad=args.vad,
+            artifact_dir=args.artifact_dir,
+            streaming=not args.no_streaming,
+            queue_size=args.queue_size,
+            decoding=args.decoding,
+            backend=args.backend,
+            word_timestamps=args.word_timestamps,
+            mel_cache_dir=args.mel_cache_dir
         )
 
         # Process video
@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+"""
+Pipeline Service - Warm Transcription/Translation Service
+=========================================================
+Version: 1.0.0
+Description: Long-lived process that keeps Whisper models, dictionaries,
+             the translation cache and the translation thread pool loaded,
+             and runs jobs submitted over a local job API (Unix socket or
+             HTTP on localhost). A cold start reloads Whisper large-v3 and
+             a DictionaryManager (with its own watchdog thread) for every
+             video; jobs sent to the service skip both.
+
+Stages and concurrency:
+- transcription: one resident Whisper model per slot (--transcription-workers);
+  a model is never shared by two jobs at once
+- translation: context analysis, translation, SRT and stats (--translation-workers);
+  every job gets its own TranslationPipeline on the shared resources
+
+A translate job releases its Whisper model before it waits for a
+translation slot, so the next video is transcribed while this one is
+translated.
+
+Job kinds:
+- transcribe: video → Thai SRT + JSON
+- translate: video → Thai SRT/JSON, context analysis, English SRT, stats
+
+Usage:
+    python src/pipeline_service.py                       # .cache/pipeline_service.sock
+    python src/pipeline_service.py --port 8765 -m medium
+    python src/orchestrator.py video.mp4 --service .cache/pipeline_service.sock
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import queue
+import signal
+import logging
+import argparse
+import threading
+import socketserver
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Local imports
+try:
+    from .orchestrator import VideoTranslationOrchestrator
+    from .thai_transcriber import ThaiTranscriber
+    from .translation_pipeline import TranslationPipeline, TranslationCache
+    from .rate_limiter import RateLimiter
+    from .data_management_system import DictionaryManager
+    from .context_analyzer import DocumentType
+    from .config import Config, ConfigMode
+    from .artifact_store import ArtifactStore
+    from .mel_cache import MelCache
+    from .decoding_strategy import DECODING_ACCURATE, DECODING_MODES
+    from .inference_backends import BACKEND_OPENAI, BACKENDS
+    from .word_alignment import WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMP_MODES
+    from .service_client import (
+        DEFAULT_SERVICE_SOCKET, JOB_KINDS, JOB_TRANSCRIBE, JOB_QUEUED, JOB_RUNNING,
+        JOB_COMPLETED, JOB_FAILED, JOB_FINISHED_STATES, ServiceClient
+    )
+except ImportError:
+    from orchestrator import VideoTranslationOrchestrator
+    from thai_transcriber import ThaiTranscriber
+    from translation_pipeline import TranslationPipeline, TranslationCache
+    from rate_limiter import RateLimiter
+    from data_management_system import DictionaryManager
+    from context_analyzer import DocumentType
+    from config import Config, ConfigMode
+    from artifact_store import ArtifactStore
+    from mel_cache import MelCache
+    from decoding_strategy import DECODING_ACCURATE, DECODING_MODES
+    from inference_backends import BACKEND_OPENAI, BACKENDS
+    from word_alignment import WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMP_MODES
+    from service_client import (
+        DEFAULT_SERVICE_SOCKET, JOB_KINDS, JOB_TRANSCRIBE, JOB_QUEUED, JOB_RUNNING,
+        JOB_COMPLETED, JOB_FAILED, JOB_FINISHED_STATES, ServiceClient
+    )
+
+# Transcription progress events at most this often (seconds)
+PROGRESS_INTERVAL = 2.0
+
+# Finished jobs kept for status queries
+MAX_FINISHED_JOBS = 200
+
+
+# ======================== JOBS ========================
+
+@dataclass
+class ServiceJob:
+    """One submitted job and its event log"""
+    id: str
+    kind: str
+    input_path: Path
+    output_dir: Path
+    doc_type: DocumentType = DocumentType.TUTORIAL
+    status: str = JOB_QUEUED
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    events: List[Dict[str, Any]] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status for the API (events are served separately)"""
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'input': str(self.input_path),
+            'output_dir': str(self.output_dir),
+            'doc_type': self.doc_type.value,
+            'status': self.status,
+            'submitted': self.submitted,
+            'started': self.started,
+            'finished': self.finished,
+            'error': self.error,
+            'result': self.result,
+            'events': len(self.events)
+        }
+
+
+# ======================== PIPELINE SERVICE ========================
+
+class PipelineService:
+    """Resident models and dictionaries plus a staged job runner"""
+
+    def __init__(
+        self,
+        whisper_model: str = "large-v3",
+        config_mode: ConfigMode = ConfigMode.PRODUCTION,
+        device: str = "cpu",
+        use_vad: bool = False,
+        artifact_dir: Optional[Path] = None,
+        decoding: str = DECODING_ACCURATE,
+        backend: str = BACKEND_OPENAI,
+        word_timestamps: str = WORD_TIMESTAMPS_EAGER,
+        mel_cache_dir: Optional[Path] = None,
+        transcription_workers: int = 1,
+        translation_workers: int = 2,
+        output_root: Path = Path("output")
+    ):
+        """
+        Load the resident components
+
+        Args:
+            whisper_model: Whisper model kept loaded
+            config_mode: Pipeline configuration mode
+            device: Device for Whisper ('cpu' or 'cuda')
+            use_vad: Skip silent stretches before Whisper decoding
+            artifact_dir: Artifact store for transcripts (None to disable)
+            decoding: Whisper decoding strategy
+            backend: Whisper inference backend
+            word_timestamps: Word alignment mode ('eager' or 'lazy')
+            mel_cache_dir: Cache of log-mel features per audio window (None to disable)
+            transcription_workers: Jobs transcribing at once (one resident model each)
+            translation_workers: Jobs translating at once
+            output_root: Output directory of jobs submitted without one
+        """
+        if transcription_workers < 1 or translation_workers < 1:
+            raise ValueError("transcription_workers and translation_workers must be at least 1")
+
+        logger.info("=" * 60)
+        logger.info("Pipeline Service")
+        logger.info("=" * 60)
+
+        self.config_mode = config_mode
+        self.output_root = Path(output_root)
+        self.started = time.time()
+
+        # One model per transcription slot; checked out for a whole transcription
+        store = ArtifactStore(artifact_dir) if artifact_dir else None
+        self._transcribers: "queue.Queue[ThaiTranscriber]" = queue.Queue()
+        self.transcribers = []
+        for index in range(transcription_workers):
+            logger.info(f"Loading resident transcriber {index + 1}/{transcription_workers} ({whisper_model})...")
+            transcriber = ThaiTranscriber(
+                model_name=whisper_model,
+                device=device,
+                use_vad=use_vad,
+                store=store,
+                decoding=decoding,
+                backend=backend,
+                word_timestamps=word_timestamps,
+                # Own instance per slot: hit/miss counts are per transcription
+                mel_cache=MelCache(mel_cache_dir) if mel_cache_dir else None
+            )
+            self.transcribers.append(transcriber)
+            self._transcribers.put(transcriber)
+
+        # Writes outputs without a model, so no job borrows a checked-out one
+        self._output_transcriber = ThaiTranscriber(
+            model_name=whisper_model,
+            device=device,
+            backend=backend,
+            load_model=False
+        )
+
+        # Shared by every job's TranslationPipeline
+        self.config = Config(mode=config_mode)
+        self.dictionaries = DictionaryManager()
+        self.cache = TranslationCache.from_config(self.config.cache)
+        self.rate_limiter = RateLimiter.from_config(self.config)
+        self.translation_executor = ThreadPoolExecutor(
+            max_workers=self.config.processing.max_workers,
+            thread_name_prefix="translate"
+        )
+        self._translation_slots = threading.Semaphore(translation_workers)
+
+        self.transcription_workers = transcription_workers
+        self.translation_workers = translation_workers
+
+        # Jobs beyond the stage slots wait in this pool's queue
+        self._runner = ThreadPoolExecutor(
+            max_workers=transcription_workers + translation_workers,
+            thread_name_prefix="job"
+        )
+        self._jobs: Dict[str, ServiceJob] = {}
+        self._changed = threading.Condition()
+
+        logger.info(
+            f"✓ Service ready: {transcription_workers} transcription slot(s), "
+            f"{translation_workers} translation slot(s)"
+        )
+
+    # ---------------- job API ----------------
+
+    def submit(
+        self,
+        kind: str,
+        input_path: Path,
+        output_dir: Optional[Path] = None,
+        doc_type: DocumentType = DocumentType.TUTORIAL
+    ) -> ServiceJob:
+        """
+        Queue a job
+
+        Args:
+            kind: 'transcribe' or 'translate'
+            input_path: Video/audio file
+            output_dir: Output directory (default: output_root)
+            doc_type: Document type for context analysis
+
+        Returns:
+            The queued job
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(JOB_KINDS)}")
+
+        input_path = Path(input_path)
+        if not input_path.exists():
+            raise ValueError(f"Input file not found: {input_path}")
+
+        job = ServiceJob(
+            id=uuid.uuid4().hex[:12],
+            kind=kind,
+            input_path=input_path,
+            output_dir=Path(output_dir) if output_dir else self.output_root,
+            doc_type=doc_type
+        )
+
+        with self._changed:
+            self._jobs[job.id] = job
+            self._forget_old_jobs()
+
+        self._emit(job, 'queued', kind=kind, input=str(input_path))
+        self._runner.submit(self._run, job)
+
+        logger.info(f"Job {job.id} queued: {kind} {input_path.name}")
+        return job
+
+    def get(self, job_id: str) -> Optional[ServiceJob]:
+        """Job by id (None if unknown)"""
+        with self._changed:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[ServiceJob]:
+        """All known jobs, oldest first"""
+        with self._changed:
+            return list(self._jobs.values())
+
+    def events(self, job: ServiceJob) -> Iterator[Dict[str, Any]]:
+        """
+        Follow a job's events from the first one until it finishes
+
+        Yields:
+            Event dicts (blocks while the job is running)
+        """
+        seen = 0
+        while True:
+            with self._changed:
+                while seen >= len(job.events) and job.status not in JOB_FINISHED_STATES:
+                    self._changed.wait()
+                new = job.events[seen:]
+                done = job.status in JOB_FINISHED_STATES
+
+            for event in new:
+                yield event
+            seen += len(new)
+
+            if done and seen >= len(job.events):
+                return
+
+    def health(self) -> Dict[str, Any]:
+        """Service status"""
+        jobs = self.jobs()
+        model = self.transcribers[0]
+        return {
+            'status': 'ok',
+            'pid': os.getpid(),
+            'uptime_seconds': time.time() - self.started,
+            'whisper_model': model.model_name,
+            'device': model.device,
+            'backend': model.backend,
+            'resident_models': len(self.transcribers),
+            'idle_models': self._transcribers.qsize(),
+            'translation_workers': self.translation_workers,
+            'jobs': {
+                status: sum(1 for job in jobs if job.status == status)
+                for status in (JOB_QUEUED, JOB_RUNNING, JOB_COMPLETED, JOB_FAILED)
+            }
+        }
+
+    def close(self):
+        """Stop accepting work and release the thread pools and cache connections"""
+        self._runner.shutdown(wait=False)
+        self.translation_executor.shutdown(wait=False)
+        self.cache.close()
+
+    # ---------------- job execution ----------------
+
+    def _emit(self, job: ServiceJob, event_type: str, **data):
+        """Append an event to a job and wake up its followers"""
+        with self._changed:
+            job.events.append({
+                'job': job.id,
+                'seq': len(job.events),
+                'time': time.time(),
+                'type': event_type,
+                **data
+            })
+            self._changed.notify_all()
+
+    def _forget_old_jobs(self):
+        """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS (lock held)"""
+        finished = [job for job in self._jobs.values() if job.status in JOB_FINISHED_STATES]
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.id]
+
+    @contextmanager
+    def _stage(self, job: ServiceJob, stage: str):
+        """Emit started and finished (or failed) events around one stage"""
+        started = time.time()
+        self._emit(job, 'stage', stage=stage, state='started')
+        state = 'failed'
+        try:
+            yield
+            state = 'finished'
+        finally:
+            self._emit(job, 'stage', stage=stage, state=state, seconds=time.time() - started)
+
+    def _run(self, job: ServiceJob):
+        """Run a job through its stages (job runner thread)"""
+        with self._changed:
+            job.status = JOB_RUNNING
+            job.started = time.time()
+        self._emit(job, 'started')
+
+        try:
+            started = datetime.now()
+            transcription = self._transcribe(job)
+
+            if job.kind == JOB_TRANSCRIBE:
+                result = self._save_transcription(job, transcription)
+            else:
+                result = self._translate(job, transcription, started)
+
+            with self._changed:
+                job.result = result
+                job.status = JOB_COMPLETED
+                job.finished = time.time()
+            self._emit(job, 'completed', result=result)
+            logger.info(f"Job {job.id} completed in {job.finished - job.started:.1f}s")
+
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            with self._changed:
+                job.error = str(e)
+                job.status = JOB_FAILED
+                job.finished = time.time()
+            self._emit(job, 'failed', error=str(e))
+
+    def _transcribe(self, job: ServiceJob):
+        """Transcription stage on a checked-out resident model"""
+        self._emit(job, 'stage', stage='transcription', state='waiting')
+        transcriber = self._transcribers.get()
+        try:
+            with self._stage(job, 'transcription'):
+                stream = transcriber.stream_file(job.input_path)
+                segments = 0
+                last_report = time.time()
+
+                for segment in stream:
+                    segments += 1
+                    if time.time() - last_report >= PROGRESS_INTERVAL:
+                        self._emit(job, 'progress', stage='transcription', position=segment.end, segments=segments)
+                        last_report = time.time()
+
+                return stream.result
+        finally:
+            self._transcribers.put(transcriber)
+
+    def _save_transcription(self, job: ServiceJob, transcription) -> Dict[str, Any]:
+        """Write the Thai SRT and JSON of a transcribe job"""
+        output_base = Path(job.output_dir) / job.input_path.stem
+        srt_path = output_base.with_name(f"{output_base.name}_thai.srt")
+        json_path = output_base.with_name(f"{output_base.name}_thai.json")
+
+        self._output_transcriber.save_srt(transcription, srt_path)
+        self._output_transcriber.save_json(transcription, json_path)
+
+        return {
+            'output_files': {'thai_srt': str(srt_path), 'thai_json': str(json_path)},
+            'stats': {
+                'duration_seconds': transcription.duration,
+                'thai_segments': len(transcription.segments),
+                'thai_words': transcription.word_count,
+                'thai_confidence': transcription.average_confidence,
+                'decoding': transcription.decoding
+            }
+        }
+
+    def _translate(self, job: ServiceJob, transcription, started: datetime) -> Dict[str, Any]:
+        """Translation stage: stages 2-5 of the orchestrator on shared resources"""
+        self._emit(job, 'stage', stage='translation', state='waiting')
+        with self._translation_slots, self._stage(job, 'translation'):
+            translator = TranslationPipeline(
+                config=Config(mode=self.config_mode),
+                data_manager=self.dictionaries,
+                cache=self.cache,
+                executor=self.translation_executor,
+                rate_limiter=self.rate_limiter
+            )
+            orchestrator = VideoTranslationOrchestrator(
+                config_mode=self.config_mode,
+                streaming=False,
+                transcriber=self._output_transcriber,
+                translator=translator
+            )
+            result = orchestrator.process_transcription(
+                job.input_path,
+                transcription,
+                output_dir=job.output_dir,
+                doc_type=job.doc_type,
+                started=started
+            )
+
+        if not result.success:
+            raise RuntimeError(result.error)
+
+        return {
+            'output_files': {name: str(path) for name, path in result.output_files.items()},
+            'stats': result.stats
+        }
+
+
+# ======================== LOCAL JOB API ========================
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """JSON job API (see service_client.py for the endpoints)"""
+
+    @property
+    def service(self) -> PipelineService:
+        return self.server.service
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port)
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status: int, data: Any):
+        body = json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job_or_404(self, job_id: str) -> Optional[ServiceJob]:
+        job = self.service.get(job_id)
+        if job is None:
+            self._send_json(404, {'error': f"Unknown job: {job_id}"})
+        return job
+
+    def do_GET(self):
+        parts = [part for part in self.path.split('?')[0].split('/') if part]
+
+        if parts == ['health']:
+            self._send_json(200, self.service.health())
+        elif parts == ['jobs']:
+            self._send_json(200, [job.to_dict() for job in self.service.jobs()])
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = self._job_or_404(parts[1])
+            if job:
+                self._send_json(200, job.to_dict())
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'events':
+            job = self._job_or_404(parts[1])
+            if job:
+                self._stream_events(job)
+        else:
+            self._send_json(404, {'error': f"Not found: {self.path}"})
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/jobs':
+            self._send_json(404, {'error': f"Not found: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf-8') or '{}')
+            job = self.service.submit(
+                request.get('kind', ''),
+                Path(request.get('input', '')),
+                output_dir=request.get('output_dir'),
+                doc_type=DocumentType(request.get('doc_type') or DocumentType.TUTORIAL.value)
+            )
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        self._send_json(202, job.to_dict())
+
+    def _stream_events(self, job: ServiceJob):
+        """NDJSON event stream; HTTP/1.0, so the end of the body is the end of the job"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+
+        try:
+            for event in self.service.events(job):
+                self.wfile.write(json.dumps(event, ensure_ascii=False, default=str).encode('utf-8') + b'\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away; the job keeps running
+            pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server on a Unix domain socket"""
+    daemon_threads = True
+
+
+def serve(service: PipelineService, socket_path: Optional[Path] = None, host: str = '127.0.0.1', port: Optional[int] = None):
+    """
+    Serve the job API until interrupted
+
+    Args:
+        service: Loaded pipeline service
+        socket_path: Unix socket to listen on (used unless port is given)
+        host: HTTP bind address (localhost by default; the API has no authentication)
+        port: HTTP port
+    """
+    if port is not None:
+        server = ThreadingHTTPServer((host, port), _ServiceHandler)
+        address = f"http://{host}:{port}"
+    else:
+        socket_path = Path(socket_path or DEFAULT_SERVICE_SOCKET)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            if ServiceClient(str(socket_path), timeout=2.0).is_available():
+                raise RuntimeError(f"A pipeline service is already listening on {socket_path}")
+            # Left behind by a service that did not shut down cleanly
+            socket_path.unlink()
+        server = _UnixHTTPServer(str(socket_path), _ServiceHandler)
+        os.chmod(socket_path, 0o600)
+        address = str(socket_path)
+
+    server.daemon_threads = True
+    server.service = service
+
+    def stop(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+
+    logger.info(f"Listening on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if port is None and socket_path.exists():
+            socket_path.unlink()
+        logger.info("Pipeline service stopped")
+
+
+# ======================== CLI INTERFACE ========================
+
+def main():
+    """Command-line interface"""
+    parser = argparse.ArgumentParser(
+        description="Warm pipeline service: resident Whisper models and dictionaries behind a local job API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Serve on the default Unix socket (.cache/pipeline_service.sock)
+  python pipeline_service.py
+
+  # HTTP on localhost, two resident models
+  python pipeline_service.py --port 8765 --transcription-workers 2
+
+  # Submit from the existing CLIs
+  python orchestrator.py input.mp4 --service .cache/pipeline_service.sock
+  python thai_transcriber.py input.mp4 --service http://127.0.0.1:8765
+        """
+    )
+
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SERVICE_SOCKET,
+                        help=f"Unix socket to listen on (default: {DEFAULT_SERVICE_SOCKET})")
+    parser.add_argument("--port", type=int, help="Listen on HTTP at this port instead of the Unix socket")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address (default: 127.0.0.1)")
+
+    parser.add_argument("-m", "--model", type=str, default="large-v3",
+                        choices=["tiny", "base", "small", "medium", "large", "large-v2", "large-v3"],
+                        help="Whisper model kept loaded (default: large-v3)")
+    parser.add_argument("--mode", type=str, default="production",
+                        choices=["development", "production", "quality_focus", "cost_optimized", "mock"],
+                        help="Pipeline mode (default: production)")
+    parser.add_argument("--device", type=str, default="cpu", choices=["cpu", "cuda"],
+                        help="Device for Whisper (default: cpu)")
+    parser.add_argument("--vad", action="store_true", help="Skip silent stretches before Whisper decoding")
+    parser.add_argument("--decoding", type=str, default=DECODING_ACCURATE, choices=DECODING_MODES,
+                        help="Whisper decoding strategy (default: accurate)")
+    parser.add_argument("--backend", type=str, default=BACKEND_OPENAI, choices=BACKENDS,
+                        help="Whisper inference backend (default: openai-whisper)")
+    parser.add_argument("--word-timestamps", type=str, default=WORD_TIMESTAMPS_EAGER, choices=WORD_TIMESTAMP_MODES,
+                        help="Word alignment mode (default: eager)")
+    parser.add_argument("--artifact-dir", type=Path, help="Artifact store for transcripts")
+    parser.add_argument("--mel-cache-dir", type=Path, help="Cache log-mel spectrograms per audio window")
+
+    parser.add_argument("--transcription-workers", type=int, default=1,
+                        help="Jobs transcribing at once; each slot keeps its own model loaded (default: 1)")
+    parser.add_argument("--translation-workers", type=int, default=2,
+                        help="Jobs translating at once (default: 2)")
+    parser.add_argument("-o", "--output", type=Path, default=Path("output"),
+                        help="Output directory of jobs submitted without one (default: output/)")
+
+    args = parser.parse_args()
+
+    mode_map = {
+        "development": ConfigMode.DEVELOPMENT,
+        "production": ConfigMode.PRODUCTION,
+        "quality_focus": ConfigMode.QUALITY_FOCUS,
+        "cost_optimized": ConfigMode.COST_OPTIMIZED,
+        "mock": ConfigMode.MOCK
+    }
+
+    try:
+        service = PipelineService(
+            whisper_model=args.model,
+            config_mode=mode_map[args.mode],
+            device=args.device,
+            use_vad=args.vad,
+            artifact_dir=args.artifact_dir,
+            decoding=args.decoding,
+            backend=args.backend,
+            word_timestamps=args.word_timestamps,
+            mel_cache_dir=args.mel_cache_dir,
+            transcription_workers=args.transcription_workers,
+            translation_workers=args.translation_workers,
+            output_root=args.output
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to start pipeline service: {e}")
+        sys.exit(1)
+
+    serve(service, socket_path=args.socket, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
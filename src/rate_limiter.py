@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter - Shared RPM/TPM Buckets and Adaptive Concurrency for API Calls
+============================================================================
+Version: 1.0.0
+Description: Keeps translation requests under the provider's requests-per-
+             minute and tokens-per-minute limits instead of finding them
+             with 429s. Token buckets live in small lock-protected state
+             files, so every thread and every worker process (batch
+             workers, the pipeline service) draws from the same budget.
+
+Features:
+- RPM and TPM token buckets per model (0 = no limit), refilled continuously
+- Shared across processes through fcntl file locks (in-process otherwise)
+- A 429 pauses every caller of that model until its Retry-After has passed
+- AIMD concurrency: +1 slot per window of healthy responses, halved on a
+  429, 5xx, timeout or dropped connection (or on latency above a target);
+  other failed requests leave the limit as it is
+- Retries with full jitter, or Retry-After plus a little jitter
+- Requests that used more tokens than reserved are charged the difference
+"""
+
+import json
+import time
+import random
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: buckets are shared by the threads of one process only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = Path('.cache/rate_limits')
+
+# Upper bound of one wait before the buckets are checked again
+MAX_WAIT_SLICE = 5.0
+# Exponential backoff without Retry-After: uniform(0, min(cap, base * 2^attempt))
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+# Jitter added to Retry-After, as a fraction of it
+RETRY_AFTER_JITTER = 0.1
+
+
+# ======================== ERROR CLASSIFICATION ========================
+
+def status_code(error: Exception) -> Optional[int]:
+    """HTTP status of an API error (openai.APIStatusError and similar), if any"""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """The provider rejected the request for exceeding a rate limit"""
+    return status_code(error) == 429
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Worth retrying: 429, 5xx and connection failures
+
+    Timeouts are not retried: request_timeout bounds a request, retries included.
+    """
+    status = status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(error, ConnectionError) or type(error).__name__ == 'APIConnectionError'
+
+
+def is_overloaded(error: Exception) -> bool:
+    """The upstream is failing under load: 429, 5xx, timeouts and dropped connections"""
+    status = status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return (
+        isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError))
+        or type(error).__name__ in ('APIConnectionError', 'APITimeoutError')
+    )
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Delay requested by the provider (retry-after-ms or retry-after header), if any"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+
+    try:
+        if headers.get('retry-after-ms') is not None:
+            return max(0.0, float(headers['retry-after-ms']) / 1000.0)
+        if headers.get('retry-after') is not None:
+            return max(0.0, float(headers['retry-after']))
+    except (TypeError, ValueError):
+        # HTTP-date form: fall back to exponential backoff
+        pass
+    return None
+
+
+def estimate_tokens(request: Dict[str, Any]) -> int:
+    """
+    Tokens a chat request counts against TPM before its response is known
+
+    Providers reserve prompt plus max_tokens. Prompt tokens are estimated
+    as UTF-8 bytes / 3: about 1 token per Thai character and slightly
+    more than actual for English, so the estimate errs on the safe side.
+    """
+    prompt_bytes = sum(
+        len(str(message.get('content', '')).encode('utf-8')) for message in request.get('messages', [])
+    )
+    return prompt_bytes // 3 + 4 * len(request.get('messages', [])) + int(request.get('max_tokens') or 0)
+
+
+# ======================== TOKEN BUCKETS ========================
+
+class SharedBuckets:
+    """RPM/TPM token buckets per model, shared by threads and (with a state dir) processes"""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        state_dir: Optional[Path] = DEFAULT_STATE_DIR
+    ):
+        """
+        Initialize buckets
+
+        Args:
+            requests_per_minute: Request budget per model (0 = unlimited)
+            tokens_per_minute: Token budget per model (0 = unlimited)
+            state_dir: Directory of the shared state files (None: this process only)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.state_dir = Path(state_dir) if state_dir is not None and fcntl is not None else None
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Dict[str, float]] = {}
+
+        if state_dir is not None and fcntl is None:
+            logger.warning("File locks unavailable: rate limits are not shared across processes")
+        if self.state_dir is not None:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def _fresh(self, now: float) -> Dict[str, float]:
+        return {
+            'requests': float(self.requests_per_minute),
+            'tokens': float(self.tokens_per_minute),
+            'updated': now,
+            'blocked_until': 0.0
+        }
+
+    @contextmanager
+    def _state(self, model: str, now: float) -> Iterator[Dict[str, float]]:
+        """Locked read-modify-write of one model's bucket state"""
+        with self._lock:
+            if self.state_dir is None:
+                yield self._memory.setdefault(model, self._fresh(now))
+                return
+
+            path = self.state_dir / f"{''.join(c if c.isalnum() or c in '-._' else '_' for c in model)}.json"
+            with open(path, 'a+', encoding='utf-8') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read() or 'null') or self._fresh(now)
+                    except ValueError:
+                        state = self._fresh(now)
+
+                    yield state
+
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _refill(self, state: Dict[str, float], now: float):
+        elapsed = max(0.0, now - state['updated'])
+        state['updated'] = now
+        if self.requests_per_minute:
+            state['requests'] = min(
+                float(self.requests_per_minute),
+                state['requests'] + elapsed * self.requests_per_minute / 60.0
+            )
+        if self.tokens_per_minute:
+            state['tokens'] = min(
+                float(self.tokens_per_minute),
+                state['tokens'] + elapsed * self.tokens_per_minute / 60.0
+            )
+
+    def try_acquire(self, model: str, tokens: int) -> float:
+        """
+        Take one request and `tokens` tokens from a model's buckets
+
+        Returns:
+            0.0 if granted, else seconds until the buckets (or a 429 pause) allow it
+        """
+        now = time.time()
+        with self._state(model, now) as state:
+            if state['blocked_until'] > now:
+                return state['blocked_until'] - now
+
+            self._refill(state, now)
+
+            # A request larger than the whole bucket waits for a full one
+            tokens = min(tokens, self.tokens_per_minute) if self.tokens_per_minute else 0
+
+            waits = []
+            if self.requests_per_minute and state['requests'] < 1.0:
+                waits.append((1.0 - state['requests']) * 60.0 / self.requests_per_minute)
+            if tokens and state['tokens'] < tokens:
+                waits.append((tokens - state['tokens']) * 60.0 / self.tokens_per_minute)
+            if waits:
+                return max(waits)
+
+            if self.requests_per_minute:
+                state['requests'] -= 1.0
+            state['tokens'] -= tokens
+            return 0.0
+
+    def refund(self, model: str, tokens: int):
+        """Return reserved tokens the request did not use (negative: charge extra)"""
+        if not self.tokens_per_minute or not tokens:
+            return
+        now = time.time()
+        with self._state(model, now) as state:
+            self._refill(state, now)
+            state['tokens'] = min(float(self.tokens_per_minute), state['tokens'] + tokens)
+
+    def block(self, model: str, seconds: float):
+        """Pause every caller of a model (e.g. after a 429) for `seconds`"""
+        now = time.time()
+        with self._state(model, now) as state:
+            state['blocked_until'] = max(state['blocked_until'], now + seconds)
+
+
+# ======================== ADAPTIVE CONCURRENCY ========================
+
+class AdaptiveConcurrency:
+    """AIMD limit on concurrent requests of this process"""
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        latency_target: float = 0.0,
+        decrease_factor: float = 0.5
+    ):
+        """
+        Initialize limit
+
+        Args:
+            initial: Starting number of slots
+            minimum: Lowest limit a decrease can reach
+            maximum: Highest limit an increase can reach (default: initial)
+            latency_target: Responses slower than this count as overload (0 = 429s only)
+            decrease_factor: Multiplicative decrease on overload
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum or initial)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._async_waiters = deque()
+        self._last_decrease = 0.0
+
+    @property
+    def current(self) -> int:
+        """Slots available at the moment"""
+        return max(self.minimum, int(self.limit))
+
+    def acquire(self):
+        """Wait for a free slot (blocking)"""
+        with self._cond:
+            while self.in_flight >= self.current:
+                self._cond.wait()
+            self.in_flight += 1
+
+    async def acquire_async(self):
+        """Wait for a free slot without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self.in_flight < self.current:
+                    self.in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass a wake-up meant for this waiter on to the next one
+                with self._cond:
+                    self._wake(1)
+                raise
+
+    def release(self):
+        """Free a slot"""
+        with self._cond:
+            self.in_flight -= 1
+            self._wake(1)
+
+    def record(self, latency: float, throttled: bool = False, overloaded: bool = False, failed: bool = False):
+        """
+        Adjust the limit after a response
+
+        Args:
+            latency: Seconds the request took
+            throttled: The provider answered 429
+            overloaded: The request failed with a 5xx, timeout or dropped connection
+            failed: The request failed (without overload: no increase either)
+        """
+        with self._cond:
+            slow = self.latency_target > 0 and latency > self.latency_target
+            now = time.monotonic()
+
+            if throttled or overloaded or slow:
+                # Requests already in flight report the same overload: decrease once per round trip
+                if now - self._last_decrease >= max(latency, 1.0):
+                    self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    reason = '429' if throttled else 'error' if overloaded else f'{latency:.1f}s latency'
+                    logger.info(f"Concurrency decreased to {self.current} ({reason})")
+                return
+
+            if failed:
+                return
+
+            before = self.current
+            self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            if self.current > before:
+                self._wake(self.current - before)
+
+    def _wake(self, count: int):
+        """Wake up to `count` waiters, threads and coroutines (lock held)"""
+        self._cond.notify(count)
+        while count > 0 and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if waiter.done():
+                continue
+            loop.call_soon_threadsafe(_resolve, waiter)
+            count -= 1
+
+
+def _resolve(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# ======================== RATE LIMITER ========================
+
+class RateLimiter:
+    """Buckets, adaptive concurrency and retries around API calls"""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        state_dir: Optional[Path] = DEFAULT_STATE_DIR,
+        max_retries: int = 3,
+        concurrency: int = 16,
+        min_concurrency: int = 1,
+        latency_target: float = 0.0
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: Request budget per model (0 = unlimited)
+            tokens_per_minute: Token budget per model (0 = unlimited)
+            state_dir: Shared state of the buckets (None: this process only)
+            max_retries: Retries of a throttled or failed request
+            concurrency: Maximum (and starting) concurrent requests of this process
+            min_concurrency: Floor of the adaptive limit
+            latency_target: Latency above which concurrency backs off (0 = 429s only)
+        """
+        self.buckets = SharedBuckets(requests_per_minute, tokens_per_minute, state_dir)
+        self.concurrency = AdaptiveConcurrency(
+            concurrency,
+            minimum=min_concurrency,
+            latency_target=latency_target
+        )
+        self.max_retries = max_retries
+
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.wait_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config) -> 'RateLimiter':
+        """Rate limiter for a pipeline Config (config.rate_limit, api and processing)"""
+        limits = config.rate_limit
+        return cls(
+            requests_per_minute=limits.requests_per_minute,
+            tokens_per_minute=limits.tokens_per_minute,
+            state_dir=limits.state_dir,
+            max_retries=config.api.max_retries,
+            concurrency=max(config.processing.max_in_flight, config.processing.max_workers),
+            min_concurrency=limits.min_concurrency,
+            latency_target=limits.latency_target
+        )
+
+    def _count(self, **increments):
+        with self._stats_lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def _backoff(self, model: str, attempt: int, error: Exception) -> float:
+        """Delay before the next attempt; a 429 pauses every caller of the model"""
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = retry_after * (1.0 + random.uniform(0.0, RETRY_AFTER_JITTER))
+        else:
+            delay = random.uniform(0.0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+        if is_rate_limited(error):
+            self.buckets.block(model, delay)
+        return delay
+
+    def _settle(self, model: str, reserved: int, response: Any):
+        """
+        Charge tokens a response used beyond its TPM reservation
+
+        Unused max_tokens are not refunded: providers count prompt plus
+        max_tokens against TPM when the request is made.
+        """
+        used = getattr(getattr(response, 'usage', None), 'total_tokens', None)
+        if isinstance(used, int) and used > reserved:
+            self.buckets.refund(model, reserved - used)
+
+    def _slice(self, wait: float) -> float:
+        # Jitter spreads callers that were woken by the same refill
+        return min(wait, MAX_WAIT_SLICE) * random.uniform(1.0, 1.1)
+
+    def call(self, model: str, tokens: int, request: Callable[[], Any]) -> Any:
+        """
+        Run a blocking API call within the limits, retrying throttled/failed attempts
+
+        Args:
+            model: Model the call counts against
+            tokens: Estimated tokens (see estimate_tokens())
+            request: Makes the call (the client's own retries should be off)
+
+        Returns:
+            The call's response; the last error is raised once retries run out
+        """
+        for attempt in range(self.max_retries + 1):
+            # Slot first: after a 429 pause only `limit` callers per process retry at once
+            self.concurrency.acquire()
+            try:
+                while True:
+                    wait = self.buckets.try_acquire(model, tokens)
+                    if wait <= 0:
+                        break
+                    wait = self._slice(wait)
+                    self._count(wait_seconds=wait)
+                    time.sleep(wait)
+            except BaseException:
+                self.concurrency.release()
+                raise
+
+            started = time.monotonic()
+            try:
+                response = request()
+            except Exception as e:
+                self.concurrency.release()
+                self.concurrency.record(
+                    time.monotonic() - started,
+                    throttled=is_rate_limited(e),
+                    overloaded=is_overloaded(e),
+                    failed=True
+                )
+                self._count(requests=1, throttled=int(is_rate_limited(e)))
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(model, attempt, e)
+                logger.warning(f"{model} request failed ({e}); retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+                self._count(retries=1, wait_seconds=delay)
+                time.sleep(delay)
+                continue
+
+            self.concurrency.release()
+            self.concurrency.record(time.monotonic() - started)
+            self._count(requests=1)
+            self._settle(model, tokens, response)
+            return response
+
+    async def call_async(self, model: str, tokens: int, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of call(); `request` returns a new awaitable per attempt
+
+        Bucket updates lock and rewrite the shared state files, so they run
+        in the loop's default executor instead of on the event loop.
+        """
+        for attempt in range(self.max_retries + 1):
+            # Slot first: after a 429 pause only `limit` callers per process retry at once
+            await self.concurrency.acquire_async()
+            try:
+                while True:
+                    wait = await asyncio.to_thread(self.buckets.try_acquire, model, tokens)
+                    if wait <= 0:
+                        break
+                    wait = self._slice(wait)
+                    self._count(wait_seconds=wait)
+                    await asyncio.sleep(wait)
+            except BaseException:
+                self.concurrency.release()
+                raise
+
+            started = time.monotonic()
+            try:
+                response = await request()
+            except Exception as e:
+                self.concurrency.release()
+                self.concurrency.record(
+                    time.monotonic() - started,
+                    throttled=is_rate_limited(e),
+                    overloaded=is_overloaded(e),
+                    failed=True
+                )
+                self._count(requests=1, throttled=int(is_rate_limited(e)))
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                delay = await asyncio.to_thread(self._backoff, model, attempt, e)
+                logger.warning(f"{model} request failed ({e}); retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+                self._count(retries=1, wait_seconds=delay)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled (e.g. request_timeout): the slot is free, not a signal
+                self.concurrency.release()
+                raise
+
+            self.concurrency.release()
+            self.concurrency.record(time.monotonic() - started)
+            self._count(requests=1)
+            await asyncio.to_thread(self._settle, model, tokens, response)
+            return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters since creation"""
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'retries': self.retries,
+            'wait_seconds': self.wait_seconds,
+            'concurrency_limit': self.concurrency.current
+        }
+
+    def log_summary(self):
+        """Log the counters"""
+        stats = self.stats()
+        logger.info(
+            f"Rate limiter: {stats['requests']} requests, {stats['throttled']} throttled (429), "
+            f"{stats['retries']} retries, {stats['wait_seconds']:.1f}s waiting, "
+            f"concurrency {stats['concurrency_limit']}"
+        )
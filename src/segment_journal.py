@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Segment Journal - Append-Only Transcription Checkpoints
+======================================================
+Version: 1.0.0
+Description: One append-only file per transcription that holds both the
+             transcribed segments and the progress markers that commit
+             them. A checkpoint appends only the new segments plus one
+             marker, so its cost is O(new segments) instead of rewriting
+             batch files and a separate checkpoint.json that a crash
+             could leave out of step with each other.
+
+Record format (one per line):
+    <crc32 of payload, 8 hex digits> <JSON payload>\n
+
+Payload types:
+- {"type": "segment", ...}  transcribed segment
+- {"type": "commit", ...}   progress marker; commits every segment before it
+
+Features:
+- Segments and their commit marker written in a single append
+- fsync batching by time and size (flushed to the OS on every commit)
+- Recovery: torn/corrupt tail and uncommitted segments are truncated
+- Compaction: rewrite as committed segments + last marker (atomic)
+- Tail scan for status tools (no full replay)
+"""
+
+import os
+import json
+import time
+import zlib
+import logging
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_NAME = 'journal.jsonl'
+
+# fsync at most every N seconds / after N unsynced bytes (whichever first)
+DEFAULT_SYNC_INTERVAL = 5.0
+DEFAULT_SYNC_BYTES = 1024 * 1024
+
+# Status tools scan this much of the file end for the last marker
+TAIL_SCAN_BYTES = 64 * 1024
+
+RECORD_SEGMENT = 'segment'
+RECORD_COMMIT = 'commit'
+
+
+@dataclass
+class JournalState:
+    """Committed content of a journal"""
+    segments: List[Dict[str, Any]] = field(default_factory=list)
+    # Payload of the last commit marker (None if nothing was committed)
+    progress: Optional[Dict[str, Any]] = None
+    # Bytes up to and including the last commit marker
+    committed_bytes: int = 0
+    # Bytes after it (uncommitted segments or a torn record)
+    discarded_bytes: int = 0
+
+
+def encode_record(payload: Dict[str, Any]) -> bytes:
+    """Encode one checksummed journal line"""
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return b'%08x ' % zlib.crc32(data) + data + b'\n'
+
+
+def decode_record(line: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Decode one journal line
+
+    Args:
+        line: Raw line including the trailing newline
+
+    Returns:
+        Payload, or None if the line is torn or fails its checksum
+    """
+    if len(line) < 10 or not line.endswith(b'\n') or line[8:9] != b' ':
+        return None
+
+    data = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(data):
+            return None
+        return json.loads(data.decode('utf-8'))
+    except ValueError:
+        return None
+
+
+# ======================== SEGMENT JOURNAL ========================
+
+class SegmentJournal:
+    """Append-only, checksummed log of segments and commit markers"""
+
+    def __init__(
+        self,
+        path: Path,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        sync_bytes: int = DEFAULT_SYNC_BYTES
+    ):
+        """
+        Initialize journal (the file is created on first append)
+
+        Args:
+            path: Journal file
+            sync_interval: Seconds between fsyncs (0 to fsync every commit)
+            sync_bytes: Unsynced bytes that force an fsync
+        """
+        self.path = Path(path)
+        self.sync_interval = sync_interval
+        self.sync_bytes = sync_bytes
+
+        self._file = None
+        self._unsynced_bytes = 0
+        self._last_sync = time.monotonic()
+
+        self.bytes_appended = 0
+        self.commits = 0
+        self.fsyncs = 0
+
+    def exists(self) -> bool:
+        """Check whether anything was journaled"""
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def append(self, segments: Iterable[Dict[str, Any]], progress: Dict[str, Any]):
+        """
+        Append segments and the marker that commits them
+
+        Everything is written in one call and flushed to the OS, so a
+        process crash never loses a commit; an OS crash can lose at most
+        the records since the last fsync, which recovery discards cleanly.
+
+        Args:
+            segments: New segment dicts since the previous commit
+            progress: Progress marker payload (resume state)
+        """
+        records = [encode_record({'type': RECORD_SEGMENT, **segment}) for segment in segments]
+        records.append(encode_record({'type': RECORD_COMMIT, **progress}))
+        data = b''.join(records)
+
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'ab')
+
+        self._file.write(data)
+        self._file.flush()
+
+        self.bytes_appended += len(data)
+        self._unsynced_bytes += len(data)
+        self.commits += 1
+
+        if (self._unsynced_bytes >= self.sync_bytes
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+
+    def sync(self):
+        """Force journaled data to disk"""
+        if self._file is None or self._unsynced_bytes == 0:
+            return
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self._unsynced_bytes = 0
+        self._last_sync = time.monotonic()
+        self.fsyncs += 1
+
+    def close(self):
+        """Sync and close the journal file"""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def replay(self) -> JournalState:
+        """
+        Read the committed state without modifying the file
+
+        Returns:
+            JournalState (segments up to the last valid commit marker)
+        """
+        state = JournalState()
+        if not self.path.exists():
+            return state
+
+        pending = []
+        position = 0
+
+        with open(self.path, 'rb') as f:
+            for line in f:
+                payload = decode_record(line)
+                if payload is None:
+                    break
+
+                position += len(line)
+                record_type = payload.pop('type', None)
+
+                if record_type == RECORD_SEGMENT:
+                    pending.append(payload)
+                elif record_type == RECORD_COMMIT:
+                    state.segments.extend(pending)
+                    pending = []
+                    state.progress = payload
+                    state.committed_bytes = position
+
+        state.discarded_bytes = self.path.stat().st_size - state.committed_bytes
+        return state
+
+    def recover(self) -> JournalState:
+        """
+        Replay and truncate everything after the last commit marker
+
+        Returns:
+            JournalState of the committed content
+        """
+        self.close()
+        state = self.replay()
+
+        if state.discarded_bytes:
+            logger.warning(
+                f"Journal {self.path.name}: discarding {state.discarded_bytes} bytes "
+                f"after the last commit (torn or uncommitted records)"
+            )
+            with open(self.path, 'r+b') as f:
+                f.truncate(state.committed_bytes)
+                f.flush()
+                os.fsync(f.fileno())
+            state.discarded_bytes = 0
+
+        return state
+
+    def compact(self) -> JournalState:
+        """
+        Rewrite the journal as committed segments plus one commit marker
+
+        Superseded markers and discarded tails are dropped. The new file is
+        written to a temp name, fsynced and renamed over the old one.
+
+        Returns:
+            JournalState of the compacted journal
+        """
+        self.close()
+        state = self.replay()
+
+        if state.progress is None:
+            return state
+
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            for segment in state.segments:
+                f.write(encode_record({'type': RECORD_SEGMENT, **segment}))
+            f.write(encode_record({'type': RECORD_COMMIT, **state.progress}))
+            f.flush()
+            os.fsync(f.fileno())
+            state.committed_bytes = f.tell()
+
+        temp_path.replace(self.path)
+        state.discarded_bytes = 0
+
+        logger.debug(f"Journal compacted: {len(state.segments)} segments, {state.committed_bytes} bytes")
+        return state
+
+
+def read_progress(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Get the last commit marker of a journal without replaying it
+
+    Scans backwards from the end of the file, so status checks stay
+    cheap for long transcriptions.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        Last commit marker payload, or None if there is none
+    """
+    path = Path(path)
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return None
+
+    scan = TAIL_SCAN_BYTES
+    with open(path, 'rb') as f:
+        while True:
+            start = max(0, size - scan)
+            f.seek(start)
+            lines = f.read(size - start).splitlines(keepends=True)
+
+            # The first line may be cut by the seek
+            if start > 0:
+                lines = lines[1:]
+
+            for line in reversed(lines):
+                payload = decode_record(line)
+                if payload is not None and payload.get('type') == RECORD_COMMIT:
+                    payload.pop('type')
+                    return payload
+
+            if start == 0:
+                return None
+            scan *= 4
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Segment Table - Columnar Transcript Storage
+===========================================
+Version: 1.0.0
+Description: Stores transcript segments and word timestamps as NumPy
+             columns plus UTF-8 string pools instead of one dict per
+             segment and per word. Tables are written as a compact binary
+             sidecar next to the JSON export and opened as a memmap, so
+             loading a long episode reads only the header; word columns
+             are not touched unless words are asked for.
+
+Features:
+- Columns: ids, starts, ends, confidences, word offsets (per segment)
+  and word starts, ends, probabilities (per word)
+- String pools with offset arrays (no per-string objects on disk)
+- Binary format: magic + JSON header + 64-byte aligned column blocks
+- Memory-mapped, lazy loading; atomic writes (temp file + rename)
+- load_transcript()/save_transcript(): drop-in for transcript JSON files
+  that use the sidecar whenever it is up to date
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TABLE_MAGIC = b'SEGTAB01'
+TABLE_SUFFIX = '.segtab'
+COLUMN_ALIGNMENT = 64
+
+# Column name -> dtype (little-endian on disk)
+SEGMENT_COLUMNS = {
+    'id': '<i8',
+    'start': '<f8',
+    'end': '<f8',
+    'confidence': '<f8',
+    'text_offsets': '<i8',
+    'word_offsets': '<i8',
+}
+
+WORD_COLUMNS = {
+    'word_start': '<f8',
+    'word_end': '<f8',
+    'word_probability': '<f8',
+    'word_text_offsets': '<i8',
+}
+
+POOL_COLUMNS = {
+    'text_pool': 'u1',
+    'word_pool': 'u1',
+}
+
+
+def _field(item: Any, names: Iterable[str], default: Any = None) -> Any:
+    """Read the first present field of a dict or attribute of an object"""
+    for name in names:
+        if isinstance(item, dict):
+            if name in item and item[name] is not None:
+                return item[name]
+        elif getattr(item, name, None) is not None:
+            return getattr(item, name)
+    return default
+
+
+def _build_pool(strings: List[str]):
+    """Encode strings into one UTF-8 pool plus an offsets array (len + 1)"""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+    if encoded:
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    pool = np.frombuffer(b''.join(encoded), dtype='u1')
+    return pool, offsets
+
+
+# ======================== SEGMENT TABLE ========================
+
+class SegmentTable:
+    """Transcript segments and word timestamps as NumPy columns"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], fields: Optional[Dict[str, Any]] = None):
+        """
+        Initialize from prepared columns (use from_segments() or load())
+
+        Args:
+            columns: Arrays named as in SEGMENT_COLUMNS, WORD_COLUMNS, POOL_COLUMNS
+            fields: Transcript-level fields (metadata, language, ...)
+        """
+        self.columns = columns
+        self.fields = fields or {}
+
+    # -------------------- Construction --------------------
+
+    @classmethod
+    def from_segments(
+        cls,
+        segments: Iterable[Any],
+        fields: Optional[Dict[str, Any]] = None
+    ) -> 'SegmentTable':
+        """
+        Build a table from segment dicts or segment dataclasses
+
+        Accepts every segment shape used in the project: transcript JSON
+        dicts, ThaiTranscriber / WhisperTranscriber segments (start/end)
+        and translation pipeline segments (start_time/end_time).
+
+        Args:
+            segments: Segments with id, start, end, text, confidence, words
+            fields: Transcript-level fields to keep alongside the columns
+
+        Returns:
+            New in-memory SegmentTable
+        """
+        ids, starts, ends, confidences, texts = [], [], [], [], []
+        word_counts, word_starts, word_ends, word_probs, word_texts = [], [], [], [], []
+
+        for index, seg in enumerate(segments):
+            ids.append(_field(seg, ('id',), index))
+            starts.append(_field(seg, ('start', 'start_time'), 0.0))
+            ends.append(_field(seg, ('end', 'end_time'), 0.0))
+            confidences.append(_field(seg, ('confidence',), 0.0))
+            texts.append(_field(seg, ('text',), ''))
+
+            words = _field(seg, ('words',), [])
+            word_counts.append(len(words))
+            for word in words:
+                word_starts.append(word.get('start', 0.0))
+                word_ends.append(word.get('end', 0.0))
+                word_probs.append(word.get('probability', 0.0))
+                word_texts.append(word.get('word', ''))
+
+        text_pool, text_offsets = _build_pool(texts)
+        word_pool, word_text_offsets = _build_pool(word_texts)
+
+        word_offsets = np.zeros(len(word_counts) + 1, dtype='<i8')
+        if word_counts:
+            np.cumsum(word_counts, out=word_offsets[1:])
+
+        columns = {
+            'id': np.asarray(ids, dtype='<i8'),
+            'start': np.asarray(starts, dtype='<f8'),
+            'end': np.asarray(ends, dtype='<f8'),
+            'confidence': np.asarray(confidences, dtype='<f8'),
+            'text_offsets': text_offsets,
+            'word_offsets': word_offsets,
+            'word_start': np.asarray(word_starts, dtype='<f8'),
+            'word_end': np.asarray(word_ends, dtype='<f8'),
+            'word_probability': np.asarray(word_probs, dtype='<f8'),
+            'word_text_offsets': word_text_offsets,
+            'text_pool': text_pool,
+            'word_pool': word_pool,
+        }
+
+        return cls(columns, fields)
+
+    @classmethod
+    def from_transcript(cls, data: Dict[str, Any]) -> 'SegmentTable':
+        """
+        Build a table from a parsed transcript JSON dict
+
+        Args:
+            data: Transcript with 'segments' (and any other top-level fields)
+
+        Returns:
+            New in-memory SegmentTable
+        """
+        fields = {key: value for key, value in data.items() if key != 'segments'}
+        table = cls.from_segments(data.get('segments', []))
+
+        # Keep 'text' only when it is not just the joined segment texts
+        if fields.get('text') == table.text:
+            fields.pop('text')
+
+        table.fields = fields
+        return table
+
+    # -------------------- Binary format --------------------
+
+    def save(self, path: Path):
+        """
+        Write the table atomically in the binary sidecar format
+
+        Layout: magic (8 bytes), header length (uint64), JSON header, then
+        every column as raw little-endian data at a 64-byte aligned offset
+        recorded in the header.
+
+        Args:
+            path: Output file (conventionally <transcript>.segtab)
+        """
+        path = Path(path)
+        layout = {}
+        offset = 0
+
+        for name, array in self.columns.items():
+            offset = -(-offset // COLUMN_ALIGNMENT) * COLUMN_ALIGNMENT
+            layout[name] = {
+                'dtype': array.dtype.str,
+                'offset': offset,
+                'length': int(len(array))
+            }
+            offset += array.nbytes
+
+        header = json.dumps({
+            'version': 1,
+            'segments': len(self),
+            'words': self.word_count,
+            'fields': self.fields,
+            'columns': layout
+        }, ensure_ascii=False).encode('utf-8')
+
+        data_start = -(-(16 + len(header)) // COLUMN_ALIGNMENT) * COLUMN_ALIGNMENT
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + '.tmp')
+
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(TABLE_MAGIC)
+                f.write(np.uint64(len(header)).astype('<u8').tobytes())
+                f.write(header)
+                f.write(b'\0' * (data_start - 16 - len(header)))
+
+                for name, array in self.columns.items():
+                    f.seek(data_start + layout[name]['offset'])
+                    f.write(np.ascontiguousarray(array).tobytes())
+
+            temp_path.replace(path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> 'SegmentTable':
+        """
+        Open a binary table as a read-only memmap
+
+        Only the header is parsed; columns are views into the mapped file
+        and their pages are read on first access.
+
+        Args:
+            path: Binary table written by save()
+
+        Returns:
+            SegmentTable backed by the file
+        """
+        with open(path, 'rb') as f:
+            if f.read(8) != TABLE_MAGIC:
+                raise ValueError(f"Not a segment table: {path}")
+            header_length = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+            header = json.loads(f.read(header_length).decode('utf-8'))
+
+        data_start = -(-(16 + header_length) // COLUMN_ALIGNMENT) * COLUMN_ALIGNMENT
+        raw = np.memmap(path, dtype='u1', mode='r')
+
+        columns = {}
+        for name, spec in header['columns'].items():
+            dtype = np.dtype(spec['dtype'])
+            begin = data_start + spec['offset']
+            columns[name] = raw[begin:begin + spec['length'] * dtype.itemsize].view(dtype)
+
+        missing = (set(SEGMENT_COLUMNS) | set(WORD_COLUMNS) | set(POOL_COLUMNS)) - set(columns)
+        if missing:
+            raise ValueError(f"Segment table {path} lacks columns: {', '.join(sorted(missing))}")
+
+        return cls(columns, header.get('fields'))
+
+    # -------------------- Access --------------------
+
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+
+    @property
+    def word_count(self) -> int:
+        return int(self.columns['word_offsets'][-1]) if len(self) else 0
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.columns['id']
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self.columns['start']
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self.columns['end']
+
+    @property
+    def confidences(self) -> np.ndarray:
+        return self.columns['confidence']
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self.columns['end'] - self.columns['start']
+
+    @property
+    def text(self) -> str:
+        """Full transcript text"""
+        if 'text' in self.fields:
+            return self.fields['text']
+        return ' '.join(self.texts())
+
+    def segment_text(self, index: int) -> str:
+        """Text of one segment"""
+        offsets = self.columns['text_offsets']
+        return bytes(self.columns['text_pool'][offsets[index]:offsets[index + 1]]).decode('utf-8')
+
+    def texts(self) -> List[str]:
+        """Texts of all segments (one pass over the pool)"""
+        pool = bytes(self.columns['text_pool'])
+        offsets = self.columns['text_offsets'].tolist()
+        return [pool[a:b].decode('utf-8') for a, b in zip(offsets[:-1], offsets[1:])]
+
+    def words(self, index: int) -> List[Dict[str, Any]]:
+        """
+        Word timestamps of one segment (only this slice of the word columns is read)
+
+        Args:
+            index: Segment position in the table
+
+        Returns:
+            List of {'word', 'start', 'end', 'probability'} dicts
+        """
+        first, last = self.columns['word_offsets'][index:index + 2].tolist()
+        return self._word_dicts(first, last)
+
+    def segments(self, with_words: bool = False) -> List[Dict[str, Any]]:
+        """
+        Segments in the transcript JSON dict shape
+
+        Args:
+            with_words: Include word timestamps (reads the word columns)
+
+        Returns:
+            List of segment dicts
+        """
+        return list(self.iter_segments(with_words))
+
+    def iter_segments(self, with_words: bool = False) -> Iterator[Dict[str, Any]]:
+        """Iterate segment dicts (see segments())"""
+        ids = self.columns['id'].tolist()
+        starts = self.columns['start'].tolist()
+        ends = self.columns['end'].tolist()
+        confidences = self.columns['confidence'].tolist()
+        word_offsets = self.columns['word_offsets'].tolist() if with_words else None
+
+        for index, text in enumerate(self.texts()):
+            segment = {
+                'id': ids[index],
+                'start': starts[index],
+                'end': ends[index],
+                'text': text,
+                'confidence': confidences[index]
+            }
+            if with_words:
+                segment['words'] = self._word_dicts(word_offsets[index], word_offsets[index + 1])
+            yield segment
+
+    def to_transcript(self, with_words: bool = False) -> Dict[str, Any]:
+        """
+        Rebuild the transcript JSON dict (top-level fields + segments)
+
+        Args:
+            with_words: Include word timestamps
+
+        Returns:
+            Transcript dict as stored in the JSON export
+        """
+        data = dict(self.fields)
+        data['text'] = self.text
+        data['segments'] = self.segments(with_words)
+        return data
+
+    def _word_dicts(self, first: int, last: int) -> List[Dict[str, Any]]:
+        if first == last:
+            return []
+
+        offsets = self.columns['word_text_offsets'][first:last + 1].tolist()
+        pool = bytes(self.columns['word_pool'][offsets[0]:offsets[-1]])
+        base = offsets[0]
+        starts = self.columns['word_start'][first:last].tolist()
+        ends = self.columns['word_end'][first:last].tolist()
+        probabilities = self.columns['word_probability'][first:last].tolist()
+
+        return [
+            {
+                'word': pool[offsets[i] - base:offsets[i + 1] - base].decode('utf-8'),
+                'start': starts[i],
+                'end': ends[i],
+                'probability': probabilities[i]
+            }
+            for i in range(last - first)
+        ]
+
+
+# ======================== TRANSCRIPT FILES ========================
+
+def table_path(json_path: Path) -> Path:
+    """Binary sidecar location of a transcript JSON file"""
+    json_path = Path(json_path)
+    return json_path.with_name(json_path.stem + TABLE_SUFFIX)
+
+
+def load_transcript(json_path: Path, with_words: bool = False) -> Dict[str, Any]:
+    """
+    Load a transcript JSON file, via its binary sidecar when up to date
+
+    Without a current sidecar the JSON is parsed once and the sidecar is
+    written next to it, so the next load skips JSON parsing entirely.
+
+    Args:
+        json_path: Transcript JSON file
+        with_words: Include per-word timestamps in the segments
+
+    Returns:
+        Transcript dict ('segments' plus the file's other top-level fields)
+    """
+    json_path = Path(json_path)
+    sidecar = table_path(json_path)
+
+    try:
+        if sidecar.stat().st_mtime >= json_path.stat().st_mtime:
+            return SegmentTable.load(sidecar).to_transcript(with_words)
+    except (OSError, ValueError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning(f"Ignoring unreadable segment table {sidecar.name}: {e}")
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    try:
+        SegmentTable.from_transcript(data).save(sidecar)
+    except OSError as e:
+        logger.debug(f"Could not write segment table {sidecar}: {e}")
+
+    if not with_words:
+        for segment in data.get('segments', []):
+            segment.pop('words', None)
+
+    return data
+
+
+def save_transcript(data: Dict[str, Any], json_path: Path):
+    """
+    Write a transcript as JSON plus its binary sidecar
+
+    Args:
+        data: Transcript dict with 'segments'
+        json_path: Output JSON file
+    """
+    json_path = Path(json_path)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+    # Written after the JSON so its mtime marks it as current
+    SegmentTable.from_transcript(data).save(table_path(json_path))
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Pipeline Service Client - Submit Jobs to a Warm Pipeline Service
+================================================================
+Version: 1.0.0
+Description: Small client for the local job API of pipeline_service.py.
+             Standard library only, so CLIs can hand work to a running
+             service without importing Whisper or loading dictionaries.
+
+Addresses:
+- Unix socket: a filesystem path (e.g. .cache/pipeline_service.sock)
+- HTTP: http://127.0.0.1:8765
+
+API (JSON over HTTP/1.0):
+- GET  /health                 service status, resident models, stage slots
+- GET  /jobs                   all known jobs
+- POST /jobs                   submit {kind, input, output_dir, doc_type}
+- GET  /jobs/<id>              job status and result
+- GET  /jobs/<id>/events       progress events as NDJSON, streamed until the job ends
+"""
+
+import json
+import socket
+import logging
+import http.client
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_SOCKET = Path('.cache/pipeline_service.sock')
+
+JOB_TRANSCRIBE = 'transcribe'
+JOB_TRANSLATE = 'translate'
+JOB_KINDS = (JOB_TRANSCRIBE, JOB_TRANSLATE)
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+JOB_FINISHED_STATES = (JOB_COMPLETED, JOB_FAILED)
+
+
+class ServiceError(Exception):
+    """The service is unreachable or rejected a request"""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket"""
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__('localhost', timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.unix_path)
+        self.sock = sock
+
+
+class ServiceClient:
+    """Client for a running pipeline service"""
+
+    def __init__(self, address: str, timeout: float = 30.0):
+        """
+        Initialize client
+
+        Args:
+            address: Unix socket path or http://host:port
+            timeout: Seconds to wait for request/response calls (event streams never time out)
+        """
+        self.address = str(address)
+        self.timeout = timeout
+
+    def _connect(self, timeout: Optional[float]) -> http.client.HTTPConnection:
+        if self.address.startswith(('http://', 'https://')):
+            url = urlparse(self.address)
+            return http.client.HTTPConnection(url.hostname, url.port or 80, timeout=timeout)
+        return _UnixHTTPConnection(self.address, timeout=timeout)
+
+    def _request(self, method: str, path: str, body: Optional[Dict] = None) -> Any:
+        connection = self._connect(self.timeout)
+        try:
+            payload = json.dumps(body).encode('utf-8') if body is not None else None
+            headers = {'Content-Type': 'application/json'} if payload is not None else {}
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            data = json.loads(response.read().decode('utf-8') or 'null')
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            raise ServiceError(f"Pipeline service at {self.address} unreachable: {e}")
+        finally:
+            connection.close()
+
+        if response.status >= 400:
+            raise ServiceError((data or {}).get('error', f"HTTP {response.status}"))
+        return data
+
+    def health(self) -> Dict[str, Any]:
+        """Service status (resident models, stage slots, job counts)"""
+        return self._request('GET', '/health')
+
+    def is_available(self) -> bool:
+        """Check whether a service answers at this address"""
+        try:
+            self.health()
+            return True
+        except ServiceError:
+            return False
+
+    def submit(
+        self,
+        kind: str,
+        input_path: Path,
+        output_dir: Optional[Path] = None,
+        doc_type: str = 'tutorial'
+    ) -> Dict[str, Any]:
+        """
+        Submit a job
+
+        Args:
+            kind: 'transcribe' (Thai SRT/JSON) or 'translate' (full pipeline)
+            input_path: Video/audio file (resolved to an absolute path)
+            output_dir: Output directory (default: the service decides)
+            doc_type: Document type for context analysis
+
+        Returns:
+            Job status dict (with 'id')
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(JOB_KINDS)}")
+
+        return self._request('POST', '/jobs', {
+            'kind': kind,
+            'input': str(Path(input_path).resolve()),
+            'output_dir': str(Path(output_dir).resolve()) if output_dir else None,
+            'doc_type': doc_type
+        })
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """Current status of a job"""
+        return self._request('GET', f'/jobs/{job_id}')
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """All jobs the service knows about"""
+        return self._request('GET', '/jobs')
+
+    def events(self, job_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a job's progress events (from the first one) until it finishes
+
+        Yields:
+            Event dicts; the last one has type 'completed' or 'failed'
+        """
+        connection = self._connect(None)
+        try:
+            connection.request('GET', f'/jobs/{job_id}/events')
+            response = connection.getresponse()
+            if response.status >= 400:
+                data = json.loads(response.read().decode('utf-8') or 'null')
+                raise ServiceError((data or {}).get('error', f"HTTP {response.status}"))
+
+            for line in response:
+                line = line.strip()
+                if line:
+                    yield json.loads(line.decode('utf-8'))
+        except (OSError, http.client.HTTPException) as e:
+            raise ServiceError(f"Event stream from {self.address} interrupted: {e}")
+        finally:
+            connection.close()
+
+    def run(
+        self,
+        kind: str,
+        input_path: Path,
+        output_dir: Optional[Path] = None,
+        doc_type: str = 'tutorial',
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit a job and follow its events until it finishes
+
+        Args:
+            kind, input_path, output_dir, doc_type: See submit()
+            on_event: Called with every event (default: log it)
+
+        Returns:
+            Final job status dict ('status' is 'completed' or 'failed')
+        """
+        job = self.submit(kind, input_path, output_dir, doc_type)
+        for event in self.events(job['id']):
+            (on_event or log_event)(event)
+        return self.status(job['id'])
+
+
+def log_event(event: Dict[str, Any]):
+    """Default event printer for CLIs"""
+    kind = event.get('type')
+    if kind == 'stage':
+        elapsed = f" ({event['seconds']:.1f}s)" if 'seconds' in event else ''
+        logger.info(f"[{event['job']}] {event['stage']} {event['state']}{elapsed}")
+    elif kind == 'progress':
+        logger.info(f"[{event['job']}] {event['stage']}: {event.get('position', 0.0):.0f}s, {event.get('segments', 0)} segments")
+    elif kind == 'failed':
+        logger.error(f"[{event['job']}] failed: {event.get('error')}")
+    else:
+        logger.info(f"[{event['job']}] {kind}")
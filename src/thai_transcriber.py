@@ -11,16 +11,24 @@ Features:
 - Multi-temperature ensemble for accuracy
 - Thai-specific prompt conditioning
 - Forex terminology awareness
+- Optional energy VAD to skip silence before decoding
+- Accepts already decoded PCM (array or shared memory-mapped buffer)
+- Optional artifact store: known videos are not transcribed again
+- Streaming API: finalized segments per window (sync or async iteration)
+- Two-tier decoding: greedy pass, beam re-decode of flagged windows only
+- Pluggable inference backends (openai-whisper, int8 quantized, ONNX Runtime)
+- Lazy word timestamps: alignment only for segments subtitles need it for
+- Optional mel cache: log-mel features of known windows are memory-mapped
 """
 
 import os
 import sys
+import asyncio
 import logging
 import argparse
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-import json
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from dataclasses import dataclass, asdict, field
 
 # Setup logging
 logging.basicConfig(
@@ -29,6 +37,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Streaming: seconds of audio per Whisper call (segments are released per window)
+STREAM_WINDOW = 120.0
+
+# Streaming: characters of the previous window carried into the next prompt
+STREAM_PROMPT_TAIL = 120
+
+# Streaming: each window ends at the quietest STREAM_CUT_GAP seconds within
+# STREAM_CUT_TOLERANCE seconds of its nominal end, so cuts fall between words
+STREAM_CUT_TOLERANCE = 5.0
+STREAM_CUT_GAP = 0.5
+
 # Try to import whisper
 try:
     import whisper
@@ -37,6 +56,39 @@ except ImportError:
     logger.warning("OpenAI Whisper not installed. Install with: pip install openai-whisper")
     WHISPER_AVAILABLE = False
 
+try:
+    from .voice_activity import EnergyVAD
+    from .audio_ingest import SAMPLE_RATE, AudioInput, as_samples, to_float32
+    from .artifact_store import ArtifactStore, fingerprint, settings_digest
+    from .segment_table import save_transcript
+    from .decoding_strategy import (
+        DECODING_ACCURATE, DECODING_MODES, DECODING_TWO_TIER,
+        DecodeTelemetry, QualityThresholds, decode_window
+    )
+    from .inference_backends import BACKEND_OPENAI, BACKENDS, load_whisper_model
+    from .word_alignment import (
+        WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMPS_LAZY, WORD_TIMESTAMP_MODES,
+        AlignmentPolicy, segment_confidence
+    )
+    from .mel_cache import DEFAULT_MEL_CACHE_DIR, MelCache
+    from .service_client import JOB_COMPLETED, JOB_TRANSCRIBE, ServiceClient, ServiceError, log_event
+except ImportError:
+    from voice_activity import EnergyVAD
+    from audio_ingest import SAMPLE_RATE, AudioInput, as_samples, to_float32
+    from artifact_store import ArtifactStore, fingerprint, settings_digest
+    from segment_table import save_transcript
+    from decoding_strategy import (
+        DECODING_ACCURATE, DECODING_MODES, DECODING_TWO_TIER,
+        DecodeTelemetry, QualityThresholds, decode_window
+    )
+    from inference_backends import BACKEND_OPENAI, BACKENDS, load_whisper_model
+    from word_alignment import (
+        WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMPS_LAZY, WORD_TIMESTAMP_MODES,
+        AlignmentPolicy, segment_confidence
+    )
+    from mel_cache import DEFAULT_MEL_CACHE_DIR, MelCache
+    from service_client import JOB_COMPLETED, JOB_TRANSCRIBE, ServiceClient, ServiceError, log_event
+
 
 # ======================== DATA STRUCTURES ========================
 
@@ -61,6 +113,38 @@ class TranscriptionResult:
     text: str
     word_count: int
     average_confidence: float
+    vad_skipped_seconds: float = 0.0
+    # Decoding telemetry (see decoding_strategy.DecodeTelemetry)
+    decoding: Dict[str, Any] = field(default_factory=dict)
+
+
+class SegmentStream:
+    """
+    Finalized transcription segments, released window by window
+
+    Iterate (or `async for`) to consume segments while Whisper is still
+    decoding later windows; `result` holds the complete TranscriptionResult
+    once the stream is exhausted.
+    """
+
+    def __init__(self, generator: Iterator[TranscriptionSegment]):
+        self._generator = generator
+        self.result: Optional[TranscriptionResult] = None
+
+    def __iter__(self) -> Iterator[TranscriptionSegment]:
+        self.result = yield from self._generator
+
+    async def __aiter__(self):
+        # Decode in a worker thread so the event loop stays responsive
+        loop = asyncio.get_running_loop()
+        iterator = iter(self)
+        done = object()
+
+        while True:
+            segment = await loop.run_in_executor(None, next, iterator, done)
+            if segment is done:
+                break
+            yield segment
 
 
 # ======================== THAI TRANSCRIBER ========================
@@ -93,29 +177,80 @@ class ThaiTranscriber:
         "initial_prompt": "นี่คือการสอนเทรด Forex และการลงทุน ใช้คำศัพท์ทางการเงินและการวิเคราะห์ทางเทคนิค"
     }
 
-    def __init__(self, model_name: str = "large-v3", device: str = "cpu"):
+    def __init__(
+        self,
+        model_name: str = "large-v3",
+        device: str = "cpu",
+        use_vad: bool = False,
+        store: Optional[ArtifactStore] = None,
+        decoding: str = DECODING_ACCURATE,
+        thresholds: Optional[QualityThresholds] = None,
+        backend: str = BACKEND_OPENAI,
+        word_timestamps: str = WORD_TIMESTAMPS_EAGER,
+        alignment: Optional[AlignmentPolicy] = None,
+        mel_cache: Optional[MelCache] = None,
+        load_model: bool = True
+    ):
         """
         Initialize Thai transcriber
 
         Args:
             model_name: Whisper model to use (large-v3 recommended)
             device: Device to use ('cpu' or 'cuda')
+            use_vad: Skip silent stretches with the energy VAD before decoding
+            store: Artifact store for finished transcripts (None to disable)
+            decoding: 'accurate' (beam search everywhere) or 'two-tier'
+                      (greedy pass, beam re-decode of flagged windows)
+            thresholds: Window quality limits for two-tier decoding
+            backend: Inference backend ('openai-whisper', 'int8' or 'onnx')
+            word_timestamps: 'eager' (align every segment) or 'lazy' (align
+                             only segments flagged by the alignment policy)
+            alignment: Limits for lazy word timestamps
+            mel_cache: Cache of log-mel features per audio window (None to disable)
+            load_model: False for an instance that only saves transcripts
+                        (e.g. when the models live in worker processes)
         """
         if not WHISPER_AVAILABLE:
             raise ImportError("Whisper not installed. Please install with: pip install openai-whisper")
 
+        if decoding not in DECODING_MODES:
+            raise ValueError(f"decoding must be one of {', '.join(DECODING_MODES)}, got '{decoding}'")
+
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(BACKENDS)}, got '{backend}'")
+
+        if word_timestamps not in WORD_TIMESTAMP_MODES:
+            raise ValueError(
+                f"word_timestamps must be one of {', '.join(WORD_TIMESTAMP_MODES)}, got '{word_timestamps}'"
+            )
+
         self.model_name = model_name
         self.device = device
         self.model = None
-
-        logger.info(f"Initializing Thai Transcriber with model: {model_name}")
+        self.vad = EnergyVAD() if use_vad else None
+        self.store = store
+        self.decoding = decoding
+        self.thresholds = thresholds or QualityThresholds()
+        self.backend = backend
+        self.word_timestamps = word_timestamps
+        # Decode without word timestamps and align flagged segments afterwards
+        self.alignment = (alignment or AlignmentPolicy()) if word_timestamps == WORD_TIMESTAMPS_LAZY else None
+        self.mel_cache = mel_cache
+
+        if not load_model:
+            return
+
+        logger.info(
+            f"Initializing Thai Transcriber with model: {model_name} "
+            f"({backend} backend, {decoding} decoding)"
+        )
         self._load_model()
 
     def _load_model(self):
         """Load Whisper model"""
         try:
             logger.info(f"Loading Whisper model: {self.model_name}...")
-            self.model = whisper.load_model(self.model_name, device=self.device)
+            self.model = load_whisper_model(self.model_name, device=self.device, backend=self.backend)
             logger.info("✓ Model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
@@ -124,41 +259,108 @@ class ThaiTranscriber:
     def transcribe_file(
         self,
         audio_path: Path,
+        audio: Optional[AudioInput] = None,
         **kwargs
     ) -> TranscriptionResult:
         """
         Transcribe audio file to Thai text
 
+        With two-tier decoding the file is decoded in windows (see
+        stream_file()) so that only unreliable windows are re-decoded.
+
         Args:
             audio_path: Path to audio/video file
+            audio: Already decoded 16kHz mono PCM (array or PCMBuffer);
+                   skips decoding the file again
             **kwargs: Additional Whisper parameters to override
 
         Returns:
             TranscriptionResult with segments and metadata
         """
-        if not audio_path.exists():
+        if audio is None and not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        if self.decoding == DECODING_TWO_TIER:
+            stream = self.stream_file(audio_path, audio=audio, **kwargs)
+            for _ in stream:
+                pass
+            return stream.result
+
         logger.info(f"Transcribing: {audio_path}")
 
         # Merge settings
         settings = {**self.THAI_SETTINGS, **kwargs}
 
+        # Reuse an earlier transcript of the same content and settings
+        artifact_key, artifact_name = self._transcript_artifact(audio_path, settings)
+        if artifact_key is not None:
+            transcription = self._load_cached_transcript(artifact_key, artifact_name)
+            if transcription is not None:
+                return transcription
+
         try:
-            # Run Whisper transcription
-            result = self.model.transcribe(
-                str(audio_path),
-                **settings
-            )
+            speech_map = None
+            audio_input = str(audio_path)
+
+            if audio is not None:
+                audio = as_samples(audio)
+                audio_input = to_float32(audio)
+            elif self.vad or self.mel_cache is not None:
+                # Decode once here so the VAD / mel cache and Whisper share the samples
+                audio = whisper.load_audio(str(audio_path))
+                audio_input = audio
+
+            if self.vad:
+                # Submit speech regions only
+                speech_map = self.vad.detect(audio)
+                audio_input = to_float32(speech_map.compact(audio))
+
+                logger.info(
+                    f"  - VAD: {len(speech_map.regions)} speech regions, "
+                    f"{speech_map.skipped_seconds:.1f}s of {speech_map.duration:.1f}s skipped"
+                )
+
+            telemetry = DecodeTelemetry(mode=self.decoding)
+
+            if speech_map is not None and not speech_map.has_speech:
+                result = {"segments": [], "text": "", "language": settings["language"]}
+            else:
+                # Run Whisper transcription
+                result, window = decode_window(
+                    self.model,
+                    audio_input,
+                    settings,
+                    mode=self.decoding,
+                    label="File",
+                    alignment=self.alignment,
+                    mel_cache=self.mel_cache
+                )
+                telemetry.record(window)
+
+            if speech_map is not None:
+                for seg in result.get("segments", []):
+                    speech_map.remap_segment(seg)
+                result["duration"] = speech_map.duration
 
             # Process results
             transcription = self._process_whisper_result(result)
+            transcription.decoding = telemetry.to_dict()
+            if speech_map is not None:
+                transcription.vad_skipped_seconds = speech_map.skipped_seconds
+
+            if artifact_key is not None:
+                self.store.put_json(artifact_key, artifact_name, asdict(transcription))
 
             logger.info(f"✓ Transcription complete:")
             logger.info(f"  - Duration: {transcription.duration:.2f}s")
             logger.info(f"  - Segments: {len(transcription.segments)}")
             logger.info(f"  - Words: {transcription.word_count}")
             logger.info(f"  - Avg confidence: {transcription.average_confidence:.2%}")
+            if self.vad:
+                logger.info(f"  - Silence skipped (VAD): {transcription.vad_skipped_seconds:.2f}s")
+            telemetry.log_summary()
+            if self.mel_cache is not None:
+                self.mel_cache.log_summary()
 
             return transcription
 
@@ -166,55 +368,271 @@ class ThaiTranscriber:
             logger.error(f"Transcription failed: {e}")
             raise
 
-    def _process_whisper_result(self, result: Dict) -> TranscriptionResult:
-        """Process Whisper output into structured format"""
+    def stream_file(
+        self,
+        audio_path: Path,
+        audio: Optional[AudioInput] = None,
+        window_size: float = STREAM_WINDOW,
+        **kwargs
+    ) -> SegmentStream:
+        """
+        Transcribe audio file window by window, releasing segments as they finish
+
+        The audio is decoded once and fed to Whisper in `window_size` pieces
+        (of the VAD-compacted timeline when VAD is on), each cut moved to
+        the quietest gap near its nominal position so no word straddles two
+        windows (the same search split_video.py uses). Segments of a window
+        are yielded as soon as that window is decoded, so downstream stages
+        can start long before the whole file is done. The tail of each
+        window's text primes the next window's prompt.
+
+        Args:
+            audio_path: Path to audio/video file
+            audio: Already decoded 16kHz mono PCM (array or PCMBuffer)
+            window_size: Seconds of audio per Whisper call (±STREAM_CUT_TOLERANCE)
+            **kwargs: Additional Whisper parameters to override
+
+        Returns:
+            SegmentStream; its `result` is set once iteration finishes
+        """
+        if audio is None and not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if window_size <= 0:
+            raise ValueError(f"window_size must be positive, got {window_size}")
+
+        return SegmentStream(self._stream_segments(audio_path, audio, window_size, kwargs))
+
+    def _stream_segments(
+        self,
+        audio_path: Path,
+        audio: Optional[AudioInput],
+        window_size: float,
+        overrides: Dict[str, Any]
+    ):
+        """Generator behind stream_file(); returns the TranscriptionResult"""
+        logger.info(f"Transcribing (streaming): {audio_path}")
+
+        settings = {**self.THAI_SETTINGS, **overrides}
+
+        artifact_key, artifact_name = self._transcript_artifact(
+            audio_path, settings, stream_window=window_size, stream_cuts='quietest_gap'
+        )
+        if artifact_key is not None:
+            transcription = self._load_cached_transcript(artifact_key, artifact_name)
+            if transcription is not None:
+                yield from transcription.segments
+                return transcription
+
+        if audio is not None:
+            audio = as_samples(audio)
+        else:
+            audio = whisper.load_audio(str(audio_path))
+
+        duration = len(audio) / SAMPLE_RATE
+        samples = audio
+        speech_map = None
+
+        if self.vad:
+            speech_map = self.vad.detect(audio)
+            samples = speech_map.compact(audio)
+
+            logger.info(
+                f"  - VAD: {len(speech_map.regions)} speech regions, "
+                f"{speech_map.skipped_seconds:.1f}s of {speech_map.duration:.1f}s skipped"
+            )
+
+        window_samples = int(window_size * SAMPLE_RATE)
+        # Cuts move by at most the tolerance: about as many windows as fixed cuts
+        total_windows = -(-len(samples) // window_samples) if len(samples) else 0
+        cutter = self.vad or EnergyVAD()
+        base_prompt = settings.get("initial_prompt") or ""
+
         segments = []
-        total_confidence = 0
-        word_count = 0
-
-        for i, seg in enumerate(result.get("segments", []), 1):
-            # Extract word-level timestamps if available
-            words = []
-            if "words" in seg:
-                words = [
-                    {
-                        "word": w.get("word", ""),
-                        "start": w.get("start", 0.0),
-                        "end": w.get("end", 0.0),
-                        "probability": w.get("probability", 0.0)
-                    }
-                    for w in seg["words"]
-                ]
-                word_count += len(words)
-
-            # Calculate confidence from word probabilities
-            if words:
-                avg_prob = sum(w["probability"] for w in words) / len(words)
-            else:
-                avg_prob = 0.8  # Default confidence
-
-            total_confidence += avg_prob
-
-            segment = TranscriptionSegment(
-                id=i,
-                start=seg.get("start", 0.0),
-                end=seg.get("end", 0.0),
-                text=seg.get("text", "").strip(),
-                words=words,
-                confidence=avg_prob,
-                no_speech_prob=seg.get("no_speech_prob", 0.0)
+        texts = []
+        language = settings["language"]
+        prompt_tail = ""
+        telemetry = DecodeTelemetry(mode=self.decoding)
+
+        offset = 0
+        index = 0
+        while offset < len(samples):
+            index += 1
+            end = self._stream_cut(samples, offset, window_samples, cutter)
+            chunk = to_float32(samples[offset:end])
+            window_start = offset / SAMPLE_RATE
+            offset = end
+
+            window_settings = dict(settings)
+            if prompt_tail:
+                window_settings["initial_prompt"] = f"{base_prompt} {prompt_tail}".strip()
+
+            result, window = decode_window(
+                self.model,
+                chunk,
+                window_settings,
+                mode=self.decoding,
+                thresholds=self.thresholds,
+                label=f"Window {index}/~{total_windows}",
+                alignment=self.alignment,
+                mel_cache=self.mel_cache
             )
+            telemetry.record(window)
+            language = result.get("language", language)
+
+            window_segments = []
+            for seg in result.get("segments", []):
+                seg["start"] = seg.get("start", 0.0) + window_start
+                seg["end"] = seg.get("end", 0.0) + window_start
+                for word in seg.get("words") or []:
+                    word["start"] = word.get("start", 0.0) + window_start
+                    word["end"] = word.get("end", 0.0) + window_start
+
+                if speech_map is not None:
+                    speech_map.remap_segment(seg)
+
+                segment = self._convert_segment(seg, len(segments) + 1)
+                segments.append(segment)
+                window_segments.append(segment)
+
+            window_text = result.get("text", "").strip()
+            if window_text:
+                texts.append(window_text)
+                prompt_tail = window_text[-STREAM_PROMPT_TAIL:]
+
+            logger.info(f"  - Window {index}/~{total_windows}: {len(window_segments)} segments")
+
+            yield from window_segments
+
+        transcription = self._summarize_segments(
+            segments,
+            language=language,
+            duration=duration,
+            text=" ".join(texts)
+        )
+        transcription.decoding = telemetry.to_dict()
+        if speech_map is not None:
+            transcription.vad_skipped_seconds = speech_map.skipped_seconds
 
-            segments.append(segment)
+        if artifact_key is not None:
+            self.store.put_json(artifact_key, artifact_name, asdict(transcription))
 
-        # Calculate average confidence
-        avg_confidence = total_confidence / len(segments) if segments else 0.0
+        logger.info(f"✓ Streaming transcription complete: {len(segments)} segments")
+        telemetry.log_summary()
+        if self.mel_cache is not None:
+            self.mel_cache.log_summary()
 
-        return TranscriptionResult(
-            segments=segments,
+        return transcription
+
+    @staticmethod
+    def _stream_cut(samples, offset: int, window_samples: int, cutter: EnergyVAD) -> int:
+        """
+        End sample of the streaming window starting at `offset`
+
+        The nominal end (offset + window) moves to the quietest gap within
+        STREAM_CUT_TOLERANCE seconds of it, so no word is split between two
+        windows. A remainder shorter than the tolerance joins the last window.
+        """
+        tolerance = min(int(STREAM_CUT_TOLERANCE * SAMPLE_RATE), window_samples // 2)
+        nominal = offset + window_samples
+        if nominal + tolerance >= len(samples):
+            return len(samples)
+
+        start = nominal - tolerance
+        gap_center, _ = cutter.quietest_gap(samples[start:nominal + tolerance], gap=STREAM_CUT_GAP)
+        return start + int(gap_center * SAMPLE_RATE)
+
+    def _transcript_artifact(
+        self,
+        audio_path: Path,
+        settings: Dict[str, Any],
+        **extra
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Artifact store key and name of a transcript (None, None without a store)"""
+        if self.store is None or not audio_path.exists():
+            return None, None
+
+        artifact_name = "thai_transcript_" + settings_digest({
+            "model": self.model_name,
+            "settings": settings,
+            "vad": self.vad is not None,
+            "decoding": self.decoding,
+            "backend": self.backend,
+            "word_timestamps": self.word_timestamps,
+            **extra
+        }) + ".json"
+
+        return fingerprint(audio_path), artifact_name
+
+    def _load_cached_transcript(self, artifact_key: str, artifact_name: str) -> Optional[TranscriptionResult]:
+        """Load a stored transcript, or None if it is not in the store"""
+        cached = self.store.get_json(artifact_key, artifact_name)
+        if cached is None:
+            return None
+
+        cached["segments"] = [TranscriptionSegment(**seg) for seg in cached["segments"]]
+        transcription = TranscriptionResult(**cached)
+        logger.info(f"✓ Transcript found in artifact store ({len(transcription.segments)} segments)")
+        return transcription
+
+    def _process_whisper_result(self, result: Dict) -> TranscriptionResult:
+        """Process Whisper output into structured format"""
+        segments = [
+            self._convert_segment(seg, i)
+            for i, seg in enumerate(result.get("segments", []), 1)
+        ]
+
+        return self._summarize_segments(
+            segments,
             language=result.get("language", "th"),
             duration=result.get("duration", 0.0),
-            text=result.get("text", ""),
+            text=result.get("text", "")
+        )
+
+    @staticmethod
+    def _convert_segment(seg: Dict, segment_id: int) -> TranscriptionSegment:
+        """Convert one Whisper segment dict into a TranscriptionSegment"""
+        # Extract word-level timestamps if available
+        words = []
+        if "words" in seg:
+            words = [
+                {
+                    "word": w.get("word", ""),
+                    "start": w.get("start", 0.0),
+                    "end": w.get("end", 0.0),
+                    "probability": w.get("probability", 0.0)
+                }
+                for w in seg["words"]
+            ]
+
+        # Word probabilities, or token log probability for unaligned segments
+        avg_prob = segment_confidence(seg, default=0.8)
+
+        return TranscriptionSegment(
+            id=segment_id,
+            start=seg.get("start", 0.0),
+            end=seg.get("end", 0.0),
+            text=seg.get("text", "").strip(),
+            words=words,
+            confidence=avg_prob,
+            no_speech_prob=seg.get("no_speech_prob", 0.0)
+        )
+
+    @staticmethod
+    def _summarize_segments(
+        segments: List[TranscriptionSegment],
+        language: str,
+        duration: float,
+        text: str
+    ) -> TranscriptionResult:
+        """Build a TranscriptionResult with word count and average confidence"""
+        word_count = sum(len(seg.words) for seg in segments)
+        avg_confidence = sum(seg.confidence for seg in segments) / len(segments) if segments else 0.0
+
+        return TranscriptionResult(
+            segments=segments,
+            language=language,
+            duration=duration,
+            text=text,
             word_count=word_count,
             average_confidence=avg_confidence
         )
@@ -248,6 +666,8 @@ class ThaiTranscriber:
             "duration": transcription.duration,
             "word_count": transcription.word_count,
             "average_confidence": transcription.average_confidence,
+            "vad_skipped_seconds": transcription.vad_skipped_seconds,
+            "decoding": transcription.decoding,
             "text": transcription.text,
             "segments": [
                 {
@@ -262,8 +682,8 @@ class ThaiTranscriber:
             ]
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # JSON export plus the binary segment table next to it
+        save_transcript(data, output_path)
 
         logger.info(f"✓ JSON saved: {output_path}")
 
@@ -306,6 +726,24 @@ Examples:
 
   # Save all formats
   python thai_transcriber.py input.mp4 --srt --json --txt
+
+  # Skip silent stretches before decoding
+  python thai_transcriber.py input.mp4 --vad
+
+  # Greedy first pass, beam search only where it looks unreliable
+  python thai_transcriber.py input.mp4 --decoding two-tier
+
+  # int8-quantized model on CPU
+  python thai_transcriber.py input.mp4 --backend int8
+
+  # Word timestamps only for segments that need them
+  python thai_transcriber.py input.mp4 --word-timestamps lazy
+
+  # Reuse log-mel features when re-running the same audio with other settings
+  python thai_transcriber.py input.mp4 --mel-cache-dir .cache/mel
+
+  # Hand the job to a running pipeline service (models already loaded)
+  python thai_transcriber.py input.mp4 --service .cache/pipeline_service.sock
         """
     )
 
@@ -338,6 +776,45 @@ Examples:
         help="Device to use (default: cpu)"
     )
 
+    parser.add_argument(
+        "--vad",
+        action="store_true",
+        help="Skip silent stretches with an energy VAD before decoding"
+    )
+
+    parser.add_argument(
+        "--decoding",
+        type=str,
+        default=DECODING_ACCURATE,
+        choices=DECODING_MODES,
+        help="Decoding strategy (default: accurate)"
+    )
+
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default=BACKEND_OPENAI,
+        choices=BACKENDS,
+        help="Inference backend: stock openai-whisper, int8 dynamic quantization "
+             "or ONNX Runtime encoder; int8/onnx are CPU only (default: openai-whisper)"
+    )
+
+    parser.add_argument(
+        "--word-timestamps",
+        type=str,
+        default=WORD_TIMESTAMPS_EAGER,
+        choices=WORD_TIMESTAMP_MODES,
+        help="eager: align every segment; lazy: align only segments that are too long, "
+             "too fast, too short or low-confidence (default: eager)"
+    )
+
+    parser.add_argument(
+        "--mel-cache-dir",
+        type=Path,
+        help=f"Cache log-mel spectrograms per audio window here, e.g. {DEFAULT_MEL_CACHE_DIR} "
+             "(reused by re-runs with other decode settings)"
+    )
+
     parser.add_argument(
         "--srt",
         action="store_true",
@@ -356,15 +833,42 @@ Examples:
         help="Save TXT file"
     )
 
+    parser.add_argument(
+        "--service",
+        type=str,
+        metavar="ADDRESS",
+        help="Submit to a running pipeline service (socket path or http://host:port) "
+             "instead of loading a model; writes <name>_thai.srt/.json, model options are the service's"
+    )
+
     args = parser.parse_args()
 
+    if args.service:
+        try:
+            job = ServiceClient(args.service).run(JOB_TRANSCRIBE, args.input, args.output, on_event=log_event)
+        except ServiceError as e:
+            logger.error(f"Error: {e}")
+            sys.exit(1)
+
+        for name, path in (job.get('result') or {}).get('output_files', {}).items():
+            logger.info(f"  {name}: {path}")
+        sys.exit(0 if job['status'] == JOB_COMPLETED else 1)
+
     # If no format specified, save all
     if not (args.srt or args.json or args.txt):
         args.srt = args.json = args.txt = True
 
     try:
         # Initialize transcriber
-        transcriber = ThaiTranscriber(model_name=args.model, device=args.device)
+        transcriber = ThaiTranscriber(
+            model_name=args.model,
+            device=args.device,
+            use_vad=args.vad,
+            decoding=args.decoding,
+            backend=args.backend,
+            word_timestamps=args.word_timestamps,
+            mel_cache=MelCache(args.mel_cache_dir) if args.mel_cache_dir else None
+        )
 
         # Transcribe
         result = transcriber.transcribe_file(args.input)
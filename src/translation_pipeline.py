@@ -11,33 +11,50 @@ Key Features:
 - Two-pass translation (context-aware)
 - Smart model routing (cost optimization)
 - External dictionary support
-- Aggressive caching
+- Aggressive caching (memory LRU over a SQLite store, translation_store.py)
 - SRT timing preservation
+- Streaming input: translation starts while transcription runs
+- Asyncio engine: a sliding window of in-flight requests with per-request
+  timeouts (Config.processing.translation_engine)
+- Packed requests: consecutive segments share one request as numbered lines
+  (Config.processing.pack_tokens)
+- Provider rate limits: shared RPM/TPM buckets, adaptive concurrency and
+  Retry-After-aware retries (Config.rate_limit, rate_limiter.py)
 """
 
+import re
 import json
+import time
+import sqlite3
 import logging
 import hashlib
 import asyncio
+import threading
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Tuple, Optional, Any
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Local imports (assuming these modules exist)
+# Local imports
 try:
     from .context_analyzer import ContextAnalyzer, DocumentType, SegmentContext
     from .data_management_system import DictionaryManager
-    from .config import Config, TranslationModel, ConfigMode
+    from .config import Config, TranslationModel, ConfigMode, TranslationEngine
+    from .rate_limiter import RateLimiter, estimate_tokens
+    from .translation_store import TranslationStore
 except ImportError:
-    print("Warning: Some modules not found. Using placeholder imports.")
+    from context_analyzer import ContextAnalyzer, DocumentType, SegmentContext
+    from data_management_system import DictionaryManager
+    from config import Config, TranslationModel, ConfigMode, TranslationEngine
+    from rate_limiter import RateLimiter, estimate_tokens
+    from translation_store import TranslationStore
 
 # Third-party imports
 try:
     import openai
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
 except ImportError:
     print("Warning: OpenAI not installed. Install with: pip install openai")
 
@@ -48,6 +65,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Packed requests: at most this many segments, and this many completion tokens
+PACK_MAX_SEGMENTS = 40
+PACK_MAX_OUTPUT_TOKENS = 4096
+
+# "[3] text", "3. text", "3) text" or "3: text" at the start of a reply line
+PACK_LINE = re.compile(r'^(?:\[(\d+)\]|(\d+)[.):])\s*(.*)$')
+
 
 # ======================== DATA STRUCTURES ========================
 
@@ -102,64 +126,192 @@ class PipelineStats:
     total_time: float = 0.0
     cache_hit_rate: float = 0.0
     average_confidence: float = 0.0
+    fallback_segments: int = 0  # API failed: dictionary translation
+    packed_requests: int = 0
+    packed_segments: int = 0
+    pack_resplits: int = 0
+    packs: List['PackStats'] = field(default_factory=list)
+
+
+@dataclass
+class PackStats:
+    """One packed request"""
+    segments: int
+    model: str
+    prompt_tokens: int  # estimated, as reserved against TPM
+    seconds: float
+    status: str  # 'ok', 'resplit' (reply didn't match, halves retried) or 'failed' (fallback)
+
+
+@dataclass
+class PackedSegment:
+    """An uncached segment waiting in a pack, with its routing"""
+    segment: TranscriptionSegment
+    context: Optional[SegmentContext]
+    complexity: float
+    model: TranslationModel
+
+
+def parse_numbered_lines(reply: str, count: int) -> Optional[List[str]]:
+    """
+    Map a packed reply back to its input lines
+    
+    Lines without a number continue the previous line; text before the
+    first number (e.g. "Here are the translations:") is ignored.
+    
+    Args:
+        reply: Model output with one numbered line per input line
+        count: Number of input lines
+        
+    Returns:
+        Translations in input order, or None unless numbers 1..count
+        each appear exactly once with non-empty text
+    """
+    items: Dict[int, str] = {}
+    current = None
+    
+    for line in reply.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        
+        match = PACK_LINE.match(line)
+        if match:
+            number = int(match.group(1) or match.group(2))
+            if number in items or not 1 <= number <= count:
+                return None
+            items[number] = match.group(3)
+            current = number
+        elif current is not None:
+            items[current] = f"{items[current]} {line}"
+    
+    if len(items) != count:
+        return None
+    
+    lines = [items[number].strip().strip('"“”').strip() for number in range(1, count + 1)]
+    return lines if all(lines) else None
 
 
 # ======================== TRANSLATION CACHE ========================
 
 class TranslationCache:
-    """Smart caching system for translations"""
+    """
+    Translation cache: a bounded in-memory LRU in front of a SQLite store
     
-    def __init__(self, cache_dir: Path):
-        """Initialize cache system"""
-        self.cache_dir = cache_dir
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.memory_cache = {}
+    Every set() is written through to the store (translation_store.py), so
+    nothing is lost between runs or when the process dies, and other
+    processes sharing the cache directory see it right away. Entries the
+    LRU already holds are not re-read from the store; concurrent writers
+    of one key store equivalent translations.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_memory_items: int = 10000,
+        ttl_seconds: Optional[int] = 86400 * 30,
+        compression: bool = True
+    ):
+        """
+        Initialize cache system
+        
+        Args:
+            cache_dir: Directory of the store (a legacy translation_cache.json there is imported once)
+            max_memory_items: Size of the in-memory LRU tier
+            ttl_seconds: Lifetime of cached translations (None or 0: never expire)
+            compression: Compress longer translations in the store
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_memory_items = max_memory_items
+        self.ttl_seconds = ttl_seconds or None
+        self.store = TranslationStore(self.cache_dir, ttl_seconds=self.ttl_seconds, compression=compression)
+        
+        # key -> (translation, expiry or None)
+        self.memory_cache: OrderedDict = OrderedDict()
         self.cache_stats = defaultdict(int)
-        self._load_persistent_cache()
-    
-    def _load_persistent_cache(self):
-        """Load cache from disk"""
-        cache_file = self.cache_dir / "translation_cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    self.memory_cache = json.load(f)
-                logger.info(f"Loaded {len(self.memory_cache)} cached translations")
-            except Exception as e:
-                logger.warning(f"Failed to load cache: {e}")
-    
-    def _save_persistent_cache(self):
-        """Save cache to disk"""
-        cache_file = self.cache_dir / "translation_cache.json"
-        try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.memory_cache, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.warning(f"Failed to save cache: {e}")
+        # Pipelines of a warm service share one cache across jobs
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, cache_config) -> 'TranslationCache':
+        """Cache configured by a CacheConfig"""
+        return cls(
+            Path(cache_config.cache_dir),
+            max_memory_items=cache_config.max_memory_items,
+            ttl_seconds=cache_config.ttl_seconds,
+            compression=cache_config.enable_compression
+        )
+    
+    def flush(self):
+        """
+        Fold the store's write-ahead log into its database file
+        
+        Also closes the store connections of threads that have exited
+        (e.g. the default executor of a finished async engine run).
+        """
+        self.store.checkpoint()
+        self.store.prune()
+    
+    def close(self):
+        """Close all store connections"""
+        self.store.close()
     
     def _generate_cache_key(self, text: str, context: str = "", model: str = "") -> str:
         """Generate unique cache key"""
         combined = f"{text}|{context}|{model}"
         return hashlib.md5(combined.encode()).hexdigest()
     
+    def _expiry(self) -> Optional[float]:
+        return time.time() + self.ttl_seconds if self.ttl_seconds else None
+    
+    def _remember(self, key: str, translation: str):
+        """Put an entry in the LRU tier, evicting the least recently used (lock held)"""
+        self.memory_cache[key] = (translation, self._expiry())
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > self.max_memory_items:
+            self.memory_cache.popitem(last=False)
+    
     def get(self, text: str, context: str = "", model: str = "") -> Optional[str]:
         """Get cached translation"""
         key = self._generate_cache_key(text, context, model)
-        if key in self.memory_cache:
+        
+        with self._lock:
+            entry = self.memory_cache.get(key)
+            if entry is not None:
+                translation, expires = entry
+                if expires is None or expires > time.time():
+                    self.memory_cache.move_to_end(key)
+                    self.cache_stats['hits'] += 1
+                    self.cache_stats['memory_hits'] += 1
+                    return translation
+                del self.memory_cache[key]
+        
+        try:
+            translation = self.store.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read cached translation: {e}")
+            translation = None
+        
+        with self._lock:
+            if translation is None:
+                self.cache_stats['misses'] += 1
+                return None
+            # Loaded entries get a fresh TTL in memory: at most one TTL past the store's expiry
+            self._remember(key, translation)
             self.cache_stats['hits'] += 1
-            return self.memory_cache[key]
-        self.cache_stats['misses'] += 1
-        return None
+        return translation
     
     def set(self, text: str, translation: str, context: str = "", model: str = ""):
         """Cache a translation"""
         key = self._generate_cache_key(text, context, model)
-        self.memory_cache[key] = translation
-        self.cache_stats['sets'] += 1
+        try:
+            self.store.put(key, translation, model)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to store cached translation: {e}")
         
-        # Periodically save to disk
-        if self.cache_stats['sets'] % 10 == 0:
-            self._save_persistent_cache()
+        with self._lock:
+            self._remember(key, translation)
+            self.cache_stats['sets'] += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -168,8 +320,10 @@ class TranslationCache:
         return {
             'hits': self.cache_stats['hits'],
             'misses': self.cache_stats['misses'],
+            'memory_hits': self.cache_stats['memory_hits'],
             'hit_rate': hit_rate,
-            'size': len(self.memory_cache)
+            'size': self.store.count(),
+            'memory_items': len(self.memory_cache)
         }
 
 
@@ -181,20 +335,34 @@ class TranslationPipeline:
     Coordinates all components for Thai→English translation
     """
     
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        data_manager: Optional['DictionaryManager'] = None,
+        cache: Optional[TranslationCache] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         """
         Initialize the translation pipeline
         
         Args:
             config: Configuration object (creates default if None)
+            data_manager: Already loaded dictionaries (e.g. shared by a warm service)
+            cache: Shared translation cache (default: one from config.cache)
+            executor: Shared translation thread pool (default: a new one)
+            rate_limiter: Shared API rate limiter (default: one from config.rate_limit)
         """
         # Initialize configuration
         self.config = config or Config(mode=ConfigMode.COST_OPTIMIZED)
         
-        # Initialize components
+        # Initialize components (context and statistics are per pipeline)
         self.context_analyzer = ContextAnalyzer()
-        self.data_manager = DictionaryManager()
-        self.cache = TranslationCache(Path(self.config.cache.cache_dir))
+        self.data_manager = data_manager or DictionaryManager()
+        self.cache = cache or TranslationCache.from_config(self.config.cache)
+        
+        # RPM/TPM buckets are shared with other processes through config.rate_limit.state_dir
+        self.rate_limiter = rate_limiter or RateLimiter.from_config(self.config)
         
         # Initialize OpenAI client
         self._init_openai_client()
@@ -203,7 +371,7 @@ class TranslationPipeline:
         self.stats = PipelineStats()
         
         # Thread pool for parallel processing
-        self.executor = ThreadPoolExecutor(
+        self.executor = executor or ThreadPoolExecutor(
             max_workers=self.config.processing.max_workers
         )
         
@@ -215,7 +383,8 @@ class TranslationPipeline:
             import os
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
-                self.client = OpenAI(api_key=api_key)
+                # Retries are the rate limiter's: it honors Retry-After for every caller
+                self.client = OpenAI(api_key=api_key, max_retries=0)
                 logger.info("OpenAI client initialized")
             else:
                 logger.warning("No OPENAI_API_KEY found. Using mock mode.")
@@ -265,45 +434,160 @@ class TranslationPipeline:
         self.stats.total_segments = len(segments)
         self.stats.cache_hit_rate = self.cache.get_stats()['hit_rate']
         
-        # Save cache
-        self.cache._save_persistent_cache()
+        # Checkpoint the cache store
+        self.cache.flush()
+        
+        self._log_run_summary()
+        
+        return translation_results, self.stats
+    
+    def process_stream(
+        self,
+        segments: Iterable[TranscriptionSegment],
+        doc_type: DocumentType = DocumentType.TUTORIAL,
+        chunk_size: Optional[int] = None
+    ) -> Tuple[List[TranslationResult], PipelineStats]:
+        """
+        Translate segments as they arrive (e.g. while Whisper is still running)
+        
+        Each segment is context-analyzed as soon as it is pulled from
+        `segments`. Every `chunk_size` segments go through the configured
+        translation engine (_translate_segments_with_context), so the
+        streaming path gets the same sliding window and rate limiting as
+        process_transcript(). While a chunk is translated no further
+        segments are pulled, so a slow API side pushes back on the producer
+        instead of buffering the whole transcript.
+        
+        Args:
+            segments: Iterable of transcription segments in time order
+            doc_type: Type of document for context
+            chunk_size: Segments per engine run (default: _stream_chunk_size())
+            
+        Returns:
+            Tuple of (translation results, pipeline statistics)
+        """
+        start_time = datetime.now()
+        
+        if chunk_size is None:
+            chunk_size = self._stream_chunk_size()
+        
+        document_context = self.context_analyzer.begin_document(doc_type)
+        
+        logger.info("Translating segments as they arrive...")
+        
+        results = []
+        chunk: List[TranscriptionSegment] = []
+        contexts: List[Optional[SegmentContext]] = []
+        segment_count = 0
+        
+        for segment in segments:
+            segment_count += 1
+            
+            # Incremental first pass: context of this segment and the text so far
+            segment_contexts = self.context_analyzer.add_text(segment.text)
+            chunk.append(segment)
+            contexts.append(segment_contexts[0] if segment_contexts else None)
+            
+            if len(chunk) >= chunk_size:
+                results.extend(self._translate_segments_with_context(chunk, document_context, contexts))
+                chunk, contexts = [], []
+        
+        if chunk:
+            results.extend(self._translate_segments_with_context(chunk, document_context, contexts))
+        
+        # Whole-document pass for the exported analysis
+        self.context_analyzer.finalize_document()
+        
+        results.sort(key=lambda x: x.segment_id)
+        
+        logger.info("Post-processing translations...")
+        results = self._post_process_translations(results, document_context)
+        
+        # Calculate statistics
+        self.stats.total_time = (datetime.now() - start_time).total_seconds()
+        self.stats.total_segments = segment_count
+        self.stats.cache_hit_rate = self.cache.get_stats()['hit_rate']
+        
+        # Checkpoint the cache store
+        self.cache.flush()
+        
+        self._log_run_summary()
+        
+        return results, self.stats
+    
+    def _stream_chunk_size(self) -> int:
+        """
+        Segments per engine run in process_stream()
         
+        One window's worth of requests: max_in_flight for the async engine,
+        two per worker for the batch engine. With packing each request
+        carries up to PACK_MAX_SEGMENTS segments, so a chunk holds that
+        many times more.
+        """
+        processing = self.config.processing
+        if processing.translation_engine == TranslationEngine.ASYNC:
+            requests = processing.max_in_flight
+        else:
+            requests = 2 * processing.max_workers
+        if processing.pack_tokens > 0:
+            return requests * PACK_MAX_SEGMENTS
+        return requests
+    
+    def _log_run_summary(self):
+        """Log timing, cache, cost, packing and rate-limit figures of a run"""
         logger.info(f"Pipeline completed in {self.stats.total_time:.2f}s")
         logger.info(f"Cache hit rate: {self.stats.cache_hit_rate:.1%}")
         logger.info(f"Estimated cost: ${self.stats.total_cost:.4f}")
-        
-        return translation_results, self.stats
+        if self.stats.packed_requests:
+            logger.info(
+                f"Packed requests: {self.stats.packed_requests} "
+                f"({self.stats.packed_segments} segments, {self.stats.pack_resplits} re-split)"
+            )
+        self.rate_limiter.log_summary()
     
     def _translate_segments_with_context(
         self, 
         segments: List[TranscriptionSegment],
-        document_context
+        document_context,
+        contexts: Optional[List[Optional[SegmentContext]]] = None
     ) -> List[TranslationResult]:
         """
         Translate segments using context and smart routing
+        
+        The engine is Config.processing.translation_engine: 'async' keeps
+        max_in_flight requests pending at all times, 'batch' sends
+        batch_size at a time and waits for each whole batch. With
+        pack_tokens set, requests carry packs of segments instead.
+        
+        Args:
+            segments: Segments to translate
+            document_context: First-pass document context
+            contexts: Context of each segment (default: looked up by segment id)
         """
+        if contexts is None:
+            contexts = [self._segment_context(segment, document_context) for segment in segments]
+        
+        if self.config.processing.pack_tokens > 0:
+            return self._translate_packed(segments, contexts, document_context)
+        
+        if self.config.processing.translation_engine == TranslationEngine.ASYNC:
+            return asyncio.run(self._translate_segments_async(segments, contexts, document_context))
+        
         results = []
         
         # Process in batches for efficiency
         batch_size = self.config.processing.batch_size
         for i in range(0, len(segments), batch_size):
-            batch = segments[i:i+batch_size]
+            batch = zip(segments[i:i+batch_size], contexts[i:i+batch_size])
             
             # Process batch in parallel
             futures = []
-            for segment in batch:
-                # Get segment context
-                seg_idx = segment.id - 1
-                if seg_idx < len(document_context.segment_contexts):
-                    seg_context = document_context.segment_contexts[seg_idx]
-                else:
-                    seg_context = None
-                
+            for segment, segment_context in batch:
                 # Submit translation task
                 future = self.executor.submit(
                     self._translate_single_segment,
                     segment,
-                    seg_context,
+                    segment_context,
                     document_context
                 )
                 futures.append(future)
@@ -320,6 +604,322 @@ class TranslationPipeline:
         results.sort(key=lambda x: x.segment_id)
         return results
     
+    async def _translate_segments_async(
+        self,
+        segments: List[TranscriptionSegment],
+        contexts: List[Optional[SegmentContext]],
+        document_context
+    ) -> List[TranslationResult]:
+        """
+        Translate segments with a sliding window of in-flight requests
+        
+        A semaphore admits max_in_flight requests; each finished request
+        frees its slot for the next segment right away, so one slow call
+        holds up one slot instead of a whole batch. Requests that exceed
+        request_timeout fall back like failed API calls.
+        
+        Returns:
+            Translation results in segment order
+        """
+        window = asyncio.Semaphore(self.config.processing.max_in_flight)
+        client = self._async_client()
+        results: List[Optional[TranslationResult]] = [None] * len(segments)
+        
+        async def translate(index: int, segment: TranscriptionSegment):
+            async with window:
+                try:
+                    results[index] = await self._translate_single_segment_async(
+                        segment,
+                        contexts[index],
+                        document_context,
+                        client
+                    )
+                except Exception as e:
+                    logger.error(f"Translation failed: {e}")
+        
+        try:
+            await asyncio.gather(*(translate(i, seg) for i, seg in enumerate(segments)))
+        finally:
+            if client is not None:
+                await client.close()
+        
+        return [result for result in results if result is not None]
+    
+    def _async_client(self) -> Optional['AsyncOpenAI']:
+        """
+        Async OpenAI client for one engine run (None in mock mode)
+        
+        Created per run: its connection pool belongs to the event loop of
+        that run.
+        """
+        if not self.client:
+            return None
+        return AsyncOpenAI(api_key=self.client.api_key, base_url=self.client.base_url, max_retries=0)
+    
+    def _translate_packed(
+        self,
+        segments: List[TranscriptionSegment],
+        contexts: List[Optional[SegmentContext]],
+        document_context
+    ) -> List[TranslationResult]:
+        """
+        Translate segments in packs, one request per pack
+        
+        Cache hits are resolved first; the rest are packed by
+        _build_packs(). The async engine keeps max_in_flight packs pending,
+        the batch engine runs all packs on the thread pool.
+        
+        Returns:
+            Translation results in segment order
+        """
+        results, packs = self._build_packs(segments, contexts)
+        
+        if self.config.processing.translation_engine == TranslationEngine.ASYNC:
+            results.extend(asyncio.run(self._translate_packs_async(packs, document_context)))
+        else:
+            futures = [
+                self.executor.submit(self._translate_pack, pack, document_context)
+                for pack in packs
+            ]
+            for future in as_completed(futures):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Translation failed: {e}")
+        
+        results.sort(key=lambda x: x.segment_id)
+        return results
+    
+    async def _translate_packs_async(
+        self,
+        packs: List[List[PackedSegment]],
+        document_context
+    ) -> List[TranslationResult]:
+        """Translate packs with a sliding window of max_in_flight requests"""
+        window = asyncio.Semaphore(self.config.processing.max_in_flight)
+        client = self._async_client()
+        results: List[TranslationResult] = []
+        
+        async def translate(pack: List[PackedSegment]):
+            async with window:
+                try:
+                    results.extend(await self._translate_pack_async(pack, document_context, client))
+                except Exception as e:
+                    logger.error(f"Translation failed: {e}")
+        
+        try:
+            await asyncio.gather(*(translate(pack) for pack in packs))
+        finally:
+            if client is not None:
+                await client.close()
+        
+        return results
+    
+    def _build_packs(
+        self,
+        segments: List[TranscriptionSegment],
+        contexts: List[Optional[SegmentContext]]
+    ) -> Tuple[List[TranslationResult], List[List[PackedSegment]]]:
+        """
+        Resolve cache hits and group the remaining segments into packs
+        
+        A pack holds consecutive uncached segments routed to the same model,
+        up to pack_tokens of Thai text (and PACK_MAX_SEGMENTS lines).
+        
+        Returns:
+            Tuple of (cached results, packs)
+        """
+        budget = self.config.processing.pack_tokens
+        cached_results = []
+        packs: List[List[PackedSegment]] = []
+        current: List[PackedSegment] = []
+        current_tokens = 0
+        
+        for segment, segment_context in zip(segments, contexts):
+            cached = self._cached_result(segment, segment_context)
+            if cached:
+                cached_results.append(cached)
+                continue
+            
+            complexity, model = self._route(segment, segment_context)
+            tokens = len(segment.text.encode('utf-8')) // 3 + 3
+            
+            if current and (
+                model != current[0].model
+                or current_tokens + tokens > budget
+                or len(current) >= PACK_MAX_SEGMENTS
+            ):
+                packs.append(current)
+                current, current_tokens = [], 0
+            
+            current.append(PackedSegment(segment, segment_context, complexity, model))
+            current_tokens += tokens
+        
+        if current:
+            packs.append(current)
+        
+        return cached_results, packs
+    
+    def _translate_pack(self, pack: List[PackedSegment], document_context) -> List[TranslationResult]:
+        """
+        Translate a pack with one request
+        
+        A reply whose numbered lines don't match the pack is re-split in
+        halves and each half retried; a single segment takes the
+        per-segment request.
+        """
+        start_time = datetime.now()
+        
+        if len(pack) == 1:
+            entry = pack[0]
+            translated_text = self._perform_translation(
+                entry.segment.text, entry.context, document_context, entry.model
+            )
+            return [self._finish_result(
+                entry.segment, entry.context, translated_text, entry.model, entry.complexity, start_time
+            )]
+        
+        request = self._pack_request(pack, document_context)
+        
+        if not self.client:
+            return self._pack_results(pack, [self._mock_translation(e.segment.text) for e in pack], request, start_time)
+        
+        try:
+            response = self.rate_limiter.call(
+                request['model'],
+                estimate_tokens(request),
+                lambda: self.client.chat.completions.create(**request)
+            )
+        except Exception as e:
+            logger.error(f"Translation API error: {e}")
+            return self._pack_fallback(pack, request, start_time)
+        
+        lines = parse_numbered_lines(response.choices[0].message.content, len(pack))
+        if lines is None:
+            self._record_pack(pack, request, start_time, 'resplit')
+            middle = len(pack) // 2
+            return (
+                self._translate_pack(pack[:middle], document_context)
+                + self._translate_pack(pack[middle:], document_context)
+            )
+        
+        return self._pack_results(pack, lines, request, start_time)
+    
+    async def _translate_pack_async(
+        self,
+        pack: List[PackedSegment],
+        document_context,
+        client: Optional['AsyncOpenAI']
+    ) -> List[TranslationResult]:
+        """
+        Async counterpart of _translate_pack()
+        
+        Results are cached from the loop's default executor, so SQLite
+        writes don't stall the other requests in flight.
+        """
+        start_time = datetime.now()
+        
+        if len(pack) == 1:
+            entry = pack[0]
+            translated_text = await self._perform_translation_async(
+                entry.segment.text, entry.context, document_context, entry.model, client
+            )
+            return [await asyncio.to_thread(
+                self._finish_result,
+                entry.segment, entry.context, translated_text, entry.model, entry.complexity, start_time
+            )]
+        
+        request = self._pack_request(pack, document_context)
+        
+        if client is None:
+            return await asyncio.to_thread(
+                self._pack_results, pack, [self._mock_translation(e.segment.text) for e in pack], request, start_time
+            )
+        
+        timeout = self.config.processing.request_timeout
+        try:
+            response = await self.rate_limiter.call_async(
+                request['model'],
+                estimate_tokens(request),
+                lambda: asyncio.wait_for(client.chat.completions.create(**request), timeout=timeout)
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Packed translation request timed out after {timeout:.0f}s")
+            return await asyncio.to_thread(self._pack_fallback, pack, request, start_time)
+        except Exception as e:
+            logger.error(f"Translation API error: {e}")
+            return await asyncio.to_thread(self._pack_fallback, pack, request, start_time)
+        
+        lines = parse_numbered_lines(response.choices[0].message.content, len(pack))
+        if lines is None:
+            self._record_pack(pack, request, start_time, 'resplit')
+            middle = len(pack) // 2
+            return (
+                await self._translate_pack_async(pack[:middle], document_context, client)
+                + await self._translate_pack_async(pack[middle:], document_context, client)
+            )
+        
+        return await asyncio.to_thread(self._pack_results, pack, lines, request, start_time)
+    
+    def _pack_results(
+        self,
+        pack: List[PackedSegment],
+        lines: List[str],
+        request: Dict[str, Any],
+        start_time: datetime
+    ) -> List[TranslationResult]:
+        """Results of a pack whose reply matched, one per segment"""
+        self._record_pack(pack, request, start_time, 'ok')
+        return [
+            self._finish_result(entry.segment, entry.context, line, entry.model, entry.complexity, start_time)
+            for entry, line in zip(pack, lines)
+        ]
+    
+    def _pack_fallback(
+        self,
+        pack: List[PackedSegment],
+        request: Dict[str, Any],
+        start_time: datetime
+    ) -> List[TranslationResult]:
+        """Dictionary translations of a pack whose request failed"""
+        self._record_pack(pack, request, start_time, 'failed')
+        return [
+            self._finish_result(
+                entry.segment, entry.context, self._fallback_translation(entry.segment.text),
+                entry.model, entry.complexity, start_time
+            )
+            for entry in pack
+        ]
+    
+    def _record_pack(
+        self,
+        pack: List[PackedSegment],
+        request: Dict[str, Any],
+        start_time: datetime,
+        status: str
+    ):
+        """Add a packed request to the pipeline statistics"""
+        self.stats.packs.append(PackStats(
+            segments=len(pack),
+            model=request['model'],
+            prompt_tokens=estimate_tokens(request) - request['max_tokens'],
+            seconds=(datetime.now() - start_time).total_seconds(),
+            status=status
+        ))
+        self.stats.packed_requests += 1
+        if status == 'resplit':
+            self.stats.pack_resplits += 1
+        else:
+            self.stats.packed_segments += len(pack)
+    
+    @staticmethod
+    def _segment_context(segment: TranscriptionSegment, document_context) -> Optional[SegmentContext]:
+        """First-pass context of a segment (None beyond the analyzed segments)"""
+        seg_idx = segment.id - 1
+        if seg_idx < len(document_context.segment_contexts):
+            return document_context.segment_contexts[seg_idx]
+        return None
+    
     def _translate_single_segment(
         self,
         segment: TranscriptionSegment,
@@ -332,28 +932,12 @@ class TranslationPipeline:
         start_time = datetime.now()
         
         # Check cache first
-        context_str = str(segment_context) if segment_context else ""
-        cached_translation = self.cache.get(segment.text, context_str)
-        
-        if cached_translation:
-            self.stats.cached_segments += 1
-            return TranslationResult(
-                segment_id=segment.id,
-                original_text=segment.text,
-                translated_text=cached_translation,
-                model_used="cache",
-                confidence=1.0,
-                complexity_score=0.0,
-                cached=True,
-                cost_estimate=0.0,
-                processing_time=0.001
-            )
-        
-        # Calculate complexity for model routing
-        complexity = self._calculate_complexity(segment.text, segment_context)
+        cached = self._cached_result(segment, segment_context)
+        if cached:
+            return cached
         
         # Route to appropriate model
-        model = self._select_model(complexity, segment_context)
+        complexity, model = self._route(segment, segment_context)
         
         # Translate
         translated_text = self._perform_translation(
@@ -363,7 +947,87 @@ class TranslationPipeline:
             model
         )
         
+        return self._finish_result(segment, segment_context, translated_text, model, complexity, start_time)
+    
+    async def _translate_single_segment_async(
+        self,
+        segment: TranscriptionSegment,
+        segment_context: Optional[SegmentContext],
+        document_context,
+        client: Optional['AsyncOpenAI']
+    ) -> TranslationResult:
+        """
+        Async counterpart of _translate_single_segment()
+        
+        Cache lookups and writes go through the loop's default executor,
+        so SQLite I/O doesn't stall the other requests in flight.
+        """
+        start_time = datetime.now()
+        
+        cached = await asyncio.to_thread(self._cached_result, segment, segment_context)
+        if cached:
+            return cached
+        
+        complexity, model = self._route(segment, segment_context)
+        
+        translated_text = await self._perform_translation_async(
+            segment.text,
+            segment_context,
+            document_context,
+            model,
+            client
+        )
+        
+        return await asyncio.to_thread(
+            self._finish_result, segment, segment_context, translated_text, model, complexity, start_time
+        )
+    
+    def _cached_result(
+        self,
+        segment: TranscriptionSegment,
+        segment_context: Optional[SegmentContext]
+    ) -> Optional[TranslationResult]:
+        """Result from the translation cache, or None on a miss"""
+        context_str = str(segment_context) if segment_context else ""
+        cached_translation = self.cache.get(segment.text, context_str)
+        
+        if not cached_translation:
+            return None
+        
+        self.stats.cached_segments += 1
+        return TranslationResult(
+            segment_id=segment.id,
+            original_text=segment.text,
+            translated_text=cached_translation,
+            model_used="cache",
+            confidence=1.0,
+            complexity_score=0.0,
+            cached=True,
+            cost_estimate=0.0,
+            processing_time=0.001
+        )
+    
+    def _route(
+        self,
+        segment: TranscriptionSegment,
+        segment_context: Optional[SegmentContext]
+    ) -> Tuple[float, TranslationModel]:
+        """Complexity of a segment and the model it is routed to"""
+        complexity = self._calculate_complexity(segment.text, segment_context)
+        return complexity, self._select_model(complexity, segment_context)
+    
+    def _finish_result(
+        self,
+        segment: TranscriptionSegment,
+        segment_context: Optional[SegmentContext],
+        translated_text: str,
+        model: TranslationModel,
+        complexity: float,
+        start_time: datetime
+    ) -> TranslationResult:
+        """Cache a fresh translation, update statistics and build its result"""
         # Cache the result
+        context_str = str(segment_context) if segment_context else ""
         self.cache.set(segment.text, translated_text, context_str, model.value)
         
         # Calculate cost
@@ -474,30 +1138,18 @@ class TranslationPipeline:
         """
         Perform actual translation using selected model
         """
-        # Prepare context for prompt
-        context_info = self._prepare_context_prompt(
-            segment_context, document_context
-        )
-        
-        # Build translation prompt
-        prompt = self._build_translation_prompt(
-            text, context_info, model
-        )
+        request = self._chat_request(text, segment_context, document_context, model)
         
         # Mock translation if no OpenAI client
         if not self.client:
             return self._mock_translation(text)
         
         try:
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=model.value,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.config.translation.temperature,
-                max_tokens=self.config.translation.max_tokens
+            # Call OpenAI API (waits for RPM/TPM budget, retries 429s and 5xx)
+            response = self.rate_limiter.call(
+                request['model'],
+                estimate_tokens(request),
+                lambda: self.client.chat.completions.create(**request)
             )
             
             return response.choices[0].message.content.strip()
@@ -507,6 +1159,130 @@ class TranslationPipeline:
             # Fallback to simple translation
             return self._fallback_translation(text)
     
+    async def _perform_translation_async(
+        self,
+        text: str,
+        segment_context: Optional[SegmentContext],
+        document_context,
+        model: TranslationModel,
+        client: Optional['AsyncOpenAI']
+    ) -> str:
+        """
+        Perform translation on the async client
+        
+        request_timeout bounds each attempt; time spent waiting for rate
+        limit budget does not count against it.
+        """
+        request = self._chat_request(text, segment_context, document_context, model)
+        
+        if client is None:
+            return self._mock_translation(text)
+        
+        timeout = self.config.processing.request_timeout
+        try:
+            response = await self.rate_limiter.call_async(
+                request['model'],
+                estimate_tokens(request),
+                lambda: asyncio.wait_for(client.chat.completions.create(**request), timeout=timeout)
+            )
+            
+            return response.choices[0].message.content.strip()
+            
+        except asyncio.TimeoutError:
+            logger.warning(f"Translation request timed out after {timeout:.0f}s")
+            return self._fallback_translation(text)
+        except Exception as e:
+            logger.error(f"Translation API error: {e}")
+            return self._fallback_translation(text)
+    
+    def _chat_request(
+        self,
+        text: str,
+        segment_context: Optional[SegmentContext],
+        document_context,
+        model: TranslationModel
+    ) -> Dict[str, Any]:
+        """Chat completion arguments for one segment"""
+        # Prepare context for prompt
+        context_info = self._prepare_context_prompt(
+            segment_context, document_context
+        )
+        
+        # Build translation prompt
+        prompt = self._build_translation_prompt(
+            text, context_info, model
+        )
+        
+        return {
+            "model": model.value,
+            "messages": [
+                {"role": "system", "content": self._get_system_prompt()},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.config.translation.temperature,
+            "max_tokens": self.config.translation.max_tokens
+        }
+    
+    def _pack_request(self, pack: List[PackedSegment], document_context) -> Dict[str, Any]:
+        """
+        Chat completion arguments for a pack
+        
+        System prompt, context and terminology hints are sent once for the
+        pack; segments go in as numbered lines and come back the same way.
+        """
+        model = pack[0].model
+        
+        # Document context plus the segments' key terms and traits
+        context_parts = [self._prepare_context_prompt(None, document_context)]
+        key_terms = list(dict.fromkeys(
+            term for entry in pack if entry.context for term in entry.context.key_terms
+        ))
+        if key_terms:
+            context_parts.append(f"Key Terms: {', '.join(key_terms[:10])}")
+        if any(entry.context and entry.context.is_metaphor for entry in pack):
+            context_parts.append("Contains: Metaphors")
+        
+        # Terminology hints of all lines, without repeats
+        term_hints = list(dict.fromkeys(
+            f"- {entry.thai} = {entry.english}"
+            for item in pack
+            for entry in self.data_manager.search_terms(item.segment.text)[:5]
+        ))
+        
+        lines = "\n".join(f"[{number}] {entry.segment.text}" for number, entry in enumerate(pack, 1))
+        
+        prompt = f"""Translate the following numbered Thai subtitle lines to English for a Forex trading video.
+
+CONTEXT:
+{chr(10).join(context_parts)}
+
+TERMINOLOGY HINTS:
+{chr(10).join(term_hints[:15]) if term_hints else "None"}
+
+THAI LINES:
+{lines}
+
+REQUIREMENTS:
+1. Maintain natural, conversational English
+2. Preserve all Forex terminology accurately
+3. Keep the same tone and style as the speaker
+4. Handle colloquialisms naturally
+5. Maintain timing-friendly segment length
+6. Translate every line on its own; never merge or split lines
+7. Answer with exactly {len(pack)} lines, each starting with its number in brackets, e.g. "[1] ..."
+
+ENGLISH LINES:"""
+        
+        return {
+            "model": model.value,
+            "messages": [
+                {"role": "system", "content": self._get_system_prompt()},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.config.translation.temperature,
+            "max_tokens": min(PACK_MAX_OUTPUT_TOKENS, self.config.translation.max_tokens * len(pack))
+        }
+    
     def _prepare_context_prompt(
         self,
         segment_context: Optional[SegmentContext],
@@ -591,6 +1367,8 @@ You understand both Thai colloquialisms and Forex technical terms."""
     
     def _fallback_translation(self, text: str) -> str:
         """Fallback translation when API fails"""
+        self.stats.fallback_segments += 1
+        
         # Use dictionary for known terms
         translated_parts = []
         for word in text.split():
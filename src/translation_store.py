@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Translation Store - Durable SQLite Backing for the Translation Cache
+===================================================================
+Version: 1.0.0
+Description: On-disk half of TranslationCache. Every translation is its
+             own row in a SQLite database in WAL mode, written with a
+             single upsert, so a set() costs one small transaction instead
+             of rewriting a JSON file with the whole cache, and readers in
+             other threads and processes never block on a writer.
+
+Features:
+- Per-key upserts; WAL journal with synchronous=NORMAL (no fsync per commit)
+- TTL: rows carry an expiry, expired rows are never returned and are
+  purged when the store opens
+- Optional zlib compression of longer values
+- One connection per thread, tracked so close() can close them all and
+  prune() those of exited threads; busy_timeout for writers in other processes
+- One-time import of the legacy translation_cache.json (renamed to
+  translation_cache.json.migrated afterwards)
+"""
+
+import json
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STORE_FILE = 'translations.sqlite3'
+LEGACY_JSON_FILE = 'translation_cache.json'
+
+# Values shorter than this are stored as-is: zlib doesn't shrink them
+COMPRESS_MIN_BYTES = 128
+# Milliseconds a writer waits for another process's transaction
+BUSY_TIMEOUT_MS = 10000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    compressed INTEGER NOT NULL DEFAULT 0,
+    model TEXT,
+    created REAL NOT NULL,
+    expires REAL
+);
+CREATE INDEX IF NOT EXISTS translations_expires ON translations (expires);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class TranslationStore:
+    """SQLite table of translations by cache key, safe across threads and processes"""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_seconds: Optional[int] = None,
+        compression: bool = True
+    ):
+        """
+        Open (and create or migrate) the store
+
+        Args:
+            cache_dir: Directory of the database (and of a legacy JSON cache to import)
+            ttl_seconds: Lifetime of new rows (None or 0: never expire)
+            compression: zlib-compress values of COMPRESS_MIN_BYTES or more
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.cache_dir / STORE_FILE
+        self.ttl_seconds = ttl_seconds or None
+        self.compression = compression
+        # Connection of each thread that has used the store
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+
+        connection = self._connection()
+        with connection:
+            connection.executescript(SCHEMA)
+        self.purge_expired()
+        self._migrate_json()
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (opened on first use)"""
+        thread = threading.current_thread()
+        with self._connections_lock:
+            connection = self._connections.get(thread)
+        if connection is not None:
+            return connection
+
+        # Used by this thread only, but close()/prune() may close it from another one
+        connection = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000.0,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        with self._connections_lock:
+            self._connections[thread] = connection
+        return connection
+
+    def _encode(self, value: str):
+        data = value.encode('utf-8')
+        if self.compression and len(data) >= COMPRESS_MIN_BYTES:
+            return zlib.compress(data), 1
+        return data, 0
+
+    def _expiry(self, now: float) -> Optional[float]:
+        return now + self.ttl_seconds if self.ttl_seconds else None
+
+    def get(self, key: str) -> Optional[str]:
+        """Translation stored under a key (None if missing or expired)"""
+        row = self._connection().execute(
+            'SELECT value, compressed FROM translations WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, compressed = row
+        try:
+            return (zlib.decompress(value) if compressed else bytes(value)).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"Discarding unreadable cached translation {key}: {e}")
+            self.delete(key)
+            return None
+
+    def put(self, key: str, value: str, model: str = ""):
+        """Insert or replace one translation"""
+        now = time.time()
+        data, compressed = self._encode(value)
+        self._connection().execute(
+            'INSERT OR REPLACE INTO translations (key, value, compressed, model, created, expires) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, data, compressed, model or None, now, self._expiry(now))
+        )
+
+    def delete(self, key: str):
+        """Remove one translation"""
+        self._connection().execute('DELETE FROM translations WHERE key = ?', (key,))
+
+    def purge_expired(self) -> int:
+        """Delete expired rows; returns how many"""
+        cursor = self._connection().execute(
+            'DELETE FROM translations WHERE expires IS NOT NULL AND expires <= ?',
+            (time.time(),)
+        )
+        if cursor.rowcount:
+            logger.info(f"Purged {cursor.rowcount} expired cached translations")
+        return cursor.rowcount
+
+    def count(self) -> int:
+        """Rows that have not expired"""
+        return self._connection().execute(
+            'SELECT COUNT(*) FROM translations WHERE expires IS NULL OR expires > ?',
+            (time.time(),)
+        ).fetchone()[0]
+
+    def checkpoint(self):
+        """Fold the WAL into the database file (readers are not blocked)"""
+        try:
+            self._connection().execute('PRAGMA wal_checkpoint(PASSIVE)')
+        except sqlite3.Error as e:
+            logger.debug(f"WAL checkpoint skipped: {e}")
+
+    def prune(self) -> int:
+        """Close the connections of threads that have exited; returns how many"""
+        with self._connections_lock:
+            exited = [thread for thread in self._connections if not thread.is_alive()]
+            connections = [self._connections.pop(thread) for thread in exited]
+        for connection in connections:
+            connection.close()
+        return len(connections)
+
+    def close(self):
+        """Close every connection the store has opened (threads reconnect on next use)"""
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def _migrate_json(self):
+        """Import the legacy JSON cache once (the first process to get here does it)"""
+        legacy = self.cache_dir / LEGACY_JSON_FILE
+        if not legacy.exists():
+            return
+
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            if connection.execute("SELECT 1 FROM meta WHERE name = 'json_migrated'").fetchone():
+                connection.execute('COMMIT')
+                return
+
+            try:
+                with open(legacy, 'r', encoding='utf-8') as f:
+                    entries: Dict[str, Any] = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not migrate {legacy}: {e}")
+                connection.execute('ROLLBACK')
+                return
+
+            now = time.time()
+            rows = [
+                (key, *self._encode(value), None, now, self._expiry(now))
+                for key, value in entries.items()
+                if isinstance(value, str)
+            ]
+            # Rows already in the store are newer than the JSON snapshot
+            connection.executemany(
+                'INSERT OR IGNORE INTO translations (key, value, compressed, model, created, expires) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('json_migrated', ?)",
+                (str(now),)
+            )
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+        try:
+            legacy.rename(legacy.with_name(LEGACY_JSON_FILE + '.migrated'))
+        except OSError as e:
+            logger.debug(f"Could not rename {legacy}: {e}")
+        logger.info(f"Migrated {len(rows)} cached translations from {legacy.name} to {self.path.name}")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Word Alignment - Lazy Word Timestamps
+=====================================
+Version: 1.0.0
+Description: word_timestamps=True runs Whisper's cross-attention/DTW
+             alignment for every segment. Word timings are only needed
+             for subtitle cues that must be split or realigned and for
+             confidence scoring, so in lazy mode windows are decoded
+             without word timestamps and alignment runs afterwards for the
+             segments that need it. Aligned words land in the usual
+             `words` field, so transcript JSON is unchanged.
+
+A segment needs alignment when it:
+- is longer than a subtitle cue may be (duration or characters)
+- reads too fast (characters per second, or WPM as in check_subtitle_wpm.py)
+- is shorter than a cue should be (it may have to be merged)
+- has low confidence (mean token log probability)
+
+Alignment runs per 30-second decoding chunk (Whisper's DTW works on the
+whole chunk), so every segment of a chunk that holds a flagged segment
+gets word timestamps.
+"""
+
+import math
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORD_TIMESTAMPS_EAGER = 'eager'
+WORD_TIMESTAMPS_LAZY = 'lazy'
+WORD_TIMESTAMP_MODES = (WORD_TIMESTAMPS_EAGER, WORD_TIMESTAMPS_LAZY)
+
+
+@dataclass
+class AlignmentPolicy:
+    """Limits that make a segment need word timestamps"""
+    # Subtitle cue length
+    max_duration: float = 7.0
+    max_chars: int = 100
+    # Reading speed (WPM counts whitespace-separated words, as check_subtitle_wpm.py)
+    max_chars_per_second: float = 20.0
+    max_wpm: float = 140.0
+    # Shorter cues are flagged by check_subtitle_wpm.py as well
+    min_duration: float = 1.5
+    # exp(-0.5) ~ 0.6, the default cascade escalation threshold
+    min_avg_logprob: float = -0.5
+
+
+def alignment_reasons(segment: Dict[str, Any], policy: AlignmentPolicy) -> List[str]:
+    """
+    Check why a Whisper segment needs word timestamps
+
+    Args:
+        segment: Whisper segment dict
+        policy: Alignment limits
+
+    Returns:
+        Reasons ('length', 'speed', 'short', 'confidence'); empty if none
+    """
+    text = segment.get('text', '').strip()
+    if not text:
+        return []
+
+    duration = max(segment.get('end', 0.0) - segment.get('start', 0.0), 1e-3)
+    reasons = []
+
+    if duration > policy.max_duration or len(text) > policy.max_chars:
+        reasons.append('length')
+    if (len(text) / duration > policy.max_chars_per_second
+            or len(text.split()) / duration * 60.0 > policy.max_wpm):
+        reasons.append('speed')
+    if duration < policy.min_duration:
+        reasons.append('short')
+    if segment.get('avg_logprob', 0.0) < policy.min_avg_logprob:
+        reasons.append('confidence')
+
+    return reasons
+
+
+def segment_confidence(segment: Dict[str, Any], default: float) -> float:
+    """
+    Confidence of a segment: mean word probability, else exp(avg_logprob)
+
+    Args:
+        segment: Whisper segment dict
+        default: Value for segments with neither words nor avg_logprob
+
+    Returns:
+        Confidence between 0 and 1
+    """
+    probabilities = [w['probability'] for w in segment.get('words') or [] if 'probability' in w]
+    if probabilities:
+        return sum(probabilities) / len(probabilities)
+    if 'avg_logprob' in segment:
+        return min(1.0, math.exp(segment['avg_logprob']))
+    return default
+
+
+def align_lazily(
+    model,
+    audio,
+    result: Dict[str, Any],
+    policy: AlignmentPolicy,
+    settings: Dict[str, Any]
+) -> Tuple[int, float]:
+    """
+    Add word timestamps to the segments of a result that need them
+
+    Args:
+        model: Whisper model that produced the result
+        audio: Audio passed to transcribe() (samples or file path)
+        result: Output of model.transcribe(word_timestamps=False), updated in place
+        policy: Alignment limits
+        settings: Transcribe settings (language, punctuation)
+
+    Returns:
+        Tuple of (segments aligned, seconds spent)
+    """
+    segments = result.get('segments', [])
+    flagged = {seg.get('seek', 0) for seg in segments if alignment_reasons(seg, policy)}
+    if not flagged:
+        return 0, 0.0
+
+    import whisper
+    from whisper.audio import HOP_LENGTH, N_FRAMES, N_SAMPLES, log_mel_spectrogram, pad_or_trim
+    from whisper.timing import add_word_timestamps
+    from whisper.tokenizer import get_tokenizer
+
+    started = time.time()
+
+    if isinstance(audio, str):
+        audio = whisper.load_audio(audio)
+
+    tokenizer_options = {
+        'language': result.get('language') or settings.get('language'),
+        'task': settings.get('task', 'transcribe')
+    }
+    if hasattr(model, 'num_languages'):
+        tokenizer_options['num_languages'] = model.num_languages
+    tokenizer = get_tokenizer(model.is_multilingual, **tokenizer_options)
+
+    punctuation = {
+        key: settings[key] for key in ('prepend_punctuations', 'append_punctuations') if key in settings
+    }
+
+    aligned = 0
+
+    for seek in sorted(flagged):
+        chunk_segments = [seg for seg in segments if seg.get('seek', 0) == seek]
+        earlier = [seg for seg in segments if seg.get('seek', 0) < seek]
+
+        # The same 30s mel chunk Whisper decoded these segments from
+        chunk = audio[seek * HOP_LENGTH:seek * HOP_LENGTH + N_SAMPLES]
+        mel = log_mel_spectrogram(chunk, model.dims.n_mels, padding=N_SAMPLES)
+        mel = pad_or_trim(mel, N_FRAMES).to(model.device)
+
+        add_word_timestamps(
+            segments=chunk_segments,
+            model=model,
+            tokenizer=tokenizer,
+            mel=mel,
+            num_frames=min(N_FRAMES, len(chunk) // HOP_LENGTH),
+            last_speech_timestamp=earlier[-1]['end'] if earlier else 0.0,
+            **punctuation
+        )
+
+        aligned += len(chunk_segments)
+
+    return aligned, time.time() - started
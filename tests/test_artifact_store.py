@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for artifact_store.py and audio_ingest.py - LRU eviction, leases and shared PCM buffers
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import artifact_store
+from artifact_store import ArtifactStore
+from audio_ingest import AudioIngest, source_key
+
+
+def write(store, key, name, size, age=0):
+    path = store.path(key, name)
+    path.write_bytes(b'x' * size)
+    os.utime(path, (1000 + age, 1000 + age))
+    store.commit(key, name)
+    os.utime(path, (1000 + age, 1000 + age))
+    return path
+
+
+def test_evicts_least_recently_used_down_to_target(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=1000)
+    oldest = write(store, 'a', 'one', 400, age=1)
+    middle = write(store, 'b', 'two', 400, age=2)
+    newest = write(store, 'c', 'three', 400, age=3)
+
+    assert not oldest.exists()
+    assert not oldest.parent.exists()
+    assert middle.exists() and newest.exists()
+    assert store.total_bytes() == 800
+
+
+def test_leased_artifacts_survive_eviction(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=1000)
+    pcm = write(store, 'a', 'pcm', 400, age=1)
+    lease = store.lease('a', 'pcm')
+    other = write(store, 'b', 'window', 400, age=2)
+
+    write(store, 'c', 'window', 400, age=3)
+
+    assert pcm.exists()
+    assert not other.exists()
+
+    store.release_lease(lease)
+    write(store, 'd', 'window', 400, age=4)
+    assert not pcm.exists()
+
+
+def test_leases_of_exited_processes_are_ignored(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=1000)
+    pcm = write(store, 'a', 'pcm', 400, age=1)
+    finished = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'], capture_output=True, text=True)
+    stale = tmp_path / 'a' / f"pcm.{int(finished.stdout)}.deadbeef.lease"
+    stale.touch()
+
+    write(store, 'b', 'one', 400, age=2)
+    write(store, 'c', 'two', 400, age=3)
+
+    assert not pcm.exists()
+    assert not stale.exists()
+
+
+def test_writes_below_the_cap_do_not_scan(tmp_path, monkeypatch):
+    store = ArtifactStore(tmp_path, max_bytes=10000)
+    write(store, 'a', 'first', 100)
+    scans = []
+    entries = store._entries
+    monkeypatch.setattr(store, '_entries', lambda: scans.append(1) or entries())
+
+    for i in range(20):
+        write(store, 'b', f'window_{i}', 100)
+    assert scans == []
+
+    # Crossing the cap scans and evicts once
+    write(store, 'c', 'big', 9000)
+    assert len(scans) == 1
+    assert store.total_bytes() <= 9000
+
+
+def test_rescan_after_interval(tmp_path, monkeypatch):
+    store = ArtifactStore(tmp_path, max_bytes=10000)
+    write(store, 'a', 'first', 100)
+    monkeypatch.setattr(artifact_store, 'RESCAN_SECONDS', 0.0)
+    scans = []
+    entries = store._entries
+    monkeypatch.setattr(store, '_entries', lambda: scans.append(1) or entries())
+
+    write(store, 'b', 'second', 100)
+
+    assert scans == [1]
+
+
+def make_ingest(tmp_path, store=None):
+    source = tmp_path / 'episode.mp4'
+    source.write_bytes(b'not really a video')
+    pcm = np.arange(16000, dtype=np.float32)
+
+    if store is not None:
+        ingest = AudioIngest(store=store)
+        pcm.tofile(store.path(source_key(source), 'pcm_16000.float32'))
+    else:
+        ingest = AudioIngest(cache_dir=tmp_path / 'pcm')
+        pcm.tofile(tmp_path / 'pcm' / f"{source_key(source)}.float32.pcm")
+    return ingest, source
+
+
+def test_shared_buffer_deleted_after_last_release(tmp_path):
+    ingest, source = make_ingest(tmp_path)
+
+    first = ingest.load(source)
+    second = ingest.load(source)
+    assert first.path == second.path
+    assert first.duration == 1.0
+
+    ingest.release(first)
+    assert Path(second.path).exists()
+    ingest.release(second)
+    assert not Path(second.path).exists()
+
+
+def test_store_buffers_leased_until_released(tmp_path):
+    store = ArtifactStore(tmp_path / 'store')
+    ingest, source = make_ingest(tmp_path, store)
+
+    first = ingest.load(source)
+    second = ingest.load(source)
+    leases = list((tmp_path / 'store').glob('*/*.lease'))
+    assert len(leases) == 1
+
+    ingest.release(first)
+    assert leases[0].exists()
+    ingest.release(second)
+    assert not leases[0].exists()
+    # Kept for later runs
+    assert Path(second.path).exists()
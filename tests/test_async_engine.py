@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for translation_pipeline.py - the async sliding-window engine against the stand-in server
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("openai")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import rate_limiter
+from config import Config, ConfigMode, TranslationEngine
+from context_analyzer import DocumentType
+from fake_openai_server import ANSWER_PREFIX, LatencyModel, StandInServer
+from translation_pipeline import TranscriptionSegment, TranslationCache, TranslationPipeline
+
+
+def make_segments(count):
+    return [
+        TranscriptionSegment(id=i, start_time=float(i), end_time=i + 1.0, text=f"ราคาขึ้นไปที่แนวต้านครั้งที่ {i}")
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def start_server(monkeypatch):
+    servers = []
+
+    def start(**kwargs):
+        kwargs.setdefault('time_scale', 0.0)
+        server = StandInServer(**kwargs)
+        server.start()
+        servers.append(server)
+        monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+        monkeypatch.setenv('OPENAI_BASE_URL', server.base_url)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def make_pipeline(tmp_path):
+    def make(max_in_flight=4, request_timeout=30.0, max_retries=3):
+        config = Config(mode=ConfigMode.PRODUCTION)
+        config.processing.translation_engine = TranslationEngine.ASYNC
+        config.processing.max_in_flight = max_in_flight
+        config.processing.max_workers = 1
+        config.processing.request_timeout = request_timeout
+        config.api.max_retries = max_retries
+        config.rate_limit.state_dir = tmp_path / 'rate_limits'
+        return TranslationPipeline(config=config, cache=TranslationCache(tmp_path / 'cache'))
+
+    return make
+
+
+def test_results_in_segment_order(start_server, make_pipeline):
+    server = start_server()
+    pipeline = make_pipeline()
+
+    results, stats = pipeline.process_transcript(make_segments(30), DocumentType.TUTORIAL)
+
+    assert [r.segment_id for r in results] == list(range(1, 31))
+    assert all(r.translated_text.startswith(ANSWER_PREFIX) for r in results)
+    assert server.stats()['requests'] == 30
+    assert stats.fallback_segments == 0
+
+
+def test_in_flight_requests_bounded(start_server, make_pipeline):
+    server = start_server(latency=LatencyModel('fixed', (0.05,)), time_scale=1.0)
+    pipeline = make_pipeline(max_in_flight=3)
+
+    results, _ = pipeline.process_transcript(make_segments(12), DocumentType.TUTORIAL)
+
+    assert len(results) == 12
+    assert 1 < server.stats()['peak_in_flight'] <= 3
+
+
+def test_throttled_and_failed_requests_retried(start_server, make_pipeline, monkeypatch):
+    monkeypatch.setattr(rate_limiter, 'BACKOFF_BASE', 0.001)
+    server = start_server(rate_429=0.15, rate_5xx=0.15, retry_after=0.0, seed=3)
+    pipeline = make_pipeline(max_retries=8)
+
+    results, stats = pipeline.process_transcript(make_segments(20), DocumentType.TUTORIAL)
+
+    served = server.stats()
+    assert [r.segment_id for r in results] == list(range(1, 21))
+    assert served['injected_errors'] > 0
+    assert pipeline.rate_limiter.retries == served['injected_errors']
+    assert pipeline.rate_limiter.throttled == served['statuses'].get('429', 0)
+    assert stats.fallback_segments == 0
+    assert pipeline.rate_limiter.concurrency.in_flight == 0
+
+
+def test_timed_out_requests_free_their_slots(start_server, make_pipeline):
+    start_server(latency=LatencyModel('fixed', (2.0,)), time_scale=1.0)
+    pipeline = make_pipeline(max_in_flight=2, request_timeout=0.2)
+
+    started = time.monotonic()
+    results, stats = pipeline.process_transcript(make_segments(6), DocumentType.TUTORIAL)
+
+    # Three rounds of two timeouts, not six two-second requests
+    assert time.monotonic() - started < 3.0
+    assert [r.segment_id for r in results] == list(range(1, 7))
+    assert stats.fallback_segments == 6
+    assert pipeline.rate_limiter.concurrency.in_flight == 0
+
+
+def test_mock_mode_without_client(make_pipeline, monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    pipeline = make_pipeline()
+
+    results, _ = pipeline.process_transcript(make_segments(5), DocumentType.TUTORIAL)
+
+    assert pipeline.client is None
+    assert [r.segment_id for r in results] == list(range(1, 6))
+    assert all(r.translated_text.startswith('[Mock translation') for r in results)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for batch_process.py - pipelined mode: stage usage, prefetch, hand-offs and failures
+"""
+
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "utilities"))
+
+import batch_process
+from batch_process import STAGE_INGEST, BatchJob, BatchProcessor, StageUsage
+
+
+@pytest.fixture
+def four_models(monkeypatch):
+    # Size local pools independently of the test machine
+    monkeypatch.setattr(batch_process, 'max_transcription_workers', lambda model, device: 4)
+
+
+def test_stage_usage_utilization():
+    stage = StageUsage(workers=2, jobs=3, busy_seconds=30.0, waiting_seconds=5.0)
+
+    assert stage.to_dict(20.0) == {
+        'workers': 2,
+        'jobs': 3,
+        'busy_seconds': 30.0,
+        'waiting_seconds': 5.0,
+        'utilization': 0.75
+    }
+
+
+def test_stage_usage_without_wall_time():
+    assert StageUsage(workers=1, busy_seconds=1.0).to_dict(0.0)['utilization'] == 0.0
+    assert StageUsage(workers=0).to_dict(10.0)['utilization'] == 0.0
+
+
+def test_record_adds_job_time():
+    stage = StageUsage(workers=1)
+    job = BatchJob(index=0, video_path=Path('a.mp4'), output_dir=Path('out'))
+    lock = threading.Lock()
+
+    BatchProcessor._record(stage, job, STAGE_INGEST, 2.0, lock)
+    BatchProcessor._record(stage, job, STAGE_INGEST, 1.5, lock)
+
+    assert stage.jobs == 2
+    assert stage.busy_seconds == 3.5
+    assert job.stage_seconds == {STAGE_INGEST: 1.5}
+
+
+def test_prefetch_enables_pipeline(four_models):
+    assert BatchProcessor(max_workers=1, prefetch=2).pipelined
+    # One worker and no prefetch: one job at a time
+    assert not BatchProcessor(max_workers=1, prefetch=0).pipelined
+
+
+def test_service_jobs_are_not_pipelined(four_models):
+    processor = BatchProcessor(max_workers=2, prefetch=2, service='pipeline.sock')
+
+    assert not processor.pipelined
+    assert processor.transcription_workers == 1
+
+
+@pytest.mark.parametrize('kwargs', [{'prefetch': -1}, {'translation_workers': 0}, {'max_workers': -1}])
+def test_invalid_sizes_rejected(four_models, kwargs):
+    with pytest.raises(ValueError):
+        BatchProcessor(**kwargs)
+
+
+# ---------------- pipelined run with stub stages ----------------
+
+class StubIngest:
+    """Hands out fake PCM buffers; videos named 'corrupt*' fail to decode"""
+
+    def __init__(self, cache_dir=None, store=None):
+        self.loaded = []
+        self.released = []
+
+    def load(self, video_path):
+        if video_path.name.startswith('corrupt'):
+            raise RuntimeError("invalid data found when processing input")
+        buffer = SimpleNamespace(path=f"{video_path.stem}.pcm")
+        self.loaded.append(buffer.path)
+        return buffer
+
+    def release(self, buffer):
+        self.released.append(buffer.path)
+
+
+class StubTranscriber:
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def transcribe_file(self, video_path, audio=None):
+        self.calls.append(threading.current_thread().name)
+        if video_path.name.startswith('mute'):
+            raise RuntimeError("no speech found")
+        return f"transcript of {video_path.stem}"
+
+
+class StubOrchestrator:
+    """Stands in for VideoTranslationOrchestrator; videos named 'untranslatable*' fail in translation"""
+
+    def __init__(self, transcriber=None, translator=None, **kwargs):
+        self.transcriber = transcriber or StubTranscriber()
+        self.translator = translator or SimpleNamespace(data_manager=None, cache=None, executor=None, rate_limiter=None)
+        self.config = None
+
+    def process_transcription(self, video_path, transcription, output_dir, doc_type, started):
+        assert transcription == f"transcript of {video_path.stem}"
+        if video_path.name.startswith('untranslatable'):
+            raise RuntimeError("translation API unavailable")
+        return SimpleNamespace(success=True, stats={'estimated_cost': 0.5}, error=None)
+
+
+@pytest.fixture
+def stub_stages(monkeypatch, tmp_path):
+    ingest = StubIngest()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(batch_process, 'AudioIngest', lambda **kwargs: ingest)
+    monkeypatch.setattr(batch_process, 'VideoTranslationOrchestrator', StubOrchestrator)
+    monkeypatch.setattr(batch_process, 'TranslationPipeline', lambda **kwargs: None)
+    monkeypatch.setattr(batch_process, 'ThaiTranscriber', StubTranscriber)
+    # Worker "processes" are threads running one shared stub transcriber
+    monkeypatch.setattr(
+        batch_process, 'ProcessPoolExecutor',
+        lambda max_workers, **kwargs: ThreadPoolExecutor(max_workers, thread_name_prefix='whisper')
+    )
+    monkeypatch.setattr(batch_process, '_worker_transcriber', StubTranscriber())
+    return ingest
+
+
+def make_jobs(*names):
+    return [BatchJob(index=i, video_path=Path(f'{name}.mp4'), output_dir=Path('out')) for i, name in enumerate(names)]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_pipelined_run_propagates_failures(four_models, stub_stages, workers):
+    processor = BatchProcessor(max_workers=workers, prefetch=1, translation_workers=2, artifact_dir=None)
+    jobs = make_jobs('ep01', 'corrupt02', 'ep03', 'mute04', 'untranslatable05', 'ep06')
+
+    report = processor.process_batch(jobs)
+
+    assert [job.status for job in jobs] == ['completed', 'failed', 'completed', 'failed', 'failed', 'completed']
+    assert 'Audio decode failed' in jobs[1].error
+    assert jobs[3].error == 'no speech found'
+    assert jobs[4].error == 'translation API unavailable'
+    assert jobs[0].result == {'estimated_cost': 0.5}
+
+    # Every decoded buffer is released once
+    assert sorted(stub_stages.released) == sorted(stub_stages.loaded)
+    assert len(stub_stages.loaded) == 5
+
+    assert report.stages['ingest']['jobs'] == 6
+    assert report.stages['transcription']['jobs'] == 5
+    assert report.stages['transcription']['workers'] == workers
+    assert report.stages['translation']['jobs'] == 4
+    assert set(jobs[0].stage_seconds) == {'ingest', 'transcription', 'translation'}
+
+
+def test_pipelined_run_skips_jobs_over_cost_limit(four_models, stub_stages):
+    processor = BatchProcessor(max_workers=1, prefetch=2, max_cost=1.0, artifact_dir=None)
+    jobs = make_jobs('done01', 'ep02', 'ep03')
+    jobs[0].status = 'completed'
+    jobs[0].result = {'estimated_cost': 1.25}
+
+    processor.process_batch(jobs)
+
+    assert [job.status for job in jobs] == ['completed', 'skipped', 'skipped']
+    assert jobs[1].error == 'Cost limit reached'
+    assert sorted(stub_stages.released) == sorted(stub_stages.loaded) == ['ep02.pcm', 'ep03.pcm']
+
+
+def test_checkpoint_records_pipelined_results(four_models, stub_stages):
+    processor = BatchProcessor(max_workers=1, prefetch=1, artifact_dir=None)
+    jobs = make_jobs('ep01', 'corrupt02')
+
+    processor.process_batch(jobs)
+
+    resumed = processor.load_checkpoint(processor.checkpoint_file)
+    assert [(job.status, job.error is None) for job in resumed] == [('completed', True), ('failed', False)]
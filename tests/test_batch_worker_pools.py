@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for batch_process.py - sizing the transcription worker pool
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "utilities"))
+
+import batch_process
+from batch_process import MIN_THREADS_PER_MODEL, BatchProcessor, max_transcription_workers
+
+PAGE_SIZE = 4096
+
+
+def machine(monkeypatch, cores, free_gb=None):
+    """Pretend to run on a machine with these cores and free RAM (None: no sysconf figures)"""
+    monkeypatch.setattr(os, 'cpu_count', lambda: cores)
+
+    def sysconf(name):
+        if free_gb is None:
+            raise ValueError(name)
+        return {'SC_PAGE_SIZE': PAGE_SIZE, 'SC_AVPHYS_PAGES': int(free_gb * 1024 ** 3 // PAGE_SIZE)}[name]
+
+    monkeypatch.setattr(os, 'sysconf', sysconf)
+
+
+def test_cores_limit_processes(monkeypatch):
+    machine(monkeypatch, cores=8 * MIN_THREADS_PER_MODEL, free_gb=1000)
+
+    assert max_transcription_workers('large-v3', 'cpu') == 8
+
+
+def test_ram_limits_processes(monkeypatch):
+    machine(monkeypatch, cores=64, free_gb=25)
+
+    # large models need 10 GB, medium 5 GB and unknown families are sized as large
+    assert max_transcription_workers('large-v3', 'cpu') == 2
+    assert max_transcription_workers('medium.en', 'cpu') == 5
+    assert max_transcription_workers('custom-model', 'cpu') == 2
+
+
+def test_at_least_one_process(monkeypatch):
+    machine(monkeypatch, cores=None, free_gb=1)
+
+    assert max_transcription_workers('large-v3', 'cpu') == 1
+
+
+def test_cores_only_without_sysconf(monkeypatch):
+    machine(monkeypatch, cores=3 * MIN_THREADS_PER_MODEL)
+
+    assert max_transcription_workers('large-v3', 'cpu') == 3
+
+
+def test_requested_workers_are_capped(monkeypatch):
+    monkeypatch.setattr(batch_process, 'max_transcription_workers', lambda model, device: 3)
+
+    assert BatchProcessor(max_workers=8).transcription_workers == 3
+    assert BatchProcessor(max_workers=2).transcription_workers == 2
+    # 0: as many as fit
+    processor = BatchProcessor(max_workers=0, prefetch=0)
+    assert processor.transcription_workers == 3
+    assert processor.pipelined
+
+
+def test_auto_size_needs_local_jobs():
+    with pytest.raises(ValueError):
+        BatchProcessor(max_workers=0, service='pipeline.sock')
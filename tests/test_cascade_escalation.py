@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for whisper_transcribe.py - spans the small-model-first cascade escalates
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The script exits at import time without Whisper
+pytest.importorskip("whisper")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from whisper_transcribe import TranscriptSegment, plan_escalations
+
+
+def make_segments(*spans):
+    return [
+        TranscriptSegment(id=i, start=start, end=end, text=f's{i}', confidence=confidence)
+        for i, (start, end, confidence) in enumerate(spans)
+    ]
+
+
+def test_confident_window_is_kept():
+    segments = make_segments((0.0, 5.0, 0.9), (5.0, 10.0, 0.8))
+
+    assert plan_escalations(segments, 0.0, 30.0, threshold=0.6) == []
+
+
+def test_consecutive_low_segments_form_one_span():
+    segments = make_segments((0.0, 4.0, 0.9), (5.0, 8.0, 0.3), (8.5, 12.0, 0.5), (13.0, 15.0, 0.9))
+
+    # Between the confident neighbours, gaps included
+    assert plan_escalations(segments, 0.0, 30.0, threshold=0.6) == [(1, 2, 4.0, 13.0)]
+
+
+def test_spans_reach_window_edges():
+    segments = make_segments((31.0, 34.0, 0.2), (35.0, 40.0, 0.9), (41.0, 50.0, 0.1))
+
+    assert plan_escalations(segments, 30.0, 60.0, threshold=0.6) == [
+        (0, 0, 30.0, 35.0),
+        (2, 2, 40.0, 60.0)
+    ]
+
+
+def test_overlapping_neighbours_give_empty_span():
+    # The next segment starts before the previous one ends
+    segments = make_segments((0.0, 6.0, 0.9), (5.0, 5.5, 0.2), (5.2, 9.0, 0.9))
+
+    assert plan_escalations(segments, 0.0, 30.0, threshold=0.6) == [(1, 1, 6.0, 6.0)]
+
+
+def test_threshold_is_exclusive():
+    segments = make_segments((0.0, 5.0, 0.6))
+
+    assert plan_escalations(segments, 0.0, 10.0, threshold=0.6) == []
+    assert plan_escalations(segments, 0.0, 10.0, threshold=0.61) == [(0, 0, 0.0, 10.0)]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for kaggle/checkpoint_manager.py - delta checkpoints, compaction and resume
+"""
+
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "kaggle"))
+
+from checkpoint_manager import CheckpointManager
+
+
+def make_segments(count):
+    return [
+        {'id': i, 'start': i * 10.0, 'end': (i + 1) * 10.0, 'text': f'ประโยค {i}'}
+        for i in range(count)
+    ]
+
+
+def make_manager(tmp_path, **kwargs):
+    kwargs.setdefault('checkpoint_interval', 10)
+    return CheckpointManager(video_name='ep01', output_dir=str(tmp_path), **kwargs)
+
+
+def test_checkpoints_hold_only_new_segments(tmp_path):
+    mgr = make_manager(tmp_path, compact_every=100)
+    segments = make_segments(30)
+
+    for count in (10, 20, 30):
+        mgr.save_checkpoint(segments[:count], {'estimated_total': 30, 'committed_time': count * 10.0})
+
+    for count in (10, 20, 30):
+        with open(tmp_path / f'ep01_checkpoint_{count:04d}.json', encoding='utf-8') as f:
+            data = json.load(f)
+        assert data['first_segment'] == count - 10
+        assert [s['id'] for s in data['segments']] == list(range(count - 10, count))
+
+    index = json.loads((tmp_path / 'ep01_checkpoint_index.json').read_text(encoding='utf-8'))
+    assert index['total_segments'] == 30
+    assert [d['count'] for d in index['deltas']] == [10, 20, 30]
+
+
+def test_interval_and_unchanged_saves(tmp_path):
+    mgr = make_manager(tmp_path)
+    segments = make_segments(12)
+
+    assert mgr.save_checkpoint(segments[:7], {}) is None
+    assert mgr.save_checkpoint(segments[:10], {}) is not None
+    # Nothing new: no file, but a forced save still records progress
+    assert mgr.save_checkpoint(segments[:10], {'committed_time': 150.0}, force=True) is None
+
+    assert mgr.get_resume_point() == (10, 150.0)
+    assert len(list(tmp_path.glob('ep01_checkpoint_0*.json'))) == 1
+
+
+def test_resume_in_a_new_manager(tmp_path):
+    mgr = make_manager(tmp_path, compact_every=100)
+    segments = make_segments(20)
+    mgr.save_checkpoint(segments[:10], {'estimated_total': 40, 'committed_time': 100.0})
+    mgr.save_checkpoint(segments[:20], {'estimated_total': 40, 'committed_time': 205.0})
+
+    resumed = make_manager(tmp_path)
+
+    assert resumed.has_checkpoint()
+    assert resumed.get_resume_point() == (20, 205.0)
+    loaded, metadata = resumed.load_checkpoint()
+    assert loaded == segments
+    assert metadata['status'] == 'in_progress'
+    assert metadata['progress_percentage'] == 50.0
+
+
+def test_compaction_merges_deltas(tmp_path):
+    mgr = make_manager(tmp_path, compact_every=100)
+    segments = make_segments(30)
+    for count in (10, 20, 30):
+        mgr.save_checkpoint(segments[:count], {'committed_time': count * 10.0})
+
+    target = mgr.compact()
+
+    assert target == tmp_path / 'ep01_checkpoint_0030.json'
+    assert sorted(p.name for p in tmp_path.glob('ep01_checkpoint_0*.json')) == ['ep01_checkpoint_0030.json']
+    stats = mgr.get_statistics()
+    assert stats['checkpoint_count'] == 1
+    assert stats['total_segments'] == 30
+
+    # Later deltas follow the compacted file
+    segments = make_segments(40)
+    mgr.save_checkpoint(segments, {'committed_time': 400.0})
+    resumed = make_manager(tmp_path)
+    assert resumed.load_checkpoint()[0] == segments
+    assert resumed.get_resume_point() == (40, 400.0)
+
+
+def test_background_compaction(tmp_path):
+    mgr = make_manager(tmp_path, compact_every=3)
+    segments = make_segments(30)
+    for count in (10, 20, 30):
+        mgr.save_checkpoint(segments[:count], {})
+    mgr.wait()
+
+    assert mgr.get_statistics()['checkpoint_count'] == 1
+    assert mgr.merge_checkpoints() == segments
+
+
+def test_index_rebuilt_from_legacy_cumulative_files(tmp_path):
+    segments = make_segments(20)
+    for count in (10, 20):
+        data = {'video_name': 'ep01', 'metadata': {'last_segment_time': count * 10.0}, 'segments': segments[:count]}
+        (tmp_path / f'ep01_checkpoint_{count:04d}.json').write_text(json.dumps(data), encoding='utf-8')
+
+    mgr = make_manager(tmp_path)
+
+    assert (tmp_path / 'ep01_checkpoint_index.json').exists()
+    assert mgr.get_resume_point() == (20, 200.0)
+    assert mgr.load_checkpoint()[0] == segments
+    assert mgr.validate_checkpoint()
+
+
+def test_final_save_replaces_checkpoints(tmp_path):
+    mgr = make_manager(tmp_path)
+    segments = make_segments(20)
+    mgr.save_checkpoint(segments[:10], {})
+
+    mgr.save_final(segments, {'model_name': 'large-v3'})
+
+    assert not list(tmp_path.glob('ep01_checkpoint_*.json'))
+    resumed = make_manager(tmp_path)
+    loaded, metadata = resumed.load_checkpoint()
+    assert loaded == segments
+    assert metadata['status'] == 'completed'
+    assert resumed.get_resume_point() == (20, 200.0)
+    assert resumed.validate_checkpoint()
+
+
+def test_final_save_waits_for_background_compaction(tmp_path, monkeypatch):
+    mgr = make_manager(tmp_path, compact_every=3)
+    segments = make_segments(30)
+    started = threading.Event()
+    read_deltas = mgr._read_deltas
+
+    def slow_read(deltas):
+        segments = read_deltas(deltas)
+        started.set()
+        time.sleep(0.2)
+        return segments
+
+    monkeypatch.setattr(mgr, '_read_deltas', slow_read)
+    for count in (10, 20, 30):
+        mgr.save_checkpoint(segments[:count], {})
+    # Compaction of the three deltas is running
+    assert started.wait(5)
+
+    mgr.save_final(segments, {})
+    mgr.wait()
+
+    assert not (tmp_path / 'ep01_checkpoint_index.json').exists()
+    assert not list(tmp_path.glob('ep01_checkpoint_*.json'))
+    assert mgr.final_file.exists()
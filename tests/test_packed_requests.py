@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for translation_pipeline.py - packed requests: numbered replies, packing and re-splits
+"""
+
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config, ConfigMode, TranslationModel
+from context_analyzer import DocumentType
+from translation_pipeline import (
+    PACK_MAX_SEGMENTS,
+    TranscriptionSegment,
+    TranslationPipeline,
+    parse_numbered_lines,
+)
+
+
+class FakeClient:
+    """Chat completions that answer every numbered line, optionally dropping the last one"""
+
+    def __init__(self, drop_last_above=None):
+        self.drop_last_above = drop_last_above
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **request):
+        self.requests.append(request)
+        prompt = request['messages'][-1]['content']
+        lines = re.findall(r'^\[(\d+)\] (.*)$', prompt.split('THAI LINES:')[-1], re.MULTILINE)
+        if not lines:
+            content = 'single'
+        else:
+            if self.drop_last_above is not None and len(lines) > self.drop_last_above:
+                lines = lines[:-1]
+            content = "Translations:\n" + "\n".join(f"{number}. EN {text}" for number, text in lines)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(total_tokens=10)
+        )
+
+
+def make_segments(texts):
+    return [TranscriptionSegment(id=i, start_time=float(i), end_time=i + 1.0, text=text) for i, text in enumerate(texts, 1)]
+
+
+@pytest.fixture
+def make_pipeline(tmp_path, monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+
+    def make(pack_tokens):
+        config = Config(mode=ConfigMode.COST_OPTIMIZED)
+        config.cache.cache_dir = tmp_path / 'cache'
+        config.rate_limit.state_dir = tmp_path / 'rate_limits'
+        config.processing.pack_tokens = pack_tokens
+        return TranslationPipeline(config=config)
+
+    return make
+
+
+def test_parse_numbered_line_styles():
+    reply = 'Here are the translations:\n[1] Hello\n2. "Price goes up"\n3) Buy\n4: Sell'
+
+    assert parse_numbered_lines(reply, 4) == ['Hello', 'Price goes up', 'Buy', 'Sell']
+
+
+def test_parse_joins_continuation_lines():
+    reply = '1. The trend\nis up\n\n2. Wait'
+
+    assert parse_numbered_lines(reply, 2) == ['The trend is up', 'Wait']
+
+
+@pytest.mark.parametrize('reply', [
+    '1. a\n2. b',            # missing line
+    '1. a\n1. b\n2. c',      # repeated number
+    '1. a\n2. b\n4. d',      # out of range
+    '1. a\n2. ""\n3. c',     # empty after stripping quotes
+])
+def test_parse_rejects_mismatched_replies(reply):
+    assert parse_numbered_lines(reply, 3) is None
+
+
+def test_packs_split_by_token_budget(make_pipeline):
+    # 30 Thai characters = 90 bytes: 33 tokens per segment, 3 per 100-token pack
+    pipeline = make_pipeline(pack_tokens=100)
+    segments = make_segments(['ก' * 30] * 7)
+    pipeline._route = lambda segment, context: (0.1, TranslationModel.GPT_35_TURBO)
+
+    cached, packs = pipeline._build_packs(segments, [None] * 7)
+
+    assert cached == []
+    assert [len(pack) for pack in packs] == [3, 3, 1]
+    assert [entry.segment.id for pack in packs for entry in pack] == list(range(1, 8))
+
+
+def test_packs_split_by_model_and_size(make_pipeline):
+    pipeline = make_pipeline(pack_tokens=10 ** 6)
+    segments = make_segments(['ข'] * (PACK_MAX_SEGMENTS + 3))
+    pipeline._route = lambda segment, context: (
+        0.9, TranslationModel.GPT_4 if segment.id == PACK_MAX_SEGMENTS + 2 else TranslationModel.GPT_35_TURBO
+    )
+
+    _, packs = pipeline._build_packs(segments, [None] * len(segments))
+
+    assert [len(pack) for pack in packs] == [PACK_MAX_SEGMENTS, 1, 1, 1]
+    assert packs[2][0].model == TranslationModel.GPT_4
+
+
+def test_cached_segments_are_not_packed(make_pipeline):
+    pipeline = make_pipeline(pack_tokens=1000)
+    pipeline.cache.set('สวัสดี', 'Hello')
+
+    cached, packs = pipeline._build_packs(make_segments(['สวัสดี', 'กราฟ']), [None, None])
+
+    assert [r.translated_text for r in cached] == ['Hello']
+    assert [[entry.segment.text for entry in pack] for pack in packs] == [['กราฟ']]
+
+
+def test_mismatched_reply_is_resplit(make_pipeline):
+    pipeline = make_pipeline(pack_tokens=1000)
+    pipeline.client = FakeClient(drop_last_above=2)
+    pipeline._route = lambda segment, context: (0.1, TranslationModel.GPT_35_TURBO)
+    segments = make_segments(['หนึ่ง', 'สอง', 'สาม', 'สี่'])
+
+    results, stats = pipeline.process_transcript(segments, DocumentType.TUTORIAL)
+
+    assert [r.translated_text for r in results] == ['EN หนึ่ง', 'EN สอง', 'EN สาม', 'EN สี่']
+    # One 4-line request, then two 2-line halves
+    assert [len(re.findall(r'^\[\d+\]', r['messages'][-1]['content'], re.MULTILINE)) for r in pipeline.client.requests] == [4, 2, 2]
+    assert stats.pack_resplits == 1
+    assert stats.packed_segments == 4
+    assert [p.status for p in stats.packs] == ['resplit', 'ok', 'ok']
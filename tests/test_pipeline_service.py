@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Tests for pipeline_service.py - job runner, event log, model slots and the HTTP job API
+"""
+
+import sys
+import json
+import threading
+import http.client
+from pathlib import Path
+from types import SimpleNamespace
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pipeline_service
+from config import ConfigMode
+from pipeline_service import PipelineService, _ServiceHandler
+from service_client import (
+    JOB_COMPLETED, JOB_FAILED, JOB_TRANSCRIBE, ServiceClient, ServiceError
+)
+
+
+class StubStream:
+    """Yields the segments of a fake transcription, then exposes it as result"""
+
+    def __init__(self, path):
+        self.path = path
+        self.result = None
+
+    def __iter__(self):
+        if self.path.name.startswith('broken'):
+            raise RuntimeError(f"Cannot decode {self.path.name}")
+
+        segments = [SimpleNamespace(start=float(i), end=float(i + 1), text=f"ส่วน {i}") for i in range(3)]
+        yield from segments
+        self.result = SimpleNamespace(
+            segments=segments,
+            duration=3.0,
+            word_count=6,
+            average_confidence=0.9,
+            decoding='accurate'
+        )
+
+
+class StubTranscriber:
+    """Stands in for ThaiTranscriber without loading a model; files named 'broken*' fail"""
+
+    def __init__(self, model_name='large-v3', device='cpu', backend='openai-whisper', **kwargs):
+        self.model_name = model_name
+        self.device = device
+        self.backend = backend
+
+    def stream_file(self, path):
+        return StubStream(Path(path))
+
+    def save_srt(self, transcription, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text('\n'.join(s.text for s in transcription.segments), encoding='utf-8')
+
+    def save_json(self, transcription, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps({'segments': len(transcription.segments)}), encoding='utf-8')
+
+
+class StubDictionaries:
+    """No data files and no watchdog thread"""
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('CACHE_DIR', str(tmp_path / '.cache'))
+    monkeypatch.setattr(pipeline_service, 'ThaiTranscriber', StubTranscriber)
+    monkeypatch.setattr(pipeline_service, 'DictionaryManager', StubDictionaries)
+
+    service = PipelineService(
+        whisper_model='tiny',
+        config_mode=ConfigMode.MOCK,
+        transcription_workers=1,
+        translation_workers=1,
+        output_root=tmp_path / 'output'
+    )
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def videos(tmp_path):
+    for name in ('lesson.mp4', 'broken.mp4', 'second.mp4'):
+        (tmp_path / name).write_bytes(b'\0')
+    return tmp_path
+
+
+@pytest.fixture
+def api(service):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ServiceHandler)
+    server.daemon_threads = True
+    server.service = service
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def _follow(service, job):
+    """All events of a job (returns once it has finished)"""
+    result = []
+    done = threading.Event()
+
+    def follow():
+        result.extend(service.events(job))
+        done.set()
+
+    threading.Thread(target=follow, daemon=True).start()
+    assert done.wait(10), f"job {job.id} did not finish"
+    return result
+
+
+def _post(address, path, body):
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    try:
+        connection.request('POST', path, body=json.dumps(body), headers={'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read().decode('utf-8'))
+    finally:
+        connection.close()
+
+
+def _get(address, path):
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    try:
+        connection.request('GET', path)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read().decode('utf-8'))
+    finally:
+        connection.close()
+
+
+# ---------------- job runner ----------------
+
+def test_transcribe_job_completes(service, videos):
+    job = service.submit(JOB_TRANSCRIBE, videos / 'lesson.mp4')
+    events = _follow(service, job)
+
+    assert [e['seq'] for e in events] == list(range(len(events)))
+    assert events[0]['type'] == 'queued'
+    assert events[-1]['type'] == 'completed'
+    stages = [(e['stage'], e['state']) for e in events if e['type'] == 'stage']
+    assert stages == [('transcription', 'waiting'), ('transcription', 'started'), ('transcription', 'finished')]
+
+    assert job.status == JOB_COMPLETED
+    assert job.error is None
+    assert job.result['stats']['thai_segments'] == 3
+    for path in job.result['output_files'].values():
+        assert Path(path).exists()
+        assert Path(path).parent == videos / 'output'
+
+
+def test_failed_stage_returns_model(service, videos):
+    job = service.submit(JOB_TRANSCRIBE, videos / 'broken.mp4')
+    events = _follow(service, job)
+
+    assert events[-1]['type'] == 'failed'
+    assert 'Cannot decode broken.mp4' in events[-1]['error']
+    assert ('transcription', 'failed') in [(e['stage'], e['state']) for e in events if e['type'] == 'stage']
+    assert job.status == JOB_FAILED
+    assert job.result is None
+
+    # The only model is back in the pool: the next job can take it
+    assert service._transcribers.qsize() == 1
+    assert service.health()['idle_models'] == 1
+    follow_up = service.submit(JOB_TRANSCRIBE, videos / 'second.mp4')
+    assert _follow(service, follow_up)[-1]['type'] == 'completed'
+    assert service.health()['jobs'] == {'queued': 0, 'running': 0, 'completed': 1, 'failed': 1}
+
+
+def test_submit_rejects_bad_requests(service, videos):
+    with pytest.raises(ValueError, match='kind must be one of'):
+        service.submit('summarize', videos / 'lesson.mp4')
+    with pytest.raises(ValueError, match='Input file not found'):
+        service.submit(JOB_TRANSCRIBE, videos / 'missing.mp4')
+    assert service.jobs() == []
+
+
+# ---------------- HTTP job API ----------------
+
+def test_api_runs_job_and_streams_events(api, videos):
+    client = ServiceClient(f"http://{api[0]}:{api[1]}")
+
+    assert client.health()['resident_models'] == 1
+    status = client.run(JOB_TRANSCRIBE, videos / 'lesson.mp4', on_event=lambda event: None)
+    assert status['status'] == JOB_COMPLETED
+    assert [job['id'] for job in client.jobs()] == [status['id']]
+
+    events = list(client.events(status['id']))
+    assert events[-1]['type'] == 'completed'
+
+    failed = client.run(JOB_TRANSCRIBE, videos / 'broken.mp4', on_event=lambda event: None)
+    assert failed['status'] == JOB_FAILED
+    assert 'Cannot decode' in failed['error']
+
+
+@pytest.mark.parametrize('path', ['/jobs/unknown', '/jobs/unknown/events', '/nowhere', '/jobs/a/b/c'])
+def test_api_unknown_paths_are_404(api, path):
+    status, body = _get(api, path)
+
+    assert status == 404
+    assert 'error' in body
+
+
+def test_api_client_reports_unknown_job(api):
+    client = ServiceClient(f"http://{api[0]}:{api[1]}")
+
+    with pytest.raises(ServiceError, match='Unknown job'):
+        client.status('unknown')
+    with pytest.raises(ServiceError, match='Unknown job'):
+        list(client.events('unknown'))
+
+
+def test_api_post_elsewhere_is_404(api, videos):
+    status, body = _post(api, '/health', {'kind': JOB_TRANSCRIBE, 'input': str(videos / 'lesson.mp4')})
+
+    assert status == 404
+    assert 'Not found' in body['error']
+
+
+@pytest.mark.parametrize('request_body, message', [
+    ({'kind': 'summarize', 'input': 'lesson.mp4'}, 'kind must be one of'),
+    ({'input': 'lesson.mp4'}, 'kind must be one of'),
+    ({'kind': JOB_TRANSCRIBE, 'input': 'missing.mp4'}, 'Input file not found'),
+    ({'kind': JOB_TRANSCRIBE, 'input': 'lesson.mp4', 'doc_type': 'poem'}, 'poem'),
+])
+def test_api_bad_submissions_are_400(api, service, videos, request_body, message):
+    request_body = dict(request_body, input=str(videos / request_body['input']))
+    status, body = _post(api, '/jobs', request_body)
+
+    assert status == 400
+    assert message in body['error']
+    assert service.jobs() == []
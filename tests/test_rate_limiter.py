@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tests for rate_limiter.py - shared token buckets, AIMD concurrency and retries
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import rate_limiter
+from rate_limiter import AdaptiveConcurrency, RateLimiter, SharedBuckets
+
+
+class Clock:
+    """Stands in for the time module: time()/monotonic() only move on sleep()"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after):
+        super().__init__('429 Too Many Requests')
+        self.response = type('Response', (), {'status_code': 429, 'headers': {'retry-after': str(retry_after)}})()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter, 'time', clock)
+    return clock
+
+
+def test_request_bucket_refills_continuously(clock):
+    buckets = SharedBuckets(requests_per_minute=2, state_dir=None)
+
+    assert buckets.try_acquire('gpt-4', 0) == 0.0
+    assert buckets.try_acquire('gpt-4', 0) == 0.0
+    # Empty: one request refills in 30s
+    assert buckets.try_acquire('gpt-4', 0) == pytest.approx(30.0)
+
+    clock.sleep(15.0)
+    assert buckets.try_acquire('gpt-4', 0) == pytest.approx(15.0)
+    clock.sleep(15.0)
+    assert buckets.try_acquire('gpt-4', 0) == 0.0
+
+
+def test_token_bucket_and_oversized_requests(clock):
+    buckets = SharedBuckets(tokens_per_minute=600, state_dir=None)
+
+    assert buckets.try_acquire('gpt-4', 400) == 0.0
+    # 200 left: 100 more tokens take 10s
+    assert buckets.try_acquire('gpt-4', 300) == pytest.approx(10.0)
+    # Larger than the bucket: waits for a full one instead of forever
+    assert buckets.try_acquire('gpt-4', 5000) == pytest.approx(40.0)
+    # Models have their own buckets
+    assert buckets.try_acquire('gpt-4o-mini', 600) == 0.0
+
+
+def test_refund_and_extra_charge(clock):
+    buckets = SharedBuckets(tokens_per_minute=600, state_dir=None)
+    buckets.try_acquire('gpt-4', 600)
+
+    buckets.refund('gpt-4', 300)
+    assert buckets.try_acquire('gpt-4', 300) == 0.0
+
+    buckets.refund('gpt-4', -60)
+    assert buckets.try_acquire('gpt-4', 0) == 0.0
+    assert buckets.try_acquire('gpt-4', 60) == pytest.approx(12.0)
+
+
+def test_block_pauses_model(clock):
+    buckets = SharedBuckets(state_dir=None)
+
+    buckets.block('gpt-4', 5.0)
+    buckets.block('gpt-4', 2.0)
+
+    assert buckets.try_acquire('gpt-4', 100) == pytest.approx(5.0)
+    clock.sleep(5.0)
+    assert buckets.try_acquire('gpt-4', 100) == 0.0
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="file locks unavailable")
+def test_state_file_shared_between_instances(clock, tmp_path):
+    first = SharedBuckets(requests_per_minute=1, state_dir=tmp_path)
+    second = SharedBuckets(requests_per_minute=1, state_dir=tmp_path)
+
+    assert first.try_acquire('org/model:v1', 0) == 0.0
+    assert second.try_acquire('org/model:v1', 0) == pytest.approx(60.0)
+    assert [p.name for p in tmp_path.iterdir()] == ['org_model_v1.json']
+
+
+def test_additive_increase_up_to_maximum():
+    limit = AdaptiveConcurrency(initial=2, maximum=3)
+
+    # +1/limit per response: about one slot per window of healthy responses
+    limit.record(0.1)
+    limit.record(0.1)
+    assert limit.current == 2
+    limit.record(0.1)
+    assert limit.current == 3
+
+    for _ in range(10):
+        limit.record(0.1)
+    assert limit.limit == 3.0
+
+
+def test_throttle_halves_once_per_round_trip(clock):
+    limit = AdaptiveConcurrency(initial=16, minimum=3)
+
+    limit.record(2.0, throttled=True)
+    # Other requests of the same round trip report the same 429
+    limit.record(2.0, throttled=True)
+    assert limit.current == 8
+
+    clock.sleep(2.0)
+    limit.record(2.0, throttled=True)
+    clock.sleep(2.0)
+    limit.record(2.0, throttled=True)
+    assert limit.current == 3
+
+
+def test_latency_target_counts_as_overload(clock):
+    limit = AdaptiveConcurrency(initial=8, latency_target=5.0)
+
+    limit.record(4.0)
+    assert limit.current == 8
+    limit.record(6.0)
+    assert limit.current == 4
+
+
+def test_call_retries_after_retry_after(clock, monkeypatch):
+    monkeypatch.setattr(rate_limiter.random, 'uniform', lambda low, high: low)
+    limiter = RateLimiter(state_dir=None, max_retries=2, concurrency=4)
+    attempts = []
+
+    def request():
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            raise RateLimitError(retry_after=3)
+        return 'ok'
+
+    assert limiter.call('gpt-4', 10, request) == 'ok'
+    assert attempts[1] - attempts[0] == pytest.approx(3.0)
+    assert limiter.stats() == {
+        'requests': 2,
+        'throttled': 1,
+        'retries': 1,
+        'wait_seconds': pytest.approx(3.0),
+        'concurrency_limit': 2
+    }
+    assert limiter.concurrency.in_flight == 0
+
+
+def test_call_raises_non_retryable_errors(clock):
+    limiter = RateLimiter(state_dir=None, max_retries=3)
+
+    def request():
+        raise ValueError('bad request')
+
+    with pytest.raises(ValueError):
+        limiter.call('gpt-4', 10, request)
+    assert limiter.retries == 0
+    assert limiter.concurrency.in_flight == 0
+
+
+class ServerError(Exception):
+    status_code = 503
+
+
+@pytest.mark.parametrize('error', [ServerError('503'), TimeoutError('timed out'), ConnectionError('reset')])
+def test_upstream_errors_decrease_concurrency(clock, monkeypatch, error):
+    monkeypatch.setattr(rate_limiter.random, 'uniform', lambda low, high: low)
+    limiter = RateLimiter(state_dir=None, max_retries=0, concurrency=8)
+
+    def request():
+        raise error
+
+    with pytest.raises(type(error)):
+        limiter.call('gpt-4', 10, request)
+    assert limiter.concurrency.current == 4
+
+
+def test_other_errors_do_not_increase_concurrency(clock):
+    limit = AdaptiveConcurrency(initial=2, maximum=4)
+
+    for _ in range(10):
+        limit.record(0.1, failed=True)
+
+    assert limit.limit == 2.0
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for segment_journal.py - append-only checkpoints, recovery and compaction
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import segment_journal
+from segment_journal import (
+    SegmentJournal,
+    decode_record,
+    encode_record,
+    read_progress,
+)
+
+
+def segment(index):
+    return {'id': index, 'start': float(index), 'end': index + 1.0, 'text': f'ข้อความ {index}'}
+
+
+def write_two_commits(path):
+    journal = SegmentJournal(path, sync_interval=0)
+    journal.append([segment(0), segment(1)], {'window': 1, 'end': 2.0})
+    journal.append([segment(2)], {'window': 2, 'end': 3.0})
+    journal.close()
+    return journal
+
+
+def test_record_round_trip_and_checksum():
+    line = encode_record({'type': 'commit', 'text': 'กราฟ'})
+
+    assert decode_record(line) == {'type': 'commit', 'text': 'กราฟ'}
+    # Torn (no newline) and flipped-byte lines are rejected
+    assert decode_record(line[:-1]) is None
+    corrupted = line.replace('กราฟ'.encode('utf-8'), 'กราบ'.encode('utf-8'))
+    assert decode_record(corrupted) is None
+
+
+def test_replay_returns_committed_segments(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = write_two_commits(path)
+
+    state = SegmentJournal(path).replay()
+
+    assert [s['id'] for s in state.segments] == [0, 1, 2]
+    assert state.progress == {'window': 2, 'end': 3.0}
+    assert state.discarded_bytes == 0
+    assert journal.commits == 2
+    assert journal.fsyncs >= 1
+
+
+def test_recover_truncates_torn_tail(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    write_two_commits(path)
+    committed = path.stat().st_size
+
+    with open(path, 'ab') as f:
+        # An uncommitted segment, then half a record
+        f.write(encode_record({'type': 'segment', **segment(3)}))
+        f.write(encode_record({'type': 'commit', 'window': 3})[:12])
+
+    state = SegmentJournal(path).recover()
+
+    assert [s['id'] for s in state.segments] == [0, 1, 2]
+    assert state.progress == {'window': 2, 'end': 3.0}
+    assert path.stat().st_size == committed
+
+
+def test_recover_stops_at_bad_checksum(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = SegmentJournal(path, sync_interval=0)
+    journal.append([segment(0)], {'window': 1})
+    journal.close()
+    first_commit = path.stat().st_size
+
+    # A complete second commit whose segment record fails its CRC
+    bad = bytearray(encode_record({'type': 'segment', **segment(1)}))
+    bad[0:8] = b'00000000'
+    with open(path, 'ab') as f:
+        f.write(bytes(bad))
+        f.write(encode_record({'type': 'commit', 'window': 2}))
+
+    state = SegmentJournal(path).recover()
+
+    assert [s['id'] for s in state.segments] == [0]
+    assert state.progress == {'window': 1}
+    assert path.stat().st_size == first_commit
+
+
+def test_appending_after_recovery(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    write_two_commits(path)
+    with open(path, 'ab') as f:
+        f.write(b'garbage without newline')
+
+    journal = SegmentJournal(path, sync_interval=0)
+    journal.recover()
+    journal.append([segment(3)], {'window': 3})
+    journal.close()
+
+    state = SegmentJournal(path).replay()
+    assert [s['id'] for s in state.segments] == [0, 1, 2, 3]
+    assert state.progress == {'window': 3}
+
+
+def test_compact_keeps_segments_and_last_marker(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    write_two_commits(path)
+    with open(path, 'ab') as f:
+        f.write(encode_record({'type': 'segment', **segment(9)}))
+
+    state = SegmentJournal(path).compact()
+    lines = path.read_bytes().splitlines(keepends=True)
+
+    assert [s['id'] for s in state.segments] == [0, 1, 2]
+    # Three segments and one commit marker
+    assert len(lines) == 4
+    assert decode_record(lines[-1]) == {'type': 'commit', 'window': 2, 'end': 3.0}
+    assert SegmentJournal(path).replay().segments == state.segments
+    assert not path.with_name(path.name + '.tmp').exists()
+
+
+def test_compact_without_commit_leaves_file(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    path.write_bytes(encode_record({'type': 'segment', **segment(0)}))
+
+    state = SegmentJournal(path).compact()
+
+    assert state.progress is None
+    assert path.stat().st_size > 0
+
+
+def test_read_progress_scans_the_tail(tmp_path, monkeypatch):
+    path = tmp_path / 'journal.jsonl'
+    journal = SegmentJournal(path, sync_interval=0)
+    for window in range(1, 51):
+        journal.append([segment(window)], {'window': window})
+    journal.close()
+    with open(path, 'ab') as f:
+        f.write(b'torn')
+
+    # A scan window smaller than the file exercises the widening scan
+    monkeypatch.setattr(segment_journal, 'TAIL_SCAN_BYTES', 64)
+
+    assert read_progress(path) == {'window': 50}
+
+
+def test_read_progress_missing_or_uncommitted(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+
+    assert read_progress(path) is None
+
+    path.write_bytes(encode_record({'type': 'segment', **segment(0)}))
+    assert read_progress(path) is None
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for segment_table.py - columnar transcripts and the binary sidecar
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from segment_table import SegmentTable, load_transcript, save_transcript, table_path
+
+
+def make_transcript():
+    return {
+        'language': 'th',
+        'metadata': {'model': 'large-v3'},
+        'segments': [
+            {
+                'id': 0, 'start': 0.0, 'end': 2.5, 'text': 'สวัสดีครับ', 'confidence': 0.9,
+                'words': [
+                    {'word': 'สวัสดี', 'start': 0.0, 'end': 1.5, 'probability': 0.95},
+                    {'word': 'ครับ', 'start': 1.5, 'end': 2.5, 'probability': 0.85}
+                ]
+            },
+            {'id': 1, 'start': 3.0, 'end': 4.0, 'text': '', 'confidence': 0.5},
+            {
+                'id': 2, 'start': 4.0, 'end': 6.0, 'text': 'กราฟขึ้น', 'confidence': 0.8,
+                'words': [{'word': 'กราฟขึ้น', 'start': 4.0, 'end': 6.0, 'probability': 0.7}]
+            }
+        ]
+    }
+
+
+def test_columns_and_text():
+    table = SegmentTable.from_transcript(make_transcript())
+
+    assert len(table) == 3
+    assert table.word_count == 3
+    assert table.ids.tolist() == [0, 1, 2]
+    assert table.durations.tolist() == [2.5, 1.0, 2.0]
+    assert table.texts() == ['สวัสดีครับ', '', 'กราฟขึ้น']
+    assert table.segment_text(2) == 'กราฟขึ้น'
+    assert table.text == 'สวัสดีครับ  กราฟขึ้น'
+    assert table.words(1) == []
+    assert table.words(0)[1] == {'word': 'ครับ', 'start': 1.5, 'end': 2.5, 'probability': 0.85}
+
+
+def test_from_segments_accepts_pipeline_fields():
+    class Segment:
+        def __init__(self, id, start_time, end_time, text):
+            self.id, self.start_time, self.end_time, self.text = id, start_time, end_time, text
+
+    table = SegmentTable.from_segments([Segment(7, 1.0, 2.0, 'a')])
+
+    assert table.segments() == [{'id': 7, 'start': 1.0, 'end': 2.0, 'text': 'a', 'confidence': 0.0}]
+
+
+def test_save_load_round_trip(tmp_path):
+    data = make_transcript()
+    path = tmp_path / 'episode.segtab'
+
+    SegmentTable.from_transcript(data).save(path)
+    table = SegmentTable.load(path)
+
+    # Read-only views into the mapped file
+    assert not table.columns['start'].flags.writeable
+    restored = table.to_transcript(with_words=True)
+    for segment in data['segments']:
+        segment.setdefault('words', [])
+    assert restored['segments'] == data['segments']
+    assert restored['language'] == 'th'
+    assert restored['metadata'] == {'model': 'large-v3'}
+    assert not (tmp_path / 'episode.segtab.tmp').exists()
+
+
+def test_empty_table_round_trip(tmp_path):
+    path = tmp_path / 'empty.segtab'
+
+    SegmentTable.from_segments([]).save(path)
+    table = SegmentTable.load(path)
+
+    assert len(table) == 0
+    assert table.word_count == 0
+    assert table.segments(with_words=True) == []
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'bogus.segtab'
+    path.write_bytes(b'NOTATABLE' * 4)
+
+    with pytest.raises(ValueError):
+        SegmentTable.load(path)
+
+
+def test_load_transcript_writes_and_uses_sidecar(tmp_path):
+    json_path = tmp_path / 'episode.json'
+    json_path.write_text(json.dumps(make_transcript(), ensure_ascii=False), encoding='utf-8')
+
+    first = load_transcript(json_path)
+    sidecar = table_path(json_path)
+
+    assert sidecar == tmp_path / 'episode.segtab'
+    assert sidecar.exists()
+    assert 'words' not in first['segments'][0]
+
+    # Corrupt the JSON: a current sidecar is read instead
+    json_path.write_text('{', encoding='utf-8')
+    os.utime(sidecar, (json_path.stat().st_mtime + 10,) * 2)
+    second = load_transcript(json_path, with_words=True)
+
+    assert [s['text'] for s in second['segments']] == ['สวัสดีครับ', '', 'กราฟขึ้น']
+    assert len(second['segments'][0]['words']) == 2
+
+
+def test_stale_sidecar_is_ignored(tmp_path):
+    json_path = tmp_path / 'episode.json'
+    save_transcript(make_transcript(), json_path)
+
+    data = make_transcript()
+    data['segments'][0]['text'] = 'แก้ไขแล้ว'
+    json_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    os.utime(json_path, (table_path(json_path).stat().st_mtime + 10,) * 2)
+
+    assert load_transcript(json_path)['segments'][0]['text'] == 'แก้ไขแล้ว'
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for thai_transcriber.py - streaming windows cut at quiet gaps
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import thai_transcriber
+from decoding_strategy import WindowDecode
+from thai_transcriber import SAMPLE_RATE, STREAM_CUT_TOLERANCE, EnergyVAD, ThaiTranscriber
+
+
+def speech(duration, pauses):
+    """Tone "words" (0.8s on, 0.2s off), silent through each (start, end) pause"""
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    audio = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    audio[(t % 1.0) >= 0.8] = 0.0
+    for start, end in pauses:
+        audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] = 0.0
+    return audio
+
+
+def test_cut_moves_to_pause_near_nominal_end():
+    audio = speech(100.0, [(62.0, 63.5)])
+
+    cut = ThaiTranscriber._stream_cut(audio, 0, 60 * SAMPLE_RATE, EnergyVAD())
+
+    assert 62.0 * SAMPLE_RATE <= cut <= 63.5 * SAMPLE_RATE
+
+
+def test_cut_stays_within_tolerance():
+    audio = speech(100.0, [(70.0, 72.0)])
+
+    cut = ThaiTranscriber._stream_cut(audio, 0, 60 * SAMPLE_RATE, EnergyVAD())
+
+    assert abs(cut - 60 * SAMPLE_RATE) <= STREAM_CUT_TOLERANCE * SAMPLE_RATE
+    # Between two words
+    assert audio[cut] == 0.0
+
+
+def test_short_remainder_joins_last_window():
+    audio = speech(63.0, [])
+
+    assert ThaiTranscriber._stream_cut(audio, 0, 60 * SAMPLE_RATE, EnergyVAD()) == len(audio)
+
+
+def test_stream_windows_are_contiguous(tmp_path, monkeypatch):
+    audio = speech(130.0, [(58.0, 59.0), (121.0, 122.0)])
+    windows = []
+
+    def fake_decode(model, chunk, settings, **kwargs):
+        windows.append(chunk)
+        duration = len(chunk) / SAMPLE_RATE
+        result = {'segments': [{'start': 0.0, 'end': duration, 'text': f'w{len(windows)}'}], 'text': f'w{len(windows)}'}
+        return result, WindowDecode(label=kwargs['label'], mode='accurate', audio_seconds=duration,
+                                    first_pass_seconds=0.0, score=None, segments=1)
+
+    monkeypatch.setattr(thai_transcriber, 'decode_window', fake_decode)
+    transcriber = ThaiTranscriber(load_model=False)
+
+    segments = list(transcriber.stream_file(tmp_path / 'episode.wav', audio=audio, window_size=60.0))
+
+    assert sum(len(w) for w in windows) == len(audio)
+    # Both cuts land in the pauses
+    assert len(segments) == 3
+    assert 58.0 <= segments[0].end <= 59.0
+    assert 121.0 <= segments[1].end <= 122.0
+    assert segments[-1].end == 130.0
+    assert all(segments[i].end == segments[i + 1].start for i in range(len(segments) - 1))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for translation_store.py and TranslationCache - SQLite store, TTL and the LRU tier
+"""
+
+import sys
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import translation_store
+import translation_pipeline
+from translation_store import COMPRESS_MIN_BYTES, LEGACY_JSON_FILE, TranslationStore
+from translation_pipeline import TranslationCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(translation_store, 'time', clock)
+    monkeypatch.setattr(translation_pipeline, 'time', clock)
+    return clock
+
+
+def test_put_get_and_replace(tmp_path):
+    store = TranslationStore(tmp_path)
+
+    store.put('k', 'กราฟ', model='gpt-4')
+    store.put('k', 'graph')
+
+    assert store.get('k') == 'graph'
+    assert store.get('missing') is None
+    assert store.count() == 1
+    store.close()
+
+
+def test_long_values_are_compressed(tmp_path):
+    store = TranslationStore(tmp_path)
+    text = 'ราคา' * COMPRESS_MIN_BYTES
+
+    store.put('long', text)
+    store.put('short', 'ok')
+
+    rows = dict(store._connection().execute('SELECT key, compressed FROM translations'))
+    assert rows == {'long': 1, 'short': 0}
+    assert store.get('long') == text
+    assert TranslationStore(tmp_path, compression=False).get('long') == text
+
+
+def test_ttl_expiry_and_purge(tmp_path, clock):
+    store = TranslationStore(tmp_path, ttl_seconds=60)
+    store.put('old', 'a')
+    clock.now += 30
+    store.put('new', 'b')
+
+    clock.now += 45
+    assert store.get('old') is None
+    assert store.get('new') == 'b'
+    assert store.count() == 1
+
+    # Reopening purges expired rows
+    TranslationStore(tmp_path, ttl_seconds=60)
+    assert store._connection().execute('SELECT key FROM translations').fetchall() == [('new',)]
+
+
+def test_json_migration_runs_once(tmp_path):
+    legacy = tmp_path / LEGACY_JSON_FILE
+    legacy.write_text(json.dumps({'a': 'one', 'b': 'two', 'bad': 3}), encoding='utf-8')
+
+    store = TranslationStore(tmp_path)
+
+    assert not legacy.exists()
+    assert (tmp_path / (LEGACY_JSON_FILE + '.migrated')).exists()
+    assert (store.get('a'), store.get('b'), store.get('bad')) == ('one', 'two', None)
+
+    # A JSON file that reappears is not imported again
+    store.put('a', 'newer')
+    legacy.write_text(json.dumps({'a': 'stale', 'c': 'three'}), encoding='utf-8')
+    store = TranslationStore(tmp_path)
+    assert store.get('a') == 'newer'
+    assert store.get('c') is None
+
+
+def test_migration_keeps_rows_already_stored(tmp_path):
+    store = TranslationStore(tmp_path)
+    store.put('a', 'from store')
+    (tmp_path / LEGACY_JSON_FILE).write_text(json.dumps({'a': 'from json', 'b': 'two'}), encoding='utf-8')
+
+    store = TranslationStore(tmp_path)
+
+    assert store.get('a') == 'from store'
+    assert store.get('b') == 'two'
+
+
+def test_connections_pruned_and_closed(tmp_path):
+    store = TranslationStore(tmp_path)
+    threads = [threading.Thread(target=store.put, args=(f'k{i}', 'v')) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store._connections) == 4
+    assert store.prune() == 3
+    assert store.count() == 3
+
+    store.close()
+    assert store._connections == {}
+    # Threads reconnect on next use
+    assert store.get('k0') == 'v'
+
+
+def test_cache_lru_tier(tmp_path):
+    cache = TranslationCache(tmp_path, max_memory_items=2)
+    for text in ('a', 'b', 'c'):
+        cache.set(text, text.upper())
+
+    # 'a' was evicted from memory, not from the store
+    assert len(cache.memory_cache) == 2
+    assert cache.get('b') == 'B'
+    assert cache.get('a') == 'A'
+    assert cache.get('missing') is None
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['memory_hits'], stats['misses']) == (2, 1, 1)
+    assert stats['size'] == 3
+    # Loading 'a' evicted the least recently used entry, 'c'
+    assert cache.get('c') == 'C'
+    assert cache.get_stats()['memory_hits'] == 1
+    cache.close()
+
+
+def test_cache_entries_expire_in_memory(tmp_path, clock):
+    cache = TranslationCache(tmp_path, ttl_seconds=60)
+    cache.set('a', 'A')
+
+    clock.now += 61
+
+    assert cache.get('a') is None
+    assert cache.memory_cache == {}
+
+
+def test_cache_survives_reopening(tmp_path):
+    TranslationCache(tmp_path).set('สวัสดี', 'Hello', 'ctx', 'gpt-4')
+
+    cache = TranslationCache(tmp_path)
+
+    assert cache.get('สวัสดี', 'ctx', 'gpt-4') == 'Hello'
+    assert cache.get('สวัสดี', 'other', 'gpt-4') is None
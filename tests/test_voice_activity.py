@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for voice_activity.py - speech maps and timestamp remapping
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from voice_activity import SAMPLE_RATE, EnergyVAD, SpeechMap, SpeechRegion
+
+
+def make_map():
+    # Speech at 2-5s and 10-12s of a 15s recording: compacted 0-3s and 3-5s
+    return SpeechMap(regions=[SpeechRegion(2.0, 5.0), SpeechRegion(10.0, 12.0)], duration=15.0)
+
+
+def test_compact_starts_and_totals():
+    speech_map = make_map()
+
+    assert speech_map.compact_starts == [0.0, 3.0]
+    assert speech_map.speech_seconds == 5.0
+    assert speech_map.skipped_seconds == 10.0
+    assert speech_map.has_speech
+
+
+def test_remap_segment_within_region():
+    segment = {'start': 0.5, 'end': 2.5, 'text': 'x'}
+
+    make_map().remap_segment(segment)
+
+    assert segment['start'] == 2.5
+    assert segment['end'] == 4.5
+
+
+def test_remap_segment_splice_point_sides():
+    # A segment ending exactly at the splice ends in the first region,
+    # one starting there starts in the second
+    speech_map = make_map()
+
+    first = speech_map.remap_segment({'start': 1.0, 'end': 3.0})
+    second = speech_map.remap_segment({'start': 3.0, 'end': 4.0})
+
+    assert first['end'] == 5.0
+    assert second['start'] == 10.0
+    assert second['end'] == 11.0
+
+
+def test_remap_segment_words_and_clamping():
+    segment = {
+        'start': 2.0,
+        'end': 6.0,
+        'words': [
+            {'word': 'a', 'start': 2.0, 'end': 2.8},
+            {'word': 'b', 'start': 3.2, 'end': 6.0}
+        ]
+    }
+
+    make_map().remap_segment(segment)
+
+    assert segment['start'] == 4.0
+    # Past the last region: clamped to its end
+    assert segment['end'] == 12.0
+    assert [(w['start'], w['end']) for w in segment['words']] == [(4.0, 4.8), (10.2, 12.0)]
+
+
+def test_remap_without_regions_is_identity():
+    segment = {'start': 1.5, 'end': 2.5}
+
+    SpeechMap(regions=[], duration=5.0).remap_segment(segment)
+
+    assert segment == {'start': 1.5, 'end': 2.5}
+
+
+def test_compact_keeps_speech_samples_only():
+    audio = np.arange(15 * SAMPLE_RATE, dtype=np.float32)
+
+    compacted = make_map().compact(audio)
+
+    assert len(compacted) == 5 * SAMPLE_RATE
+    assert compacted[0] == 2 * SAMPLE_RATE
+    assert compacted[3 * SAMPLE_RATE] == 10 * SAMPLE_RATE
+
+
+def test_detect_finds_tone_between_silence():
+    t = np.arange(10 * SAMPLE_RATE) / SAMPLE_RATE
+    audio = np.zeros_like(t, dtype=np.float32)
+    speech = (t >= 3.0) & (t < 6.0)
+    audio[speech] = 0.3 * np.sin(2 * np.pi * 220 * t[speech])
+
+    speech_map = EnergyVAD(padding=0.2).detect(audio)
+
+    assert len(speech_map.regions) == 1
+    region = speech_map.regions[0]
+    assert abs(region.start - 2.8) < 0.05
+    assert abs(region.end - 6.2) < 0.05
+
+
+def test_detect_empty_audio():
+    speech_map = EnergyVAD().detect(np.zeros(0, dtype=np.float32))
+
+    assert not speech_map.has_speech
+    assert speech_map.duration == 0.0
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for whisper_transcribe.py - audio windows and stitching overlapped windows
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The script exits at import time without Whisper
+pytest.importorskip("whisper")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from whisper_transcribe import TranscriptSegment, plan_windows, stitch_window
+
+
+def word(text, start, end, probability=0.9):
+    return {'word': text, 'start': start, 'end': end, 'probability': probability}
+
+
+def test_plan_windows_cover_duration():
+    windows = plan_windows(65.0, 30.0)
+
+    assert [(w.index, w.start, w.end) for w in windows] == [(0, 0.0, 30.0), (1, 30.0, 60.0), (2, 60.0, 65.0)]
+    assert plan_windows(0.0, 30.0) == []
+
+
+def test_segments_past_core_end_left_to_next_window():
+    segments = [
+        TranscriptSegment(id=0, start=20.0, end=29.0, text='a'),
+        TranscriptSegment(id=1, start=30.5, end=31.5, text='b')
+    ]
+
+    kept, seam = stitch_window(segments, seam=0.0, core_end=30.0, is_last=False)
+
+    assert [s.text for s in kept] == ['a']
+    assert seam == 29.0
+
+    kept, _ = stitch_window(segments, seam=0.0, core_end=30.0, is_last=True)
+    assert len(kept) == 2
+
+
+def test_words_before_seam_are_dropped():
+    # The previous window already emitted words up to 31.0
+    segment = TranscriptSegment(
+        id=0, start=29.8, end=33.0, text='ab cd ef', confidence=0.7,
+        words=[word('ab', 29.8, 30.4, 0.5), word(' cd', 30.4, 31.0, 0.6), word(' ef', 31.1, 33.0, 0.8)]
+    )
+
+    kept, seam = stitch_window([segment], seam=31.0, core_end=60.0, is_last=False)
+
+    assert len(kept) == 1
+    assert kept[0].text == 'ef'
+    assert kept[0].start == 31.1
+    assert kept[0].confidence == 0.8
+    assert seam == 33.0
+
+
+def test_fully_repeated_segments_are_skipped():
+    repeated = TranscriptSegment(id=0, start=28.0, end=30.0, text='x', words=[word('x', 28.0, 30.0)])
+    plain_repeat = TranscriptSegment(id=1, start=29.0, end=30.5, text='y')
+    plain_new = TranscriptSegment(id=2, start=30.0, end=32.0, text='z')
+
+    kept, seam = stitch_window([repeated, plain_repeat, plain_new], seam=31.0, core_end=60.0, is_last=False)
+
+    assert [s.text for s in kept] == ['z']
+    # Segments without words are clipped at the seam
+    assert kept[0].start == 31.0
+    assert seam == 32.0